@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""
+Agent Runtime
+
+Keeps FlexTime agent modules loaded and calls their process_user_query
+directly, either on a thread pool in this process or on a warm pool of
+worker processes for isolation. Tracks cold-start and warm-call latency
+for each agent.
+
+Part of the XII-OS FlexTime module.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import inspect
+import importlib
+import statistics
+import subprocess
+import threading
+import multiprocessing
+import concurrent.futures
+from typing import Dict, List, Any, Optional, Tuple, Callable
+
+# FlexTime configuration
+FLEXTIME_VERSION = "1.0.0"
+FLEXTIME_MODULE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+AGENTS_PATH = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_TIMEOUT = 60.0  # seconds
+ISOLATION_MODES = ["thread", "process"]
+
+def _ensure_agents_path():
+    """Make agent modules (and the shared engines they import) importable by name"""
+    if AGENTS_PATH not in sys.path:
+        sys.path.insert(0, AGENTS_PATH)
+
+def _module_name(agent_path: str) -> str:
+    return os.path.splitext(os.path.basename(agent_path))[0]
+
+def _invoke(module: Any, query: str, context: Optional[Dict[str, Any]] = None, system_prompt: str = "") -> str:
+    """
+    Call an agent's process_user_query, passing upstream results and the system prompt to
+    agents that accept them; an agent without a system_prompt parameter gets it after the query
+    """
+    handler = module.process_user_query
+    parameters = inspect.signature(handler).parameters
+    kwargs: Dict[str, Any] = {}
+    if context and "context" in parameters:
+        kwargs["context"] = context
+    if system_prompt:
+        if "system_prompt" in parameters:
+            kwargs["system_prompt"] = system_prompt
+        else:
+            query = f"{query}\n{system_prompt}"
+    return handler(query, **kwargs)
+
+def upstream_findings(context: Optional[Dict[str, Dict[str, Any]]]) -> str:
+    """
+    Section quoting, in full, the results of the subtasks an agent's task depends on
+
+    Args:
+        context: Upstream subtask results keyed by subtask id, as passed by the head coach
+            (each with agent, description, response and error)
+
+    Returns:
+        Text to append to the agent's response, or "" when nothing came from upstream
+    """
+    if not context:
+        return ""
+
+    section = "\n\n[Upstream Findings]\n"
+    for subtask_id, result in context.items():
+        label = f"{result.get('description') or subtask_id} ({result.get('agent', subtask_id)})"
+        if result.get("error"):
+            section += f"- {label}: not available ({result['error']})\n"
+            continue
+        lines = [line.rstrip() for line in str(result.get("response", "")).splitlines()]
+        section += f"- {label}:\n"
+        section += "".join(f"    {line}\n" if line else "\n" for line in lines)
+    return section
+
+def answer_query(answer: Callable[[str], str], query: str, context: Optional[Dict[str, Any]] = None,
+                 system_prompt: str = "") -> str:
+    """
+    Shared process_user_query for the keyword-routed agents
+
+    The agent's router sees only the query. The caller's instructions and the
+    upstream results are added after its answer, so they reach whoever reads the
+    response without changing which analysis is given.
+
+    Args:
+        answer: The agent's router, mapping a query to its response
+        query: Natural language query from the user
+        context: Upstream subtask results keyed by subtask id, from the head coach
+        system_prompt: Optional caller instructions
+
+    Returns:
+        The agent's response followed by the instructions and upstream findings
+    """
+    response = answer(query)
+    if system_prompt:
+        response += f"\n\n[Caller Instructions]\n{system_prompt}"
+    return response + upstream_findings(context)
+
+def _worker_call(module_name: str, query: str, context: Optional[Dict[str, Any]] = None,
+                 system_prompt: str = "") -> Tuple[str, float, float]:
+    """
+    Run an agent inside a worker process
+
+    Returns:
+        Tuple of (response, import seconds, call seconds); import seconds is 0
+        once the module is loaded in that worker
+    """
+    _ensure_agents_path()
+    import_seconds = 0.0
+    if module_name not in sys.modules:
+        start = time.perf_counter()
+        importlib.import_module(module_name)
+        import_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    response = _invoke(sys.modules[module_name], query, context, system_prompt)
+    return response, import_seconds, time.perf_counter() - start
+
+class AgentTimeoutError(Exception):
+    """Raised when an agent does not answer within its timeout"""
+    pass
+
+class AgentCancelledError(Exception):
+    """Raised inside a call whose worker process was stopped by a cancel"""
+    pass
+
+def _worker_loop(conn: Any):
+    """Serve agent calls sent over a pipe until the runtime closes it"""
+    _ensure_agents_path()
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+        try:
+            conn.send((True, _worker_call(*message)))
+        except Exception as e:
+            # The exception itself may not pickle, so send its description
+            conn.send((False, f"{type(e).__name__}: {str(e)}"))
+
+_spawn_lock = threading.Lock()
+
+class _Worker:
+    """A warm worker process that runs one agent call at a time"""
+
+    def __init__(self):
+        # One fork at a time, so a worker never inherits another worker's end of its pipe
+        with _spawn_lock:
+            self.conn, child = multiprocessing.Pipe()
+            self.process = multiprocessing.Process(target=_worker_loop, args=(child,), daemon=True,
+                                                   name="flextime-agent-worker")
+            self.process.start()
+            child.close()
+
+    def call(self, module_name: str, query: str, context: Optional[Dict[str, Any]],
+             system_prompt: str = "") -> Tuple[str, float, float]:
+        self.conn.send((module_name, query, context, system_prompt))
+        try:
+            ok, payload = self.conn.recv()
+        except (EOFError, OSError):
+            raise AgentCancelledError("Agent worker was stopped")
+        if not ok:
+            raise RuntimeError(payload)
+        return payload
+
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def terminate(self):
+        """Kill the process; a call waiting on it then fails with AgentCancelledError"""
+        if self.process.is_alive():
+            self.process.terminate()
+
+    def stop(self, wait: bool = True):
+        self.terminate()
+        if wait:
+            self.process.join()
+        self.conn.close()
+
+class AgentRuntime:
+    """Persistent runtime that executes FlexTime agents without spawning an interpreter per call"""
+
+    def __init__(self, agent_paths: Dict[str, str], isolation: str = "thread", max_workers: int = 4,
+                 default_timeout: float = DEFAULT_TIMEOUT, timeouts: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            agent_paths: Mapping of agent name to agent script path
+            isolation: "thread" to run agents in this process, "process" for a warm worker-process pool
+            max_workers: Pool size
+            default_timeout: Seconds to wait for an agent before cancelling it
+            timeouts: Optional per-agent timeout overrides
+        """
+        if isolation not in ISOLATION_MODES:
+            raise ValueError(f"Unknown isolation mode '{isolation}', expected one of {ISOLATION_MODES}")
+
+        self.agent_paths = agent_paths
+        self.isolation = isolation
+        self.max_workers = max_workers
+        self.default_timeout = default_timeout
+        self.timeouts = timeouts or {}
+
+        self._modules: Dict[str, Any] = {}
+        self._load_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        # Process mode: idle warm workers, and the worker serving each running call
+        self._workers_lock = threading.Lock()
+        self._idle_workers: List[_Worker] = []
+        self._calls: Dict[concurrent.futures.Future, Dict[str, Any]] = {}
+        # Calls run on threads; in process mode each thread hands its call to a worker process
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="flextime-agent")
+
+    def has_agent(self, agent_name: str) -> bool:
+        """Check whether an agent is registered and its script exists"""
+        path = self.agent_paths.get(agent_name)
+        return bool(path) and os.path.exists(path)
+
+    def load(self, agent_name: str) -> Any:
+        """
+        Import an agent module once and keep it for later calls
+
+        Returns:
+            The agent module
+        """
+        module = self._modules.get(agent_name)
+        if module is not None:
+            return module
+
+        with self._load_lock:
+            if agent_name not in self._modules:
+                _ensure_agents_path()
+                start = time.perf_counter()
+                self._modules[agent_name] = importlib.import_module(_module_name(self.agent_paths[agent_name]))
+                self._record(agent_name, import_seconds=time.perf_counter() - start)
+            return self._modules[agent_name]
+
+    def _call(self, agent_name: str, query: str, context: Optional[Dict[str, Any]] = None,
+              system_prompt: str = "") -> str:
+        module = self.load(agent_name)
+        start = time.perf_counter()
+        response = _invoke(module, query, context, system_prompt)
+        self._record(agent_name, call_seconds=time.perf_counter() - start)
+        return response
+
+    def _record(self, agent_name: str, import_seconds: float = 0.0, call_seconds: Optional[float] = None):
+        with self._stats_lock:
+            stats = self._stats.setdefault(agent_name, {"cold_start_seconds": 0.0, "calls": []})
+            stats["cold_start_seconds"] += import_seconds
+            if call_seconds is not None:
+                stats["calls"].append(call_seconds)
+
+    def submit(self, agent_name: str, query: str, context: Optional[Dict[str, Any]] = None,
+               system_prompt: str = "") -> concurrent.futures.Future:
+        """
+        Schedule an agent call on the pool
+
+        Args:
+            agent_name: Registered agent name
+            query: Query passed to the agent's process_user_query
+            context: Optional structured upstream results, passed to agents
+                whose process_user_query accepts a `context` argument
+            system_prompt: Optional system prompt for the agent
+
+        Returns:
+            Future resolving to the agent's response
+        """
+        if self.isolation == "process":
+            call: Dict[str, Any] = {"worker": None, "cancelled": False}
+            future = self._pool.submit(self._process_call, call, _module_name(self.agent_paths[agent_name]), query,
+                                       context, system_prompt)
+            with self._workers_lock:
+                if not future.done():
+                    self._calls[future] = call
+            future.add_done_callback(self._forget_call)
+            return future
+
+        return self._pool.submit(self._call, agent_name, query, context, system_prompt)
+
+    def _process_call(self, call: Dict[str, Any], module_name: str, query: str,
+                      context: Optional[Dict[str, Any]], system_prompt: str = "") -> Tuple[str, float, float]:
+        """Run one call on a warm worker that no other call uses meanwhile"""
+        with self._workers_lock:
+            if call["cancelled"]:
+                raise AgentCancelledError("Call was cancelled")
+            worker = self._idle_workers.pop() if self._idle_workers else None
+        if worker is None or not worker.alive():
+            worker = _Worker()
+        with self._workers_lock:
+            call["worker"] = worker
+            cancelled = call["cancelled"]
+        if cancelled:
+            worker.stop()
+            raise AgentCancelledError("Call was cancelled")
+
+        try:
+            response = worker.call(module_name, query, context, system_prompt)
+        except AgentCancelledError:
+            worker.stop()
+            raise
+        with self._workers_lock:
+            if not call["cancelled"] and worker.alive() and len(self._idle_workers) < self.max_workers:
+                self._idle_workers.append(worker)
+                worker = None
+        if worker is not None:
+            worker.stop(wait=False)
+        return response
+
+    def _forget_call(self, future: concurrent.futures.Future):
+        with self._workers_lock:
+            self._calls.pop(future, None)
+
+    def result(self, agent_name: str, future: concurrent.futures.Future, timeout: Optional[float] = None) -> str:
+        """
+        Wait for a submitted call, cancelling it if it exceeds the agent's timeout
+
+        Raises:
+            AgentTimeoutError: If the agent did not answer in time
+        """
+        timeout = timeout if timeout is not None else self.timeouts.get(agent_name, self.default_timeout)
+        try:
+            response = future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            self.cancel(future)
+            raise AgentTimeoutError(f"Agent '{agent_name}' timed out after {timeout:.1f}s")
+
+        if self.isolation == "process":
+            response, import_seconds, call_seconds = response
+            self._record(agent_name, import_seconds, call_seconds)
+        return response
+
+    def run(self, agent_name: str, query: str, timeout: Optional[float] = None, system_prompt: str = "") -> str:
+        """
+        Run an agent and wait for its response
+
+        Args:
+            agent_name: Registered agent name
+            query: Query passed to the agent's process_user_query
+            timeout: Optional timeout override in seconds
+            system_prompt: Optional system prompt for the agent
+
+        Returns:
+            Agent's response
+        """
+        return self.result(agent_name, self.submit(agent_name, query, system_prompt=system_prompt), timeout)
+
+    def cancel(self, future: concurrent.futures.Future):
+        """
+        Cancel a call. Calls that have not started are dropped; a running call in
+        process mode is stopped by terminating the one worker serving it, so other
+        calls carry on. Threads cannot be interrupted, so a running in-process call
+        is abandoned and its result discarded.
+        """
+        if future.cancel() or self.isolation != "process":
+            return
+
+        with self._workers_lock:
+            call = self._calls.get(future)
+            if call is None:
+                return
+            call["cancelled"] = True
+            worker = call["worker"]
+        if worker is not None:
+            worker.terminate()
+
+    def latency_report(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize cold-start and warm-call latency per agent
+
+        Returns:
+            Dictionary keyed by agent name with times in milliseconds
+        """
+        report = {}
+        with self._stats_lock:
+            for agent_name, stats in self._stats.items():
+                calls = stats["calls"]
+                warm = calls[1:]
+                report[agent_name] = {
+                    "cold_start_ms": round(stats["cold_start_seconds"] * 1000, 2),
+                    "first_call_ms": round(calls[0] * 1000, 2) if calls else None,
+                    "warm_calls": len(warm),
+                    "warm_mean_ms": round(statistics.mean(warm) * 1000, 2) if warm else None,
+                    "warm_max_ms": round(max(warm) * 1000, 2) if warm else None
+                }
+        return report
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker pool, cancelling anything still queued"""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+        with self._workers_lock:
+            workers, self._idle_workers = self._idle_workers, []
+            running = [call["worker"] for call in self._calls.values() if call["worker"] is not None]
+        for worker in workers:
+            worker.stop(wait=wait)
+        for worker in running:
+            worker.terminate()
+
+def benchmark(runtime: AgentRuntime, agent_names: List[str], query: str, repeats: int = 5) -> Dict[str, Dict[str, Any]]:
+    """
+    Compare spawning `python agent.py` per call against the persistent runtime
+
+    Returns:
+        Dictionary keyed by agent name with subprocess and runtime timings
+    """
+    results = {}
+    for agent_name in agent_names:
+        if not runtime.has_agent(agent_name):
+            continue
+
+        start = time.perf_counter()
+        subprocess.run([sys.executable, runtime.agent_paths[agent_name], "--prompt", query],
+                       capture_output=True, text=True)
+        subprocess_ms = (time.perf_counter() - start) * 1000
+
+        for _ in range(repeats):
+            runtime.run(agent_name, query)
+
+        results[agent_name] = {"subprocess_ms": round(subprocess_ms, 2)}
+        results[agent_name].update(runtime.latency_report().get(agent_name, {}))
+
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='FlexTime Agent Runtime')
+    parser.add_argument('-p', '--prompt', type=str, default="help", help='Query to send to each agent')
+    parser.add_argument('-a', '--agents', type=str, nargs='*', help='Agents to benchmark (default: all available)')
+    parser.add_argument('-n', '--repeats', type=int, default=5, help='Runtime calls per agent')
+    parser.add_argument('--isolation', type=str, choices=ISOLATION_MODES, default="thread", help='Execution mode')
+
+    args = parser.parse_args()
+
+    _ensure_agents_path()
+    from head_coach_agent import AGENT_PATHS
+
+    runtime = AgentRuntime(AGENT_PATHS, isolation=args.isolation)
+    agent_names = args.agents or [name for name in AGENT_PATHS if runtime.has_agent(name)]
+
+    try:
+        print(json.dumps(benchmark(runtime, agent_names, args.prompt, args.repeats), indent=2))
+    finally:
+        runtime.shutdown()
+
+if __name__ == "__main__":
+    main()
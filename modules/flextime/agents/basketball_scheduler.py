@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Basketball Scheduler
+
+Generates complete men's and women's basketball conference schedules from the
+rules recorded in historical_patterns_agent: the number of conference games,
+9 home and 9 away, travel partners, traditional game days and the
+back-to-back away limit.
+
+Construction: each travel-partner pair is a pod. A round robin of pods gives
+two-date blocks in which one pod meets another (four games), so a visiting
+team can play both partners on one trip; a rematch block and two partner
+dates complete the schedule. A simulated-annealing repair then orders the
+blocks and sets venues until every team is balanced and within the away
+limit, keeping as many partner trips and as few travel miles as it can.
+Randomized restarts run on a process pool and the best schedules under a
+scoring function are kept.
+
+Part of the XII-OS FlexTime module.
+"""
+
+import sys
+import json
+import argparse
+import datetime
+import functools
+from typing import Dict, List, Any, Optional, Callable
+
+import numpy as np
+
+import distance_engine
+import scheduling_core
+from historical_patterns_agent import SPORT_TRADITIONAL_PARAMETERS
+
+BASKETBALL_SPORTS = ["mbasketball", "wbasketball"]
+DEFAULT_SEASON_START = "01-03"  # conference play opens in early January
+
+# Search settings
+DEFAULT_RESTARTS = 4
+DEFAULT_KEEP = 3
+DEFAULT_ITERATIONS = 15000      # annealing moves per restart
+REPAIR_TEMPERATURE = 0.5        # repair phase, in hard violations
+MIN_REPAIR_TEMPERATURE = 0.05
+REPAIR_ITERATIONS = 4000        # moves before a stalled repair starts over
+REPAIR_COOLING = 0.9995
+INITIAL_TEMPERATURE = 2000.0    # travel phase, in miles
+FINAL_TEMPERATURE = 5.0
+
+PARTNER_TRIP_BONUS = 300.0      # miles credited per road trip that plays both travel partners
+
+class PodSchedule:
+    """Games of a pod-structured schedule as arrays, with block order and venues as the search state"""
+
+    def __init__(self, teams: List[str], blocks: List[int], gx: np.ndarray, gy: np.ndarray,
+                 block: np.ndarray, offset: np.ndarray, link: np.ndarray, meeting: np.ndarray):
+        """
+        Args:
+            teams: Team codes; teams 2p and 2p + 1 are travel partners
+            blocks: Number of dates in each block
+            gx, gy: Team indices of each game (gx hosts unless the venue is flipped)
+            block: Block of each game
+            offset: Date of each game within its block (0 or 1)
+            link: Game that must be played at the other venue (-1 for none)
+            meeting: Pod meeting of each game (-1 for partner games)
+        """
+        self.teams = teams
+        self.blocks = np.array(blocks)
+        self.gx, self.gy = gx, gy
+        self.block, self.offset = block, offset
+        self.link, self.meeting = link, meeting
+        self.T = len(teams)
+        self.S = int(self.blocks.sum())
+        self.pair_blocks = np.flatnonzero(self.blocks == 2)
+        # One game on each date of every two-date block, to locate the block's first date
+        self.pair_games = np.array([[np.flatnonzero((block == b) & (offset == k))[0] for k in (0, 1)]
+                                    for b in self.pair_blocks])
+        # Games whose venue can be set directly; linked games follow them
+        self.free = np.flatnonzero((link == -1) | (link > np.arange(len(gx))))
+
+    def slots(self, order: np.ndarray, flip: np.ndarray) -> np.ndarray:
+        """Date index of every game for a block order and per-block date flips"""
+        start = np.empty(len(self.blocks), dtype=np.int64)
+        start[order] = np.concatenate([[0], np.cumsum(self.blocks[order])[:-1]])
+        return start[self.block] + (self.offset ^ flip[self.block])
+
+    def evaluate(self, order: np.ndarray, flip: np.ndarray, venue: np.ndarray,
+                 distances: np.ndarray, limit: int) -> Dict[str, Any]:
+        """
+        Score a block order, per-block date flips and per-game venue flips
+
+        Returns:
+            Dictionary with "hard" violations (home games off balance plus away
+            games beyond the limit), partner "trips", "miles", the soft "cost"
+            and the (teams, dates) "home" array
+        """
+        slot = self.slots(order, flip)
+        host = np.where(venue, self.gy, self.gx)
+        guest = np.where(venue, self.gx, self.gy)
+
+        home = np.zeros((self.T, self.S), dtype=bool)
+        home[host, slot] = True
+        location = np.empty((self.T, self.S), dtype=np.int64)
+        location[host, slot] = host
+        location[guest, slot] = host
+
+        away = ~home
+        hard = (np.abs(home.sum(axis=1) - self.S // 2).sum()
+                + scheduling_core.road_streak_excess(away, limit).sum())
+        first = slot[self.pair_games].min(axis=1)
+        trips = (away[:, first] & away[:, first + 1]).sum()
+
+        teams = np.arange(self.T)
+        miles = (distances[teams, location[:, 0]].sum() + distances[location[:, :-1], location[:, 1:]].sum()
+                 + distances[location[:, -1], teams].sum())
+
+        return {"hard": int(hard), "trips": int(trips), "miles": float(miles),
+                "cost": float(miles - PARTNER_TRIP_BONUS * trips), "home": home}
+
+def build_pod_schedule(partners: List[List[str]], rng: np.random.Generator) -> PodSchedule:
+    """
+    Lay out every game of a pod-structured schedule
+
+    Pods meet in a circle-method round robin, one two-date block per round;
+    a random pairing of pods meets again in a rematch block at the opposite
+    venues, and partners meet on two single dates, once at each venue.
+
+    Args:
+        partners: Travel-partner pairs (an even number of pairs)
+        rng: Random generator used to shuffle pods and partner order
+    """
+    pods = [list(pair) for pair in partners]
+    rng.shuffle(pods)
+    for pod in pods:
+        rng.shuffle(pod)
+    teams = [team for pod in pods for team in pod]
+    n = len(pods)
+
+    gx, gy, block, offset, link, meeting = [], [], [], [], [], []
+    blocks = []
+    first_meeting = {}
+
+    def add(x, y, b, k, linked=-1, m=-1):
+        gx.append(x); gy.append(y); block.append(b); offset.append(k); link.append(linked); meeting.append(m)
+        return len(gx) - 1
+
+    def meet(p, q, b, rematch=False):
+        m = max(meeting, default=-1) + 1
+        p, q = min(p, q), max(p, q)
+        for k, (x, y) in enumerate([((2 * p, 2 * q), (2 * p + 1, 2 * q + 1)), ((2 * p, 2 * q + 1), (2 * p + 1, 2 * q))]):
+            for a, c in (x, y):
+                if rematch:
+                    original = first_meeting[(a, c)]
+                    link[original] = add(a, c, b, k, original, m)
+                else:
+                    first_meeting[(a, c)] = add(a, c, b, k, -1, m)
+
+    rotation = list(range(1, n))
+    for _ in range(n - 1):
+        lineup = [0] + rotation
+        b = len(blocks)
+        blocks.append(2)
+        for k in range(n // 2):
+            meet(lineup[k], lineup[n - 1 - k], b)
+        rotation = rotation[-1:] + rotation[:-1]
+
+    pairing = rng.permutation(n)
+    b = len(blocks)
+    blocks.append(2)
+    for k in range(0, n, 2):
+        meet(int(pairing[k]), int(pairing[k + 1]), b, rematch=True)
+
+    blocks += [1, 1]
+    for p in range(n):
+        first = add(2 * p, 2 * p + 1, b + 1, 0)
+        link[first] = add(2 * p, 2 * p + 1, b + 2, 0, first)
+
+    as_array = lambda values: np.array(values, dtype=np.int64)
+    return PodSchedule(teams, blocks, as_array(gx), as_array(gy), as_array(block), as_array(offset),
+                       as_array(link), as_array(meeting))
+
+def _initial_state(problem: PodSchedule, rng: np.random.Generator):
+    """Random block order with whole-pod trips and random hosts"""
+    order = rng.permutation(len(problem.blocks))
+    flip = np.zeros(len(problem.blocks), dtype=np.int64)
+    venue = np.zeros(len(problem.gx), dtype=bool)
+    hosts = rng.random(problem.meeting.max() + 1) < 0.5
+    free_meeting = problem.meeting[problem.free]
+    venue[problem.free] = hosts[free_meeting] & (free_meeting >= 0)
+    linked = problem.free[problem.link[problem.free] >= 0]
+    venue[problem.link[linked]] = ~venue[linked]
+    return order, flip, venue
+
+def _propose(problem: PodSchedule, rng: np.random.Generator, order: np.ndarray, flip: np.ndarray, venue: np.ndarray):
+    """
+    Random neighbor: swap two blocks, swap the dates of a two-date block, or
+    flip the venue of one game or a whole pod meeting (linked games follow)
+    """
+    move = rng.random()
+    if move < 0.25:
+        i, j = rng.choice(len(order), 2, replace=False)
+        order = order.copy()
+        order[i], order[j] = order[j], order[i]
+    elif move < 0.4:
+        flip = flip.copy()
+        flip[rng.choice(problem.pair_blocks)] ^= 1
+    else:
+        if move < 0.8:
+            games = rng.choice(problem.free, 1)
+        else:
+            games = problem.free[problem.meeting[problem.free] == rng.integers(problem.meeting.max() + 1)]
+        venue = venue.copy()
+        venue[games] = ~venue[games]
+        linked = games[problem.link[games] >= 0]
+        venue[problem.link[linked]] = ~venue[linked]
+    return order, flip, venue
+
+def anneal_schedule(partners: List[List[str]], distances: Dict[str, Dict[str, float]], limit: int,
+                    iterations: int, seed: int) -> Optional[Dict[str, Any]]:
+    """
+    One randomized restart: build a pod schedule, repair it to feasibility,
+    then anneal travel among feasible schedules
+
+    A repair that stalls for REPAIR_ITERATIONS moves starts over from a new
+    random layout; every move counts against the same budget.
+
+    Args:
+        partners: Travel-partner pairs
+        distances: Road miles between teams
+        limit: Away games allowed in a row
+        iterations: Annealing moves across both phases
+        seed: Random seed
+
+    Returns:
+        Candidate schedule with games by round and metrics, or None if no feasible schedule was found
+    """
+    rng = np.random.default_rng(seed)
+    used = 0
+    current = None
+    while used < iterations and (current is None or current["hard"] > 0):
+        problem = build_pod_schedule(partners, rng)
+        D = np.array([[distances[a][b] if a != b else 0.0 for b in problem.teams] for a in problem.teams])
+        order, flip, venue = _initial_state(problem, rng)
+
+        # Repair: anneal on the number of hard violations alone
+        current = problem.evaluate(order, flip, venue, D, limit)
+        temperature = REPAIR_TEMPERATURE
+        for _ in range(min(REPAIR_ITERATIONS, iterations - used)):
+            if current["hard"] == 0:
+                break
+            used += 1
+            new_order, new_flip, new_venue = _propose(problem, rng, order, flip, venue)
+            candidate = problem.evaluate(new_order, new_flip, new_venue, D, limit)
+            delta = candidate["hard"] - current["hard"]
+            if delta <= 0 or rng.random() < np.exp(-delta / temperature):
+                order, flip, venue, current = new_order, new_flip, new_venue, candidate
+            temperature = max(MIN_REPAIR_TEMPERATURE, temperature * REPAIR_COOLING)
+
+    if current is None or current["hard"] > 0:
+        return None
+
+    # Improve: anneal travel, never leaving the feasible region
+    best = dict(current, order=order, flip=flip, venue=venue)
+    remaining = iterations - used
+    cooling = (FINAL_TEMPERATURE / INITIAL_TEMPERATURE) ** (1.0 / max(remaining, 1))
+    temperature = INITIAL_TEMPERATURE
+    for _ in range(remaining):
+        new_order, new_flip, new_venue = _propose(problem, rng, order, flip, venue)
+        candidate = problem.evaluate(new_order, new_flip, new_venue, D, limit)
+        delta = candidate["cost"] - current["cost"]
+        if candidate["hard"] == 0 and (delta <= 0 or rng.random() < np.exp(-delta / temperature)):
+            order, flip, venue, current = new_order, new_flip, new_venue, candidate
+            if current["cost"] < best["cost"]:
+                best = dict(current, order=order, flip=flip, venue=venue)
+        temperature *= cooling
+
+    slot = problem.slots(best["order"], best["flip"])
+    host = np.where(best["venue"], problem.gy, problem.gx)
+    guest = np.where(best["venue"], problem.gx, problem.gy)
+    home = best["home"]
+
+    return {
+        "seed": seed,
+        "games": sorted(
+            [{"round": int(s) + 1, "home_team": problem.teams[h], "away_team": problem.teams[a]}
+             for s, h, a in zip(slot, host, guest)],
+            key=lambda game: (game["round"], game["home_team"])
+        ),
+        "metrics": {
+            "total_miles": round(best["miles"], 1),
+            "partner_trips": best["trips"],
+            "max_consecutive_away": int(scheduling_core.max_road_streak(~home).max()),
+            "home_games": {team: int(n) for team, n in zip(problem.teams, home.sum(axis=1))}
+        }
+    }
+
+def default_score(candidate: Dict[str, Any]) -> float:
+    """Travel miles less a bonus for every road trip that plays both travel partners"""
+    return candidate["metrics"]["total_miles"] - PARTNER_TRIP_BONUS * candidate["metrics"]["partner_trips"]
+
+def generate_conference_schedules(sport: str = "mbasketball", start_date: Optional[str] = None,
+                                  restarts: int = DEFAULT_RESTARTS, keep: int = DEFAULT_KEEP,
+                                  iterations: int = DEFAULT_ITERATIONS, workers: Optional[int] = None,
+                                  seed: Optional[int] = None,
+                                  score: Optional[Callable[[Dict[str, Any]], float]] = None,
+                                  matrix: Optional[distance_engine.DistanceMatrix] = None) -> Dict[str, Any]:
+    """
+    Generate complete basketball conference schedules
+
+    Args:
+        sport: "mbasketball" or "wbasketball"
+        start_date: First possible game date (defaults to the next early January)
+        restarts: Independent randomized searches
+        keep: Number of best schedules to return
+        iterations: Annealing moves per restart
+        workers: Worker processes (defaults to the CPU count, at most 4)
+        seed: Base random seed
+        score: Function schedule -> score, lower is better (defaults to default_score)
+        matrix: Distance matrix (defaults to the shared one)
+
+    Returns:
+        Dictionary with the best "schedules" (games with round, date and day;
+        metrics; score; seed) and "search" statistics
+
+    Raises:
+        ValueError: If the sport's parameters do not fit the pod structure
+    """
+    if sport not in BASKETBALL_SPORTS:
+        raise ValueError(f"Unsupported sport for the basketball scheduler: {sport}")
+    params = SPORT_TRADITIONAL_PARAMETERS[sport]["parameters"]
+    partners = params["travel_partners"]
+    games_per_team = params["conference_games"]
+    if len(partners) % 2 or games_per_team != 2 * len(partners) + 2:
+        raise ValueError(f"{len(partners)} travel-partner pairs cannot produce {games_per_team} games per team")
+
+    teams = [team for pair in partners for team in pair]
+    matrix = matrix or distance_engine.get_distance_matrix()
+    distances = matrix.as_dict(teams)
+    limit = params["back_to_back_away_limit"]
+    base_seed = seed if seed is not None else int(np.random.SeedSequence().entropy % (2 ** 31))
+
+    search = functools.partial(anneal_schedule, partners, distances, limit, iterations)
+    best, stats = scheduling_core.run_restarts(search, [base_seed + n for n in range(restarts)],
+                                               score or default_score, keep, workers)
+
+    dates = scheduling_core.game_dates(start_date or scheduling_core.next_season_date(DEFAULT_SEASON_START),
+                                       games_per_team, params["typical_game_days"])
+    for candidate in best:
+        for game in candidate["games"]:
+            game["date"] = dates[game["round"] - 1]
+            game["day"] = scheduling_core.WEEKDAYS[datetime.date.fromisoformat(game["date"]).weekday()]
+            game["sport"] = sport
+
+    return {"sport": sport, "schedules": best, "search": stats}
+
+def main():
+    parser = argparse.ArgumentParser(description='FlexTime Basketball Scheduler')
+    parser.add_argument('-s', '--sport', type=str, default="mbasketball", choices=BASKETBALL_SPORTS, help='Sport code')
+    parser.add_argument('--start', type=str, help='First possible game date (YYYY-MM-DD)')
+    parser.add_argument('-r', '--restarts', type=int, default=DEFAULT_RESTARTS, help='Randomized restarts')
+    parser.add_argument('-k', '--keep', type=int, default=DEFAULT_KEEP, help='Schedules to keep')
+    parser.add_argument('-w', '--workers', type=int, help='Worker processes')
+    parser.add_argument('--seed', type=int, help='Random seed')
+
+    args = parser.parse_args()
+
+    result = generate_conference_schedules(args.sport, args.start, args.restarts, args.keep,
+                                           workers=args.workers, seed=args.seed)
+    if not result["schedules"]:
+        print("No feasible schedule found; try more restarts", file=sys.stderr)
+    print(json.dumps(result, indent=2))
+
+if __name__ == "__main__":
+    main()
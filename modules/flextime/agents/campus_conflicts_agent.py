@@ -12,16 +12,22 @@ import os
 import sys
 import json
 import argparse
-import datetime
 import subprocess
 from typing import Dict, List, Any, Optional, Union
 
+import conflict_engine
+import slot_finder
+import venue_catalog
+import scheduling_core
+import agent_runtime
+import scheduling_constraints
+
 # FlexTime configuration
 FLEXTIME_VERSION = "1.0.0"
 FLEXTIME_MODULE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 AGENTS_PATH = os.path.dirname(os.path.abspath(__file__))
 SCHEDULING_DATA_PATH = "/Users/nickthequick/XII-OS/data/scheduling_data"
-VENUE_DATA_PATH = "/Users/nickthequick/XII-OS/data/venue_data/big12_venues.json"
+VENUE_DATA_PATH = venue_catalog.VENUE_DATA_PATH
 
 # Big 12 Conference constants
 BIG12_SCHOOLS = [
@@ -36,28 +42,14 @@ SCHEDULING_SPORTS = [
     "gymnastics", "lacrosse"
 ]
 
-# Load venue data from the centralized JSON file
 def load_venue_data() -> Dict[str, Any]:
     """
-    Load venue data from the centralized JSON file
+    Get venue data from the shared venue catalog
     
     Returns:
         Dictionary containing venue data for all schools
     """
-    try:
-        if os.path.exists(VENUE_DATA_PATH):
-            with open(VENUE_DATA_PATH, 'r') as f:
-                venue_data = json.load(f)
-            return venue_data
-        else:
-            print(f"Warning: Venue data file not found at {VENUE_DATA_PATH}", file=sys.stderr)
-            return {"schools": {}}
-    except Exception as e:
-        print(f"Error loading venue data: {str(e)}", file=sys.stderr)
-        return {"schools": {}}
-
-# Fall back to hardcoded values if venue data file cannot be loaded
-VENUE_DATA = load_venue_data()
+    return venue_catalog.get_catalog().data
 
 # Venue configurations and setup times (in hours) - fallback if venue data not available
 VENUE_SETUP_TIMES = {
@@ -193,11 +185,9 @@ def identify_venue_for_event(school_code: str, sport: str) -> str:
         Name of the venue or empty string if not found
     """
     # Try to get venue from centralized venue data
-    if "schools" in VENUE_DATA and school_code in VENUE_DATA["schools"]:
-        school_venues = VENUE_DATA["schools"][school_code]["venues"]
-        for venue in school_venues:
-            if sport in venue["sports"]:
-                return venue["name"]
+    venue = venue_catalog.get_catalog().venue_for(school_code, sport)
+    if venue:
+        return venue["name"]
     
     # Fall back to hardcoded data if not found
     if school_code not in SHARED_VENUES:
@@ -221,11 +211,9 @@ def get_venue_info(school_code: str, venue_name: str) -> Dict[str, Any]:
         Venue information dictionary
     """
     # Try to get venue info from centralized venue data
-    if "schools" in VENUE_DATA and school_code in VENUE_DATA["schools"]:
-        school_venues = VENUE_DATA["schools"][school_code]["venues"]
-        for venue in school_venues:
-            if venue["name"] == venue_name:
-                return venue
+    venue = venue_catalog.get_catalog().venue(school_code, venue_name)
+    if venue:
+        return venue
     
     # Fall back to hardcoded data
     if school_code in SHARED_VENUES and venue_name in SHARED_VENUES[school_code]:
@@ -254,11 +242,9 @@ def get_transition_time(from_sport: str, to_sport: str, school_code: str = None,
     
     # Check venue-specific transition times if venue info provided
     if school_code and venue_name:
-        venue_info = get_venue_info(school_code, venue_name)
-        if venue_info and "transition_times" in venue_info:
-            transition_key = f"{from_sport}_to_{to_sport}"
-            if transition_key in venue_info["transition_times"]:
-                return venue_info["transition_times"][transition_key]
+        venue_hours = venue_catalog.get_catalog().transition_hours(school_code, venue_name, from_sport, to_sport)
+        if venue_hours is not None:
+            return venue_hours
     
     # Fall back to global transition times
     transition_key = f"{from_sport}_to_{to_sport}"
@@ -272,182 +258,170 @@ def detect_conflicts(schedules: Dict[str, List[Dict[str, Any]]]) -> List[Dict[st
     """
     Detect venue conflicts across all schedules
     
+    Events may carry optional "end_date", "setup_minutes" and "teardown_minutes"
+    fields; events that run past midnight are compared against the next day's events.
+    
     Args:
         schedules: Dictionary mapping sport codes to lists of scheduled events
     
     Returns:
         List of identified conflicts
     """
-    conflicts = []
+    return conflict_engine.detect_conflicts(schedules, identify_venue_for_event, get_transition_time)
+
+def create_conflict_session(schedules: Dict[str, List[Dict[str, Any]]]) -> conflict_engine.ConflictSession:
+    """
+    Create a stateful conflict session for interactive what-if edits
     
-    # Create a map of venue usage by day and time
-    venue_usage = {}
+    Args:
+        schedules: Dictionary mapping sport codes to lists of scheduled events
     
-    # First pass: organize events by venue, date, and time
-    for sport, events in schedules.items():
-        for event in events:
-            # Extract essential information
-            home_school = event.get("home_team")
-            event_date = event.get("date")
-            start_time = event.get("start_time")
-            end_time = event.get("end_time", "")  # End time might not be specified
-            
-            # If no end time, estimate based on sport type
-            if not end_time:
-                # Assume 2 hours for most sports, 3 for football
-                duration = 3 if sport == "football" else 2
-                # Parse start time and add duration
-                try:
-                    start_dt = datetime.datetime.strptime(start_time, "%H:%M")
-                    end_dt = start_dt + datetime.timedelta(hours=duration)
-                    end_time = end_dt.strftime("%H:%M")
-                except:
-                    # If time parsing fails, use a default end time
-                    end_time = "23:59"
-            
-            # Only care about home games (they use the venue)
-            if home_school and event_date and start_time:
-                venue = identify_venue_for_event(home_school, sport)
-                if venue:
-                    # Create venue usage entry
-                    venue_key = f"{home_school}:{venue}"
-                    date_key = event_date
-                    
-                    if venue_key not in venue_usage:
-                        venue_usage[venue_key] = {}
-                    
-                    if date_key not in venue_usage[venue_key]:
-                        venue_usage[venue_key][date_key] = []
-                    
-                    # Add this event to the venue usage
-                    venue_usage[venue_key][date_key].append({
-                        "sport": sport,
-                        "start_time": start_time,
-                        "end_time": end_time,
-                        "event_id": event.get("id", ""),
-                        "description": event.get("description", "")
-                    })
-    
-    # Second pass: detect conflicts in the venue usage
-    for venue_key, dates in venue_usage.items():
-        school_code, venue_name = venue_key.split(":")
-        
-        for date, events in dates.items():
-            # Sort events by start time
-            events.sort(key=lambda x: x["start_time"])
-            
-            # Check for same-day conflicts
-            if len(events) > 1:
-                # Check each pair of events
-                for i in range(len(events)):
-                    for j in range(i+1, len(events)):
-                        event1 = events[i]
-                        event2 = events[j]
-                        
-                        sport1 = event1["sport"]
-                        sport2 = event2["sport"]
-                        
-                        # Same sport, different genders for tennis (soft conflict)
-                        if (sport1 == "mtennis" and sport2 == "wtennis") or (sport1 == "wtennis" and sport2 == "mtennis"):
-                            # This is a soft conflict - men's and women's tennis should preferably be on different days
-                            conflicts.append({
-                                "type": "soft_conflict",
-                                "school": school_code,
-                                "venue": venue_name,
-                                "date": date,
-                                "sport1": sport1,
-                                "sport2": sport2,
-                                "event1_time": f"{event1['start_time']}-{event1['end_time']}",
-                                "event2_time": f"{event2['start_time']}-{event2['end_time']}",
-                                "reason": "Men's and Women's Tennis preferably scheduled on different days",
-                                "severity": "Medium",
-                                "recommendation": "Consider scheduling tennis events on separate days if possible"
-                            })
-                        
-                        # Check if event times overlap
-                        elif event1["end_time"] > event2["start_time"]:
-                            # Hard conflict - overlapping times
-                            conflicts.append({
-                                "type": "hard_conflict",
-                                "school": school_code,
-                                "venue": venue_name,
-                                "date": date,
-                                "sport1": sport1,
-                                "sport2": sport2,
-                                "event1_time": f"{event1['start_time']}-{event1['end_time']}",
-                                "event2_time": f"{event2['start_time']}-{event2['end_time']}",
-                                "reason": "Events have overlapping times",
-                                "severity": "High",
-                                "recommendation": "Reschedule one event to different day or time"
-                            })
-                        else:
-                            # Check if there's enough transition time between events
-                            start_time2 = datetime.datetime.strptime(event2["start_time"], "%H:%M")
-                            end_time1 = datetime.datetime.strptime(event1["end_time"], "%H:%M")
-                            
-                            # Calculate hours between end of first event and start of second
-                            hours_between = (start_time2 - end_time1).total_seconds() / 3600
-                            
-                            # Get required transition time
-                            required_transition = get_transition_time(sport1, sport2, school_code, venue_name)
-                            
-                            if hours_between < required_transition:
-                                # Hard conflict - insufficient transition time
-                                conflicts.append({
-                                    "type": "hard_conflict",
-                                    "school": school_code,
-                                    "venue": venue_name,
-                                    "date": date,
-                                    "sport1": sport1,
-                                    "sport2": sport2,
-                                    "event1_time": f"{event1['start_time']}-{event1['end_time']}",
-                                    "event2_time": f"{event2['start_time']}-{event2['end_time']}",
-                                    "reason": f"Insufficient transition time ({hours_between:.1f} hours, need {required_transition} hours)",
-                                    "severity": "High",
-                                    "recommendation": f"Reschedule to allow {required_transition} hours between events"
-                                })
-                            elif hours_between < required_transition + 1:
-                                # Soft conflict - tight transition time
-                                conflicts.append({
-                                    "type": "soft_conflict",
-                                    "school": school_code,
-                                    "venue": venue_name,
-                                    "date": date,
-                                    "sport1": sport1,
-                                    "sport2": sport2,
-                                    "event1_time": f"{event1['start_time']}-{event1['end_time']}",
-                                    "event2_time": f"{event2['start_time']}-{event2['end_time']}",
-                                    "reason": f"Tight transition time ({hours_between:.1f} hours)",
-                                    "severity": "Medium",
-                                    "recommendation": f"Consider adding buffer time if possible"
-                                })
-                            
-                            # Check for possible doubleheader opportunities (except for tennis)
-                            if ((sport1 == "mbasketball" and sport2 == "wbasketball") or 
-                                (sport1 == "wbasketball" and sport2 == "mbasketball")):
-                                # Basketball doubleheader opportunity
-                                conflicts.append({
-                                    "type": "doubleheader_opportunity",
-                                    "school": school_code,
-                                    "venue": venue_name,
-                                    "date": date,
-                                    "sport1": sport1,
-                                    "sport2": sport2,
-                                    "event1_time": f"{event1['start_time']}-{event1['end_time']}",
-                                    "event2_time": f"{event2['start_time']}-{event2['end_time']}",
-                                    "reason": "Potential basketball doubleheader",
-                                    "severity": "Opportunity",
-                                    "recommendation": "Consider marketing as doubleheader event"
-                                })
+    Returns:
+        ConflictSession holding the season and its conflicts; move_event, add_event
+        and remove_event return the conflicts added and removed by each edit
+    """
+    return conflict_engine.ConflictSession(schedules, identify_venue_for_event, get_transition_time)
+
+def create_slot_finder(schedules: Dict[str, List[Dict[str, Any]]]) -> slot_finder.SlotFinder:
+    """
+    Create a slot finder over a full season
+    
+    Args:
+        schedules: Dictionary mapping sport codes to lists of scheduled events
     
+    Returns:
+        SlotFinder indexing each venue's busy intervals and each team's game days;
+        slots on dates the campus calendars rule out are never proposed
+    """
+    return slot_finder.SlotFinder(schedules, identify_venue_for_event, get_transition_time,
+                                  constraints=scheduling_constraints.get_constraints())
+
+# Soft calendar planes reported for home and away games
+CALENDAR_WARNINGS = {
+    "avoid_home": "home",
+    "exam": "any"
+}
+
+def detect_calendar_conflicts(schedules: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Check every game against the compiled campus calendars
+    
+    Games on a date the host cannot host or the visitor cannot play are hard
+    conflicts; home games on dates a school asked to avoid and games during
+    a school's exams are soft conflicts.
+    
+    Args:
+        schedules: Dictionary mapping sport codes to lists of scheduled events
+    
+    Returns:
+        List of calendar conflicts
+    """
+    constraints = scheduling_constraints.get_constraints()
+    if constraints is None:
+        return []
+
+    entries = []
+    for sport, events in schedules.items():
+        for n, event in enumerate(events):
+            if not conflict_engine.parse_day(event.get("date")):
+                continue
+            event_id = event.get("id", f"{sport}-{n + 1}")
+            teams = [(event.get("home_team"), True), (event.get("away_team") or event.get("opponent"), False)]
+            entries += [(sport, event, event_id, school, home) for school, home in teams if school]
+    if not entries:
+        return []
+
+    allowed = constraints.allowed_many([e[3] for e in entries], [e[1]["date"] for e in entries],
+                                       [e[0] for e in entries], [e[4] for e in entries])
+    conflicts = []
+    for (sport, event, event_id, school, home), ok in zip(entries, allowed):
+        conflict = {
+            "school": school,
+            "sport": sport,
+            "date": event["date"],
+            "event_id": event_id,
+            "home": home
+        }
+        if not ok:
+            blocking = constraints.explain(school, event["date"], sport, home)
+            conflicts.append(dict(conflict, type="calendar_conflict", severity="hard",
+                                  description="; ".join(c.description for c in blocking),
+                                  constraints=[c.to_dict() for c in blocking]))
+            continue
+        for plane in constraints.soft_flags(school, event["date"], sport):
+            if CALENDAR_WARNINGS.get(plane) == "any" or (CALENDAR_WARNINGS.get(plane) == "home" and home):
+                conflicts.append(dict(conflict, type="calendar_warning", severity="soft",
+                                      description=f"{plane.replace('_', ' ')} date for {school}"))
     return conflicts
 
-def recommend_conflict_resolution(conflict: Dict[str, Any]) -> Dict[str, Any]:
+def event_to_move(conflict: Dict[str, Any]) -> str:
+    """
+    Pick which event of a conflict should move: the one whose sport has the
+    lower priority at the venue (the first event on a tie)
+    
+    Args:
+        conflict: The conflict information (with event ids)
+    
+    Returns:
+        Event id of the event to move
+    """
+    venue_info = SHARED_VENUES.get(conflict["school"], {}).get(conflict["venue"], {})
+    priority_order = venue_info.get("priority_order", [])
+    
+    sport1_priority = priority_order.index(conflict["sport1"]) if conflict["sport1"] in priority_order else 999
+    sport2_priority = priority_order.index(conflict["sport2"]) if conflict["sport2"] in priority_order else 999
+    
+    return conflict["event2_id"] if sport1_priority < sport2_priority else conflict["event1_id"]
+
+def find_alternative_slots(schedules: Dict[str, List[Dict[str, Any]]], conflict: Dict[str, Any],
+                           k: int = 5, window_days: int = slot_finder.DEFAULT_WINDOW_DAYS,
+                           finder: Optional[slot_finder.SlotFinder] = None) -> List[Dict[str, Any]]:
+    """
+    Find the nearest feasible slots for the lower-priority event of a conflict
+    
+    Args:
+        schedules: Dictionary mapping sport codes to lists of scheduled events
+        conflict: The conflict information, with event ids matching the schedules
+        k: Number of alternatives to return
+        window_days: Search this many days either side of the current date
+        finder: Optional existing SlotFinder for the same schedules
+    
+    Returns:
+        Alternative slots ordered by displacement cost
+    """
+    finder = finder or create_slot_finder(schedules)
+    return finder.find_slots(event_to_move(conflict), k=k, window_days=window_days)
+
+def resolve_hard_conflicts(schedules: Dict[str, List[Dict[str, Any]]], k: int = 3,
+                           window_days: int = slot_finder.DEFAULT_WINDOW_DAYS) -> List[Dict[str, Any]]:
+    """
+    Propose a new slot for every hard conflict in a season
+    
+    Each conflict's lower-priority event is moved into its cheapest slot before
+    the next conflict is handled, so the proposals do not collide with each other.
+    
+    Args:
+        schedules: Dictionary mapping sport codes to lists of scheduled events
+        k: Number of alternatives to keep per conflict
+        window_days: Search this many days either side of each event's date
+    
+    Returns:
+        List of resolutions (conflict, event_id, chosen slot, alternatives)
+    """
+    # The session numbers id-less events the same way the slot finder does
+    conflicts = create_conflict_session(schedules).conflicts()
+    finder = create_slot_finder(schedules)
+    return finder.resolve_conflicts(conflicts, event_to_move, k=k, window_days=window_days)
+
+def recommend_conflict_resolution(conflict: Dict[str, Any],
+                                  schedules: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
     """
     Generate a resolution recommendation for a venue conflict
     
     Args:
         conflict: The conflict information
+        schedules: Optional full schedules; when given, hard conflicts also get
+            concrete alternative slots for the event to move
     
     Returns:
         Resolution recommendations
@@ -504,6 +478,9 @@ def recommend_conflict_resolution(conflict: Dict[str, Any]) -> Dict[str, Any]:
             "priority": 3,
             "rationale": "Some schools have secondary facilities that could be used"
         })
+        
+        if schedules is not None and conflict.get("event1_id") and conflict.get("event2_id"):
+            resolution["alternative_slots"] = find_alternative_slots(schedules, conflict, k=3)
     
     elif conflict["type"] == "soft_conflict":
         # For soft conflicts, provide more flexible recommendations
@@ -570,7 +547,7 @@ def recommend_conflict_resolution(conflict: Dict[str, Any]) -> Dict[str, Any]:
     
     return resolution
 
-def process_user_query(query: str) -> str:
+def _answer_query(query: str) -> str:
     """
     Process a user query related to campus venue conflicts
     
@@ -600,6 +577,29 @@ def process_user_query(query: str) -> str:
         
         return response
     
+    # Check for campus calendar queries (blackouts, exams, graduation)
+    if any(term in query_lower for term in ["blackout", "exam", "graduation", "commencement", "spring break", "campus calendar"]):
+        constraints = scheduling_constraints.get_constraints()
+        schools = [school for school in BIG12_SCHOOLS if school.replace("_", " ") in query_lower]
+        response = "[Campus Calendar Constraints]\n\n"
+        if constraints is None:
+            response += "The campus scheduling sheets could not be read.\n"
+            return response
+        for school in schools or constraints.schools:
+            entries = constraints.for_school(school)
+            if not entries:
+                continue
+            response += f"{school.replace('_', ' ').title()}:\n"
+            for entry in entries:
+                dates = entry.first.isoformat() if entry.first else "every " + ", ".join(
+                    scheduling_core.WEEKDAYS[d] for d in entry.weekdays)
+                if entry.last and entry.last != entry.first:
+                    dates += f" to {entry.last.isoformat()}"
+                label = "HARD" if entry.hard else "soft"
+                response += f"- [{label}] {type(entry).__name__} {dates}: {entry.description}\n"
+            response += "\n"
+        return response
+    
     # Check for tennis-specific queries
     if any(term in query_lower for term in ["tennis", "tennis doubleheader", "men's and women's tennis"]):
         response = "[Tennis Scheduling Policy]\n\n"
@@ -780,6 +780,10 @@ def process_user_query(query: str) -> str:
     
     return response
 
+def process_user_query(query: str, context: Optional[Dict[str, Any]] = None, system_prompt: str = "") -> str:
+    """Process a user query; see agent_runtime.answer_query for context and system_prompt"""
+    return agent_runtime.answer_query(_answer_query, query, context, system_prompt)
+
 def main():
     parser = argparse.ArgumentParser(description='FlexTime Campus Conflicts Agent')
     parser.add_argument('-p', '--prompt', type=str, required=True, help='User prompt/query')
@@ -788,7 +792,7 @@ def main():
     args = parser.parse_args()
     
     # Process the query
-    response = process_user_query(args.prompt)
+    response = process_user_query(args.prompt, system_prompt=args.system_prompt)
     
     # Print the response
     print(response)
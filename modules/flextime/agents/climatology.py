@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Climatology
+
+Long-range weather risk from local historical observations. Each school's
+daily history (data/climatology/<school>.csv or .parquet with columns date,
+precipitation [inches], tmax, tmin [°F] and optionally thunder [0/1]) is
+reduced once to per-day-of-year probabilities of a rain day, a lightning day,
+a freeze and extreme heat. The tables are stored as one uint8 NumPy array of
+percentages keyed on the source files, and memory-mapped on load, so scoring
+any future date is a single array lookup.
+
+Part of the XII-OS FlexTime module.
+"""
+
+import os
+import sys
+import json
+import glob
+import hashlib
+import argparse
+import threading
+from typing import Dict, List, Any, Optional, Iterable
+
+import numpy as np
+import pandas as pd
+
+# FlexTime configuration
+FLEXTIME_VERSION = "1.0.0"
+FLEXTIME_MODULE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_PATH = os.path.join(FLEXTIME_MODULE_PATH, "data", "storage", "cache")
+CLIMATOLOGY_SOURCE_PATH = os.path.join(FLEXTIME_MODULE_PATH, "data", "climatology")
+
+HAZARDS = ["rain", "lightning", "freeze", "heat"]
+RAIN_DAY_INCHES = 0.1   # daily precipitation that counts as a rain day
+FREEZE_F = 32           # daily low at or below which the day counts as a freeze
+EXTREME_HEAT_F = 95     # daily high at or above which the day counts as extreme heat
+SMOOTHING_DAYS = 7      # days either side pooled into each day-of-year estimate
+DAYS_IN_TABLE = 366     # leap-year calendar; Feb 29 is day index 59
+CLIMATE_HIGH_RISK = 50  # % of years with a hazard on a date above which its risk is High
+CLIMATE_MEDIUM_RISK = 25  # % of years with a hazard on a date above which its risk is Medium
+
+def day_of_year_index(dates: Iterable[Any]) -> np.ndarray:
+    """
+    Table row for each date on a 366-day calendar, so a calendar day maps to
+    the same row in leap and common years
+
+    Args:
+        dates: ISO date strings, datetime.date objects or datetime64 values
+    """
+    days = np.asarray(dates, dtype="datetime64[D]")
+    years = days.astype("datetime64[Y]")
+    doy = (days - years).astype(np.int64)
+    year = years.astype(np.int64) + 1970
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    return doy + ((~leap) & (doy >= 59))
+
+def read_history(path: str) -> pd.DataFrame:
+    """Read one school's daily observations from CSV or Parquet"""
+    if path.endswith(".parquet"):
+        frame = pd.read_parquet(path)
+    else:
+        frame = pd.read_csv(path)
+    frame.columns = [column.strip().lower() for column in frame.columns]
+    missing = {"date", "precipitation", "tmax", "tmin"} - set(frame.columns)
+    if missing:
+        raise ValueError(f"{os.path.basename(path)} is missing columns: {', '.join(sorted(missing))}")
+    return frame
+
+def compute_probabilities(history: pd.DataFrame) -> np.ndarray:
+    """
+    Per-day-of-year hazard probabilities for one location
+
+    A day only counts towards a hazard when the relevant observation is present;
+    without a thunder column the lightning probability is 0.
+
+    Returns:
+        uint8 array of shape (DAYS_IN_TABLE, len(HAZARDS)) with percentages
+    """
+    day = day_of_year_index(pd.to_datetime(history["date"]).values)
+    precip = pd.to_numeric(history["precipitation"], errors="coerce").to_numpy(dtype=float)
+    tmax = pd.to_numeric(history["tmax"], errors="coerce").to_numpy(dtype=float)
+    tmin = pd.to_numeric(history["tmin"], errors="coerce").to_numpy(dtype=float)
+    if "thunder" in history:
+        thunder = pd.to_numeric(history["thunder"], errors="coerce").to_numpy(dtype=float)
+    else:
+        thunder = np.full(len(history), np.nan)
+
+    values = [precip, thunder, tmin, tmax]
+    events = [precip >= RAIN_DAY_INCHES, thunder > 0, tmin <= FREEZE_F, tmax >= EXTREME_HEAT_F]
+
+    # Pool each day with its neighbors (wrapping around the year) to smooth short records
+    window = np.ones(2 * SMOOTHING_DAYS + 1)
+    pooled = lambda a: np.convolve(np.concatenate([a[-SMOOTHING_DAYS:], a, a[:SMOOTHING_DAYS]]), window, mode="valid")
+    table = np.zeros((DAYS_IN_TABLE, len(HAZARDS)), dtype=np.uint8)
+    for h, (observed, event) in enumerate(zip(values, events)):
+        observed = ~np.isnan(observed)
+        counts = np.bincount(day, weights=(event & observed).astype(float), minlength=DAYS_IN_TABLE)
+        totals = np.bincount(day, weights=observed.astype(float), minlength=DAYS_IN_TABLE)
+        table[:, h] = np.rint(100 * pooled(counts) / np.maximum(pooled(totals), 1)).astype(np.uint8)
+    return table
+
+class Climatology:
+    """Memory-mapped per-school, per-day-of-year hazard probabilities"""
+
+    def __init__(self, schools: List[str], table: np.ndarray, version: str = ""):
+        """
+        Args:
+            schools: School codes, one per table row
+            table: uint8 array of shape (len(schools), DAYS_IN_TABLE, len(HAZARDS)) with percentages
+            version: Identifier of the source data the table was built from
+        """
+        self.schools = list(schools)
+        self.table = table
+        self.version = version
+        self.index = {school: i for i, school in enumerate(self.schools)}
+
+    def __contains__(self, school: str) -> bool:
+        return school in self.index
+
+    def lookup(self, schools: List[str], dates: Iterable[Any]) -> np.ndarray:
+        """
+        Hazard percentages for parallel lists of schools and dates
+
+        Returns:
+            Array of shape (n, len(HAZARDS)); rows for schools without history are -1
+        """
+        rows = np.array([self.index.get(school, -1) for school in schools], dtype=np.intp)
+        days = day_of_year_index(dates)
+        result = np.full((len(rows), len(HAZARDS)), -1, dtype=np.int16)
+        known = rows >= 0
+        result[known] = self.table[rows[known], days[known]]
+        return result
+
+    def probabilities(self, school: str, date: Any) -> Optional[Dict[str, int]]:
+        """Hazard percentages for one school and date, or None without history"""
+        if school not in self.index:
+            return None
+        row = self.table[self.index[school], day_of_year_index([date])[0]]
+        return {hazard: int(value) for hazard, value in zip(HAZARDS, row)}
+
+def source_files(source_dir: str) -> List[str]:
+    """History files in a source directory, one per school, sorted by school code"""
+    files = glob.glob(os.path.join(source_dir, "*.csv")) + glob.glob(os.path.join(source_dir, "*.parquet"))
+    return sorted(files, key=lambda path: os.path.splitext(os.path.basename(path))[0])
+
+def build_climatology(source_dir: str = CLIMATOLOGY_SOURCE_PATH, cache_dir: Optional[str] = CACHE_PATH,
+                      rebuild: bool = False) -> Optional[Climatology]:
+    """
+    Build the probability tables, reusing the on-disk copy when the source files are unchanged
+
+    Args:
+        source_dir: Directory of per-school history files
+        cache_dir: Directory for the persisted tables, or None to keep them in memory
+        rebuild: Recompute even when a persisted copy exists
+
+    Returns:
+        Climatology instance, or None when there is no history to build from
+    """
+    files = source_files(source_dir) if os.path.isdir(source_dir) else []
+    if not files:
+        return None
+
+    digest = hashlib.sha256()
+    for path in files:
+        stat = os.stat(path)
+        digest.update(f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    digest.update(json.dumps([RAIN_DAY_INCHES, FREEZE_F, EXTREME_HEAT_F, SMOOTHING_DAYS]).encode())
+    version = digest.hexdigest()[:16]
+
+    table_file = os.path.join(cache_dir, f"climatology_{version}.npy") if cache_dir else None
+    index_file = os.path.join(cache_dir, f"climatology_{version}.json") if cache_dir else None
+    if table_file and not rebuild and os.path.exists(table_file) and os.path.exists(index_file):
+        try:
+            with open(index_file) as f:
+                schools = json.load(f)
+            return Climatology(schools, np.load(table_file, mmap_mode="r"), version)
+        except Exception as e:
+            print(f"Error reading cached climatology: {str(e)}", file=sys.stderr)
+
+    schools = []
+    tables = []
+    for path in files:
+        try:
+            tables.append(compute_probabilities(read_history(path)))
+            schools.append(os.path.splitext(os.path.basename(path))[0])
+        except Exception as e:
+            print(f"Error reading weather history {path}: {str(e)}", file=sys.stderr)
+
+    if not tables:
+        return None
+    table = np.stack(tables)
+
+    if table_file:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            np.save(table_file, table)
+            with open(index_file, "w") as f:
+                json.dump(schools, f)
+            table = np.load(table_file, mmap_mode="r")
+        except Exception as e:
+            print(f"Error saving climatology: {str(e)}", file=sys.stderr)
+
+    return Climatology(schools, table, version)
+
+_climatology: Optional[Climatology] = None
+_climatology_loaded = False
+_climatology_lock = threading.Lock()
+
+def get_climatology() -> Optional[Climatology]:
+    """Get the shared climatology for this process, or None when no history is available"""
+    global _climatology, _climatology_loaded
+
+    if not _climatology_loaded:
+        with _climatology_lock:
+            if not _climatology_loaded:
+                try:
+                    _climatology = build_climatology()
+                except Exception as e:
+                    print(f"Error loading climatology: {str(e)}", file=sys.stderr)
+                _climatology_loaded = True
+    return _climatology
+
+def main():
+    parser = argparse.ArgumentParser(description='FlexTime Climatology')
+    parser.add_argument('-s', '--school', type=str, help='School code')
+    parser.add_argument('-d', '--date', type=str, help='Date (YYYY-MM-DD)')
+    parser.add_argument('--source', type=str, default=CLIMATOLOGY_SOURCE_PATH, help='Directory of history files')
+    parser.add_argument('--rebuild', action='store_true', help='Rebuild and persist the tables')
+
+    args = parser.parse_args()
+
+    climate = build_climatology(args.source, rebuild=args.rebuild)
+    if climate is None:
+        print(f"No weather history found in {args.source}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.school and args.date:
+        print(json.dumps(climate.probabilities(args.school, args.date), indent=2))
+    else:
+        print(json.dumps({"version": climate.version, "schools": climate.schools}, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -11,9 +11,16 @@ import sys
 import json
 import argparse
 import datetime
+import threading
 import subprocess
 import requests
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, Tuple
+
+import distance_engine
+import pairing_engine
+import travel_optimizer
+import weather_provider
+import agent_runtime
 
 # FlexTime configuration
 FLEXTIME_VERSION = "1.0.0"
@@ -28,6 +35,9 @@ BIG12_SCHOOLS = [
     "oklahoma_state", "tcu", "texas_tech", "ucf", "utah", "west_virginia"
 ]
 
+# Search time per worker for the sample schedule answered to chat queries
+SAMPLE_TIME_BUDGET = 2.0
+
 SCHEDULING_SPORTS = [
     "mbasketball", "wbasketball", "football", "baseball", "softball", 
     "mtennis", "wtennis", "volleyball", "soccer", "wrestling", 
@@ -85,29 +95,17 @@ def get_compass_school_location(school_code: str) -> str:
 
 def get_travel_distance_matrix() -> Dict[str, Dict[str, float]]:
     """
-    Get the travel distance matrix between all Big 12 schools from COMPASS
+    Get the travel distance matrix (road miles) between all Big 12 schools
     """
-    # In a real implementation, this would call the COMPASS API
-    # This is a simplified mock implementation
-    
-    # Create a mock distance matrix (miles between schools)
-    distances = {}
-    for school1 in BIG12_SCHOOLS:
-        distances[school1] = {}
-        for school2 in BIG12_SCHOOLS:
-            if school1 == school2:
-                distances[school1][school2] = 0
-            else:
-                # Generate a realistic but mock distance
-                # In a real implementation, this would use actual distances
-                distances[school1][school2] = 500 + (hash(school1 + school2) % 1500)
-    
-    return distances 
+    return distance_engine.get_distance_matrix().as_dict(BIG12_SCHOOLS)
 
 def get_weather_forecast(school_code: str, start_date: str, end_date: str) -> List[Dict[str, Any]]:
     """
     Get weather forecast for a school location within a date range
     
+    Forecasts come from the shared weather provider, which caches them per
+    (school, date) in memory and on disk.
+    
     Args:
         school_code: School identifier
         start_date: Start date (YYYY-MM-DD)
@@ -116,178 +114,133 @@ def get_weather_forecast(school_code: str, start_date: str, end_date: str) -> Li
     Returns:
         List of weather forecasts for each day
     """
-    # In a real implementation, this would call the COMPASS API
-    # This is a simplified mock implementation
-    
-    # Convert dates to datetime objects
-    start = datetime.datetime.strptime(start_date, "%Y-%m-%d")
-    end = datetime.datetime.strptime(end_date, "%Y-%m-%d")
-    
-    # Number of days in the range
-    days = (end - start).days + 1
+    try:
+        return weather_provider.get_provider().get_forecast(school_code, start_date, end_date)
+    except Exception as e:
+        print(f"Error getting weather forecast: {str(e)}", file=sys.stderr)
+        return []
+
+def get_historical_travel_partners(sport: str) -> List[List[str]]:
+    """
+    Get the traditional travel partners for a sport from the historical patterns agent
     
-    # Generate mock weather data
-    forecasts = []
-    for i in range(days):
-        day = start + datetime.timedelta(days=i)
-        day_str = day.strftime("%Y-%m-%d")
-        
-        # Generate realistic but mock weather
-        # In a real implementation, this would use actual weather forecasts
-        seed = hash(f"{school_code}_{day_str}")
-        temp_high = 40 + (seed % 60)  # Temperature between 40-100°F
-        temp_low = temp_high - 15 - (seed % 10)  # 15-25 degrees lower than high
-        precip_chance = seed % 101  # 0-100%
-        
-        # For high-altitude schools, adjust temperatures
-        high_altitude_schools = ["colorado", "byu", "utah", "texas_tech"]
-        if school_code in high_altitude_schools:
-            temp_high -= 5
-            temp_low -= 7
-        
-        # For southern schools, increase temperatures
-        southern_schools = ["arizona", "arizona_state", "houston", "ucf"]
-        if school_code in southern_schools:
-            temp_high += 8
-            temp_low += 6
-        
-        # Determine weather conditions based on precipitation chance
-        conditions = "Sunny"
-        if precip_chance > 80:
-            conditions = "Heavy Rain"
-        elif precip_chance > 60:
-            conditions = "Rain"
-        elif precip_chance > 40:
-            conditions = "Partly Cloudy"
-        elif precip_chance > 20:
-            conditions = "Mostly Sunny"
-        
-        # Add special conditions for certain locations/seasons
-        if school_code in ["colorado", "utah", "byu"] and day.month in [11, 12, 1, 2, 3]:
-            if precip_chance > 50:
-                conditions = "Snow"
-                
-        if school_code in ["houston", "ucf"] and day.month in [6, 7, 8, 9]:
-            if precip_chance > 70:
-                conditions = "Thunderstorms"
-        
-        # Create the forecast entry
-        forecast = {
-            "date": day_str,
-            "school": school_code,
-            "conditions": conditions,
-            "temperature": {
-                "high": temp_high,
-                "low": temp_low,
-                "unit": "F"
-            },
-            "precipitation": {
-                "chance": precip_chance,
-                "type": "rain" if "Rain" in conditions else "snow" if conditions == "Snow" else "none"
-            },
-            "advisories": []
-        }
+    Args:
+        sport: Sport code (e.g. "mbasketball")
         
-        # Add weather advisories if applicable
-        if conditions == "Heavy Rain" and precip_chance > 90:
-            forecast["advisories"].append("Flood Watch")
-        if conditions == "Snow" and precip_chance > 85:
-            forecast["advisories"].append("Winter Storm Warning")
-        if temp_high > 95 and precip_chance < 20:
-            forecast["advisories"].append("Heat Advisory")
+    Returns:
+        List of school pairs, or an empty list if the sport has none
+    """
+    try:
+        import historical_patterns_agent
+        params = historical_patterns_agent.SPORT_TRADITIONAL_PARAMETERS.get(sport, {}).get("parameters", {})
+        partners = params.get("travel_partners", [])
+        return partners if isinstance(partners, list) else []
+    except Exception as e:
+        print(f"Error loading travel partners for {sport}: {str(e)}", file=sys.stderr)
+        return []
+
+def compare_travel_pairings(schools: Optional[List[str]] = None, sport: Optional[str] = None,
+                            fixed_partners: Optional[List[List[str]]] = None,
+                            extra_coordinates: Optional[Dict[str, Tuple[float, float]]] = None) -> Dict[str, Any]:
+    """
+    Find the travel partnerships with minimum total partner distance and
+    compare them with the greedy nearest-neighbor pairing
+    
+    Args:
+        schools: League members (defaults to the current Big 12); any even-sized
+            league, e.g. 14- or 18-team hypotheticals
+        sport: Keep this sport's traditional travel partners fixed
+        fixed_partners: Additional partnerships to keep fixed
+        extra_coordinates: (lat, lng) for schools outside the Big 12, for hypothetical leagues
         
-        forecasts.append(forecast)
+    Returns:
+        Dictionary with optimal and greedy pairings, total partner miles and the savings,
+        or with "error" and no pairings when the fixed partnerships conflict
+    """
+    schools = list(schools or BIG12_SCHOOLS)
+    fixed = list(fixed_partners or [])
+    if sport:
+        fixed.extend(get_historical_travel_partners(sport))
+    
+    if extra_coordinates:
+        coordinates = {s: distance_engine.SCHOOL_COORDINATES[s] for s in schools if s in distance_engine.SCHOOL_COORDINATES}
+        coordinates.update(extra_coordinates)
+        matrix = distance_engine.DistanceMatrix.from_coordinates(coordinates)
+    else:
+        matrix = distance_engine.get_distance_matrix()
     
-    return forecasts
+    try:
+        return pairing_engine.optimal_pairings(matrix, schools, fixed)
+    except ValueError as e:
+        return {"error": f"Cannot pair these schools: {str(e)}", "pairings": [], "fixed_pairs": fixed}
 
-def find_optimal_travel_pairings() -> List[List[str]]:
+def find_optimal_travel_pairings(schools: Optional[List[str]] = None, sport: Optional[str] = None) -> List[List[str]]:
     """
     Find optimal travel partnerships based on proximity
     
+    Args:
+        schools: League members (defaults to the current Big 12)
+        sport: Keep this sport's traditional travel partners fixed
+    
     Returns:
         List of school pairs that make good travel partners
     """
-    # Get the distance matrix
-    distances = get_travel_distance_matrix()
-    
-    # Dictionary to store each school's closest partner
-    closest_partners = {}
-    
-    # Find each school's closest neighbor
-    for school in BIG12_SCHOOLS:
-        other_schools = [s for s in BIG12_SCHOOLS if s != school]
-        closest = min(other_schools, key=lambda s: distances[school][s])
-        closest_partners[school] = closest
-    
-    # Create mutual pairings where possible
-    pairings = []
-    unpaired = set(BIG12_SCHOOLS)
-    
-    # First, find mutual closest partners
-    for school in list(unpaired):
-        if school not in unpaired:
-            continue
-            
-        partner = closest_partners[school]
-        if partner in unpaired and closest_partners[partner] == school:
-            pairings.append([school, partner])
-            unpaired.remove(school)
-            unpaired.remove(partner)
-    
-    # Then, pair remaining schools by proximity
-    while len(unpaired) >= 2:
-        school = unpaired.pop()
-        closest = min(unpaired, key=lambda s: distances[school][s])
-        pairings.append([school, closest])
-        unpaired.remove(closest)
-    
-    return pairings 
+    return compare_travel_pairings(schools, sport)["pairings"]
 
-def optimize_schedule_for_travel(schedule: Dict[str, Any]) -> Dict[str, Any]:
+def optimize_schedule_for_travel(schedule: Dict[str, Any], time_budget: float = travel_optimizer.DEFAULT_TIME_BUDGET,
+                                 workers: Optional[int] = None) -> Dict[str, Any]:
     """
     Optimize a schedule to minimize travel distance and burden
     
+    Rounds are reordered and home/away assignments flipped by the travel
+    optimizer; metrics compare the schedule as given with the optimized one.
+    
     Args:
-        schedule: Current schedule information
+        schedule: Current schedule information with a "games" list
+            (home_team, away_team and a round, week or date per game)
+        time_budget: Seconds of search per worker process
+        workers: Worker processes (defaults to the CPU count, at most 4)
         
     Returns:
         Optimized schedule with travel metrics
     """
-    # In a real implementation, this would analyze the actual schedule
-    # This is a simplified mock implementation
-    
-    # Mock schedule optimization - pretend we've improved the schedule
     optimized = schedule.copy() if isinstance(schedule, dict) else {"games": []}
     
-    # Add optimization metrics
-    optimized["optimizationMetrics"] = {
-        "totalTravelDistance": {
-            "original": 254680,  # miles
-            "optimized": 198520,  # miles
-            "improvement": "22%"
-        },
-        "averageTravelTime": {
-            "original": 3.8,  # hours
-            "optimized": 3.1,  # hours
-            "improvement": "18%"
-        },
-        "longestTrip": {
-            "original": 2180,  # miles
-            "optimized": 1850,  # miles
-            "improvement": "15%"
-        },
-        "carbonFootprint": {
-            "original": 126.4,  # tons CO2
-            "optimized": 98.2,  # tons CO2
-            "improvement": "22%"
-        }
-    }
+    try:
+        optimized = travel_optimizer.optimize_schedule(optimized, time_budget=time_budget, workers=workers)
+    except Exception as e:
+        print(f"Error optimizing schedule for travel: {str(e)}", file=sys.stderr)
+        optimized["optimizationMetrics"] = {}
     
     # Add travel partnership recommendations
     optimized["travelPartnerships"] = find_optimal_travel_pairings()
     
     return optimized
 
+_sample_optimization: Optional[Dict[str, Any]] = None
+_sample_source: Optional[str] = None
+_sample_lock = threading.Lock()
+
+def get_sample_optimization() -> Dict[str, Any]:
+    """
+    Travel optimization of the sample conference schedule, run once per distance matrix version
+
+    Chat queries share this result instead of each starting a new search.
+    """
+    global _sample_optimization, _sample_source
+
+    version = distance_engine.get_distance_matrix().version
+    with _sample_lock:
+        if _sample_optimization is None or version != _sample_source:
+            schedule = travel_optimizer.round_robin_schedule(BIG12_SCHOOLS)
+            schedule.update({"sport": "basketball", "season": "2024-25"})
+            optimized = optimize_schedule_for_travel(schedule, time_budget=SAMPLE_TIME_BUDGET)
+            if not optimized["optimizationMetrics"]:
+                # Failed runs are retried by the next query rather than cached
+                return optimized
+            _sample_optimization, _sample_source = optimized, version
+        return _sample_optimization
+
 def generate_travel_itinerary(school_code: str, schedule: Dict[str, Any]) -> Dict[str, Any]:
     """
     Generate a travel itinerary for a school based on their schedule
@@ -318,7 +271,7 @@ def generate_travel_itinerary(school_code: str, schedule: Dict[str, Any]) -> Dic
         return_date = base_date + datetime.timedelta(days=1)
         
         # Distance (from the distance matrix)
-        distance = get_travel_distance_matrix()[school_code][opponent]
+        distance = distance_engine.get_travel_distance(school_code, opponent)
         
         # Create the trip
         trip = {
@@ -357,7 +310,7 @@ def generate_travel_itinerary(school_code: str, schedule: Dict[str, Any]) -> Dic
     
     return itinerary
 
-def process_user_query(query: str) -> str:
+def _answer_query(query: str) -> str:
     """
     Process a user query related to COMPASS integration
     
@@ -376,14 +329,18 @@ def process_user_query(query: str) -> str:
     # Generate an appropriate response based on the query type
     if "optimize" in query_lower and "schedule" in query_lower:
         # Schedule optimization request
-        mock_schedule = {"games": [], "sport": "basketball", "season": "2024-25"}
-        optimized = optimize_schedule_for_travel(mock_schedule)
-        
-        response = f"[COMPASS Integration Analysis]\n\nI've analyzed the schedule for travel optimization with the following results:\n\n"
-        response += f"Total travel distance: Reduced by {optimized['optimizationMetrics']['totalTravelDistance']['improvement']}\n"
-        response += f"Average travel time: Reduced by {optimized['optimizationMetrics']['averageTravelTime']['improvement']}\n"
-        response += f"Longest trip: Reduced by {optimized['optimizationMetrics']['longestTrip']['improvement']}\n"
-        response += f"Carbon footprint: Reduced by {optimized['optimizationMetrics']['carbonFootprint']['improvement']}\n\n"
+        optimized = get_sample_optimization()
+        metrics = optimized["optimizationMetrics"]
+        
+        response = f"[COMPASS Integration Analysis]\n\nI've analyzed a double round-robin conference schedule for travel optimization with the following results:\n\n"
+        if metrics:
+            response += f"Total travel distance: {metrics['totalTravelDistance']['original']:,.0f} -> {metrics['totalTravelDistance']['optimized']:,.0f} miles ({metrics['totalTravelDistance']['improvement']} reduction)\n"
+            response += f"Average travel time per team: {metrics['averageTravelTime']['original']} -> {metrics['averageTravelTime']['optimized']} hours ({metrics['averageTravelTime']['improvement']} reduction)\n"
+            response += f"Longest road trip: {metrics['longestTrip']['original']:,.0f} -> {metrics['longestTrip']['optimized']:,.0f} miles ({metrics['longestTrip']['improvement']} reduction)\n"
+            response += f"Longest road streak: {metrics['consecutiveRoadGames']['original']} -> {metrics['consecutiveRoadGames']['optimized']} games\n"
+            response += f"Candidate schedules evaluated: {optimized['search']['candidates_evaluated']:,}\n\n"
+        else:
+            response += "The schedule could not be optimized.\n\n"
         
         response += "Recommended travel partnerships:\n"
         for pair in optimized["travelPartnerships"][:5]:
@@ -392,8 +349,8 @@ def process_user_query(query: str) -> str:
         response += "\nThese optimizations were achieved by:\n"
         response += "1. Pairing geographically close schools for away trips\n"
         response += "2. Sequencing games to minimize back-and-forth travel\n"
-        response += "3. Scheduling around weather patterns and forecasted conditions\n"
-        response += "4. Balancing home/away distribution to reduce consecutive long trips\n"
+        response += "3. Flipping home/away assignments while keeping each team's home game count\n"
+        response += "4. Limiting consecutive road games to reduce long trips\n"
         
         return response
         
@@ -453,9 +410,14 @@ def process_user_query(query: str) -> str:
             response += f"- {school}: {avg:.1f} miles average\n"
             
         response += "\nRecommended travel partnerships based on proximity:\n"
-        pairs = find_optimal_travel_pairings()
-        for pair in pairs[:5]:
+        comparison = compare_travel_pairings()
+        if "error" in comparison:
+            response += f"- {comparison['error']}\n"
+            return response
+        for pair in comparison["pairings"][:5]:
             response += f"- {pair[0]} and {pair[1]} ({distances[pair[0]][pair[1]]} miles apart)\n"
+        response += f"\nTotal partner distance: {comparison['total_miles']:,.1f} miles "
+        response += f"({comparison['savings_miles']:,.1f} miles less than nearest-neighbor pairing)\n"
             
         return response
         
@@ -518,6 +480,10 @@ def process_user_query(query: str) -> str:
         
         return response
 
+def process_user_query(query: str, context: Optional[Dict[str, Any]] = None, system_prompt: str = "") -> str:
+    """Process a user query; see agent_runtime.answer_query for context and system_prompt"""
+    return agent_runtime.answer_query(_answer_query, query, context, system_prompt)
+
 def main():
     parser = argparse.ArgumentParser(description='FlexTime COMPASS Integration Agent')
     parser.add_argument('-p', '--prompt', type=str, required=True, help='User prompt/query')
@@ -526,7 +492,7 @@ def main():
     args = parser.parse_args()
     
     # Process the query
-    response = process_user_query(args.prompt)
+    response = process_user_query(args.prompt, system_prompt=args.system_prompt)
     
     # Print the response
     print(response)
@@ -0,0 +1,513 @@
+#!/usr/bin/env python3
+"""
+Conflict Engine
+
+Interval-based venue conflict detection for the campus conflicts agent.
+Events are placed on a single minute timeline (date ordinal * 1440 + minutes),
+sorted per venue, and swept once, so overlaps, transition shortfalls and
+midnight-crossing events are found in O(n log n) for a full conference season.
+
+Part of the XII-OS FlexTime module.
+"""
+
+import sys
+import heapq
+import datetime
+import functools
+import itertools
+from typing import Dict, List, Any, Optional, Tuple, Callable, Iterable
+
+MINUTES_PER_DAY = 24 * 60
+
+# Default event length (hours) when a schedule entry has no end time
+DEFAULT_DURATION_HOURS = 2
+SPORT_DURATION_HOURS = {
+    "football": 3
+}
+
+TENNIS_PAIR = {"mtennis", "wtennis"}
+BASKETBALL_PAIR = {"mbasketball", "wbasketball"}
+
+@functools.lru_cache(maxsize=4096)
+def parse_clock(value: str) -> Optional[int]:
+    """Convert "HH:MM" to minutes after midnight, or None if it cannot be parsed"""
+    try:
+        hours, minutes = value.split(":")
+        hours, minutes = int(hours), int(minutes)
+        if 0 <= hours <= 24 and 0 <= minutes < 60:
+            return hours * 60 + minutes
+    except (AttributeError, ValueError):
+        pass
+    return None
+
+@functools.lru_cache(maxsize=4096)
+def parse_day(value: str) -> Optional[int]:
+    """Convert "YYYY-MM-DD" to a day ordinal, or None if it cannot be parsed"""
+    try:
+        return datetime.date.fromisoformat(value).toordinal()
+    except (TypeError, ValueError):
+        return None
+
+def format_clock(minutes: int) -> str:
+    minutes %= MINUTES_PER_DAY
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+class VenueInterval:
+    """A single event's occupancy of a venue on the minute timeline"""
+
+    __slots__ = ("sport", "date", "start", "end", "busy_start", "busy_end",
+                 "start_time", "end_time", "event_id", "description")
+
+    def __init__(self, sport: str, date: str, start: int, end: int, setup: int, teardown: int,
+                 start_time: str, end_time: str, event_id: str = "", description: str = ""):
+        self.sport = sport
+        self.date = date
+        self.start = start
+        self.end = end
+        self.busy_start = start - setup
+        self.busy_end = end + teardown
+        self.start_time = start_time
+        self.end_time = end_time
+        self.event_id = event_id
+        self.description = description
+
+    @property
+    def label(self) -> str:
+        return f"{self.start_time}-{self.end_time}"
+
+    @property
+    def order(self) -> Tuple[int, int, str]:
+        """Ordering used to decide which event of a pair is reported first"""
+        return (self.start, self.busy_start, self.event_id)
+
+def build_interval(sport: str, event: Dict[str, Any]) -> Optional[VenueInterval]:
+    """
+    Place a schedule entry on the minute timeline
+
+    Supports optional "end_date" (multi-day events), "setup_minutes" and
+    "teardown_minutes" fields. An end time earlier than the start time is
+    treated as finishing after midnight.
+
+    Returns:
+        VenueInterval, or None if the date or start time is missing or invalid
+    """
+    day = parse_day(event.get("date"))
+    start_clock = parse_clock(event.get("start_time"))
+    if day is None or start_clock is None:
+        return None
+
+    start = day * MINUTES_PER_DAY + start_clock
+    end_time = event.get("end_time", "")
+    end_clock = parse_clock(end_time) if end_time else None
+
+    if end_clock is None:
+        end = start + SPORT_DURATION_HOURS.get(sport, DEFAULT_DURATION_HOURS) * 60
+        end_time = format_clock(end)
+    else:
+        end_day = parse_day(event.get("end_date")) if event.get("end_date") else None
+        end = (end_day if end_day is not None else day) * MINUTES_PER_DAY + end_clock
+        while end < start:
+            end += MINUTES_PER_DAY
+
+    return VenueInterval(
+        sport, event["date"], start, end,
+        int(event.get("setup_minutes", 0) or 0), int(event.get("teardown_minutes", 0) or 0),
+        event["start_time"], end_time, event.get("id", ""), event.get("description", "")
+    )
+
+def build_venue_intervals(schedules: Dict[str, List[Dict[str, Any]]],
+                          venue_resolver: Callable[[str, str], str]) -> Dict[Tuple[str, str], List[VenueInterval]]:
+    """
+    Group home events into per-venue interval lists
+
+    Args:
+        schedules: Dictionary mapping sport codes to lists of scheduled events
+        venue_resolver: Function (school_code, sport) -> venue name or ""
+
+    Returns:
+        Dictionary keyed by (school, venue) with unsorted interval lists
+    """
+    venue_cache = {}
+    by_venue = {}
+
+    for sport, events in schedules.items():
+        for event in events:
+            home_school = event.get("home_team")
+            if not home_school:
+                continue
+
+            key = (home_school, sport)
+            if key not in venue_cache:
+                venue_cache[key] = venue_resolver(home_school, sport)
+            venue = venue_cache[key]
+            if not venue:
+                continue
+
+            interval = build_interval(sport, event)
+            if interval is None:
+                continue
+
+            by_venue.setdefault((home_school, venue), []).append(interval)
+
+    return by_venue
+
+class TransitionTable:
+    """Required transition hours between sports, resolved once per (venue, from, to)"""
+
+    def __init__(self, lookup: Callable[..., float]):
+        self.lookup = lookup
+        self._cache = {}
+
+    def hours(self, school: str, venue: str, from_sport: str, to_sport: str) -> float:
+        key = (school, venue, from_sport, to_sport)
+        if key not in self._cache:
+            self._cache[key] = self.lookup(from_sport, to_sport, school, venue)
+        return self._cache[key]
+
+    def horizon_minutes(self, school: str, venue: str, sports: Iterable[str]) -> int:
+        """Largest gap (transition + 1 hour buffer) that can still produce a conflict at this venue"""
+        sports = list(sports)
+        longest = max((self.hours(school, venue, a, b) for a in sports for b in sports), default=0)
+        return int((longest + 1) * 60)
+
+def _conflict(kind: str, school: str, venue: str, first: VenueInterval, second: VenueInterval,
+              reason: str, severity: str, recommendation: str) -> Dict[str, Any]:
+    return {
+        "type": kind,
+        "school": school,
+        "venue": venue,
+        "date": first.date,
+        "sport1": first.sport,
+        "sport2": second.sport,
+        "event1_time": first.label,
+        "event2_time": second.label,
+        "event1_id": first.event_id,
+        "event2_id": second.event_id,
+        "reason": reason,
+        "severity": severity,
+        "recommendation": recommendation
+    }
+
+def classify_pair(school: str, venue: str, first: VenueInterval, second: VenueInterval,
+                  transitions: TransitionTable) -> List[Dict[str, Any]]:
+    """
+    Apply the campus conflict rules to two events at the same venue
+
+    Args:
+        first: The event that starts first
+        second: The event that starts second
+
+    Returns:
+        List of conflict dictionaries (possibly empty)
+    """
+    sports = {first.sport, second.sport}
+    same_day = first.date == second.date
+
+    # Men's and women's tennis on the same day is a soft conflict, whatever the times
+    if same_day and sports == TENNIS_PAIR:
+        return [_conflict("soft_conflict", school, venue, first, second,
+                          "Men's and Women's Tennis preferably scheduled on different days", "Medium",
+                          "Consider scheduling tennis events on separate days if possible")]
+
+    if first.busy_end > second.busy_start:
+        return [_conflict("hard_conflict", school, venue, first, second,
+                          "Events have overlapping times", "High",
+                          "Reschedule one event to different day or time")]
+
+    conflicts = []
+    hours_between = (second.busy_start - first.busy_end) / 60
+    required = transitions.hours(school, venue, first.sport, second.sport)
+
+    if hours_between < required:
+        conflicts.append(_conflict("hard_conflict", school, venue, first, second,
+                                   f"Insufficient transition time ({hours_between:.1f} hours, need {required} hours)", "High",
+                                   f"Reschedule to allow {required} hours between events"))
+    elif hours_between < required + 1:
+        conflicts.append(_conflict("soft_conflict", school, venue, first, second,
+                                   f"Tight transition time ({hours_between:.1f} hours)", "Medium",
+                                   "Consider adding buffer time if possible"))
+
+    if same_day and sports == BASKETBALL_PAIR:
+        conflicts.append(_conflict("doubleheader_opportunity", school, venue, first, second,
+                                   "Potential basketball doubleheader", "Opportunity",
+                                   "Consider marketing as doubleheader event"))
+
+    return conflicts
+
+def candidate_pairs(intervals: List[VenueInterval], horizon: int) -> List[Tuple[int, int]]:
+    """
+    Sweep a venue's intervals (sorted by busy_start) and return index pairs that can conflict
+
+    A pair is a candidate if the second event starts within `horizon` minutes of the
+    first one's busy end, or if both fall on the same day and form a tennis or
+    basketball pairing (those rules apply regardless of the gap).
+    """
+    pairs = []
+    active = []  # heap of (busy_end, index)
+
+    for j, interval in enumerate(intervals):
+        while active and active[0][0] + horizon <= interval.busy_start:
+            heapq.heappop(active)
+        for _, i in active:
+            pairs.append((i, j))
+        heapq.heappush(active, (interval.busy_end, j))
+
+    seen = set(pairs)
+    same_day = {}
+    for j, interval in enumerate(intervals):
+        if interval.sport in TENNIS_PAIR or interval.sport in BASKETBALL_PAIR:
+            same_day.setdefault(interval.date, []).append(j)
+
+    for indices in same_day.values():
+        for a in range(len(indices)):
+            for b in range(a + 1, len(indices)):
+                i, j = indices[a], indices[b]
+                if (i, j) not in seen and intervals[i].sport != intervals[j].sport:
+                    pairs.append((i, j))
+
+    return pairs
+
+def detect_venue_conflicts(school: str, venue: str, intervals: List[VenueInterval],
+                           transitions: TransitionTable) -> List[Dict[str, Any]]:
+    """
+    Detect all conflicts at one venue
+
+    Returns:
+        Conflicts ordered by the first event's start time
+    """
+    intervals = sorted(intervals, key=lambda x: (x.busy_start, x.start))
+    horizon = transitions.horizon_minutes(school, venue, {i.sport for i in intervals})
+
+    conflicts = []
+    for i, j in sorted(candidate_pairs(intervals, horizon)):
+        first, second = intervals[i], intervals[j]
+        if second.order < first.order:
+            first, second = second, first
+        conflicts.extend(classify_pair(school, venue, first, second, transitions))
+
+    return conflicts
+
+def detect_conflicts(schedules: Dict[str, List[Dict[str, Any]]],
+                     venue_resolver: Callable[[str, str], str],
+                     transition_lookup: Callable[..., float]) -> List[Dict[str, Any]]:
+    """
+    Detect venue conflicts for every school and sport in one pass
+
+    Args:
+        schedules: Dictionary mapping sport codes to lists of scheduled events
+        venue_resolver: Function (school_code, sport) -> venue name or ""
+        transition_lookup: Function (from_sport, to_sport, school_code, venue_name) -> hours
+
+    Returns:
+        List of identified conflicts
+    """
+    transitions = TransitionTable(transition_lookup)
+    conflicts = []
+
+    try:
+        for (school, venue), intervals in build_venue_intervals(schedules, venue_resolver).items():
+            conflicts.extend(detect_venue_conflicts(school, venue, intervals, transitions))
+    except Exception as e:
+        print(f"Error detecting conflicts: {str(e)}", file=sys.stderr)
+
+    return conflicts
+
+def conflict_key(conflict: Dict[str, Any]) -> Tuple[str, ...]:
+    """Identity of a conflict, used to diff conflict sets between edits"""
+    return (conflict["type"], conflict["school"], conflict["venue"],
+            conflict["event1_id"], conflict["event2_id"], conflict["reason"])
+
+class ConflictSession:
+    """
+    A season held in memory together with its conflict set
+
+    Edits (add_event, remove_event, move_event) only re-check the edited event
+    against events in its venue whose occupancy falls within the venue's conflict
+    horizon, and return the conflicts added and removed by the edit.
+    """
+
+    def __init__(self, schedules: Dict[str, List[Dict[str, Any]]],
+                 venue_resolver: Callable[[str, str], str],
+                 transition_lookup: Callable[..., float]):
+        """
+        Args:
+            schedules: Dictionary mapping sport codes to lists of scheduled events;
+                events without an "id" are given one
+            venue_resolver: Function (school_code, sport) -> venue name or ""
+            transition_lookup: Function (from_sport, to_sport, school_code, venue_name) -> hours
+        """
+        self.venue_resolver = venue_resolver
+        self.transitions = TransitionTable(transition_lookup)
+
+        self.events: Dict[str, Dict[str, Any]] = {}
+        self._sports: Dict[str, str] = {}
+        self._placement: Dict[str, Tuple[Tuple[str, str], VenueInterval]] = {}
+        self._day_index: Dict[Tuple[str, str], Dict[int, set]] = {}
+        self._venue_sports: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self._conflicts: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        self._event_conflicts: Dict[str, set] = {}
+
+        for sport, events in schedules.items():
+            for n, event in enumerate(events):
+                event = dict(event)
+                event.setdefault("id", f"{sport}-{n + 1}")
+                self._insert(sport, event)
+
+        by_venue = {}
+        for venue_key, interval in self._placement.values():
+            by_venue.setdefault(venue_key, []).append(interval)
+        for (school, venue), intervals in by_venue.items():
+            for conflict in detect_venue_conflicts(school, venue, intervals, self.transitions):
+                self._store(conflict)
+
+        # Generated ids are never reused, so an id freed by remove_event keeps pointing at nothing
+        self._id_counter = itertools.count(len(self.events) + 1)
+
+    def _new_id(self, sport: str) -> str:
+        """Next generated id for an event of a sport that is not already in use"""
+        while True:
+            event_id = f"{sport}-{next(self._id_counter)}"
+            if event_id not in self.events:
+                return event_id
+
+    def conflicts(self) -> List[Dict[str, Any]]:
+        """Current conflict set"""
+        return list(self._conflicts.values())
+
+    def add_event(self, sport: str, event: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Add an event to the season
+
+        Returns:
+            Dictionary with "added" and "removed" conflict lists
+        """
+        event = dict(event)
+        if "id" not in event:
+            event["id"] = self._new_id(sport)
+        if event["id"] in self.events:
+            raise ValueError(f"Event '{event['id']}' already exists")
+
+        self._insert(sport, event)
+        return {"added": self._recheck(event["id"]), "removed": []}
+
+    def remove_event(self, event_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Remove an event from the season
+
+        Returns:
+            Dictionary with "added" and "removed" conflict lists
+        """
+        removed = self._drop_conflicts(event_id)
+        self._evict(event_id)
+        del self.events[event_id]
+        del self._sports[event_id]
+        return {"added": [], "removed": removed}
+
+    def move_event(self, event_id: str, **changes: Any) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Change an event's date, times, home team or setup/teardown windows
+
+        Args:
+            event_id: Event to change
+            **changes: Event fields to update (e.g. date="2025-02-01", start_time="19:00")
+
+        Returns:
+            Dictionary with "added" and "removed" conflict lists
+        """
+        sport = self._sports[event_id]
+        before = {conflict_key(c): c for c in self._drop_conflicts(event_id)}
+
+        event = dict(self.events[event_id])
+        event.update(changes)
+        if "start_time" in changes and "end_time" not in changes:
+            event.pop("end_time", None)  # Re-estimate the end from the new start
+
+        self._evict(event_id)
+        self._insert(sport, event)
+        after = {conflict_key(c): c for c in self._recheck(event_id)}
+
+        return {
+            "added": [c for k, c in after.items() if k not in before],
+            "removed": [c for k, c in before.items() if k not in after]
+        }
+
+    def _insert(self, sport: str, event: Dict[str, Any]):
+        event_id = event["id"]
+        self.events[event_id] = event
+        self._sports[event_id] = sport
+
+        home_school = event.get("home_team")
+        venue = self.venue_resolver(home_school, sport) if home_school else ""
+        interval = build_interval(sport, event) if venue else None
+        if interval is None:
+            return
+
+        venue_key = (home_school, venue)
+        self._placement[event_id] = (venue_key, interval)
+
+        days = self._day_index.setdefault(venue_key, {})
+        for day in range(interval.busy_start // MINUTES_PER_DAY, interval.busy_end // MINUTES_PER_DAY + 1):
+            days.setdefault(day, set()).add(event_id)
+
+        counts = self._venue_sports.setdefault(venue_key, {})
+        counts[sport] = counts.get(sport, 0) + 1
+
+    def _evict(self, event_id: str):
+        placement = self._placement.pop(event_id, None)
+        if placement is None:
+            return
+
+        venue_key, interval = placement
+        days = self._day_index[venue_key]
+        for day in range(interval.busy_start // MINUTES_PER_DAY, interval.busy_end // MINUTES_PER_DAY + 1):
+            days[day].discard(event_id)
+            if not days[day]:
+                del days[day]
+
+        counts = self._venue_sports[venue_key]
+        counts[interval.sport] -= 1
+        if not counts[interval.sport]:
+            del counts[interval.sport]
+
+    def _recheck(self, event_id: str) -> List[Dict[str, Any]]:
+        """Classify the event against its venue neighbours and store the resulting conflicts"""
+        placement = self._placement.get(event_id)
+        if placement is None:
+            return []
+
+        (school, venue), interval = placement
+        horizon = self.transitions.horizon_minutes(school, venue, self._venue_sports[(school, venue)])
+        days = self._day_index[(school, venue)]
+
+        neighbours = set()
+        for day in range((interval.busy_start - horizon) // MINUTES_PER_DAY,
+                         (interval.busy_end + horizon) // MINUTES_PER_DAY + 1):
+            neighbours.update(days.get(day, ()))
+        neighbours.discard(event_id)
+
+        added = []
+        for other_id in sorted(neighbours):
+            other = self._placement[other_id][1]
+            first, second = (interval, other) if interval.order < other.order else (other, interval)
+            for conflict in classify_pair(school, venue, first, second, self.transitions):
+                self._store(conflict)
+                added.append(conflict)
+
+        return added
+
+    def _store(self, conflict: Dict[str, Any]):
+        key = conflict_key(conflict)
+        self._conflicts[key] = conflict
+        self._event_conflicts.setdefault(conflict["event1_id"], set()).add(key)
+        self._event_conflicts.setdefault(conflict["event2_id"], set()).add(key)
+
+    def _drop_conflicts(self, event_id: str) -> List[Dict[str, Any]]:
+        removed = []
+        for key in self._event_conflicts.pop(event_id, set()):
+            conflict = self._conflicts.pop(key, None)
+            if conflict is None:
+                continue
+            removed.append(conflict)
+            other_id = conflict["event2_id"] if conflict["event1_id"] == event_id else conflict["event1_id"]
+            self._event_conflicts.get(other_id, set()).discard(key)
+        return removed
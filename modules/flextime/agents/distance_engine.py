@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Distance Engine
+
+Builds the travel distance matrix between Big 12 schools and their venues once,
+persists it to disk keyed on the venue catalog version, and serves constant-time
+lookups to the travel, COMPASS integration and game manager agents.
+
+Part of the XII-OS FlexTime module.
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+from typing import Dict, List, Optional, Tuple, Iterable
+
+import numpy as np
+
+from venue_catalog import VenueCatalog, get_catalog
+
+# FlexTime configuration
+FLEXTIME_VERSION = "1.0.0"
+FLEXTIME_MODULE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_PATH = os.path.join(FLEXTIME_MODULE_PATH, "data", "storage", "cache")
+
+EARTH_RADIUS_MILES = 3958.8
+ROAD_FACTOR = 1.2  # Circuity of the road network relative to great-circle distance
+
+# Campus coordinates (lat, lng) for each school - venue-level coordinates come from the venue data file
+SCHOOL_COORDINATES = {
+    "arizona": (32.2319, -110.9501),
+    "arizona_state": (33.4242, -111.9281),
+    "baylor": (31.5489, -97.1131),
+    "byu": (40.2518, -111.6493),
+    "cincinnati": (39.1329, -84.5150),
+    "colorado": (40.0076, -105.2659),
+    "houston": (29.7199, -95.3422),
+    "iowa_state": (42.0266, -93.6465),
+    "kansas": (38.9543, -95.2558),
+    "kansas_state": (39.1974, -96.5847),
+    "oklahoma_state": (36.1270, -97.0737),
+    "tcu": (32.7098, -97.3628),
+    "texas_tech": (33.5843, -101.8783),
+    "ucf": (28.6024, -81.2001),
+    "utah": (40.7649, -111.8421),
+    "west_virginia": (39.6480, -79.9559)
+}
+
+def haversine_matrix(origins: np.ndarray, destinations: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Compute great-circle distances in miles between two sets of coordinates
+
+    Args:
+        origins: Array of shape (n, 2) with (lat, lng) in degrees
+        destinations: Array of shape (m, 2); defaults to origins
+
+    Returns:
+        Array of shape (n, m) with distances in miles
+    """
+    if destinations is None:
+        destinations = origins
+
+    lat1 = np.radians(origins[:, 0])[:, None]
+    lng1 = np.radians(origins[:, 1])[:, None]
+    lat2 = np.radians(destinations[:, 0])[None, :]
+    lng2 = np.radians(destinations[:, 1])[None, :]
+
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+class DistanceMatrix:
+    """Road-mile distance matrix over schools and venues with O(1) lookups"""
+
+    def __init__(self, keys: List[str], coordinates: np.ndarray, miles: Optional[np.ndarray] = None,
+                 version: str = ""):
+        self.keys = list(keys)
+        self.index = {key: i for i, key in enumerate(self.keys)}
+        self.coordinates = np.asarray(coordinates, dtype=np.float64)
+        if miles is None:
+            miles = np.round(haversine_matrix(self.coordinates) * ROAD_FACTOR, 1)
+        self.miles = miles
+        self.version = version
+
+    @classmethod
+    def from_coordinates(cls, coordinates: Dict[str, Tuple[float, float]], version: str = "") -> "DistanceMatrix":
+        """
+        Build a matrix from an arbitrary set of locations (e.g. a hypothetical league)
+
+        Args:
+            coordinates: Mapping of location key to (lat, lng)
+            version: Optional version label; defaults to a hash of the coordinates
+        """
+        keys = list(coordinates.keys())
+        coords = np.array([coordinates[k] for k in keys], dtype=np.float64)
+        if not version:
+            version = hashlib.sha256(json.dumps([keys, coords.tolist()]).encode()).hexdigest()[:16]
+        return cls(keys, coords, version=version)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+
+    def distance(self, origin: str, destination: str) -> float:
+        """Distance in road miles between two schools or venues"""
+        return float(self.miles[self.index[origin], self.index[destination]])
+
+    def distances(self, pairs: Iterable[Tuple[str, str]]) -> np.ndarray:
+        """
+        Vectorized lookup for a list of (origin, destination) pairs
+
+        Raises:
+            KeyError: If any location is not in the matrix
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return np.zeros(0)
+        origins = np.fromiter((self.index[o] for o, _ in pairs), dtype=np.intp, count=len(pairs))
+        destinations = np.fromiter((self.index[d] for _, d in pairs), dtype=np.intp, count=len(pairs))
+        return self.miles[origins, destinations]
+
+    def submatrix(self, keys: List[str]) -> np.ndarray:
+        """Square sub-matrix for the given keys, in the given order"""
+        idx = np.array([self.index[k] for k in keys], dtype=np.intp)
+        return self.miles[np.ix_(idx, idx)]
+
+    def as_dict(self, keys: Optional[List[str]] = None) -> Dict[str, Dict[str, float]]:
+        """Nested dictionary form, as returned by the COMPASS distance matrix API"""
+        keys = keys or self.keys
+        sub = self.submatrix(keys)
+        return {a: {b: float(sub[i, j]) for j, b in enumerate(keys)} for i, a in enumerate(keys)}
+
+def load_locations(catalog: Optional[VenueCatalog] = None) -> Tuple[List[str], np.ndarray]:
+    """
+    Collect school and venue coordinates
+
+    Schools are keyed by school code and venues by "school:venue name", matching
+    the venue keys used by the campus conflicts agent.
+
+    Args:
+        catalog: Venue catalog to read venue coordinates from (defaults to the shared one)
+
+    Returns:
+        Tuple of (keys, coordinates)
+    """
+    catalog = catalog or get_catalog()
+    keys = list(SCHOOL_COORDINATES.keys())
+    coords = [SCHOOL_COORDINATES[k] for k in keys]
+
+    for school_code, school in catalog.data.get("schools", {}).items():
+        for venue in school.get("venues", []):
+            location = venue.get("location", {})
+            if "lat" in location and "lng" in location:
+                keys.append(f"{school_code}:{venue['name']}")
+                coords.append((location["lat"], location["lng"]))
+
+    return keys, np.array(coords, dtype=np.float64)
+
+def build_distance_matrix(catalog: Optional[VenueCatalog] = None, cache_dir: Optional[str] = CACHE_PATH) -> DistanceMatrix:
+    """
+    Build the distance matrix, reusing the on-disk copy when the inputs are unchanged
+
+    Args:
+        catalog: Venue catalog to read venue coordinates from (defaults to the shared one)
+        cache_dir: Directory for the persisted matrix, or None to skip persistence
+
+    Returns:
+        DistanceMatrix instance
+    """
+    catalog = catalog or get_catalog()
+    keys, coords = load_locations(catalog)
+
+    digest = hashlib.sha256(catalog.version.encode())
+    digest.update(json.dumps(SCHOOL_COORDINATES, sort_keys=True).encode())
+    digest.update(str(ROAD_FACTOR).encode())
+    version = digest.hexdigest()[:16]
+
+    cache_file = os.path.join(cache_dir, f"distance_matrix_{version}.npz") if cache_dir else None
+    if cache_file and os.path.exists(cache_file):
+        try:
+            with np.load(cache_file, allow_pickle=False) as cached:
+                return DistanceMatrix(cached["keys"].tolist(), cached["coordinates"], cached["miles"], version)
+        except Exception as e:
+            print(f"Error reading cached distance matrix: {str(e)}", file=sys.stderr)
+
+    matrix = DistanceMatrix(keys, coords, version=version)
+
+    if cache_file:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            np.savez(cache_file, keys=np.array(matrix.keys), coordinates=matrix.coordinates, miles=matrix.miles)
+        except Exception as e:
+            print(f"Error saving distance matrix: {str(e)}", file=sys.stderr)
+
+    return matrix
+
+_matrix: Optional[DistanceMatrix] = None
+_matrix_source: Optional[str] = None
+
+def get_distance_matrix() -> DistanceMatrix:
+    """
+    Get the shared distance matrix for this process, rebuilding it if the venue data changed
+    """
+    global _matrix, _matrix_source
+
+    catalog = get_catalog()
+    catalog.refresh()
+    if _matrix is None or catalog.version != _matrix_source:
+        _matrix = build_distance_matrix(catalog)
+        _matrix_source = catalog.version
+    return _matrix
+
+def get_travel_distance(origin: str, destination: str) -> float:
+    """
+    Get travel distance in road miles between two schools or venues
+
+    Raises:
+        KeyError: If either location is unknown
+    """
+    return get_distance_matrix().distance(origin, destination)
+
+def get_travel_distances(pairs: Iterable[Tuple[str, str]]) -> np.ndarray:
+    """
+    Get travel distances in road miles for a list of (origin, destination) pairs in one call
+    """
+    return get_distance_matrix().distances(pairs)
+
+def main():
+    parser = argparse.ArgumentParser(description='FlexTime Distance Engine')
+    parser.add_argument('-o', '--origin', type=str, help='Origin school code or "school:venue"')
+    parser.add_argument('-d', '--destination', type=str, help='Destination school code or "school:venue"')
+    parser.add_argument('--rebuild', action='store_true', help='Rebuild and persist the matrix')
+
+    args = parser.parse_args()
+
+    matrix = build_distance_matrix() if args.rebuild else get_distance_matrix()
+
+    if args.origin and args.destination:
+        print(f"{matrix.distance(args.origin, args.destination):.1f}")
+    else:
+        print(json.dumps({"version": matrix.version, "locations": len(matrix.keys)}, indent=2))
+
+if __name__ == "__main__":
+    main()
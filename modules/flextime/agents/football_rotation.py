@@ -0,0 +1,586 @@
+#!/usr/bin/env python3
+"""
+Football Rotation
+
+Generates multi-season football conference rotations from the parameters in
+historical_patterns_agent: nine conference games a season, the consecutive
+away limit, and protected rivalries played every year in the weeks allowed by
+the same tradition rules the agent validates schedules against.
+
+Each season is solved in two stages. Opponents and venues are chosen season
+by season, since fairness over the rotation (every pair home and away,
+18 home games per team) depends on the seasons before; weeks are then
+assigned to each season's games independently, in parallel across seasons.
+Both stages are cached on disk under a key that includes everything they
+depend on, so changing one season re-solves only that season and the seasons
+after it.
+
+Part of the XII-OS FlexTime module.
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import datetime
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+import scheduling_core
+import tradition_engine
+from historical_patterns_agent import SPORT_TRADITIONAL_PARAMETERS, tradition_rule_specs
+
+# FlexTime configuration
+FLEXTIME_VERSION = "1.0.0"
+FLEXTIME_MODULE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_PATH = os.path.join(FLEXTIME_MODULE_PATH, "data", "storage", "cache")
+ROTATION_CACHE_PATH = os.path.join(CACHE_PATH, "football_rotation")
+
+ROTATION_SEASONS = 4
+SEASON_OPENER = "08-29"          # first Saturday on or after this date opens the season
+NON_CONFERENCE_WEEKS = 3         # opening weeks kept for non-conference games where possible
+MIN_MEETINGS = 2                 # every pair meets home and away over the rotation
+MAX_MEETINGS = 3
+
+# Search settings
+OPPONENT_ITERATIONS = 20000
+WEEK_ITERATIONS = 20000
+STALL_ITERATIONS = 2000          # moves without improvement before a feasible search stops
+SEASON_ATTEMPTS = 4              # seeds tried before a season is reported unsolved
+HARD_VIOLATION_WEIGHT = 1000.0
+INITIAL_TEMPERATURE = 2.0
+FINAL_TEMPERATURE = 0.05
+REPEAT_WEIGHT = 0.2              # soft cost of meeting the same opponent in back-to-back seasons
+
+# Days after Thanksgiving of the day rules in the tradition rule set
+SPECIAL_DAYS = {"Black Friday": 1, "Thanksgiving Day": 0}
+
+def football_teams() -> List[str]:
+    """Conference football teams, from the basketball travel partners"""
+    pairs = SPORT_TRADITIONAL_PARAMETERS["mbasketball"]["parameters"]["travel_partners"]
+    return sorted(team for pair in pairs for team in pair)
+
+def season_weeks(season: int) -> List[datetime.date]:
+    """Saturdays of a season, from the opener through Thanksgiving weekend"""
+    opener = datetime.date.fromisoformat(f"{season}-{SEASON_OPENER}")
+    opener += datetime.timedelta(days=(5 - opener.weekday()) % 7)
+    last = scheduling_core.thanksgiving(season) + datetime.timedelta(days=2)
+    return [opener + datetime.timedelta(weeks=w) for w in range((last - opener).days // 7 + 1)]
+
+def protected_games(season: int) -> List[Dict[str, Any]]:
+    """
+    Games played every season, with the weeks they may be played in
+
+    Windows come from the football tradition rules that the historical
+    patterns agent validates against: one date rule per rivalry pair (a
+    season finale is the last week) and low-severity Black Friday and
+    Thanksgiving Day rules, which pin a game to that day when it fits its
+    date rule. When a team's protected games cannot all fit in their windows,
+    a day rule is given up first, then a window is widened by the week before.
+
+    Returns:
+        List of {"teams", "name", "weeks" (indices into season_weeks), "day_offset", "severity"}
+    """
+    weeks = season_weeks(season)
+    games = {}
+    unpinned = {}  # weeks each day-pinned game had under its date rule alone
+
+    def allowed(phrase):
+        if phrase.lower() in tradition_engine.FINALE_PHRASES:
+            return [len(weeks) - 1]
+        window = scheduling_core.tradition_window(phrase, season)
+        if window is None:
+            return list(range(len(weeks)))
+        inside = [w for w, day in enumerate(weeks) if window[0] <= day <= window[1]]
+        if inside:
+            return inside
+        middle = window[0] + (window[1] - window[0]) / 2
+        return [min(range(len(weeks)), key=lambda w: abs((weeks[w] - middle).days))]
+
+    specs = tradition_rule_specs("football")
+    for spec in specs:
+        if spec["phrase"] not in SPECIAL_DAYS:
+            games[frozenset(spec["teams"])] = {"teams": tuple(spec["teams"]), "name": spec["name"],
+                                               "weeks": allowed(spec["phrase"]), "day_offset": None,
+                                               "severity": spec["severity"]}
+    for spec in specs:
+        if spec["phrase"] in SPECIAL_DAYS:
+            pair = frozenset(spec["teams"])
+            game = games.setdefault(pair, {"teams": tuple(spec["teams"]), "name": spec["name"],
+                                           "weeks": list(range(len(weeks))), "day_offset": None,
+                                           "severity": spec["severity"]})
+            day_weeks = [w for w in allowed(spec["phrase"]) if w in game["weeks"]]
+            if day_weeks:
+                unpinned[pair] = game["weeks"]
+                game["weeks"], game["day_offset"] = day_weeks, SPECIAL_DAYS[spec["phrase"]]
+
+    widened = True
+    while widened:
+        widened = False
+        for team in sorted({team for pair in games for team in pair}):
+            own = [game for game in games.values() if team in game["teams"]]
+            if len(set().union(*(game["weeks"] for game in own))) >= len(own):
+                continue
+            pinned = [game for game in own if game["day_offset"] is not None]
+            if pinned:
+                game = pinned[0]
+                game["day_offset"] = None
+                game["weeks"] = unpinned[frozenset(game["teams"])]
+                widened = True
+                continue
+            movable = [game for game in own if game["day_offset"] is None and game["weeks"][0] > 0]
+            if movable:
+                game = min(movable, key=lambda game: (game["severity"] != "Low", len(game["weeks"])))
+                game["weeks"] = [game["weeks"][0] - 1] + game["weeks"]
+                widened = True
+
+    return list(games.values())
+
+def _cache_key(*parts: Any) -> str:
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()[:20]
+
+def _load_cached(cache_dir: Optional[str], name: str) -> Optional[Any]:
+    if not cache_dir:
+        return None
+    path = os.path.join(cache_dir, f"{name}.json")
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Error reading cached rotation {name}: {str(e)}", file=sys.stderr)
+        return None
+
+def _save_cached(cache_dir: Optional[str], name: str, value: Any):
+    if not cache_dir:
+        return
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(os.path.join(cache_dir, f"{name}.json"), "w") as f:
+            json.dump(value, f)
+    except Exception as e:
+        print(f"Error saving cached rotation {name}: {str(e)}", file=sys.stderr)
+
+def choose_opponents(teams: List[str], locks: List[Tuple[str, str]], history: List[List[List[str]]],
+                     season_index: int, seasons: int, games: int, excluded: List[Tuple[str, str]],
+                     seed: int, iterations: int = OPPONENT_ITERATIONS) -> Optional[List[List[str]]]:
+    """
+    Choose one season's conference games and venues
+
+    Protected games are always played, at the venue opposite their last
+    meeting. Other pairs are picked by degree-preserving edge swaps and
+    venue flips under simulated annealing, so that the season is balanced
+    (4 or 5 home games), the rotation stays balanced, no pair meets more
+    than MAX_MEETINGS times, and the remaining seasons can still bring every
+    pair to MIN_MEETINGS.
+
+    Args:
+        teams: Team codes
+        locks: Pairs that must meet this season
+        history: Games [home, away] of each earlier season of the rotation
+        season_index: Position of this season in the rotation
+        seasons: Seasons in the rotation
+        games: Conference games per team
+        excluded: Pairs that must not meet this season
+        seed: Random seed
+        iterations: Annealing moves
+
+    Returns:
+        List of [home, away] games, or None if no feasible season was found
+    """
+    rng = np.random.default_rng(seed)
+    index = {team: i for i, team in enumerate(teams)}
+    n = len(teams)
+
+    lock = np.zeros((n, n), dtype=bool)
+    for a, b in locks:
+        lock[index[a], index[b]] = lock[index[b], index[a]] = True
+    banned = lock | np.eye(n, dtype=bool)
+    for a, b in excluded:
+        banned[index[a], index[b]] = banned[index[b], index[a]] = True
+
+    meetings = np.zeros((n, n), dtype=np.int64)
+    last_host = np.full((n, n), -1, dtype=np.int64)
+    previous = np.zeros((n, n), dtype=bool)
+    past_home = np.zeros(n, dtype=np.int64)
+    for k, season_games in enumerate(history):
+        for home, away in season_games:
+            h, a = index[home], index[away]
+            meetings[h, a] += 1
+            meetings[a, h] += 1
+            last_host[h, a] = last_host[a, h] = h
+            past_home[h] += 1
+            if k == len(history) - 1:
+                previous[h, a] = previous[a, h] = True
+
+    # hosts[a, b]: a hosts b if they meet. A pair that has met once alternates.
+    rows = np.arange(n)[:, None]
+    upper = np.triu(rng.random((n, n)) < 0.5, 1)
+    hosts = upper | np.tril(~upper.T, -1)
+    met = last_host >= 0
+    alternate = met & (lock | (meetings == 1))
+    hosts = np.where(alternate, last_host != rows, hosts)
+    first_lock = lock & ~met
+    hosts = np.where(first_lock, (rows < rows.T) == (season_index % 2 == 0), hosts)
+    np.fill_diagonal(hosts, False)
+    flippable = ~alternate & ~first_lock
+
+    degree = games - lock.sum(axis=1)
+    graph = scheduling_core.random_graph(degree, banned, rng)
+    if graph is None:
+        return None
+
+    remaining = seasons - season_index - 1
+    locked = lock.sum(axis=1)
+    capacity = remaining * (games - locked)
+    target = games * (season_index + 1) / 2
+    total_target = games * seasons / 2
+    season_home = (games // 2, games - games // 2)
+
+    def evaluate(graph, hosts):
+        played = graph | lock
+        count = meetings + played
+        home = (hosts & played).sum(axis=1)
+        need = np.clip(MIN_MEETINGS - count, 0, None)
+        np.fill_diagonal(need, 0)
+
+        # Home games the later seasons are already committed to: protected games
+        # keep alternating and pairs met once must meet again at the other venue
+        pending = (count == 1) & ~lock
+        host_now = np.where(played, hosts, last_host == rows)
+        pending_home = (pending & ~host_now).sum(axis=1)
+        lock_home = (lock & hosts).sum(axis=1) * (remaining // 2) + (lock & ~hosts).sum(axis=1) * ((remaining + 1) // 2)
+        committed = pending_home + lock_home
+        open_games = capacity - pending.sum(axis=1)
+        cumulative = past_home + home
+        most = np.minimum(remaining * season_home[1], total_target + 1 - cumulative)
+        least = np.maximum(remaining * season_home[0], total_target - 1 - cumulative)
+
+        hard = (((count > MAX_MEETINGS) & graph).sum() // 2
+                + (need > remaining).sum() // 2
+                + np.clip(need.sum(axis=1) - capacity, 0, None).sum()
+                + np.clip(np.abs(home - games / 2) - 0.5, 0, None).sum()
+                + np.clip(np.abs(cumulative - target) - 1, 0, None).sum()
+                + np.clip(committed - most, 0, None).sum()
+                + np.clip(least - committed - open_games, 0, None).sum())
+        soft = REPEAT_WEIGHT * (graph & previous).sum() / 2
+        return hard, HARD_VIOLATION_WEIGHT * hard + soft
+
+    hard, cost = evaluate(graph, hosts)
+    best = (cost, hard, graph, hosts)
+    cooling = (FINAL_TEMPERATURE / INITIAL_TEMPERATURE) ** (1.0 / max(iterations, 1))
+    temperature = INITIAL_TEMPERATURE
+
+    improved = 0
+    for step in range(iterations):
+        if best[1] == 0 and step - improved > STALL_ITERATIONS:
+            break
+        new_graph, new_hosts = graph, hosts
+        if rng.random() < 0.7:
+            edges = np.argwhere(np.triu(graph))
+            (a, b), (c, d) = edges[rng.choice(len(edges), 2, replace=False)]
+            if rng.random() < 0.5:
+                c, d = d, c
+            if len({a, b, c, d}) < 4 or banned[a, c] or banned[b, d] or graph[a, c] or graph[b, d]:
+                continue
+            new_graph = graph.copy()
+            new_graph[a, b] = new_graph[b, a] = new_graph[c, d] = new_graph[d, c] = False
+            new_graph[a, c] = new_graph[c, a] = new_graph[b, d] = new_graph[d, b] = True
+        else:
+            edges = np.argwhere(np.triu(graph & flippable))
+            if not len(edges):
+                continue
+            a, b = edges[rng.integers(len(edges))]
+            new_hosts = hosts.copy()
+            new_hosts[a, b], new_hosts[b, a] = hosts[b, a], hosts[a, b]
+
+        new_hard, new_cost = evaluate(new_graph, new_hosts)
+        delta = new_cost - cost
+        if delta <= 0 or rng.random() < np.exp(-delta / temperature):
+            graph, hosts, hard, cost = new_graph, new_hosts, new_hard, new_cost
+            if cost < best[0]:
+                best, improved = (cost, hard, graph, hosts), step
+        temperature *= cooling
+
+    _, hard, graph, hosts = best
+    if hard > 0:
+        return None
+    played = np.argwhere(np.triu(graph | lock))
+    return [[teams[a], teams[b]] if hosts[a, b] else [teams[b], teams[a]] for a, b in played]
+
+def assign_weeks(teams: List[str], games: List[List[str]], allowed: List[List[int]], weeks: int,
+                 limit: int, seed: int, iterations: int = WEEK_ITERATIONS) -> Optional[List[int]]:
+    """
+    Assign one season's games to weeks
+
+    Each team plays at most once a week and never more than `limit` conference
+    road games in a row; protected games stay within their weeks, and other
+    games avoid the non-conference opening weeks where possible.
+
+    Args:
+        teams: Team codes
+        games: [home, away] games
+        allowed: Week indices each game may be played in
+        weeks: Weeks in the season
+        limit: Conference road games allowed in a row
+        seed: Random seed
+        iterations: Annealing moves
+
+    Returns:
+        Week index per game, or None if no feasible assignment was found
+    """
+    rng = np.random.default_rng(seed)
+    index = {team: i for i, team in enumerate(teams)}
+    home = np.array([index[h] for h, _ in games])
+    away = np.array([index[a] for _, a in games])
+    n = len(teams)
+    per_team = np.bincount(np.concatenate([home, away]), minlength=n)
+    flexible = np.array([len(options) == weeks for options in allowed])
+
+    week = np.array([rng.choice(options) for options in allowed])
+
+    def evaluate(week):
+        busy = (np.bincount(home * weeks + week, minlength=n * weeks)
+                + np.bincount(away * weeks + week, minlength=n * weeks)).reshape(n, weeks)
+        road = np.zeros((n, weeks), dtype=bool)
+        road[away, week] = True
+        order = np.argsort(busy == 0, axis=1, kind="stable")
+        sequence = np.take_along_axis(road, order, axis=1)
+        sequence &= np.arange(weeks) < per_team[:, None]
+        hard = np.clip(busy - 1, 0, None).sum() + scheduling_core.road_streak_excess(sequence, limit).sum()
+        soft = (flexible & (week < NON_CONFERENCE_WEEKS)).sum()
+        return hard, HARD_VIOLATION_WEIGHT * hard + soft
+
+    hard, cost = evaluate(week)
+    best = (cost, hard, week)
+    cooling = (FINAL_TEMPERATURE / INITIAL_TEMPERATURE) ** (1.0 / max(iterations, 1))
+    temperature = INITIAL_TEMPERATURE
+
+    improved = 0
+    for step in range(iterations):
+        if best[1] == 0 and step - improved > STALL_ITERATIONS:
+            break
+        new_week = week.copy()
+        g = rng.integers(len(games))
+        if rng.random() < 0.6:
+            new_week[g] = rng.choice(allowed[g])
+        else:
+            other = rng.integers(len(games))
+            if week[other] not in allowed[g] or week[g] not in allowed[other]:
+                continue
+            new_week[g], new_week[other] = week[other], week[g]
+
+        new_hard, new_cost = evaluate(new_week)
+        delta = new_cost - cost
+        if delta <= 0 or rng.random() < np.exp(-delta / temperature):
+            week, hard, cost = new_week, new_hard, new_cost
+            if cost < best[0]:
+                best, improved = (cost, hard, week), step
+        temperature *= cooling
+
+    return [int(w) for w in best[2]] if best[1] == 0 else None
+
+def _solve_weeks(task: Dict[str, Any]) -> Optional[List[int]]:
+    """Worker entry point: try a few seeds for one season's week assignment"""
+    for attempt in range(SEASON_ATTEMPTS):
+        result = assign_weeks(task["teams"], task["games"], task["allowed"], task["weeks"], task["limit"],
+                              task["seed"] + attempt, task["iterations"])
+        if result is not None:
+            return result
+    return None
+
+def _season_schedule(season: int, games: List[List[str]], week_of_game: List[int],
+                     protected: List[Dict[str, Any]], limit: int) -> Dict[str, Any]:
+    """Dated games and metrics for one solved season"""
+    weeks = season_weeks(season)
+    special = {frozenset(game["teams"]): game for game in protected}
+    schedule = []
+    for (home, away), week in zip(games, week_of_game):
+        date = weeks[week]
+        entry = {"week": week + 1, "home_team": home, "away_team": away}
+        game = special.get(frozenset((home, away)))
+        if game:
+            entry["rivalry"] = game["name"]
+            if game["day_offset"] is not None:
+                date = scheduling_core.thanksgiving(season) + datetime.timedelta(days=game["day_offset"])
+        entry["date"] = date.isoformat()
+        entry["day"] = scheduling_core.WEEKDAYS[date.weekday()]
+        schedule.append(entry)
+    schedule.sort(key=lambda entry: (entry["week"], entry["home_team"]))
+
+    teams = sorted({team for pair in games for team in pair})
+    index = {team: i for i, team in enumerate(teams)}
+    road = np.zeros((len(teams), len(weeks)), dtype=bool)
+    played = np.zeros((len(teams), len(weeks)), dtype=bool)
+    for (home, away), week in zip(games, week_of_game):
+        road[index[away], week] = True
+        played[index[home], week] = played[index[away], week] = True
+    sequence = np.array([row[mask] for row, mask in zip(road, played)])
+
+    return {
+        "season": season,
+        "games": schedule,
+        "metrics": {
+            "weeks": len(weeks),
+            "home_games": {team: sum(1 for h, _ in games if h == team) for team in teams},
+            "max_consecutive_away": int(scheduling_core.max_road_streak(sequence).max()),
+            "consecutive_away_limit": limit
+        }
+    }
+
+def generate_rotation(first_season: Optional[int] = None, seasons: int = ROTATION_SEASONS,
+                      overrides: Optional[Dict[int, Dict[str, List[List[str]]]]] = None, seed: int = 0,
+                      workers: Optional[int] = None, cache_dir: Optional[str] = ROTATION_CACHE_PATH,
+                      opponent_iterations: int = OPPONENT_ITERATIONS,
+                      week_iterations: int = WEEK_ITERATIONS) -> Dict[str, Any]:
+    """
+    Generate a multi-season football conference rotation
+
+    Args:
+        first_season: First season year (defaults to the next season that has not started)
+        seasons: Seasons in the rotation
+        overrides: Per season year, {"fixed": [[a, b], ...]} pairs that must meet and
+            {"excluded": [[a, b], ...]} pairs that must not
+        seed: Base random seed; results are deterministic and cached per seed
+        workers: Worker processes for the weekly stage
+        cache_dir: Directory for cached partial solutions, or None to disable caching
+        opponent_iterations: Annealing moves per season for opponents and venues
+        week_iterations: Annealing moves per season for the week assignment
+
+    Returns:
+        Dictionary with the solved "seasons" (dated games and metrics), a
+        "rotation" summary, any "unsolved" seasons and "search" statistics
+
+    Raises:
+        ValueError: If the rotation has too few seasons for every pair to meet MIN_MEETINGS times
+    """
+    started = time.perf_counter()
+    football = SPORT_TRADITIONAL_PARAMETERS["football"]["parameters"]
+    games_per_team = football["conference_games"]
+    limit = football["max_consecutive_away"]
+    teams = football_teams()
+    needed = -(-MIN_MEETINGS * (len(teams) - 1) // games_per_team)
+    if seasons < needed:
+        raise ValueError(f"A rotation needs at least {needed} seasons for every pair to meet {MIN_MEETINGS} times "
+                         f"with {games_per_team} conference games a season, got {seasons}")
+    overrides = overrides or {}
+    if first_season is None:
+        today = datetime.date.today()
+        first_season = today.year if today < datetime.date.fromisoformat(f"{today.year}-{SEASON_OPENER}") else today.year + 1
+
+    stats = {"opponents": {"solved": [], "cached": []}, "weeks": {"solved": [], "cached": []}}
+    history = []
+    parent = _cache_key(FLEXTIME_VERSION, teams, football, seed, opponent_iterations)
+    season_games = {}
+    unsolved = []
+
+    # Stage 1: opponents and venues, chained through the rotation
+    for k in range(seasons):
+        season = first_season + k
+        protected = protected_games(season)
+        season_overrides = overrides.get(season, {})
+        locks = [tuple(game["teams"]) for game in protected] + [tuple(pair) for pair in season_overrides.get("fixed", [])]
+        excluded = [tuple(pair) for pair in season_overrides.get("excluded", [])]
+        key = _cache_key(parent, season, k, seasons, locks, excluded)
+
+        games = _load_cached(cache_dir, f"opponents_{key}")
+        if games is not None:
+            stats["opponents"]["cached"].append(season)
+        else:
+            for attempt in range(SEASON_ATTEMPTS):
+                games = choose_opponents(teams, locks, history, k, seasons, games_per_team, excluded,
+                                         seed + 1000 * k + attempt, opponent_iterations)
+                if games is not None:
+                    break
+            if games is None:
+                unsolved.extend(range(season, first_season + seasons))
+                break
+            _save_cached(cache_dir, f"opponents_{key}", games)
+            stats["opponents"]["solved"].append(season)
+
+        season_games[season] = (key, games, protected)
+        history.append(games)
+        parent = key
+
+    # Stage 2: weeks, independent per season
+    week_of_games = {}
+    tasks = []
+    for season, (key, games, protected) in season_games.items():
+        weeks = season_weeks(season)
+        windows = {frozenset(game["teams"]): game["weeks"] for game in protected}
+        allowed = [windows.get(frozenset(pair), list(range(len(weeks)))) for pair in games]
+        task_key = _cache_key(key, [d.isoformat() for d in weeks], allowed, limit, week_iterations)
+        cached = _load_cached(cache_dir, f"weeks_{task_key}")
+        if cached is not None:
+            week_of_games[season] = cached
+            stats["weeks"]["cached"].append(season)
+        else:
+            tasks.append((season, task_key, {"teams": teams, "games": games, "allowed": allowed, "weeks": len(weeks),
+                                             "limit": limit, "seed": seed + season, "iterations": week_iterations}))
+
+    results, stats["workers"] = scheduling_core.parallel_map(_solve_weeks, [task for _, _, task in tasks], workers)
+    for (season, task_key, _), result in zip(tasks, results):
+        if result is None:
+            unsolved.append(season)
+            continue
+        _save_cached(cache_dir, f"weeks_{task_key}", result)
+        week_of_games[season] = result
+        stats["weeks"]["solved"].append(season)
+
+    solved = [_season_schedule(season, season_games[season][1], week_of_games[season], season_games[season][2], limit)
+              for season in sorted(week_of_games)]
+
+    meetings = {}
+    home_games = dict.fromkeys(teams, 0)
+    for schedule in solved:
+        for game in schedule["games"]:
+            meetings.setdefault(frozenset((game["home_team"], game["away_team"])), []).append(game["home_team"])
+            home_games[game["home_team"]] += 1
+    complete = len(solved) == seasons
+    stats["elapsed_seconds"] = round(time.perf_counter() - started, 2)
+
+    return {
+        "first_season": first_season,
+        "seasons": solved,
+        "unsolved": sorted(set(unsolved)),
+        "rotation": {
+            "min_meetings": min((len(hosts) for hosts in meetings.values()), default=0) if complete else None,
+            "max_meetings": max((len(hosts) for hosts in meetings.values()), default=0),
+            "pairs_home_and_away": sum(1 for hosts in meetings.values() if len(set(hosts)) == 2),
+            "pairs": len(teams) * (len(teams) - 1) // 2,
+            "home_games": home_games
+        },
+        "search": stats
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='FlexTime Football Rotation')
+    parser.add_argument('--first-season', type=int, help='First season year')
+    parser.add_argument('-n', '--seasons', type=int, default=ROTATION_SEASONS, help='Seasons in the rotation')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('-w', '--workers', type=int, help='Worker processes')
+    parser.add_argument('--overrides', type=str, help='JSON file of per-season fixed/excluded pairs')
+    parser.add_argument('--no-cache', action='store_true', help='Solve every season from scratch without caching')
+
+    args = parser.parse_args()
+
+    overrides = None
+    if args.overrides:
+        with open(args.overrides) as f:
+            overrides = {int(season): value for season, value in json.load(f).items()}
+
+    try:
+        result = generate_rotation(args.first_season, args.seasons, overrides, args.seed, args.workers,
+                                   None if args.no_cache else ROTATION_CACHE_PATH)
+    except ValueError as e:
+        parser.error(str(e))
+    if result["unsolved"]:
+        print(f"No feasible schedule found for seasons {result['unsolved']}; try another seed", file=sys.stderr)
+    print(json.dumps(result, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -13,16 +13,23 @@ import sys
 import json
 import argparse
 import datetime
-import subprocess
-import requests
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, Tuple
 import re
 
+import numpy as np
+
+import distance_engine
+import climatology
+import venue_calendar
+import venue_catalog
+import weather_provider
+import agent_runtime
+
 # FlexTime configuration
 FLEXTIME_VERSION = "1.0.0"
 FLEXTIME_MODULE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 AGENTS_PATH = os.path.dirname(os.path.abspath(__file__))
-VENUE_DATA_PATH = os.path.join(FLEXTIME_MODULE_PATH, "data", "venue_data.json")
+VENUE_DATA_PATH = venue_catalog.VENUE_DATA_PATH
 SCHEDULING_DATA_PATH = "/Users/nickthequick/XII-OS/data/scheduling_data"
 
 # Big 12 Conference constants
@@ -98,6 +105,66 @@ SPORT_REQUIREMENTS = {
     }
 }
 
+# Estimated game duration (hours) by sport
+GAME_DURATION_HOURS = {
+    "mbasketball": 2.5,
+    "wbasketball": 2.5,
+    "football": 3.5,
+    "baseball": 3.0,
+    "softball": 3.0,
+    "volleyball": 2.0,
+    "soccer": 2.5
+}
+DEFAULT_GAME_DURATION_HOURS = 3.0
+GATES_OPEN_HOURS = 1.5  # gates open this long before the event
+
+# When each role is on site: (timeline mark it arrives at, timeline mark it leaves at)
+ROLE_SHIFTS = {
+    "security": ("setup_start", "teardown_end"),
+    "grounds_crew": ("setup_start", "teardown_end"),
+    "television": ("setup_start", "event_end"),
+    "medical": ("gates_open", "event_end"),
+    "ticketing": ("gates_open", "event_end"),
+    "concessions": ("gates_open", "event_end"),
+    "officials": ("event_start", "event_end")
+}
+
+# Staff per role for one event, by sport (roles not listed need one person)
+STAFF_HEADCOUNT = {
+    "football": {"security": 120, "medical": 12, "officials": 8, "concessions": 150, "television": 40, "ticketing": 40},
+    "mbasketball": {"security": 40, "medical": 4, "officials": 3, "concessions": 50, "television": 20, "ticketing": 15},
+    "wbasketball": {"security": 25, "medical": 4, "officials": 3, "concessions": 30, "television": 12, "ticketing": 10},
+    "baseball": {"grounds_crew": 12, "security": 15, "medical": 3, "officials": 4, "concessions": 20, "ticketing": 8},
+    "softball": {"grounds_crew": 8, "security": 10, "medical": 2, "officials": 4, "concessions": 12, "ticketing": 6},
+    "volleyball": {"security": 15, "medical": 2, "officials": 4, "concessions": 15, "ticketing": 6},
+    "soccer": {"grounds_crew": 6, "security": 12, "medical": 2, "officials": 4, "ticketing": 6}
+}
+
+# Staff a campus can field per role at one time
+DEFAULT_STAFF_CAPACITY = {
+    "security": 150,
+    "grounds_crew": 20,
+    "television": 50,
+    "medical": 15,
+    "ticketing": 50,
+    "concessions": 180,
+    "officials": 20
+}
+
+# Weather risk thresholds
+RISK_LEVELS = ["Low", "Medium", "High"]
+PRECIP_HIGH_RISK = 70       # % chance of precipitation above which risk is High
+PRECIP_MEDIUM_RISK = 40     # % chance of precipitation above which risk is Medium
+EXTREME_HEAT_F = 95         # forecast high above which risk is at least Medium
+FREEZE_F = 32               # forecast low below which freeze-sensitive sports are at least Medium
+FREEZE_SENSITIVE_SPORTS = ["football", "soccer"]
+CLIMATE_HAZARD_NOTES = {
+    "rain": "Rain",
+    "lightning": "Lightning",
+    "freeze": "Freezing temperatures",
+    "heat": "Extreme heat"
+}
+
 # Utility functions
 def get_school_context() -> str:
     """
@@ -121,39 +188,19 @@ def get_school_context() -> str:
 
 def load_venue_data() -> Dict[str, Any]:
     """
-    Load venue data from the centralized JSON file
+    Get venue data from the shared venue catalog
     
     Returns:
         Dictionary containing venue data for all schools
     """
-    try:
-        if os.path.exists(VENUE_DATA_PATH):
-            with open(VENUE_DATA_PATH, 'r') as f:
-                venue_data = json.load(f)
-            return venue_data
-        else:
-            # Call the venue data agent if needed
-            subprocess.run([
-                sys.executable,
-                os.path.join(AGENTS_PATH, "venue_data_agent.py"),
-                "-p", "retrieve venue data for all schools"
-            ])
-            
-            # Try to load again
-            if os.path.exists(VENUE_DATA_PATH):
-                with open(VENUE_DATA_PATH, 'r') as f:
-                    venue_data = json.load(f)
-                return venue_data
-            
-            print(f"Warning: Venue data file not found at {VENUE_DATA_PATH}", file=sys.stderr)
-            return {"schools": {}}
-    except Exception as e:
-        print(f"Error loading venue data: {str(e)}", file=sys.stderr)
-        return {"schools": {}}
+    return venue_catalog.get_catalog().data
 
 def get_weather_forecast(school_code: str, start_date: str, end_date: str) -> List[Dict[str, Any]]:
     """
-    Get weather forecast for a school location using the COMPASS agent
+    Get weather forecast for a school location within a date range
+    
+    Forecasts come from the shared weather provider, which caches them per
+    (school, date) in memory and on disk.
     
     Args:
         school_code: School identifier
@@ -164,41 +211,7 @@ def get_weather_forecast(school_code: str, start_date: str, end_date: str) -> Li
         List of weather forecasts for each day
     """
     try:
-        # Call the COMPASS integration agent
-        result = subprocess.run([
-            sys.executable,
-            os.path.join(AGENTS_PATH, "compass_integration_agent.py"),
-            "-p", f"Get weather forecast for {school_code} from {start_date} to {end_date}"
-        ], capture_output=True, text=True)
-        
-        # Parse the output
-        # In a real implementation, we would parse structured data
-        # For now, we'll return a mock forecast
-        
-        # Mock forecast data
-        forecasts = []
-        start = datetime.datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.datetime.strptime(end_date, "%Y-%m-%d")
-        days = (end - start).days + 1
-        
-        for i in range(days):
-            day = start + datetime.timedelta(days=i)
-            day_str = day.strftime("%Y-%m-%d")
-            
-            # Create a mock forecast
-            forecast = {
-                "date": day_str,
-                "school": school_code,
-                "conditions": "Sunny",
-                "temperature": {"high": 75, "low": 60, "unit": "F"},
-                "precipitation": {"chance": 10, "type": "none"},
-                "wind": {"speed": 5, "direction": "NW"},
-                "advisories": []
-            }
-            
-            forecasts.append(forecast)
-        
-        return forecasts
+        return weather_provider.get_provider().get_forecast(school_code, start_date, end_date)
     except Exception as e:
         print(f"Error getting weather forecast: {str(e)}", file=sys.stderr)
         return []
@@ -212,67 +225,74 @@ def check_venue_availability(school_code: str, venue_name: str, date: str, start
         venue_name: Name of the venue
         date: Date (YYYY-MM-DD)
         start_time: Start time (HH:MM)
-        end_time: End time (HH:MM)
+        end_time: End time (HH:MM); earlier than start_time means after midnight
         
     Returns:
-        Dictionary with availability information
+        Dictionary with availability information; when the venue is booked it
+        also lists the conflicting bookings and the next free window of the
+        same length
     """
-    # In a real implementation, this would check a venue calendar database
-    # This is a simplified mock implementation
-    
-    # Convert times to datetime objects for comparison
-    date_obj = datetime.datetime.strptime(date, "%Y-%m-%d")
-    start_dt = datetime.datetime.strptime(f"{date} {start_time}", "%Y-%m-%d %H:%M")
-    end_dt = datetime.datetime.strptime(f"{date} {end_time}", "%Y-%m-%d %H:%M")
-    
-    # Mock events calendar - in reality, this would come from a database
-    mock_calendar = {
-        "kansas": {
-            "Allen Fieldhouse": [
-                {"date": "2024-02-15", "start_time": "18:00", "end_time": "22:00", "event": "Men's Basketball vs. Baylor"},
-                {"date": "2024-02-18", "start_time": "14:00", "end_time": "18:00", "event": "Women's Basketball vs. Iowa State"}
-            ]
-        },
-        "iowa_state": {
-            "Hilton Coliseum": [
-                {"date": "2024-02-17", "start_time": "19:00", "end_time": "23:00", "event": "Men's Basketball vs. TCU"},
-                {"date": "2024-02-20", "start_time": "18:00", "end_time": "22:00", "event": "Wrestling Meet vs. Oklahoma State"}
-            ]
-        }
-    }
+    try:
+        calendar = venue_calendar.get_calendar()
+        conflicts = calendar.conflicts(school_code, venue_name, date, start_time, end_time)
+    except Exception as e:
+        print(f"Error checking venue calendar: {str(e)}", file=sys.stderr)
+        return {"available": True, "conflicts": [], "notes": "Venue calendar unavailable"}
     
-    # Check if we have calendar data for this school and venue
-    if school_code in mock_calendar and venue_name in mock_calendar[school_code]:
-        events = mock_calendar[school_code][venue_name]
-        
-        # Check for conflicts
-        conflicts = []
-        for event in events:
-            event_date = datetime.datetime.strptime(event["date"], "%Y-%m-%d")
-            event_start = datetime.datetime.strptime(f"{event['date']} {event['start_time']}", "%Y-%m-%d %H:%M")
-            event_end = datetime.datetime.strptime(f"{event['date']} {event['end_time']}", "%Y-%m-%d %H:%M")
-            
-            # Check if the dates match and times overlap
-            if event_date.date() == date_obj.date() and (
-                (start_dt <= event_start < end_dt) or
-                (start_dt < event_end <= end_dt) or
-                (event_start <= start_dt and event_end >= end_dt)
-            ):
-                conflicts.append(event)
-        
-        if conflicts:
-            return {
-                "available": False,
-                "conflicts": conflicts
-            }
+    if not conflicts:
+        return {"available": True, "conflicts": []}
     
-    # If we reach here, the venue is available (or we don't have data)
+    start = venue_calendar.to_minute(date, start_time)
+    end = venue_calendar.to_minute(date, end_time)
+    duration = end - start if end > start else end + venue_calendar.MINUTES_PER_DAY - start
+    return {
+        "available": False,
+        "conflicts": conflicts,
+        "next_available": calendar.next_free_window(school_code, venue_name, date, start_time, duration)
+    }
+
+def _venue_name(school_code: str, sport: str) -> str:
+    """Venue a school uses for a sport according to the venue catalog"""
+    return (venue_catalog.get_catalog().venue_for(school_code, sport) or {}).get("name", "")
+
+def _operations_windows() -> Dict[str, Dict[str, int]]:
+    """Setup and teardown windows per sport in minutes, from SPORT_REQUIREMENTS"""
     return {
-        "available": True,
-        "conflicts": []
+        "setup_minutes": {sport: int(info.get("setup_time", 0) * 60) for sport, info in SPORT_REQUIREMENTS.items()},
+        "teardown_minutes": {sport: int(info.get("teardown_time", 0) * 60) for sport, info in SPORT_REQUIREMENTS.items()}
     }
 
-def assess_weather_risk(school_code: str, sport: str, date: str) -> Dict[str, Any]:
+def load_season_calendar(schedules: Dict[str, List[Dict[str, Any]]], source: str = "season") -> int:
+    """
+    Book a season's home events in the venue calendar with their setup and teardown windows
+    
+    Args:
+        schedules: Dictionary mapping sport codes to lists of scheduled events
+        source: Label for this load; loading the same source again replaces it
+        
+    Returns:
+        Number of bookings loaded
+    """
+    return venue_calendar.get_calendar().load_schedules(schedules, _venue_name, source, **_operations_windows())
+
+def check_schedule_availability(schedules: Dict[str, List[Dict[str, Any]]],
+                                exclude_source: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Check every home event of a candidate schedule against the venue calendar in one pass
+    
+    Args:
+        schedules: Dictionary mapping sport codes to lists of scheduled events
+        exclude_source: Calendar source to ignore, e.g. an earlier load of the same schedule
+        
+    Returns:
+        Dictionary with the events whose venue is booked ("conflicts") and their count
+    """
+    conflicts = venue_calendar.get_calendar().sweep(schedules, _venue_name, exclude_source=exclude_source,
+                                                    **_operations_windows())
+    return {"available": not conflicts, "conflict_count": len(conflicts), "conflicts": conflicts}
+
+def assess_weather_risk(school_code: str, sport: str, date: str,
+                        forecast: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Assess weather-related risks for a scheduled event
     
@@ -280,6 +300,8 @@ def assess_weather_risk(school_code: str, sport: str, date: str) -> Dict[str, An
         school_code: School identifier
         sport: Sport code
         date: Event date (YYYY-MM-DD)
+        forecast: Forecast for the date if already looked up (e.g. from a bulk
+            weather_provider lookup); fetched from the provider otherwise
         
     Returns:
         Dictionary with weather risk assessment
@@ -296,7 +318,9 @@ def assess_weather_risk(school_code: str, sport: str, date: str) -> Dict[str, An
         }
     
     # Get the weather forecast
-    forecast = get_weather_forecast(school_code, date, date)
+    if forecast is None:
+        forecasts = get_weather_forecast(school_code, date, date)
+        forecast = forecasts[0] if forecasts else None
     
     if not forecast:
         return {
@@ -306,7 +330,7 @@ def assess_weather_risk(school_code: str, sport: str, date: str) -> Dict[str, An
         }
     
     # Analyze the forecast for the specific date
-    day_forecast = forecast[0]
+    day_forecast = forecast
     
     # Determine risk level based on conditions
     risk_level = "Low"
@@ -314,10 +338,10 @@ def assess_weather_risk(school_code: str, sport: str, date: str) -> Dict[str, An
     
     # Check precipitation
     precip_chance = day_forecast.get("precipitation", {}).get("chance", 0)
-    if precip_chance > 70:
+    if precip_chance > PRECIP_HIGH_RISK:
         risk_level = "High"
         risk_notes.append(f"High precipitation chance ({precip_chance}%)")
-    elif precip_chance > 40:
+    elif precip_chance > PRECIP_MEDIUM_RISK:
         risk_level = "Medium"
         risk_notes.append(f"Moderate precipitation chance ({precip_chance}%)")
     
@@ -325,12 +349,12 @@ def assess_weather_risk(school_code: str, sport: str, date: str) -> Dict[str, An
     temp_high = day_forecast.get("temperature", {}).get("high", 75)
     temp_low = day_forecast.get("temperature", {}).get("low", 55)
     
-    if temp_high > 95:
-        risk_level = max(risk_level, "Medium")
+    if temp_high > EXTREME_HEAT_F:
+        risk_level = max(risk_level, "Medium", key=RISK_LEVELS.index)
         risk_notes.append(f"Extreme heat (high: {temp_high}°F)")
     
-    if temp_low < 32 and sport in ["football", "soccer"]:
-        risk_level = max(risk_level, "Medium")
+    if temp_low < FREEZE_F and sport in FREEZE_SENSITIVE_SPORTS:
+        risk_level = max(risk_level, "Medium", key=RISK_LEVELS.index)
         risk_notes.append(f"Freezing temperatures (low: {temp_low}°F)")
     
     # Check for weather advisories
@@ -363,7 +387,229 @@ def assess_weather_risk(school_code: str, sport: str, date: str) -> Dict[str, An
     
     return assessment
 
-def create_operations_plan(school_code: str, sport: str, venue_name: str, event_date: str, event_time: str) -> Dict[str, Any]:
+def _season_games(schedule: Union[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Flatten a season schedule into games carrying their sport, dropping games without a host or date"""
+    if isinstance(schedule, dict):
+        games = [dict(event, sport=sport) for sport, events in schedule.items() for event in events]
+    else:
+        games = [dict(game) for game in schedule]
+    return [g for g in games if g.get("home_team") and g.get("date")]
+
+def _summarize_risk(assessments: List[Dict[str, Any]], top_n: int) -> Dict[str, Any]:
+    """Group per-game risk assessments into riskiest dates per venue and counts per level"""
+    # Riskiest dates per venue (a date's risk is its riskiest game)
+    by_venue = {}
+    for assessment in assessments:
+        if not assessment["weather_sensitive"] or assessment["risk_level"] == "Unknown":
+            continue
+        venue_key = f"{assessment['school']}:{assessment['venue']}" if assessment["venue"] else assessment["school"]
+        dates = by_venue.setdefault(venue_key, {})
+        entry = dates.get(assessment["date"])
+        if entry is None:
+            entry = dates[assessment["date"]] = {"date": assessment["date"], "risk_level": assessment["risk_level"],
+                                                 "risk_score": assessment["risk_score"], "sports": []}
+        elif assessment["risk_score"] > entry["risk_score"]:
+            entry.update(risk_level=assessment["risk_level"], risk_score=assessment["risk_score"])
+        if assessment["sport"] not in entry["sports"]:
+            entry["sports"].append(assessment["sport"])
+    
+    riskiest = {
+        venue_key: sorted(dates.values(), key=lambda d: (-d["risk_score"], d["date"]))[:top_n]
+        for venue_key, dates in by_venue.items()
+    }
+    
+    summary = {}
+    for assessment in assessments:
+        summary[assessment["risk_level"]] = summary.get(assessment["risk_level"], 0) + 1
+    
+    return {"games": assessments, "riskiest_dates": riskiest, "summary": summary}
+
+def assess_season_weather_risk(schedule: Union[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]],
+                               top_n: int = 5, forecasts: Optional[Dict[Any, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    Assess weather risk for every game of a season at once
+    
+    Forecasts for every (school, date) are looked up once through the weather
+    provider; the precipitation, heat, freeze and advisory rules of
+    assess_weather_risk are then applied as array operations over all games.
+    
+    Args:
+        schedule: Dictionary mapping sport codes to events, or a list of games
+            with a "sport" field; each game needs "home_team" and "date" and may
+            name its "venue"
+        top_n: Number of riskiest dates to list per venue
+        forecasts: Optional pre-fetched forecasts keyed by (school, date)
+        
+    Returns:
+        Dictionary with per-game assessments ("games", in schedule order),
+        the riskiest dates per venue ("riskiest_dates", keyed "school:venue")
+        and counts per risk level ("summary")
+    """
+    games = _season_games(schedule)
+    if not games:
+        return {"games": [], "riskiest_dates": {}, "summary": {}}
+    
+    sensitive = np.array([SPORT_REQUIREMENTS.get(g["sport"], {}).get("weather_sensitive", False) for g in games])
+    keys = [(g["home_team"], g["date"]) for g in games]
+    
+    if forecasts is None:
+        try:
+            wanted = {key for key, s in zip(keys, sensitive) if s}
+            forecasts = weather_provider.get_provider().lookup(wanted)
+        except Exception as e:
+            print(f"Error getting season weather forecasts: {str(e)}", file=sys.stderr)
+            forecasts = {}
+    
+    day_forecasts = [forecasts.get(key) if s else None for key, s in zip(keys, sensitive)]
+    known = np.array([f is not None for f in day_forecasts])
+    precip = np.array([f["precipitation"]["chance"] if f else 0 for f in day_forecasts], dtype=float)
+    high = np.array([f["temperature"]["high"] if f else 75 for f in day_forecasts], dtype=float)
+    low = np.array([f["temperature"]["low"] if f else 55 for f in day_forecasts], dtype=float)
+    advisory = np.array([bool(f and f.get("advisories")) for f in day_forecasts])
+    freeze_sport = np.array([g["sport"] in FREEZE_SENSITIVE_SPORTS for g in games])
+    
+    # Risk level codes: 0 Low, 1 Medium, 2 High (same rules as assess_weather_risk)
+    wet = np.where(precip > PRECIP_HIGH_RISK, 2, np.where(precip > PRECIP_MEDIUM_RISK, 1, 0))
+    hot = high > EXTREME_HEAT_F
+    freezing = (low < FREEZE_F) & freeze_sport
+    level = np.maximum(wet, (hot | freezing).astype(int))
+    level = np.where(advisory, 2, level)
+    
+    # Continuous score for ranking within a level
+    score = (level * 100 + precip + np.maximum(high - EXTREME_HEAT_F, 0)
+             + np.where(freeze_sport, np.maximum(FREEZE_F - low, 0), 0))
+    score = np.where(sensitive & known, score, 0.0)
+    
+    catalog = venue_catalog.get_catalog()
+    assessments = []
+    for i, game in enumerate(games):
+        venue = game.get("venue") or (catalog.venue_for(game["home_team"], game["sport"]) or {}).get("name", "")
+        if not sensitive[i]:
+            risk_level, notes = "Low", ["Indoor sport with minimal weather impact"]
+        elif not known[i]:
+            risk_level, notes = "Unknown", ["Unable to retrieve weather forecast"]
+        else:
+            risk_level = RISK_LEVELS[level[i]]
+            notes = []
+            if wet[i] == 2:
+                notes.append(f"High precipitation chance ({precip[i]:.0f}%)")
+            elif wet[i] == 1:
+                notes.append(f"Moderate precipitation chance ({precip[i]:.0f}%)")
+            if hot[i]:
+                notes.append(f"Extreme heat (high: {high[i]:.0f}°F)")
+            if freezing[i]:
+                notes.append(f"Freezing temperatures (low: {low[i]:.0f}°F)")
+            if advisory[i]:
+                notes.append(f"Weather advisories: {', '.join(day_forecasts[i]['advisories'])}")
+        
+        assessments.append({
+            "sport": game["sport"],
+            "school": game["home_team"],
+            "venue": venue,
+            "date": game["date"],
+            "event_id": game.get("id", ""),
+            "risk_level": risk_level,
+            "risk_score": round(float(score[i]), 1),
+            "weather_sensitive": bool(sensitive[i]),
+            "notes": "; ".join(notes) if notes else "No significant weather concerns"
+        })
+    
+    return _summarize_risk(assessments, top_n)
+
+def assess_season_climate_risk(schedule: Union[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]],
+                               top_n: int = 5, climate: Optional[climatology.Climatology] = None) -> Dict[str, Any]:
+    """
+    Assess long-range weather risk for every game of a season from climatology
+    
+    Meant for dates beyond the forecast range: each game is scored from the
+    share of past years with rain, lightning, a freeze or extreme heat around
+    that calendar day at the host school. Freezes only count for the
+    freeze-sensitive sports, as in assess_weather_risk.
+    
+    Args:
+        schedule: Dictionary mapping sport codes to events, or a list of games
+            with a "sport" field; each game needs "home_team" and "date" and may
+            name its "venue"
+        top_n: Number of riskiest dates to list per venue
+        climate: Climatology tables to use (defaults to the shared ones)
+        
+    Returns:
+        Same structure as assess_season_weather_risk; games at schools without
+        weather history are rated "Unknown"
+    """
+    games = _season_games(schedule)
+    if not games:
+        return {"games": [], "riskiest_dates": {}, "summary": {}}
+    
+    climate = climate or climatology.get_climatology()
+    sensitive = np.array([SPORT_REQUIREMENTS.get(g["sport"], {}).get("weather_sensitive", False) for g in games])
+    if climate is None:
+        probs = np.full((len(games), len(climatology.HAZARDS)), -1)
+    else:
+        probs = climate.lookup([g["home_team"] for g in games], [g["date"] for g in games])
+    known = probs[:, 0] >= 0
+    
+    exposed = np.ones(probs.shape, dtype=bool)
+    exposed[:, climatology.HAZARDS.index("freeze")] = [g["sport"] in FREEZE_SENSITIVE_SPORTS for g in games]
+    exposure = np.where(exposed & known[:, None], probs, 0)
+    worst = exposure.max(axis=1)
+    
+    # Risk level codes: 0 Low, 1 Medium, 2 High; ranked within a level by mean exposure
+    level = np.where(worst > climatology.CLIMATE_HIGH_RISK, 2, np.where(worst > climatology.CLIMATE_MEDIUM_RISK, 1, 0))
+    score = np.where(sensitive & known, level * 100 + exposure.mean(axis=1), 0.0)
+    
+    catalog = venue_catalog.get_catalog()
+    assessments = []
+    for i, game in enumerate(games):
+        venue = game.get("venue") or (catalog.venue_for(game["home_team"], game["sport"]) or {}).get("name", "")
+        if not sensitive[i]:
+            risk_level, notes = "Low", ["Indoor sport with minimal weather impact"]
+        elif not known[i]:
+            risk_level, notes = "Unknown", ["No weather history for this location"]
+        else:
+            risk_level = RISK_LEVELS[level[i]]
+            notes = [f"{CLIMATE_HAZARD_NOTES[hazard]} on this date in {exposure[i, h]}% of years"
+                     for h, hazard in enumerate(climatology.HAZARDS) if exposure[i, h] > climatology.CLIMATE_MEDIUM_RISK]
+        
+        assessments.append({
+            "sport": game["sport"],
+            "school": game["home_team"],
+            "venue": venue,
+            "date": game["date"],
+            "event_id": game.get("id", ""),
+            "risk_level": risk_level,
+            "risk_score": round(float(score[i]), 1),
+            "weather_sensitive": bool(sensitive[i]),
+            "notes": "; ".join(notes) if notes else "No significant weather concerns"
+        })
+    
+    return _summarize_risk(assessments, top_n)
+
+TIMELINE_MARKS = ["setup_start", "gates_open", "event_start", "event_end", "teardown_end"]
+
+def _timeline_offsets(sport: str) -> Dict[str, int]:
+    """Minutes from the event start to each mark of an event's operations timeline"""
+    sport_info = SPORT_REQUIREMENTS.get(sport, {})
+    game = int(GAME_DURATION_HOURS.get(sport, DEFAULT_GAME_DURATION_HOURS) * 60)
+    return {
+        "setup_start": -int(sport_info.get("setup_time", 3) * 60),  # default 3 hours
+        "gates_open": -int(GATES_OPEN_HOURS * 60),
+        "event_start": 0,
+        "event_end": game,
+        "teardown_end": game + int(sport_info.get("teardown_time", 2) * 60)  # default 2 hours
+    }
+
+def _staff_shifts(sport: str) -> Dict[str, Tuple[int, str, str]]:
+    """(headcount, arrival mark, departure mark) for each role a sport requires"""
+    headcounts = STAFF_HEADCOUNT.get(sport, {})
+    shifts = {}
+    for role in SPORT_REQUIREMENTS.get(sport, {}).get("staffing_requirements", []):
+        arrive, depart = ROLE_SHIFTS.get(role, ("setup_start", "teardown_end"))
+        shifts[role] = (headcounts.get(role, 1), arrive, depart)
+    return shifts
+
+def create_operations_plan(school_code: str, sport: str, venue_name: str, event_date: str, event_time: str,
+                           opponent: Optional[str] = None) -> Dict[str, Any]:
     """
     Create a game operations plan for a specific event
     
@@ -373,6 +619,7 @@ def create_operations_plan(school_code: str, sport: str, venue_name: str, event_
         venue_name: Name of the venue
         event_date: Event date (YYYY-MM-DD)
         event_time: Event time (HH:MM)
+        opponent: Optional visiting school code, used to plan the visiting team's arrival
         
     Returns:
         Dictionary with operations plan
@@ -380,31 +627,12 @@ def create_operations_plan(school_code: str, sport: str, venue_name: str, event_
     # Get the sport requirements
     sport_info = SPORT_REQUIREMENTS.get(sport, {})
     
-    # Calculate setup and teardown times
-    setup_time = sport_info.get("setup_time", 3)  # default 3 hours
-    teardown_time = sport_info.get("teardown_time", 2)  # default 2 hours
-    
-    # Calculate setup start time
+    # Build the setup, game and teardown timeline
     event_dt = datetime.datetime.strptime(f"{event_date} {event_time}", "%Y-%m-%d %H:%M")
-    setup_start = event_dt - datetime.timedelta(hours=setup_time)
-    
-    # Estimate game duration (varies by sport)
-    if sport in ["mbasketball", "wbasketball"]:
-        duration = 2.5  # hours
-    elif sport == "football":
-        duration = 3.5  # hours
-    elif sport in ["baseball", "softball"]:
-        duration = 3.0  # hours
-    elif sport == "volleyball":
-        duration = 2.0  # hours
-    elif sport == "soccer":
-        duration = 2.5  # hours
-    else:
-        duration = 3.0  # default
-    
-    # Calculate end time and teardown end time
-    event_end = event_dt + datetime.timedelta(hours=duration)
-    teardown_end = event_end + datetime.timedelta(hours=teardown_time)
+    offsets = _timeline_offsets(sport)
+    marks = {mark: event_dt + datetime.timedelta(minutes=minutes) for mark, minutes in offsets.items()}
+    setup_start, event_end, teardown_end = marks["setup_start"], marks["event_end"], marks["teardown_end"]
+    duration = GAME_DURATION_HOURS.get(sport, DEFAULT_GAME_DURATION_HOURS)
     
     # Check venue availability
     availability = check_venue_availability(
@@ -428,18 +656,32 @@ def create_operations_plan(school_code: str, sport: str, venue_name: str, event_
             "time": event_time,
             "estimated_duration": f"{duration} hours"
         },
-        "schedule": {
-            "setup_start": setup_start.strftime("%Y-%m-%d %H:%M"),
-            "event_start": event_dt.strftime("%Y-%m-%d %H:%M"),
-            "event_end": event_end.strftime("%Y-%m-%d %H:%M"),
-            "teardown_end": teardown_end.strftime("%Y-%m-%d %H:%M")
-        },
+        "schedule": {mark: marks[mark].strftime("%Y-%m-%d %H:%M") for mark in TIMELINE_MARKS},
         "venue_availability": availability,
         "weather_assessment": weather_assessment,
         "staffing_requirements": sport_info.get("staffing_requirements", []),
+        "staffing": {
+            role: {
+                "headcount": headcount,
+                "arrive": marks[arrive].strftime("%Y-%m-%d %H:%M"),
+                "depart": marks[depart].strftime("%Y-%m-%d %H:%M")
+            }
+            for role, (headcount, arrive, depart) in _staff_shifts(sport).items()
+        },
         "operations_notes": sport_info.get("operations_notes", "")
     }
     
+    # Visiting team travel distance (to the venue itself when its coordinates are known)
+    if opponent:
+        matrix = distance_engine.get_distance_matrix()
+        venue_key = f"{school_code}:{venue_name}"
+        destination = venue_key if venue_key in matrix else school_code
+        if opponent in matrix and destination in matrix:
+            ops_plan["visiting_team_travel"] = {
+                "opponent": opponent,
+                "distance_miles": matrix.distance(opponent, destination)
+            }
+    
     # Add specific operational tasks
     ops_plan["tasks"] = {
         "pre_event": [
@@ -447,7 +689,7 @@ def create_operations_plan(school_code: str, sport: str, venue_name: str, event_
             {"time": (setup_start).strftime("%H:%M"), "task": "Begin venue setup", "responsible": "Operations Manager"},
             {"time": (event_dt - datetime.timedelta(hours=3)).strftime("%H:%M"), "task": "Technical/AV setup", "responsible": "Tech Director"},
             {"time": (event_dt - datetime.timedelta(hours=2)).strftime("%H:%M"), "task": "Team arrival", "responsible": "Team Liaisons"},
-            {"time": (event_dt - datetime.timedelta(hours=1.5)).strftime("%H:%M"), "task": "Gates open to public", "responsible": "Venue Manager"},
+            {"time": marks["gates_open"].strftime("%H:%M"), "task": "Gates open to public", "responsible": "Venue Manager"},
         ],
         "post_event": [
             {"time": (event_end).strftime("%H:%M"), "task": "Begin venue teardown", "responsible": "Operations Manager"},
@@ -466,7 +708,115 @@ def create_operations_plan(school_code: str, sport: str, venue_name: str, event_
     
     return ops_plan
 
-def process_user_query(query: str) -> str:
+def _demand_curve(starts: np.ndarray, ends: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sweep-line over shifts: step curve of concurrent demand
+    
+    Returns:
+        (times, levels) where levels[i] holds from times[i] until times[i + 1]
+    """
+    times = np.concatenate([starts, ends])
+    deltas = np.concatenate([counts, -counts])
+    order = np.lexsort((deltas, times))
+    times, levels = times[order], np.cumsum(deltas[order])
+    
+    # Keep the level after the last change at each time, then drop steps that change nothing
+    last = np.append(times[1:] != times[:-1], True)
+    times, levels = times[last], levels[last]
+    changed = np.insert(levels[1:] != levels[:-1], 0, True)
+    return times[changed], levels[changed]
+
+def plan_school_operations(school_code: str, events: Union[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]],
+                           staff_capacity: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+    """
+    Build operations timelines for many events at one school and find staffing peaks
+    
+    Each event gets the setup, game and teardown timeline and staff shifts of
+    create_operations_plan; a sweep-line over all shifts then gives every role's
+    demand curve, its peak, and the windows where demand exceeds capacity.
+    
+    Args:
+        school_code: Host school identifier
+        events: Events at the school, each with "sport", "date", "start_time"
+            (or "time") and optional "id" and "venue"; or a season schedule
+            mapping sport codes to events, from which the school's home games are taken
+        staff_capacity: Staff available per role at one time, merged over DEFAULT_STAFF_CAPACITY
+        
+    Returns:
+        Dictionary with per-event timelines ("events"), per-role demand curves,
+        peaks and over-capacity windows ("roles"), and the peak number of
+        events on site at once ("peak_concurrent_events")
+    """
+    if isinstance(events, dict):
+        games = [g for g in _season_games(events) if g["home_team"] == school_code]
+    else:
+        games = [dict(event) for event in events]
+    capacity = dict(DEFAULT_STAFF_CAPACITY, **(staff_capacity or {}))
+    
+    timelines = []
+    shifts = {}
+    on_site = []
+    for game in games:
+        sport = game.get("sport", "")
+        try:
+            start = venue_calendar.to_minute(game.get("date"), game.get("start_time") or game.get("time"))
+        except ValueError:
+            continue
+        
+        marks = {mark: start + minutes for mark, minutes in _timeline_offsets(sport).items()}
+        index = len(timelines)
+        timelines.append({
+            "event_id": game.get("id") or f"{sport} {game['date']} {venue_calendar.format_minute(start)[-5:]}",
+            "sport": sport,
+            "venue": game.get("venue") or _venue_name(school_code, sport),
+            "schedule": {mark: venue_calendar.format_minute(marks[mark]) for mark in TIMELINE_MARKS}
+        })
+        on_site.append((marks["setup_start"], marks["teardown_end"], 1, index))
+        for role, (headcount, arrive, depart) in _staff_shifts(sport).items():
+            shifts.setdefault(role, []).append((marks[arrive], marks[depart], headcount, index))
+    
+    roles = {}
+    for role, role_shifts in shifts.items():
+        starts, ends, counts, owners = (np.array(column) for column in zip(*role_shifts))
+        times, levels = _demand_curve(starts, ends, counts)
+        limit = capacity.get(role)
+        
+        demand = [{"start": venue_calendar.format_minute(times[i]), "end": venue_calendar.format_minute(times[i + 1]),
+                   "staff": int(levels[i])} for i in range(len(times) - 1) if levels[i] > 0]
+        peak = int(np.argmax(levels))
+        
+        over_capacity = []
+        if limit is not None:
+            over = levels[:-1] > limit
+            # Group consecutive over-capacity steps into windows
+            edges = np.flatnonzero(np.diff(np.concatenate([[0], over.astype(np.int8), [0]])))
+            for first, last in zip(edges[::2], edges[1::2]):
+                window_start, window_end = times[first], times[last]
+                involved = np.unique(owners[(starts < window_end) & (ends > window_start)])
+                over_capacity.append({
+                    "start": venue_calendar.format_minute(window_start),
+                    "end": venue_calendar.format_minute(window_end),
+                    "staff": int(levels[first:last].max()),
+                    "capacity": limit,
+                    "events": [timelines[i]["event_id"] for i in involved]
+                })
+        
+        roles[role] = {
+            "demand": demand,
+            "peak": {"staff": int(levels[peak]), "start": venue_calendar.format_minute(times[peak]),
+                     "end": venue_calendar.format_minute(times[peak + 1])},
+            "capacity": limit,
+            "over_capacity": over_capacity
+        }
+    
+    peak_events = 0
+    if on_site:
+        starts, ends, counts, _ = (np.array(column) for column in zip(*on_site))
+        peak_events = int(_demand_curve(starts, ends, counts)[1].max())
+    
+    return {"school": school_code, "events": timelines, "roles": roles, "peak_concurrent_events": peak_events}
+
+def _answer_query(query: str) -> str:
     """
     Process a user query related to game operations and venue management
     
@@ -539,14 +889,8 @@ def process_user_query(query: str) -> str:
             event_time = event_time.replace("AM", "").replace("am", "").replace("PM", "").replace("pm", "").strip()
         
         # Get venue information
-        venue_data = load_venue_data()
-        venue_name = "Default Arena"  # Default venue
-        
-        if "schools" in venue_data and school_mentioned in venue_data["schools"]:
-            for venue in venue_data["schools"][school_mentioned].get("venues", []):
-                if sport_mentioned in venue.get("sports", []):
-                    venue_name = venue["name"]
-                    break
+        venue = venue_catalog.get_catalog().venue_for(school_mentioned, sport_mentioned)
+        venue_name = venue["name"] if venue else "Default Arena"  # Default venue
         
         # Create the operations plan
         ops_plan = create_operations_plan(
@@ -558,8 +902,9 @@ def process_user_query(query: str) -> str:
         )
         
         # Format the response
-        response = f"[Game Operations Plan: {school_mentioned.title()} {sport_mentioned.replace('m', 'Men\'s ').replace('w', 'Women\'s ')}]\n\n"
-        response += f"Event: {sport_mentioned.replace('m', 'Men\'s ').replace('w', 'Women\'s ')} at {venue_name}\n"
+        sport_label = sport_mentioned.replace('m', "Men's ").replace('w', "Women's ")
+        response = f"[Game Operations Plan: {school_mentioned.title()} {sport_label}]\n\n"
+        response += f"Event: {sport_label} at {venue_name}\n"
         response += f"Date: {event_date}\n"
         response += f"Time: {event_time}\n\n"
         
@@ -631,7 +976,8 @@ def process_user_query(query: str) -> str:
         weather_assessment = assess_weather_risk(school_mentioned, sport_mentioned, event_date)
         
         # Format the response
-        response = f"[Weather Analysis: {school_mentioned.title()} for {sport_mentioned.replace('m', 'Men\'s ').replace('w', 'Women\'s ')}]\n\n"
+        sport_label = sport_mentioned.replace('m', "Men's ").replace('w', "Women's ")
+        response = f"[Weather Analysis: {school_mentioned.title()} for {sport_label}]\n\n"
         response += f"Date: {event_date}\n"
         response += f"Risk Level: {weather_assessment['risk_level']}\n"
         response += f"Weather Sensitive Sport: {'Yes' if weather_assessment['weather_sensitive'] else 'No'}\n\n"
@@ -691,14 +1037,8 @@ def process_user_query(query: str) -> str:
             event_time = event_time.replace("AM", "").replace("am", "").replace("PM", "").replace("pm", "").strip()
         
         # Get venue information
-        venue_data = load_venue_data()
-        venue_name = "Default Arena"  # Default venue
-        
-        if "schools" in venue_data and school_mentioned in venue_data["schools"]:
-            for venue in venue_data["schools"][school_mentioned].get("venues", []):
-                if sport_mentioned in venue.get("sports", []):
-                    venue_name = venue["name"]
-                    break
+        venue = venue_catalog.get_catalog().venue_for(school_mentioned, sport_mentioned)
+        venue_name = venue["name"] if venue else "Default Arena"  # Default venue
         
         # Calculate estimated duration based on sport
         if sport_mentioned in ["mbasketball", "wbasketball"]:
@@ -724,24 +1064,26 @@ def process_user_query(query: str) -> str:
         )
         
         # Format the response
+        sport_label = sport_mentioned.replace('m', "Men's ").replace('w', "Women's ")
         response = f"[Venue Availability: {venue_name} at {school_mentioned.title()}]\n\n"
         response += f"Date: {event_date}\n"
         response += f"Time: {event_time} - {end_time}\n"
-        response += f"Sport: {sport_mentioned.replace('m', 'Men\'s ').replace('w', 'Women\'s ')}\n\n"
+        response += f"Sport: {sport_label}\n\n"
         
         if availability["available"]:
             response += "✅ Venue is AVAILABLE for the requested time\n"
         else:
             response += "❌ Venue is NOT AVAILABLE due to the following conflicts:\n"
             for conflict in availability["conflicts"]:
-                response += f"- {conflict['event']} ({conflict['date']} {conflict['start_time']}-{conflict['end_time']})\n"
+                response += f"- {conflict['event'] or conflict['sport']} ({conflict['date']} {conflict['start_time']}-{conflict['end_time']})\n"
+            response += f"\nNext free window: {availability['next_available']['start']} - {availability['next_available']['end']}\n"
         
         return response
     
     else:
         # General request - provide an overview of Game Manager capabilities
-        response = f"[Game Manager Agent]\n\n"
-        response += f"I can help with game operations, venue management, weather analysis, and other logistical aspects of Big 12 sporting events. Here's what I can assist with:\n\n"
+        response = "[Game Manager Agent]\n\n"
+        response += "I can help with game operations, venue management, weather analysis, and other logistical aspects of Big 12 sporting events. Here's what I can assist with:\n\n"
         
         response += "1. Game Operations Planning\n"
         response += "   - Create detailed operations timelines for events\n"
@@ -768,6 +1110,10 @@ def process_user_query(query: str) -> str:
         
         return response
 
+def process_user_query(query: str, context: Optional[Dict[str, Any]] = None, system_prompt: str = "") -> str:
+    """Process a user query; see agent_runtime.answer_query for context and system_prompt"""
+    return agent_runtime.answer_query(_answer_query, query, context, system_prompt)
+
 def main():
     parser = argparse.ArgumentParser(description='Game Manager Agent')
     parser.add_argument('-p', '--prompt', type=str, required=True, help='User prompt/query')
@@ -776,7 +1122,7 @@ def main():
     args = parser.parse_args()
     
     # Process the query
-    response = process_user_query(args.prompt)
+    response = process_user_query(args.prompt, system_prompt=args.system_prompt)
     
     # Print the response
     print(response)
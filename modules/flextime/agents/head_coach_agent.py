@@ -11,10 +11,13 @@ Part of the XII-OS FlexTime module.
 import os
 import sys
 import json
+import time
 import argparse
-import subprocess
+import concurrent.futures
 import re
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
+
+from agent_runtime import AgentRuntime, AgentTimeoutError, ISOLATION_MODES
 
 # Define paths
 FLEXTIME_VERSION = "1.0.0"
@@ -29,10 +32,10 @@ AGENT_PATHS = {
     "bash": os.path.join(AGENTS_PATH, "bash_agent.py"),
     "scraper": os.path.join(AGENTS_PATH, "scraper_agent.py"),
     "codebase": os.path.join(AGENTS_PATH, "codebase_agent.py"),
-    "compassIntegration": os.path.join(AGENTS_PATH, "compass_integration_agent.py"),
-    "historicalPatterns": os.path.join(AGENTS_PATH, "historical_patterns_agent.py"),
-    "campusConflicts": os.path.join(AGENTS_PATH, "campus_conflicts_agent.py"),
-    "venueData": os.path.join(AGENTS_PATH, "venue_data_agent.py"),
+    "compass_integration": os.path.join(AGENTS_PATH, "compass_integration_agent.py"),
+    "historical_patterns": os.path.join(AGENTS_PATH, "historical_patterns_agent.py"),
+    "campus_conflicts": os.path.join(AGENTS_PATH, "campus_conflicts_agent.py"),
+    "venue_data": os.path.join(AGENTS_PATH, "venue_data_agent.py"),
     "game_manager": os.path.join(AGENTS_PATH, "game_manager_agent.py")
 }
 
@@ -192,6 +195,14 @@ def get_best_agent(task: str) -> str:
     confidence_scores = analyze_task(task)
     return max(confidence_scores.items(), key=lambda x: x[1])[0]
 
+# Upstream subtasks whose results each subtask needs; everything else runs independently
+SUBTASK_DEPENDENCIES = {
+    "campus_conflicts": ["venue_data"],
+    "shared_facility_conflicts": ["venue_data"],
+    "game_operations": ["venue_data", "campus_conflicts"],
+    "weather_risk": ["compass_integration"]
+}
+
 def decompose_task(task: str) -> List[Dict[str, Any]]:
     """
     Decompose a complex scheduling task into subtasks for specialized agents
@@ -208,6 +219,7 @@ def decompose_task(task: str) -> List[Dict[str, Any]]:
     # Check for historical pattern analysis needs
     if any(keyword in task_lower for keyword in ["history", "tradition", "pattern", "rivalry"]):
         subtasks.append({
+            "id": "historical_patterns",
             "description": "Analyze historical scheduling patterns and traditions",
             "agent": "historical_patterns",
             "priority": 1,
@@ -217,6 +229,7 @@ def decompose_task(task: str) -> List[Dict[str, Any]]:
     # Check for venue conflict needs
     if any(keyword in task_lower for keyword in ["venue", "conflict", "facility", "arena", "stadium", "shared"]):
         subtasks.append({
+            "id": "campus_conflicts",
             "description": "Identify and resolve potential venue conflicts",
             "agent": "campus_conflicts",
             "priority": 2,
@@ -226,6 +239,7 @@ def decompose_task(task: str) -> List[Dict[str, Any]]:
         # Add specific venue conflict checks for problematic schools
         if any(school in task_lower for school in ["arizona_state", "asu", "iowa_state", "isu", "west_virginia", "wvu"]):
             subtasks.append({
+                "id": "shared_facility_conflicts",
                 "description": f"Special venue conflict analysis for shared facilities",
                 "agent": "campus_conflicts",
                 "priority": 1,  # Higher priority for these schools
@@ -235,6 +249,7 @@ def decompose_task(task: str) -> List[Dict[str, Any]]:
     # Check for geographical/travel optimization needs
     if any(keyword in task_lower for keyword in ["travel", "distance", "geography", "weather"]):
         subtasks.append({
+            "id": "compass_integration",
             "description": "Optimize for travel and geographical considerations",
             "agent": "compass_integration",
             "priority": 3,
@@ -244,6 +259,7 @@ def decompose_task(task: str) -> List[Dict[str, Any]]:
     # Check for venue data needs
     if any(keyword in task_lower for keyword in ["venue", "facility", "capacity", "specs"]):
         subtasks.append({
+            "id": "venue_data",
             "description": "Retrieve venue specifications and data",
             "agent": "venue_data",
             "priority": 2,
@@ -253,6 +269,7 @@ def decompose_task(task: str) -> List[Dict[str, Any]]:
     # Check for game operations needs
     if any(keyword in task_lower for keyword in ["operations", "logistics", "game day", "staffing", "setup", "weather"]):
         subtasks.append({
+            "id": "game_operations",
             "description": "Plan game operations and logistics",
             "agent": "game_manager",
             "priority": 2,
@@ -262,6 +279,7 @@ def decompose_task(task: str) -> List[Dict[str, Any]]:
         # Add specific weather analysis for outdoor sports
         if any(sport in task_lower for sport in ["football", "baseball", "softball", "soccer", "track"]):
             subtasks.append({
+                "id": "weather_risk",
                 "description": "Analyze weather risks and create contingency plans",
                 "agent": "game_manager",
                 "priority": 3,
@@ -271,17 +289,49 @@ def decompose_task(task: str) -> List[Dict[str, Any]]:
     # If no specific needs identified, add a general analysis task
     if not subtasks:
         subtasks.append({
+            "id": "general_analysis",
             "description": "General scheduling analysis",
             "agent": "historical_patterns",  # Default to historical patterns
             "priority": 1,
             "input": task
         })
     
+    # Declare dependencies on the subtasks that were actually created
+    ids = {subtask["id"] for subtask in subtasks}
+    for subtask in subtasks:
+        subtask["depends_on"] = [dep for dep in SUBTASK_DEPENDENCIES.get(subtask["id"], []) if dep in ids]
+    
     # Sort subtasks by priority (lower number = higher priority)
     subtasks.sort(key=lambda x: x["priority"])
     
     return subtasks
 
+_runtime: Optional[AgentRuntime] = None
+
+def get_runtime(isolation: Optional[str] = None, timeout: Optional[float] = None) -> AgentRuntime:
+    """
+    Get the shared agent runtime, creating it on first use
+    
+    Args:
+        isolation: "thread" (in-process) or "process" (warm worker pool);
+            defaults to the current runtime's mode, or "thread"
+        timeout: Optional default per-agent timeout in seconds
+        
+    Returns:
+        AgentRuntime instance
+    """
+    global _runtime
+    
+    if _runtime is None or (isolation and _runtime.isolation != isolation):
+        if _runtime is not None:
+            _runtime.shutdown(wait=False)
+        kwargs = {"default_timeout": timeout} if timeout else {}
+        _runtime = AgentRuntime(AGENT_PATHS, isolation=isolation or "thread", **kwargs)
+    elif timeout:
+        _runtime.default_timeout = timeout
+    
+    return _runtime
+
 def execute_agent(agent_name: str, task: str, system_prompt: str = "") -> str:
     """
     Execute a specialized agent with a task
@@ -294,35 +344,91 @@ def execute_agent(agent_name: str, task: str, system_prompt: str = "") -> str:
     Returns:
         Agent's response
     """
-    agent_path = AGENT_PATHS.get(agent_name)
-    if not agent_path or not os.path.exists(agent_path):
+    runtime = get_runtime()
+    if not runtime.has_agent(agent_name):
         return f"Error: Agent '{agent_name}' not found or not available."
     
     try:
-        # Run the appropriate agent with the task
-        cmd = [
-            "python", agent_path,
-            "--prompt", task
-        ]
-        
-        if system_prompt:
-            cmd.extend(["--system-prompt", system_prompt])
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        return result.stdout
+        return runtime.run(agent_name, task, system_prompt=system_prompt)
     
-    except subprocess.CalledProcessError as e:
-        return f"Error executing agent: {str(e)}\n{e.stderr}"
+    except AgentTimeoutError as e:
+        return f"Error executing agent: {str(e)}"
     
     except Exception as e:
         return f"Unexpected error: {str(e)}"
 
+def execute_subtasks(subtasks: List[Dict[str, Any]], system_prompt: str = "") -> Dict[str, Dict[str, Any]]:
+    """
+    Execute decomposed subtasks as a dependency graph
+    
+    Each subtask is started as soon as the subtasks it depends on have finished,
+    so independent agents run concurrently and total latency follows the critical
+    path. A subtask receives only its own upstream results, as structured data.
+    
+    Args:
+        subtasks: Subtasks from decompose_task (with id and depends_on)
+        system_prompt: Optional system prompt passed to every agent
+        
+    Returns:
+        Dictionary keyed by subtask id with agent, response, error and elapsed_ms
+    """
+    runtime = get_runtime()
+    pending = {subtask["id"]: subtask for subtask in subtasks}
+    running = {}
+    results = {}
+    
+    def finish(subtask: Dict[str, Any], started: float, response: str, error: Optional[str] = None):
+        results[subtask["id"]] = {
+            "id": subtask["id"],
+            "agent": subtask["agent"],
+            "description": subtask["description"],
+            "response": response,
+            "error": error,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2)
+        }
+    
+    while pending or running:
+        # Start every subtask whose dependencies are complete (priority order is preserved)
+        for subtask_id, subtask in list(pending.items()):
+            if not all(dep in results for dep in subtask.get("depends_on", [])):
+                continue
+            del pending[subtask_id]
+            started = time.perf_counter()
+            
+            if not runtime.has_agent(subtask["agent"]):
+                finish(subtask, started, f"Error: Agent '{subtask['agent']}' not found or not available.", "unavailable")
+                continue
+            
+            context = {dep: results[dep] for dep in subtask.get("depends_on", [])}
+            future = runtime.submit(subtask["agent"], subtask["description"], context, system_prompt)
+            deadline = started + runtime.timeouts.get(subtask["agent"], runtime.default_timeout)
+            running[future] = (subtask, started, deadline)
+        
+        if not running:
+            # Remaining subtasks depend on something that will never finish
+            for subtask in pending.values():
+                finish(subtask, time.perf_counter(), "Error: Unresolved subtask dependencies.", "unresolved")
+            break
+        
+        wait_for = max(0.0, min(deadline for _, _, deadline in running.values()) - time.perf_counter())
+        done, _ = concurrent.futures.wait(running, timeout=wait_for, return_when=concurrent.futures.FIRST_COMPLETED)
+        
+        for future in done:
+            subtask, started, _ = running.pop(future)
+            try:
+                finish(subtask, started, runtime.result(subtask["agent"], future, timeout=0))
+            except Exception as e:
+                finish(subtask, started, f"Error executing agent: {str(e)}", str(e))
+        
+        now = time.perf_counter()
+        for future, (subtask, started, deadline) in list(running.items()):
+            if now >= deadline and not future.done():
+                del running[future]
+                runtime.cancel(future)
+                finish(subtask, started, f"Error executing agent: Agent '{subtask['agent']}' timed out", "timeout")
+    
+    return results
+
 def process_query(query: str, system_prompt: str = "") -> str:
     """
     Process a user query by either selecting the best agent or decomposing into subtasks
@@ -342,33 +448,19 @@ def process_query(query: str, system_prompt: str = "") -> str:
     
     is_complex = any(indicator in query.lower() for indicator in complexity_indicators)
     
-    # For complex tasks, decompose and execute sequentially
+    # For complex tasks, decompose and execute the subtask graph
     if is_complex:
         subtasks = decompose_task(query)
+        results = execute_subtasks(subtasks, system_prompt)
         
-        # Sort subtasks by priority
-        subtasks.sort(key=lambda x: x["priority"])
-        
-        # Execute each subtask and collect results
-        results = []
+        # Combine results into a coherent response, in priority order
+        steps = []
         for i, subtask in enumerate(subtasks, 1):
-            agent_name = subtask["agent"]
-            task_desc = subtask["description"]
-            
-            # Add context from previous subtasks if available
-            context = system_prompt
-            if results:
-                context += "\n\nPrevious steps results:\n" + "\n".join(results)
-            
-            # Execute the agent
-            step_result = execute_agent(agent_name, task_desc, context)
-            
-            # Add to results
-            results.append(f"Step {i} ({agent_name}): {step_result}")
+            result = results[subtask["id"]]
+            steps.append(f"Step {i} ({subtask['agent']}): {result['response']}")
         
-        # Combine results into a coherent response
         final_response = "I've broken down your request into specialized steps:\n\n"
-        final_response += "\n\n".join(results)
+        final_response += "\n\n".join(steps)
         
         return final_response
     
@@ -383,14 +475,26 @@ def main():
     parser = argparse.ArgumentParser(description='FlexTime Head Coach Agent')
     parser.add_argument('-p', '--prompt', type=str, required=True, help='User prompt/query')
     parser.add_argument('--system-prompt', type=str, help='System prompt for the agent', default="")
+    parser.add_argument('--isolation', type=str, choices=ISOLATION_MODES, default="thread",
+                        help='Run agents in-process (thread) or in a warm worker-process pool (process)')
+    parser.add_argument('--timeout', type=float, help='Per-agent timeout in seconds')
+    parser.add_argument('--latency-report', action='store_true', help='Print per-agent latency to stderr')
     
     args = parser.parse_args()
     
-    # Process the query
-    response = process_query(args.prompt, args.system_prompt)
+    runtime = get_runtime(args.isolation, args.timeout)
     
-    # Print the response
-    print(response)
+    try:
+        # Process the query
+        response = process_query(args.prompt, args.system_prompt)
+        
+        # Print the response
+        print(response)
+        
+        if args.latency_report:
+            print(json.dumps(runtime.latency_report(), indent=2), file=sys.stderr)
+    finally:
+        runtime.shutdown()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -13,16 +13,23 @@ import os
 import sys
 import json
 import argparse
-import datetime
 import subprocess
 import re
-from typing import Dict, List, Any, Optional, Union
+import functools
+from typing import Dict, List, Any, Optional, Union, Tuple
+
+import numpy as np
+import pandas as pd
+
+import tradition_engine
+import schedule_history
+import agent_runtime
 
 # FlexTime configuration
 FLEXTIME_VERSION = "1.0.0"
 FLEXTIME_MODULE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 AGENTS_PATH = os.path.dirname(os.path.abspath(__file__))
-SCHEDULING_DATA_PATH = "/Users/nickthequick/XII-OS/data/scheduling_data"
+HISTORY_SEASONS = 3   # seasons returned when none are requested
 
 # Big 12 Conference constants
 BIG12_SCHOOLS = [
@@ -144,6 +151,11 @@ SPORT_TRADITIONAL_PARAMETERS = {
     }
 }
 
+# Stored sports covered by a sport name
+HISTORY_SPORTS = {
+    "basketball": ["mbasketball", "wbasketball"]
+}
+
 # Traditional rivalry weekends that should be preserved
 TRADITIONAL_RIVALRY_WEEKENDS = {
     "football": {
@@ -217,29 +229,40 @@ def get_historical_schedules(sport: str, seasons: Optional[List[str]] = None) ->
     Returns:
         Dictionary of historical schedule data
     """
-    # In a real implementation, this would fetch actual historical data
-    # This is a simplified mock implementation
-    
-    sport_path = os.path.join(SCHEDULING_DATA_PATH, sport)
-    
-    # Create mock historical data
     historical_data = {
         "sport": sport,
         "seasons": {},
         "recurring_patterns": [],
         "traditional_parameters": SPORT_TRADITIONAL_PARAMETERS.get(sport, {})
     }
-    
+
+    sports = HISTORY_SPORTS.get(sport, [sport])
+    wanted = [history_season(season) for season in seasons] if seasons else None
+    frames = [schedule_history.get_games(name, wanted) for name in sports]
+    games = pd.concat(frames, ignore_index=True) if any(len(frame) for frame in frames) else frames[0]
+
     # Get seasons to include
     if not seasons:
-        # Default to last 3 seasons
-        current_year = datetime.datetime.now().year
-        seasons = [f"{year-1}-{year}" for year in range(current_year-2, current_year+1)]
-    
-    # For each season, create mock data
+        # Default to the most recent stored seasons
+        seasons = sorted(set(games["season"]))[-HISTORY_SEASONS:]
+        games = games[games["season"].isin(seasons)]
+
     for season in seasons:
+        rows = games[games["season"] == history_season(season)]
+        rows = rows.astype(object).where(rows.notna(), None)
         historical_data["seasons"][season] = {
-            "games": [],  # In a real implementation, this would contain actual games
+            "games": [
+                {
+                    "sport": row.sport,
+                    "date": row.date.date().isoformat(),
+                    "home_team": row.home_team,
+                    "away_team": row.away_team,
+                    "venue": row.venue,
+                    "tv_window": row.tv_window,
+                    "network": row.network
+                }
+                for row in rows.itertuples(index=False)
+            ],
             "patterns": []  # Patterns identified for this season
         }
     
@@ -273,6 +296,72 @@ def get_historical_schedules(sport: str, seasons: Optional[List[str]] = None) ->
     
     return historical_data
 
+def history_season(season: str) -> str:
+    """Stored season label for a requested season ("2024-2025" -> "2024-25")"""
+    match = re.fullmatch(r"(\d{4})\s*[-/]\s*(\d{2}|\d{4})", season.strip())
+    if match:
+        return f"{match.group(1)}-{match.group(2)[-2:]}"
+    return season.strip()
+
+def rivalry_week_dates(sport: str, seasons: int = 5) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Dates each traditional rivalry was played over the most recent stored seasons
+    
+    Args:
+        sport: Sport with traditional rivalry weekends
+        seasons: Number of most recent seasons to scan
+        
+    Returns:
+        Dictionary of rivalry weekend -> list of {"teams", "season", "dates"}
+    """
+    weekends = TRADITIONAL_RIVALRY_WEEKENDS.get(sport, {})
+    games = schedule_history.get_games(sport, columns=["date", "home_team", "away_team"])
+    recent = sorted(set(games["season"]))[-seasons:]
+    games = games[games["season"].isin(recent)]
+
+    # One key per unordered pair, so the scan is a single isin over the whole column
+    home, away = games["home_team"].to_numpy(dtype=str), games["away_team"].to_numpy(dtype=str)
+    keys = np.where(home < away, np.char.add(np.char.add(home, "|"), away), np.char.add(np.char.add(away, "|"), home))
+    rivalry_keys = {"|".join(sorted(pair)) for pairs in weekends.values() for pair in pairs}
+    played = games.assign(key=keys)[np.isin(keys, list(rivalry_keys))]
+    by_key = {key: group for key, group in played.groupby("key")}
+
+    results = {}
+    for weekend, pairs in weekends.items():
+        results[weekend] = []
+        for pair in pairs:
+            group = by_key.get("|".join(sorted(pair)))
+            for season in recent:
+                dates = [] if group is None else group.loc[group["season"] == season, "date"]
+                results[weekend].append({
+                    "teams": pair,
+                    "season": season,
+                    "dates": [date.date().isoformat() for date in dates]
+                })
+    return results
+
+def big_monday_appearances(sport: str = "mbasketball", seasons: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Monday-night conference games per team
+    
+    Args:
+        sport: Basketball sport code
+        seasons: Seasons to count, or None for every stored season
+        
+    Returns:
+        Dictionary with "games" (Monday games) and "appearances" (team -> count, most first)
+    """
+    wanted = [history_season(season) for season in seasons] if seasons else None
+    games = schedule_history.get_games(sport, wanted, columns=["date", "home_team", "away_team"])
+    monday = games[games["date"].dt.dayofweek == 0]
+    teams = pd.concat([monday["home_team"], monday["away_team"]]).value_counts()
+    return {
+        "sport": sport,
+        "seasons": sorted(set(monday["season"])),
+        "games": len(monday),
+        "appearances": {team: int(count) for team, count in teams.items()}
+    }
+
 def identify_key_traditions(sport: str) -> List[Dict[str, Any]]:
     """
     Identify key scheduling traditions for a sport
@@ -415,111 +504,129 @@ def analyze_sport_specific_patterns(sport: str) -> Dict[str, Any]:
     
     return analysis
 
+# Games pinned to a day of Thanksgiving week, by the parameter that lists them
+SPECIAL_DATE_GAMES = {
+    "black_friday_games": ("Black Friday", "Black Friday Game"),
+    "thanksgiving_games": ("Thanksgiving Day", "Thanksgiving Game")
+}
+
+def tradition_rule_specs(sport: str) -> List[Dict[str, Any]]:
+    """
+    Tradition rules recorded for a sport, with one date rule per rivalry pair
+
+    A pair listed under a traditional rivalry weekend is held to that weekend,
+    which takes precedence over the rivalry's own traditional date (the two
+    disagree for several pairs); the rule keeps the rivalry's name. Black Friday
+    and Thanksgiving Day games add a low-severity day rule on top.
+
+    Args:
+        sport: Sport code
+
+    Returns:
+        List of {"teams", "name", "phrase", "type", "severity"} for the tradition engine
+    """
+    rivalries = SPORT_TRADITIONAL_PARAMETERS.get(sport, {}).get("rivalry_games", [])
+    names = {frozenset(rivalry["teams"]): rivalry["name"] for rivalry in rivalries}
+    date_rules = {}
+    for rivalry in rivalries:
+        date_rules[frozenset(rivalry["teams"])] = {"teams": rivalry["teams"], "name": rivalry["name"],
+                                                   "phrase": rivalry["traditional_date"],
+                                                   "type": "Rivalry Game", "severity": "High"}
+    for weekend, matchups in TRADITIONAL_RIVALRY_WEEKENDS.get(sport, {}).items():
+        for teams in matchups:
+            date_rules[frozenset(teams)] = {"teams": teams, "name": names.get(frozenset(teams), weekend),
+                                            "phrase": weekend, "type": "Rivalry Weekend", "severity": "High"}
+
+    specs = list(date_rules.values())
+    params = SPORT_TRADITIONAL_PARAMETERS.get(sport, {}).get("parameters", {})
+    for key, (phrase, kind) in SPECIAL_DATE_GAMES.items():
+        for matchup in params.get(key, []):
+            specs.append({"teams": [team.strip() for team in matchup.split(" vs ")], "name": phrase,
+                          "phrase": phrase, "type": kind, "severity": "Low"})
+    return specs
+
+def away_limit(sport: str) -> Optional[int]:
+    """Consecutive away games (or series) allowed for a sport, if it records a limit"""
+    params = SPORT_TRADITIONAL_PARAMETERS.get(sport, {}).get("parameters", {})
+    for key in ("max_consecutive_away", "back_to_back_away_limit"):
+        if key in params:
+            return params[key]
+    match = re.search(r"(\d+) consecutive away", params.get("travel_restrictions", ""))
+    return int(match.group(1)) if match else None
+
+@functools.lru_cache(maxsize=64)
+def get_tradition_rules(sport: str, years: Tuple[int, ...]) -> tradition_engine.TraditionRules:
+    """
+    Compiled tradition rules for a sport over the given years
+
+    Generators scoring many candidates should compile once here and call
+    score() on batched arrays from encode().
+    """
+    return tradition_engine.TraditionRules(BIG12_SCHOOLS, tradition_rule_specs(sport), years, away_limit(sport))
+
 def validate_schedule_against_traditions(sport: str, proposed_schedule: Dict[str, Any]) -> Dict[str, Any]:
     """
     Validate a proposed schedule against historical traditions
     
     Args:
         sport: Sport being scheduled
-        proposed_schedule: Proposed schedule to validate
+        proposed_schedule: Proposed schedule with "games" ({"home_team", "away_team", "date"})
+            or, for baseball and softball, "series" ({"home_team", "away_team", "dates"})
         
     Returns:
         Dictionary with validation results and recommendations
     """
-    # In a real implementation, this would analyze the actual proposed schedule
-    # This is a simplified mock implementation
-    
-    # Get the sport-specific patterns
-    patterns = analyze_sport_specific_patterns(sport)
-    
-    # Create mock validation results
     validation = {
         "sport": sport,
         "is_valid": True,
-        "adherence_score": 85,  # 0-100 score for tradition adherence
+        "adherence_score": 100,  # 0-100 score for tradition adherence
         "violations": [],
         "warnings": [],
         "recommendations": [],
         "user_approval_needed": []
     }
-    
-    # Add some mock violations for demonstration
-    if sport == "football":
-        validation["violations"] = [
-            {
-                "type": "Rivalry Weekend",
-                "description": "Kansas vs Kansas State not scheduled on Thanksgiving weekend",
-                "severity": "High",
-                "recommendation": "Move game to traditional Thanksgiving weekend slot"
-            }
-        ]
-        
-        validation["warnings"] = [
-            {
-                "type": "Consecutive Away Games",
-                "description": "Iowa State has 3 consecutive away games in October",
-                "severity": "Medium",
-                "recommendation": "Restructure to limit to 2 consecutive away games"
-            },
-            {
-                "type": "Black Friday Game",
-                "description": "Utah vs Colorado not scheduled on Black Friday",
-                "severity": "Low", 
-                "recommendation": "Consider moving to traditional Black Friday slot"
-            }
-        ]
-        
-        validation["user_approval_needed"] = [
-            {
-                "parameter": "Kansas vs Kansas State game date",
-                "tradition": "Traditionally played Thanksgiving weekend",
-                "proposed_change": "Scheduled for November 2nd",
-                "impact": "Breaks long-standing rivalry tradition",
-                "requires_approval": True
-            },
-            {
-                "parameter": "Consecutive Away Games for Iowa State",
-                "tradition": "Maximum 2 consecutive away games",
-                "proposed_change": "3 consecutive away games in October",
-                "impact": "Potentially unfair competitive disadvantage",
-                "requires_approval": True
-            }
-        ]
-    elif sport == "basketball":
-        validation["warnings"] = [
-            {
-                "type": "Travel Partners",
-                "description": "Arizona/Arizona State not scheduled as travel partners for visiting teams",
-                "severity": "Medium",
-                "recommendation": "Restructure to maintain traditional travel partner arrangement"
-            }
-        ]
-        
-        validation["user_approval_needed"] = [
-            {
-                "parameter": "Travel partner arrangement",
-                "tradition": "Arizona and Arizona State visited on same road trip",
-                "proposed_change": "Split into separate trips",
-                "impact": "Increases travel burden for all teams",
+
+    unit = "series" if "series" in proposed_schedule else "games"
+    games = proposed_schedule.get("games") or [
+        {"home_team": series.get("home_team"), "away_team": series.get("away_team"),
+         "date": (series.get("dates") or [None])[0]}
+        for series in proposed_schedule.get("series", [])
+    ]
+    years = {int(game["date"][:4]) for game in games
+             if isinstance(game.get("date"), str) and game["date"][:4].isdigit()}
+    if not years:
+        return validation
+
+    try:
+        rules = get_tradition_rules(sport, tuple(range(min(years), max(years) + 1)))
+        result = rules.check(games, unit)
+    except Exception as e:
+        print(f"Error validating schedule traditions: {str(e)}", file=sys.stderr)
+        return validation
+
+    for finding in result["findings"]:
+        entry = {key: finding[key] for key in ("type", "description", "severity", "recommendation")}
+        if finding["severity"] == tradition_engine.VIOLATION_SEVERITY:
+            validation["violations"].append(entry)
+        else:
+            validation["warnings"].append(entry)
+        if finding["severity"] != "Low":
+            validation["user_approval_needed"].append({
+                "parameter": finding["parameter"],
+                "tradition": finding["tradition"],
+                "proposed_change": finding["proposed_change"],
+                "impact": "Breaks long-standing rivalry tradition" if finding["severity"] == "High"
+                          else "Potentially unfair competitive disadvantage",
                 "requires_approval": True
-            }
-        ]
-    
-    # If there are violations, the schedule is not valid
-    if validation["violations"]:
-        validation["is_valid"] = False
-        validation["adherence_score"] -= 15 * len(validation["violations"])
-    
-    # If there are warnings, reduce the adherence score
-    if validation["warnings"]:
-        validation["adherence_score"] -= 5 * len(validation["warnings"])
-    
-    # Ensure the score stays within 0-100
-    validation["adherence_score"] = max(0, min(100, validation["adherence_score"]))
-    
+            })
+        if finding["recommendation"] not in validation["recommendations"]:
+            validation["recommendations"].append(finding["recommendation"])
+
+    validation["is_valid"] = not validation["violations"]
+    validation["adherence_score"] = result["adherence_score"]
     return validation
 
-def process_user_query(query: str) -> str:
+def _answer_query(query: str) -> str:
     """
     Process a user query related to historical scheduling patterns
     
@@ -614,6 +721,22 @@ def process_user_query(query: str) -> str:
         
         return response
         
+    elif "big monday" in query_lower:
+        # Big Monday appearances from the stored schedules
+        sport = "wbasketball" if sport_mentioned == "wbasketball" else "mbasketball"
+        monday = big_monday_appearances(sport)
+        
+        response = f"[Big Monday Appearances: {sport.title()}]\n\n"
+        if not monday["games"]:
+            response += "No Monday games were found in the stored schedules.\n"
+            return response
+        
+        response += f"{monday['games']} Monday games in {', '.join(monday['seasons'])}:\n"
+        for team, count in monday["appearances"].items():
+            response += f"- {tradition_engine.display_name(team)}: {count}\n"
+        
+        return response
+        
     elif "tradition" in query_lower or "rivalr" in query_lower:
         # Rivalry/tradition information request
         traditions = identify_key_traditions(sport_mentioned)
@@ -637,6 +760,13 @@ def process_user_query(query: str) -> str:
                     matchup_strs.append(f"{matchup[0].title()} vs {matchup[1].title()}")
                 response += ", ".join(matchup_strs) + "\n"
         
+        history = [entry for entries in rivalry_week_dates(sport_mentioned).values() for entry in entries if entry["dates"]]
+        if history:
+            response += "\nRecent Rivalry Dates:\n"
+            for entry in history:
+                teams = " vs ".join(tradition_engine.display_name(team) for team in entry["teams"])
+                response += f"- {teams} ({entry['season']}): {', '.join(entry['dates'])}\n"
+        
         response += "\nWould you like to maintain these traditions in the upcoming schedule? Are there any specific traditions you'd like to modify?"
         
         return response
@@ -694,6 +824,10 @@ def process_user_query(query: str) -> str:
         
         return response
 
+def process_user_query(query: str, context: Optional[Dict[str, Any]] = None, system_prompt: str = "") -> str:
+    """Process a user query; see agent_runtime.answer_query for context and system_prompt"""
+    return agent_runtime.answer_query(_answer_query, query, context, system_prompt)
+
 def main():
     parser = argparse.ArgumentParser(description='FlexTime Historical Patterns Agent')
     parser.add_argument('-p', '--prompt', type=str, required=True, help='User prompt/query')
@@ -703,7 +837,7 @@ def main():
     args = parser.parse_args()
     
     # Process the query
-    response = process_user_query(args.prompt)
+    response = process_user_query(args.prompt, system_prompt=args.system_prompt)
     
     # Print the response
     print(response)
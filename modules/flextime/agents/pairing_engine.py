@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Pairing Engine
+
+Pairs schools into travel partners with the minimum total partner distance.
+The exact solver is a dynamic program over bitmasks of already-paired schools,
+evaluated one popcount layer at a time with numpy; leagues of up to
+MAX_MATCHING_SCHOOLS schools solve well under a second.
+
+Part of the XII-OS FlexTime module.
+"""
+
+import threading
+from typing import Dict, List, Any, Optional, Tuple, Iterable
+
+import numpy as np
+
+from distance_engine import DistanceMatrix
+
+MAX_MATCHING_SCHOOLS = 20  # 2^20 float64 states = 8 MB
+PAIRING_CACHE_SIZE = 64
+
+def min_weight_perfect_matching(weights: np.ndarray,
+                                fixed_pairs: Iterable[Tuple[int, int]] = ()) -> Tuple[List[Tuple[int, int]], float]:
+    """
+    Exact minimum-weight perfect matching on a complete graph
+
+    Args:
+        weights: Symmetric n x n weight matrix (n even)
+        fixed_pairs: Index pairs that must appear in the matching
+
+    Returns:
+        Tuple of (pairs as (i, j) with i < j, total weight)
+
+    Raises:
+        ValueError: If n is odd, too large, or the fixed pairs overlap
+    """
+    weights = np.asarray(weights, dtype=float)
+    n = len(weights)
+    if n % 2:
+        raise ValueError(f"Cannot pair an odd number of schools ({n})")
+    if n > MAX_MATCHING_SCHOOLS:
+        raise ValueError(f"Exact pairing supports at most {MAX_MATCHING_SCHOOLS} schools, got {n}")
+
+    start = 0
+    fixed_total = 0.0
+    fixed = []
+    for i, j in fixed_pairs:
+        i, j = min(i, j), max(i, j)
+        if i == j or start & (1 << i) or start & (1 << j):
+            raise ValueError(f"Fixed pairs overlap at ({i}, {j})")
+        start |= (1 << i) | (1 << j)
+        fixed_total += weights[i, j]
+        fixed.append((i, j))
+
+    full = (1 << n) - 1
+    dp = np.full(1 << n, np.inf)
+    dp[start] = 0.0
+    bits = np.array([1 << j for j in range(n)], dtype=np.int64)
+    layer = np.array([start], dtype=np.int64)
+
+    # Each step pairs the lowest unpaired school with every other unpaired school
+    while layer.size and layer[0] != full:
+        low = ~layer & (layer + 1)
+        low_index = np.log2(low).astype(np.intp)
+        reached = []
+
+        for j in range(n):
+            ok = ((layer & bits[j]) == 0) & (bits[j] > low)
+            if not ok.any():
+                continue
+            masks = layer[ok]
+            targets = masks | low[ok] | bits[j]
+            np.minimum.at(dp, targets, dp[masks] + weights[low_index[ok], j])
+            reached.append(targets)
+
+        layer = np.unique(np.concatenate(reached)) if reached else np.zeros(0, dtype=np.int64)
+
+    # Walk back from the full mask, recovering the pair added at each step
+    pairs = []
+    mask = full
+    while mask != start:
+        for i in range(n):
+            if not (mask >> i) & 1 or (start >> i) & 1:
+                continue
+            found = None
+            for j in range(i + 1, n):
+                if not (mask >> j) & 1 or (start >> j) & 1:
+                    continue
+                prev = mask ^ (1 << i) ^ (1 << j)
+                lowest_free = ~prev & (prev + 1)
+                if lowest_free == (1 << i) and np.isclose(dp[prev] + weights[i, j], dp[mask]):
+                    found = (i, j, prev)
+                    break
+            if found:
+                pairs.append(found[:2])
+                mask = found[2]
+                break
+
+    pairs = sorted(fixed + pairs)
+    return pairs, float(dp[full] + fixed_total)
+
+def greedy_pairing(weights: np.ndarray) -> List[Tuple[int, int]]:
+    """
+    Mutual-nearest-neighbor pairing followed by nearest-available pairing
+
+    This is the heuristic COMPASS integration used before the exact solver and
+    is kept as the baseline for reporting savings.
+    """
+    weights = np.asarray(weights, dtype=float)
+    n = len(weights)
+    masked = weights + np.diag(np.full(n, np.inf))
+    closest = masked.argmin(axis=1)
+
+    pairs = []
+    unpaired = list(range(n))
+
+    for school in range(n):
+        partner = int(closest[school])
+        if school in unpaired and partner in unpaired and closest[partner] == school:
+            pairs.append((min(school, partner), max(school, partner)))
+            unpaired.remove(school)
+            unpaired.remove(partner)
+
+    while len(unpaired) >= 2:
+        school = unpaired.pop(0)
+        partner = min(unpaired, key=lambda s: weights[school, s])
+        pairs.append((min(school, partner), max(school, partner)))
+        unpaired.remove(partner)
+
+    return sorted(pairs)
+
+def pairing_total(weights: np.ndarray, pairs: Iterable[Tuple[int, int]]) -> float:
+    """Total weight of a set of index pairs"""
+    return float(sum(weights[i, j] for i, j in pairs))
+
+_cache: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+_cache_lock = threading.Lock()
+
+def optimal_pairings(matrix: DistanceMatrix, schools: List[str],
+                     fixed_pairs: Optional[List[List[str]]] = None) -> Dict[str, Any]:
+    """
+    Minimum-total-distance travel partners for a league, compared with the greedy pairing
+
+    Results are cached by distance-matrix version, league and fixed pairs.
+
+    Args:
+        matrix: Distance matrix containing every school
+        schools: League members (an even number)
+        fixed_pairs: Partnerships that must be kept; repeated pairs are merged and
+            pairs naming schools outside the league are ignored
+
+    Returns:
+        Dictionary with the optimal and greedy pairings (school code pairs), their
+        total partner miles, and the miles saved by the optimal pairing
+
+    Raises:
+        ValueError: If a school is fixed to two different partners, or the league
+            cannot be paired
+    """
+    members = set(schools)
+    fixed = sorted({tuple(sorted(pair)) for pair in (fixed_pairs or []) if set(pair) <= members})
+    partner_of: Dict[str, str] = {}
+    for a, b in fixed:
+        for school, partner in ((a, b), (b, a)):
+            if partner_of.setdefault(school, partner) != partner:
+                raise ValueError(f"{school} is fixed to both {partner_of[school]} and {partner}")
+    key = (matrix.version, tuple(schools), tuple(fixed))
+
+    with _cache_lock:
+        if key in _cache:
+            return _cache[key]
+
+    weights = matrix.submatrix(schools)
+    index = {school: i for i, school in enumerate(schools)}
+    pairs, total = min_weight_perfect_matching(weights, [(index[a], index[b]) for a, b in fixed])
+    greedy = greedy_pairing(weights)
+    greedy_total = pairing_total(weights, greedy)
+
+    result = {
+        "pairings": [[schools[i], schools[j]] for i, j in pairs],
+        "total_miles": round(total, 1),
+        "greedy_pairings": [[schools[i], schools[j]] for i, j in greedy],
+        "greedy_total_miles": round(greedy_total, 1),
+        "savings_miles": round(greedy_total - total, 1),
+        "fixed_pairs": [list(pair) for pair in fixed],
+        "matrix_version": matrix.version
+    }
+
+    with _cache_lock:
+        if len(_cache) >= PAIRING_CACHE_SIZE:
+            _cache.clear()
+        _cache[key] = result
+    return result
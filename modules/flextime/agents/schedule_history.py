@@ -0,0 +1,504 @@
+#!/usr/bin/env python3
+"""
+Schedule History
+
+Columnar store of past conference schedules for the historical patterns
+agent. The files under data/scheduling (conference grids as CSV or XLSX,
+composite schedules as DOCX) are parsed into one normalized games table
+(season, sport, date, home, away, venue, TV window, network) and written as
+Parquet partitioned by sport and season. Each source file is keyed on its
+content hash, so a re-run only parses files that changed; pattern queries
+read just the partitions and columns they need.
+
+PDF schedules are catalogued but not parsed: their text carries no table
+layout to recover the grid from.
+
+Part of the XII-OS FlexTime module.
+"""
+
+import os
+import re
+import sys
+import csv
+import json
+import hashlib
+import zipfile
+import argparse
+import datetime
+import threading
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Any, Optional, Tuple, Iterable
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+import venue_catalog
+
+# FlexTime configuration
+FLEXTIME_VERSION = "1.0.0"
+FLEXTIME_MODULE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+XII_OS_PATH = os.path.dirname(os.path.dirname(FLEXTIME_MODULE_PATH))
+SCHEDULING_SOURCE_PATH = os.path.join(XII_OS_PATH, "data", "scheduling")
+HISTORY_STORE_PATH = os.path.join(FLEXTIME_MODULE_PATH, "data", "storage", "schedule_history")
+MANIFEST_FILE = "manifest.json"
+PARSER_VERSION = 1  # bump to re-parse every source after a parser change
+
+# Abbreviations used in the conference grids
+TEAM_ABBREVIATIONS = {
+    "ARIZ": "arizona", "ASU": "arizona_state", "BYU": "byu", "UTAH": "utah", "COL": "colorado",
+    "ISU": "iowa_state", "KU": "kansas", "KSU": "kansas_state", "OSU": "oklahoma_state",
+    "TTU": "texas_tech", "TCU": "tcu", "BU": "baylor", "UH": "houston", "UCF": "ucf",
+    "CIN": "cincinnati", "WVU": "west_virginia"
+}
+TEAM_NAME_ALIASES = {"k-state": "kansas_state"}
+
+# Sport named by a schedule's file name, checked in order; the folder name is the fallback
+SPORT_PATTERNS = [
+    ("mbasketball", r"\bMBB\b|\bmen'?s basketball"),
+    ("wbasketball", r"\bWBB\b|\bBB-W\b|women'?s basketball"),
+    ("mtennis", r"\bMTEN\b|\bMTN\b|\bmen'?s tennis"),
+    ("wtennis", r"\bWTE\b|\bWTN\b|women'?s tennis"),
+    ("volleyball", r"\bVB\b|volleyball"),
+    ("soccer", r"\bSOC\b|soccer"),
+    ("wrestling", r"\bWRES\b|wrestling"),
+    ("gymnastics", r"\bGYM\b|gymnastics"),
+    ("lacrosse", r"\bW?LAX\b|lacrosse"),
+    ("baseball", r"\bBSB\b|baseball"),
+    ("softball", r"\bSB\b|softball")
+]
+
+COLUMNS = ["date", "home_team", "away_team", "venue", "tv_window", "network", "source"]
+SCHEMA = pa.schema([
+    ("date", pa.date32()), ("home_team", pa.string()), ("away_team", pa.string()), ("venue", pa.string()),
+    ("tv_window", pa.string()), ("network", pa.string()), ("source", pa.string())
+])
+PARTITIONING = ds.partitioning(pa.schema([("sport", pa.string()), ("season", pa.string())]), flavor="hive")
+
+ABBREVIATION = re.compile(r"^[A-Z]{2,5}$")
+GRID_CELL = re.compile(r"^(at\s+|@\s*)?([A-Z]{2,5})\b")
+SEASON_SPAN = re.compile(r"\b(20\d\d)-(\d\d)\b")
+SEASON_YEAR = re.compile(r"\b(20\d\d)\b")
+DATE_HEADING = re.compile(r"^(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),\s+([A-Za-z]+)\s+(\d{1,2})\b")
+COMPOSITE_GAME = re.compile(r"^(?P<away>[A-Za-z.&' -]+?) (?:at|@) (?P<home>[A-Za-z.&' -]+?), (?P<rest>.*)$")
+
+EXCEL_EPOCH = datetime.date(1899, 12, 30)
+WEEKDAY_ABBREVIATIONS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+XLSX_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+DOCX_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+def team_code(value: str) -> str:
+    """Team code for a grid abbreviation ("KSU") or school name ("K-State", "Iowa State")"""
+    value = value.strip()
+    if value in TEAM_ABBREVIATIONS:
+        return TEAM_ABBREVIATIONS[value]
+    lowered = value.lower()
+    return TEAM_NAME_ALIASES.get(lowered, re.sub(r"[^a-z0-9]+", "_", lowered).strip("_"))
+
+def sport_for_file(path: str) -> Optional[str]:
+    """Sport a schedule file covers, from its name or else its folder"""
+    name = os.path.basename(path)
+    for sport, pattern in SPORT_PATTERNS:
+        if re.search(pattern, name, re.IGNORECASE):
+            return sport
+    folder = os.path.basename(os.path.dirname(path)).lower()
+    return next((sport for sport, _ in SPORT_PATTERNS if sport == folder), None)
+
+def season_label(text: str) -> Optional[str]:
+    """Season named in text: "2024-25" for a split season, "2025" for a single year"""
+    match = SEASON_SPAN.search(text)
+    if match:
+        return f"{match.group(1)}-{match.group(2)}"
+    match = SEASON_YEAR.search(text)
+    return match.group(1) if match else None
+
+def season_year(season: str, month: int) -> int:
+    """Calendar year of a month within a season (July onwards is the first year of a split season)"""
+    first = int(season[:4])
+    return first + 1 if "-" in season and month < 7 else first
+
+def _grid_date(value: str, season: Optional[str], weekday: str = "") -> Optional[datetime.date]:
+    value = value.strip()
+    if weekday[:3].title() in WEEKDAY_ABBREVIATIONS:
+        # The weekday label next to the date wins over a stale date serial
+        day = _grid_date(value, season)
+        if day is None:
+            return None
+        shift = (WEEKDAY_ABBREVIATIONS.index(weekday[:3].title()) - day.weekday() + 3) % 7 - 3
+        return day + datetime.timedelta(days=shift)
+    if re.fullmatch(r"\d{5}(\.0+)?", value):
+        day = EXCEL_EPOCH + datetime.timedelta(days=int(float(value)))
+        if season and "-" not in season and day.year != int(season):
+            # Sheets copied from an earlier season keep the old dates; move by whole weeks
+            day += datetime.timedelta(weeks=round((int(season) - day.year) * 365.2425 / 7))
+        return day
+    match = re.fullmatch(r"(\d{1,2})-([A-Za-z]{3})", value)
+    if match and season:
+        try:
+            month = datetime.datetime.strptime(match.group(2).title(), "%b").month
+            return datetime.date(season_year(season, month), month, int(match.group(1)))
+        except ValueError:
+            return None
+    return None
+
+def _header_blocks(cells: List[str], season: Optional[str]) -> List[Tuple[int, Dict[int, str], Optional[str]]]:
+    """
+    Runs of team-abbreviation columns in a header row, each with its date
+    column (the one before the run) and season (the last season named left
+    of the run). Rows with "at" cells, repeated teams or a date are game rows.
+    """
+    if any(GRID_CELL.match(value) and GRID_CELL.match(value).group(1) for value in cells):
+        return []
+    blocks = []
+    run = []
+    for col, value in enumerate(cells + [""]):
+        if ABBREVIATION.match(value):
+            run.append(col)
+            continue
+        teams = [cells[c] for c in run]
+        if len(run) >= 3 and run[0] > 0 and len(set(teams)) == len(teams) and set(teams) & set(TEAM_ABBREVIATIONS):
+            labels = [season_label(value) for value in cells[:run[0]]]
+            label = next((l for l in reversed(labels) if l), season)
+            if _grid_date(cells[run[0] - 1], label) is not None:
+                return []
+            blocks.append((run[0] - 1, {c: team_code(cells[c]) for c in run}, label))
+        run = []
+    return blocks
+
+def parse_grid(rows: Iterable[List[str]], season: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    Games from a conference grid (one row per date, one column per team)
+
+    A cell names the opponent, with "at" when the column's team travels. Each
+    game appears under both teams and is kept once; when the two entries sit
+    a day apart (a slip in the source grid) the host's date is kept.
+
+    Args:
+        rows: Rows of cell text
+        season: Season from the file name, used when a header does not name one
+
+    Returns:
+        List of {"season", "date", "home_team", "away_team"}
+    """
+    hosted = {}
+    visited = {}
+    blocks = []
+    for row in rows:
+        cells = [(value or "").strip() for value in row]
+        header = _header_blocks(cells, season)
+        if header:
+            blocks = header
+            continue
+        for date_col, columns, label in blocks:
+            if date_col >= len(cells):
+                continue
+            day = _grid_date(cells[date_col], label, cells[date_col - 1] if date_col > 0 else "")
+            if day is None:
+                continue
+            for col, team in columns.items():
+                match = GRID_CELL.match(cells[col]) if col < len(cells) else None
+                if not match:
+                    continue
+                opponent = team_code(match.group(2))
+                if match.group(1):
+                    visited[(day, opponent, team)] = label
+                else:
+                    hosted[(day, team, opponent)] = label
+
+    one_day = datetime.timedelta(days=1)
+    games = dict(hosted)
+    for (day, home, away), label in visited.items():
+        if (day, home, away) in hosted:
+            continue
+        if any((day + shift, home, away) in hosted and (day + shift, home, away) not in visited
+               for shift in (-one_day, one_day)):
+            continue
+        games[(day, home, away)] = label
+    return [{"season": label, "date": day, "home_team": home, "away_team": away}
+            for (day, home, away), label in games.items()]
+
+def parse_composite(lines: Iterable[str], season: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    Games from a composite schedule: date headings ("Saturday, January 4")
+    followed by lines such as "Baylor at Kansas, 4 pm CT – ESPN+"
+
+    Returns:
+        List of {"season", "date", "home_team", "away_team", "tv_window", "network"}
+    """
+    games = []
+    day = None
+    for line in lines:
+        line = line.strip()
+        heading = DATE_HEADING.match(line)
+        if heading:
+            try:
+                month = datetime.datetime.strptime(heading.group(1), "%B").month
+                day = datetime.date(season_year(season, month), month, int(heading.group(2))) if season else None
+            except ValueError:
+                day = None
+            continue
+        match = COMPOSITE_GAME.match(line)
+        if day is None or not match:
+            continue
+        window, _, broadcast = match.group("rest").partition("–")
+        network = broadcast.split()[0] if broadcast.split() else None
+        games.append({"season": season, "date": day, "home_team": team_code(match.group("home")),
+                      "away_team": team_code(match.group("away")), "tv_window": window.strip() or None,
+                      "network": network})
+    return games
+
+def read_xlsx_rows(path: str) -> List[List[str]]:
+    """Cell text of the first worksheet of an XLSX workbook"""
+    with zipfile.ZipFile(path) as book:
+        names = set(book.namelist())
+        shared = []
+        if "xl/sharedStrings.xml" in names:
+            root = ET.fromstring(book.read("xl/sharedStrings.xml"))
+            shared = ["".join(t.text or "" for t in item.iter(XLSX_NS + "t")) for item in root.iter(XLSX_NS + "si")]
+        sheet = ET.fromstring(book.read("xl/worksheets/sheet1.xml"))
+
+    rows = []
+    for row in sheet.iter(XLSX_NS + "row"):
+        cells = {}
+        for cell in row.findall(XLSX_NS + "c"):
+            letters = re.match(r"[A-Z]+", cell.get("r", "")).group()
+            col = 0
+            for letter in letters:
+                col = col * 26 + ord(letter) - 64
+            value = cell.find(XLSX_NS + "v")
+            if value is not None:
+                text = shared[int(value.text)] if cell.get("t") == "s" else (value.text or "")
+            else:
+                text = "".join(t.text or "" for t in cell.iter(XLSX_NS + "t"))
+            cells[col - 1] = text
+        rows.append([cells.get(c, "") for c in range(max(cells) + 1)] if cells else [])
+    return rows
+
+def read_docx(path: str) -> Tuple[List[str], List[List[List[str]]]]:
+    """Paragraph text and table cell text of a DOCX document"""
+    with zipfile.ZipFile(path) as document:
+        root = ET.fromstring(document.read("word/document.xml"))
+    text = lambda element: "".join(t.text or "" for t in element.iter(DOCX_NS + "t"))
+    paragraphs = [text(p) for p in root.iter(DOCX_NS + "p")]
+    tables = [[[text(cell) for cell in row.findall(DOCX_NS + "tc")] for row in table.iter(DOCX_NS + "tr")]
+              for table in root.iter(DOCX_NS + "tbl")]
+    return paragraphs, tables
+
+def parse_source(path: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Games in one schedule file
+
+    Returns:
+        List of game dictionaries (possibly empty for files that hold no games),
+        or None for a format that cannot be parsed
+    """
+    season = season_label(os.path.basename(path))
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        with open(path, newline="", encoding="utf-8-sig", errors="replace") as f:
+            return parse_grid(csv.reader(f), season)
+    if extension == ".xlsx":
+        return parse_grid(read_xlsx_rows(path), season)
+    if extension == ".docx":
+        paragraphs, tables = read_docx(path)
+        games = parse_composite(paragraphs, season)
+        for table in tables:
+            games += parse_grid(table, season)
+        return games
+    return None
+
+def _file_hash(path: str) -> str:
+    digest = hashlib.sha256(f"parser:{PARSER_VERSION}:".encode())
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _load_manifest(store_dir: str) -> Dict[str, Any]:
+    path = os.path.join(store_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Error reading schedule history manifest: {str(e)}", file=sys.stderr)
+        return {}
+
+def _remove_outputs(store_dir: str, entry: Dict[str, Any]):
+    for relative in entry.get("files", []):
+        try:
+            os.remove(os.path.join(store_dir, relative))
+        except FileNotFoundError:
+            pass
+
+def _home_venue(catalog: venue_catalog.VenueCatalog, team: str, sport: str) -> Optional[Dict[str, Any]]:
+    """Home venue for a sport, falling back to a sport sharing its venue (WBB plays in the MBB arena)"""
+    venue = catalog.venue_for(team, sport)
+    if venue is None:
+        group = venue_catalog.transition_group(sport)
+        siblings = [other for other, shared in venue_catalog.TRANSITION_SPORT_GROUPS.items()
+                    if shared == group and other != sport]
+        venue = next((catalog.venue_for(team, other) for other in siblings if catalog.venue_for(team, other)), None)
+    return venue
+
+def _write_partitions(store_dir: str, games: List[Dict[str, Any]], sport: str, source: str, key: str) -> List[str]:
+    """Write one Parquet file per season partition, returning paths relative to the store"""
+    catalog = venue_catalog.get_catalog()
+    by_season = {}
+    for game in games:
+        by_season.setdefault(game["season"] or "unknown", []).append(game)
+
+    files = []
+    for season, season_games in sorted(by_season.items()):
+        columns = {column: [] for column in COLUMNS}
+        for game in sorted(season_games, key=lambda g: (g["date"], g["home_team"])):
+            venue = _home_venue(catalog, game["home_team"], sport)
+            row = dict(game, venue=venue.get("name") if venue else None, source=source)
+            for column in COLUMNS:
+                columns[column].append(row.get(column))
+        relative = os.path.join(f"sport={sport}", f"season={season}", f"{key[:16]}.parquet")
+        os.makedirs(os.path.join(store_dir, os.path.dirname(relative)), exist_ok=True)
+        pq.write_table(pa.table(columns, schema=SCHEMA), os.path.join(store_dir, relative))
+        files.append(relative)
+    return files
+
+def ingest(source_dir: str = SCHEDULING_SOURCE_PATH, store_dir: str = HISTORY_STORE_PATH,
+           rebuild: bool = False) -> Dict[str, Any]:
+    """
+    Parse changed schedule files into the partitioned store
+
+    Args:
+        source_dir: Directory tree of schedule files
+        store_dir: Directory of the Parquet store and its manifest
+        rebuild: Re-parse every file even when its content is unchanged
+
+    Returns:
+        Dictionary listing "parsed", "cached" and "skipped" (unparseable) files and the "games" stored
+    """
+    manifest = _load_manifest(store_dir) if not rebuild else {}
+    if rebuild and os.path.isdir(store_dir):
+        for entry in _load_manifest(store_dir).values():
+            _remove_outputs(store_dir, entry)
+
+    summary = {"parsed": [], "cached": [], "skipped": [], "games": 0}
+    seen = set()
+    paths = sorted(os.path.join(root, name) for root, _, names in os.walk(source_dir) for name in names
+                   if not name.startswith("."))
+    for path in paths:
+        source = os.path.relpath(path, source_dir)
+        seen.add(source)
+        try:
+            key = _file_hash(path)
+            entry = manifest.get(source)
+            if entry and entry.get("hash") == key and all(os.path.exists(os.path.join(store_dir, f))
+                                                          for f in entry.get("files", [])):
+                summary["skipped" if entry.get("unsupported") else "cached"].append(source)
+                summary["games"] += entry.get("games", 0)
+                continue
+
+            if entry:
+                _remove_outputs(store_dir, entry)
+            sport = sport_for_file(path)
+            games = parse_source(path) if sport else None
+            if games is None:
+                manifest[source] = {"hash": key, "files": [], "games": 0, "unsupported": True}
+                summary["skipped"].append(source)
+                continue
+            files = _write_partitions(store_dir, games, sport, source, key) if games else []
+            manifest[source] = {"hash": key, "sport": sport, "files": files, "games": len(games)}
+            summary["parsed"].append(source)
+            summary["games"] += len(games)
+        except Exception as e:
+            print(f"Error ingesting schedule file {source}: {str(e)}", file=sys.stderr)
+            summary["skipped"].append(source)
+
+    for source in set(manifest) - seen:
+        _remove_outputs(store_dir, manifest.pop(source))
+
+    try:
+        os.makedirs(store_dir, exist_ok=True)
+        with open(os.path.join(store_dir, MANIFEST_FILE), "w") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+    except Exception as e:
+        print(f"Error saving schedule history manifest: {str(e)}", file=sys.stderr)
+    return summary
+
+def load_games(sport: Optional[str] = None, seasons: Optional[List[str]] = None,
+               columns: Optional[List[str]] = None, store_dir: str = HISTORY_STORE_PATH) -> pd.DataFrame:
+    """
+    Scan the store for games
+
+    Only the requested sport and season partitions and the requested columns
+    are read. Games listed in more than one source are returned once.
+
+    Args:
+        sport: Sport code, or None for all sports
+        seasons: Season labels ("2024-25", "2025"), or None for all seasons
+        columns: Columns to read (defaults to all); "sport" and "season" are always included
+        store_dir: Directory of the Parquet store
+
+    Returns:
+        DataFrame sorted by date, with "date" as datetime64
+    """
+    wanted = ["sport", "season"] + [c for c in (columns or COLUMNS) if c not in ("sport", "season")]
+    if not os.path.isdir(store_dir) or not any(name.startswith("sport=") for name in os.listdir(store_dir)):
+        return pd.DataFrame(columns=wanted)
+
+    dataset = ds.dataset(store_dir, format="parquet", partitioning=PARTITIONING,
+                         exclude_invalid_files=True, ignore_prefixes=[".", "_", MANIFEST_FILE])
+    condition = None
+    if sport is not None:
+        condition = ds.field("sport") == sport
+    if seasons is not None:
+        in_seasons = ds.field("season").isin(list(seasons))
+        condition = in_seasons if condition is None else condition & in_seasons
+    frame = dataset.to_table(columns=wanted, filter=condition).to_pandas()
+    if "date" in frame:
+        frame["date"] = pd.to_datetime(frame["date"])
+    keys = [c for c in ("sport", "season", "date", "home_team", "away_team") if c in frame]
+    return frame.drop_duplicates(subset=keys).sort_values(keys).reset_index(drop=True)
+
+_ingested = False
+_ingest_lock = threading.Lock()
+
+def get_games(sport: Optional[str] = None, seasons: Optional[List[str]] = None,
+              columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Games from the shared store, bringing it up to date with the source files once per process"""
+    global _ingested
+
+    if not _ingested:
+        with _ingest_lock:
+            if not _ingested:
+                try:
+                    ingest()
+                except Exception as e:
+                    print(f"Error updating schedule history: {str(e)}", file=sys.stderr)
+                _ingested = True
+    try:
+        return load_games(sport, seasons, columns)
+    except Exception as e:
+        print(f"Error reading schedule history: {str(e)}", file=sys.stderr)
+        return pd.DataFrame(columns=["sport", "season"] + (columns or COLUMNS))
+
+def main():
+    parser = argparse.ArgumentParser(description='FlexTime Schedule History')
+    parser.add_argument('--source', type=str, default=SCHEDULING_SOURCE_PATH, help='Directory of schedule files')
+    parser.add_argument('--store', type=str, default=HISTORY_STORE_PATH, help='Directory of the Parquet store')
+    parser.add_argument('--rebuild', action='store_true', help='Re-parse every file')
+    parser.add_argument('-s', '--sport', type=str, help='Print the stored games for a sport')
+
+    args = parser.parse_args()
+
+    summary = ingest(args.source, args.store, args.rebuild)
+    if args.sport:
+        games = load_games(args.sport, store_dir=args.store)
+        games["date"] = games["date"].dt.strftime("%Y-%m-%d")
+        games = games.astype(object).where(games.notna(), None)
+        print(json.dumps(games.to_dict(orient="records"), indent=2))
+    else:
+        print(json.dumps(summary, indent=2))
+
+if __name__ == "__main__":
+    main()
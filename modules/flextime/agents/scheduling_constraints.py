@@ -0,0 +1,700 @@
+#!/usr/bin/env python3
+"""
+Scheduling Constraints
+
+Compiles the conference's scheduling sheets into typed constraints: the
+campus conflicts sheet (data/scheduling/core/... Campus Scheduling
+Conflicts.csv) gives blackout dates, unavailable venues, preferred home
+dates and campus events such as exams, and the per-sport "Scheduling
+Considerations" sheets (data/scheduling/<sport>/ and data/analysis/) give
+each sport's conference season window.
+
+The constraints are then laid out as date-indexed bitsets, one uint16 per
+school and day with a bit per sport, so checking a (school, date, sport)
+triple is a single array lookup. The compiled arrays are cached on disk,
+keyed on the source files, and rebuilt when a sheet changes.
+
+Part of the XII-OS FlexTime module.
+"""
+
+import os
+import re
+import sys
+import csv
+import json
+import glob
+import hashlib
+import zipfile
+import argparse
+import datetime
+import threading
+from typing import Dict, List, Any, Optional, Tuple, Iterable
+
+import numpy as np
+
+import scheduling_core
+import schedule_history
+
+# FlexTime configuration
+FLEXTIME_VERSION = "1.0.0"
+FLEXTIME_MODULE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_PATH = os.path.join(FLEXTIME_MODULE_PATH, "data", "storage", "cache")
+XII_OS_PATH = os.path.dirname(os.path.dirname(FLEXTIME_MODULE_PATH))
+CONSTRAINT_SOURCE_PATHS = [
+    os.path.join(XII_OS_PATH, "data", "scheduling"),
+    os.path.join(XII_OS_PATH, "data", "analysis")
+]
+CONSIDERATIONS_PATTERN = "*Scheduling Considerations.csv"
+CAMPUS_CONFLICTS_PATTERN = "*Campus Scheduling Conflicts.csv"
+COMPILER_VERSION = 1  # bump to recompile cached constraints after a parser change
+
+# Bit order of the per-day sport masks
+SPORTS = [
+    "mbasketball", "wbasketball", "football", "baseball", "softball",
+    "mtennis", "wtennis", "volleyball", "soccer", "wrestling",
+    "gymnastics", "lacrosse"
+]
+ALL_SPORTS = (1 << len(SPORTS)) - 1
+SPORT_BITS = {sport: 1 << i for i, sport in enumerate(SPORTS)}
+
+# Sports named in the sheets' free text
+SPORT_KEYWORDS = [
+    (r"\bM ?BB\b|\b(?:M|men'?s) basketball", ["mbasketball"]),
+    (r"\bW ?BB\b|\bBB-W\b|\b(?:W|women'?s) basketball", ["wbasketball"]),
+    (r"\bbasketball\b", ["mbasketball", "wbasketball"]),
+    (r"\bFB\b|\bfootball\b", ["football"]),
+    (r"\bbaseball\b", ["baseball"]),
+    (r"\bsoftball\b", ["softball"]),
+    (r"\bM ?TEN\b|\b(?:M|men'?s) tennis", ["mtennis"]),
+    (r"\bW ?TE\b|\bW ?TN\b|\b(?:W|women'?s) tennis", ["wtennis"]),
+    (r"\btennis\b", ["mtennis", "wtennis"]),
+    (r"\bVB\b|\bvolleyball\b", ["volleyball"]),
+    (r"\bsoccer\b", ["soccer"]),
+    (r"\bWRES\b|\bwrestling\b", ["wrestling"]),
+    (r"\bGYM\b|\bgymnastics\b", ["gymnastics"]),
+    (r"\bW?LAX\b|\blacrosse\b", ["lacrosse"])
+]
+
+# Sports played in a school's main arena, for "arena closed" conflicts
+ARENA_SPORTS = ["mbasketball", "wbasketball", "volleyball", "wrestling", "gymnastics"]
+
+# Campus conflicts sheet columns, matched on header text
+CAMPUS_COLUMNS = [
+    ("conflicts", r"campus conflicts"),
+    ("winter_exams", r"winter exam"),
+    ("spring_break", r"spring break"),
+    ("spring_exams", r"spring exam"),
+    ("graduation", r"graduation"),
+    ("softball_home", r"softball home"),
+    ("baseball_home", r"baseball home"),
+    ("notes", r"other notes")
+]
+
+# Soft constraint planes: dates to prefer or avoid, reported but not blocking
+SOFT_PLANES = ["preferred_home", "exam", "spring_break", "graduation", "avoid_home"]
+
+MONTH = (r"(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|June?|July?|Aug(?:ust)?|"
+         r"Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\.?")
+DATE_RANGE = re.compile(r"\b" + MONTH + r"\s*(\d{1,2})\b(?:\s*[-–]\s*(?:" + MONTH + r"\s*)?(\d{1,2})\b)?(?:,?\s*(20\d\d))?",
+                        re.IGNORECASE)
+NO_WEEKDAY = re.compile(r"\bno (mon|tues|wednes|thurs|fri|satur|sun)days\b", re.IGNORECASE)
+SEASON_DATE = re.compile(r"(?:(20\d\d)\s+)?(Start|End) Date:\s*([^\n]+)", re.IGNORECASE)
+NOTHING = re.compile(r"^\W*(none|n/?a|not available|no conflicts.*)?\W*$", re.IGNORECASE)
+
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+Window = Tuple[datetime.date, datetime.date]
+
+def _month(name: str) -> int:
+    return datetime.datetime.strptime(name[:3].title(), "%b").month
+
+def date_ranges(text: str, season: Optional[str] = None, year: Optional[int] = None) -> List[Window]:
+    """
+    Date ranges written in a sheet cell ("Dec 8-13", "April 29- May 5", "Oct 4-5, 2025")
+
+    Args:
+        text: Cell text
+        season: Season the sheet covers ("2025-26"), used for ranges without a year
+        year: Year for ranges without one, taking precedence over the season
+
+    Returns:
+        List of (first, last) dates; ranges whose year cannot be told are left out
+    """
+    ranges = []
+    for first_month, first_day, last_month, last_day, explicit in DATE_RANGE.findall(text):
+        month = _month(first_month)
+        end_month = _month(last_month) if last_month else month
+        if explicit:
+            first_year = last_year = int(explicit)
+        elif year is not None:
+            first_year = last_year = year
+        elif season:
+            first_year = schedule_history.season_year(season, month)
+            last_year = schedule_history.season_year(season, end_month)
+        else:
+            continue
+        try:
+            first = datetime.date(first_year, month, int(first_day))
+            last = datetime.date(last_year, end_month, int(last_day or first_day))
+        except ValueError:
+            continue
+        ranges.append((first, last) if first <= last else (last, first))
+    return ranges
+
+def named_sports(text: str) -> List[str]:
+    """Sports named in free text ("NCAA WBB Final Four" -> ["wbasketball"])"""
+    sports = []
+    for pattern, names in SPORT_KEYWORDS:
+        if re.search(pattern, text, re.IGNORECASE):
+            sports += [sport for sport in names if sport not in sports]
+            # "M TENNIS" should not also count as the generic "tennis" further down
+            text = re.sub(pattern, " ", text, flags=re.IGNORECASE)
+    return sports
+
+def day_ordinals(dates: Iterable[Any]) -> np.ndarray:
+    """Day ordinals for ISO date strings, datetime.date objects or datetime64 values"""
+    dates = list(dates)
+    if dates and isinstance(dates[0], datetime.date):
+        return np.array([date.toordinal() for date in dates], dtype=np.int64)
+    return np.asarray(dates, dtype="datetime64[D]").astype(np.int64) + EPOCH_ORDINAL
+
+def academic_year(date: datetime.date) -> Window:
+    """July 1 - June 30 year a date falls in"""
+    first = date.year if date.month >= 7 else date.year - 1
+    return datetime.date(first, 7, 1), datetime.date(first + 1, 6, 30)
+
+class Constraint:
+    """
+    A scheduling rule from one of the sheets
+
+    A constraint covers a school (None for every school), a set of sports
+    (None for all) and either a date range or a set of weekdays.
+    """
+
+    kind = "constraint"
+    hard = False          # hard constraints make a date unavailable, soft ones only flag it
+    home_only = True      # only restricts the school's home events
+    __slots__ = ("school", "sports", "first", "last", "weekdays", "description", "source")
+
+    def __init__(self, school: Optional[str], sports: Optional[List[str]] = None,
+                 first: Optional[datetime.date] = None, last: Optional[datetime.date] = None,
+                 weekdays: Optional[List[int]] = None, description: str = "", source: str = ""):
+        self.school = school
+        self.sports = sorted(sports) if sports else None
+        self.first = first
+        self.last = last if last is not None else first
+        self.weekdays = sorted(weekdays) if weekdays else None
+        self.description = description
+        self.source = source
+
+    @property
+    def plane(self) -> Optional[str]:
+        """Soft plane the constraint is compiled into (None for hard constraints)"""
+        return None
+
+    @property
+    def sport_mask(self) -> int:
+        if self.sports is None:
+            return ALL_SPORTS
+        return sum(1 << SPORTS.index(sport) for sport in self.sports if sport in SPORTS)
+
+    def covers(self, date: datetime.date) -> bool:
+        """Whether the constraint restricts this date"""
+        if self.weekdays is not None and date.weekday() not in self.weekdays:
+            return False
+        return self.first is None or self.first <= date <= self.last
+
+    def applies(self, school: str, date: datetime.date, sport: str, home: bool = True) -> bool:
+        """Whether the constraint restricts a school's game on a date"""
+        return ((self.school is None or self.school == school)
+                and (self.sports is None or sport in self.sports)
+                and (home or not self.home_only)
+                and self.covers(date))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "school": self.school,
+            "sports": self.sports,
+            "first": self.first.isoformat() if self.first else None,
+            "last": self.last.isoformat() if self.last else None,
+            "weekdays": self.weekdays,
+            "description": self.description,
+            "source": self.source
+        }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "Constraint":
+        cls = CONSTRAINT_TYPES[data["kind"]]
+        extra = {key: data[key] for key in cls.__dict__.get("__slots__", ()) if key in data}
+        return cls(data["school"], data["sports"],
+                   datetime.date.fromisoformat(data["first"]) if data["first"] else None,
+                   datetime.date.fromisoformat(data["last"]) if data["last"] else None,
+                   data["weekdays"], data["description"], data["source"], **extra)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.school}, {self.sports}, {self.first}, {self.last})"
+
+class BlackoutDates(Constraint):
+    """Dates a school cannot host, or with home_only False cannot play at all (BYU Sundays)"""
+
+    kind = "blackout"
+    hard = True
+    __slots__ = ("home_only",)
+
+    def __init__(self, *args, home_only: bool = True, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.home_only = home_only
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(super().to_dict(), home_only=self.home_only)
+
+class UnavailableVenue(Constraint):
+    """Dates a school's venue is taken (arena closed, hosting an NCAA event)"""
+
+    kind = "unavailable_venue"
+    hard = True
+    __slots__ = ("venue",)
+
+    def __init__(self, *args, venue: str = "", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.venue = venue
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(super().to_dict(), venue=self.venue)
+
+class PreferredDays(Constraint):
+    """Dates a school would like to be at home (a soft preference)"""
+
+    kind = "preferred_days"
+    __slots__ = ()
+
+    @property
+    def plane(self) -> Optional[str]:
+        return "preferred_home"
+
+class CampusEvent(Constraint):
+    """Campus calendar dates worth knowing when scheduling: exams, spring break, graduation, events to avoid"""
+
+    kind = "campus_event"
+    __slots__ = ("event",)
+
+    def __init__(self, *args, event: str = "avoid_home", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.event = event
+
+    @property
+    def plane(self) -> Optional[str]:
+        return self.event
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(super().to_dict(), event=self.event)
+
+class SeasonWindow(Constraint):
+    """A sport's conference season; within its academic year, no conference games outside first..last"""
+
+    kind = "season_window"
+    hard = True
+    home_only = False
+    __slots__ = ()
+
+    def covers(self, date: datetime.date) -> bool:
+        start, end = academic_year(self.first)
+        return start <= date <= end and not (self.first <= date <= self.last)
+
+CONSTRAINT_TYPES = {cls.kind: cls for cls in (BlackoutDates, UnavailableVenue, PreferredDays, CampusEvent, SeasonWindow)}
+
+def read_sheet(path: str) -> List[List[str]]:
+    """Rows of a sheet; some ".csv" exports are really XLSX workbooks"""
+    if zipfile.is_zipfile(path):
+        return schedule_history.read_xlsx_rows(path)
+    with open(path, newline="", encoding="utf-8-sig", errors="replace") as f:
+        return [[cell.strip() for cell in row] for row in csv.reader(f)]
+
+def parse_campus_conflicts(rows: List[List[str]], season: Optional[str], source: str = "") -> List[Constraint]:
+    """
+    Constraints from the campus conflicts sheet (one row per school)
+
+    Conflicts apply to the sports the sheet was collected for (listed in its
+    introduction). Entries that say to avoid or prefer dates become soft
+    constraints; "arena closed" and "hosting NCAA ..." entries mark the venue
+    unavailable; "cannot compete during finals" or "commencement" without
+    dates black out the school's exam or graduation dates.
+    """
+    text = "\n".join(cell for row in rows for cell in row)
+    intro = text.split("Although")[0]
+    sheet_sports = [sport for item in re.findall(r"•\s*([^\n•]+)", intro) for sport in named_sports(item)] or None
+
+    columns = {}
+    constraints = []
+    for row in rows:
+        cells = [(cell or "").strip() for cell in row]
+        if not columns:
+            for col, cell in enumerate(cells):
+                for name, pattern in CAMPUS_COLUMNS:
+                    if name not in columns and re.search(pattern, cell, re.IGNORECASE):
+                        columns[name] = col
+                        break
+            continue
+        if not cells or not cells[0]:
+            continue
+        school = schedule_history.team_code(cells[0])
+        if school not in schedule_history.TEAM_ABBREVIATIONS.values():
+            continue
+
+        def cell(name: str) -> str:
+            col = columns.get(name)
+            value = cells[col] if col is not None and col < len(cells) else ""
+            return "" if NOTHING.match(value) else value
+
+        exams = date_ranges(cell("winter_exams"), season) + date_ranges(cell("spring_exams"), season)
+        spring_exams = date_ranges(cell("spring_exams"), season)
+        graduation = date_ranges(cell("graduation"), season)
+
+        def add(cls, windows, description, **kwargs):
+            sports = kwargs.pop("sports", sheet_sports)
+            description = " ".join(description.split())
+            for first, last in windows:
+                constraints.append(cls(school, sports, first, last, description=description, source=source, **kwargs))
+
+        for segment in re.split(r";", cell("conflicts")):
+            segment = segment.strip()
+            if not segment or NOTHING.match(segment):
+                continue
+            windows = date_ranges(segment, season)
+            lowered = segment.lower()
+            weekday = NO_WEEKDAY.search(segment)
+            if weekday:
+                day = [name[:3].lower() for name in scheduling_core.WEEKDAYS].index(weekday.group(1)[:3].lower())
+                constraints.append(BlackoutDates(school, None, weekdays=[day], description=weekday.group(0),
+                                                 source=source, home_only=False))
+            if "hosting" in lowered:
+                named = named_sports(segment)
+                if named:
+                    add(UnavailableVenue, windows, segment, sports=named, venue=segment)
+                else:
+                    add(CampusEvent, windows, segment, event="avoid_home")
+            elif "arena" in lowered or "closed" in lowered:
+                add(UnavailableVenue, windows, segment, sports=ARENA_SPORTS, venue="arena")
+            elif "avoid" in lowered or "best effort" in lowered or "prefer" in lowered:
+                add(CampusEvent, windows, segment, event="avoid_home")
+            else:
+                # "Cannot host" keeps road games possible; "unable to compete" rules out all games
+                home_only = not re.search(r"\bcompe?te", lowered)
+                if windows:
+                    add(BlackoutDates, windows, segment, home_only=home_only)
+                else:
+                    if "final" in lowered or "exam" in lowered:
+                        add(BlackoutDates, exams, segment, home_only=home_only)
+                    if "commencement" in lowered or "graduation" in lowered:
+                        add(BlackoutDates, graduation, segment, home_only=home_only)
+
+        add(CampusEvent, exams, "Final exams", event="exam", sports=None)
+        add(CampusEvent, date_ranges(cell("spring_break"), season), "Spring break", event="spring_break", sports=None)
+        add(CampusEvent, graduation, "Graduation", event="graduation", sports=None)
+        for sport in ("softball", "baseball"):
+            preference = cell(f"{sport}_home")
+            windows = date_ranges(preference, season) or (spring_exams if "exam" in preference.lower() else [])
+            add(PreferredDays, windows, preference, sports=[sport])
+    return constraints
+
+def parse_considerations(rows: List[List[str]], sport: Optional[str], source: str = "") -> List[Constraint]:
+    """
+    Season windows from a sport scheduling considerations sheet
+
+    Sheets covering several sports start each sport's block with its name in
+    the first column. "<year> Start Date:" and "End Date:" lines bound the
+    window; where a line offers alternatives ("Friday, March 7 (or Thursday,
+    March 6)") the widest window is kept.
+    """
+    bounds: Dict[str, Dict[str, List[datetime.date]]] = {}
+    for row in rows:
+        cells = [(cell or "").strip() for cell in row]
+        if cells and cells[0]:
+            named = named_sports(cells[0].split("(")[0])
+            if len(named) == 1 and re.match(r"^[A-Z'’ ]+(SCHEDULING)?\b", cells[0]):
+                sport = named[0]
+        if sport is None:
+            continue
+        for cell in cells:
+            for year, which, text in SEASON_DATE.findall(cell):
+                dates = [d for window in date_ranges(text, year=int(year) if year else None) for d in window]
+                if dates:
+                    bounds.setdefault(sport, {"start": [], "end": []})[which.lower()].append(
+                        min(dates) if which.lower() == "start" else max(dates))
+
+    constraints = []
+    for sport, found in bounds.items():
+        for start in found["start"]:
+            ends = [end for end in found["end"] if academic_year(end) == academic_year(start) and end >= start]
+            if ends:
+                constraints.append(SeasonWindow(None, [sport], start, max(ends),
+                                                description=f"Conference season {start.isoformat()} to {max(ends).isoformat()}",
+                                                source=source))
+    return constraints
+
+def source_files(source_dirs: Iterable[str] = CONSTRAINT_SOURCE_PATHS) -> List[str]:
+    """Constraint sheets under the source directories, sorted"""
+    files = set()
+    for source_dir in source_dirs:
+        for pattern in (CONSIDERATIONS_PATTERN, CAMPUS_CONFLICTS_PATTERN):
+            files.update(glob.glob(os.path.join(source_dir, "**", pattern), recursive=True))
+    return sorted(files)
+
+def parse_sources(files: Iterable[str]) -> List[Constraint]:
+    """Constraints from every sheet, with identical rules from overlapping sheets kept once"""
+    constraints = []
+    seen = set()
+    for path in files:
+        name = os.path.basename(path)
+        try:
+            rows = read_sheet(path)
+            if re.search("campus scheduling conflicts", name, re.IGNORECASE):
+                found = parse_campus_conflicts(rows, schedule_history.season_label(name), name)
+            else:
+                found = parse_considerations(rows, schedule_history.sport_for_file(path), name)
+        except Exception as e:
+            print(f"Error reading scheduling sheet {path}: {str(e)}", file=sys.stderr)
+            continue
+        for constraint in found:
+            key = json.dumps({k: v for k, v in constraint.to_dict().items() if k != "source"}, sort_keys=True)
+            if key not in seen:
+                seen.add(key)
+                constraints.append(constraint)
+    return constraints
+
+class CompiledConstraints:
+    """
+    Constraints laid out as per-school, per-day sport bitsets
+
+    Rows are schools, with a last row for schools the sheets do not name
+    (only conference-wide rules apply to them); columns are days from
+    day0. Each uint16 holds one bit per entry of SPORTS.
+    """
+
+    def __init__(self, constraints: List[Constraint], version: str = "",
+                 arrays: Optional[Dict[str, np.ndarray]] = None):
+        """
+        Args:
+            constraints: Constraints to compile
+            version: Identifier of the source sheets
+            arrays: Previously compiled arrays for the same constraints (from the disk cache)
+        """
+        self.constraints = list(constraints)
+        self.version = version
+        self.schools = sorted({c.school for c in self.constraints if c.school is not None})
+        self.index = {school: i for i, school in enumerate(self.schools)}
+
+        dated = [d for c in self.constraints if c.first is not None for d in (c.first, c.last)]
+        dated += [day for c in self.constraints if isinstance(c, SeasonWindow) for day in academic_year(c.first)]
+        first = academic_year(min(dated))[0] if dated else datetime.date(2000, 7, 1)
+        last = academic_year(max(dated))[1] if dated else datetime.date(2001, 6, 30)
+        self.day0 = first.toordinal()
+        self.days = last.toordinal() - self.day0 + 1
+
+        if arrays is not None:
+            self.host_blocked = arrays["host_blocked"]
+            self.play_blocked = arrays["play_blocked"]
+            self.weekday_blocked = arrays["weekday_blocked"]
+            self.soft = arrays["soft"]
+        else:
+            self._compile()
+
+    def _rows(self, constraint: Constraint) -> Any:
+        return slice(None) if constraint.school is None else self.index[constraint.school]
+
+    def _compile(self):
+        rows = len(self.schools) + 1
+        self.host_blocked = np.zeros((rows, self.days), dtype=np.uint16)
+        self.play_blocked = np.zeros((rows, self.days), dtype=np.uint16)
+        self.weekday_blocked = np.zeros((rows, 7), dtype=np.uint16)
+        self.soft = np.zeros((len(SOFT_PLANES), rows, self.days), dtype=np.uint16)
+        weekday = (np.arange(self.days) + self.day0 - 1) % 7  # date.weekday() of each day
+
+        for constraint in self.constraints:
+            mask = np.uint16(constraint.sport_mask)
+            row = self._rows(constraint)
+            if constraint.first is None:
+                if constraint.hard and constraint.weekdays:
+                    self.weekday_blocked[row, constraint.weekdays] |= mask
+                continue
+
+            days = np.zeros(self.days, dtype=bool)
+            if isinstance(constraint, SeasonWindow):
+                start, end = academic_year(constraint.first)
+                days[start.toordinal() - self.day0:end.toordinal() - self.day0 + 1] = True
+                days[constraint.first.toordinal() - self.day0:constraint.last.toordinal() - self.day0 + 1] = False
+            else:
+                days[constraint.first.toordinal() - self.day0:constraint.last.toordinal() - self.day0 + 1] = True
+            if constraint.weekdays:
+                days &= np.isin(weekday, constraint.weekdays)
+
+            if constraint.hard:
+                target = self.host_blocked if constraint.home_only else self.play_blocked
+            else:
+                target = self.soft[SOFT_PLANES.index(constraint.plane)]
+            target[row, days] |= mask
+
+    def _lookup(self, school: str, day: int) -> Tuple[int, int]:
+        return self.index.get(school, len(self.schools)), day - self.day0
+
+    def allowed(self, school: str, date: Any, sport: str, home: bool = True) -> bool:
+        """
+        Whether a school can play a sport on a date
+
+        Args:
+            school: School code
+            date: ISO date string or datetime.date
+            sport: Sport code
+            home: Whether the school is hosting (host-only blackouts apply)
+        """
+        day = (datetime.date.fromisoformat(date) if isinstance(date, str) else date).toordinal()
+        return self.allowed_day(school, day, sport, home)
+
+    def allowed_day(self, school: str, day: int, sport: str, home: bool = True) -> bool:
+        """allowed() for a day ordinal"""
+        bit = SPORT_BITS.get(sport)
+        if bit is None:
+            return True
+        row, offset = self._lookup(school, day)
+        if self.weekday_blocked[row, (day - 1) % 7] & bit:
+            return False
+        if not 0 <= offset < self.days:
+            return True
+        blocked = self.play_blocked[row, offset] | (self.host_blocked[row, offset] if home else 0)
+        return not blocked & bit
+
+    def allowed_many(self, schools: Iterable[str], dates: Iterable[Any], sports: Iterable[str],
+                     home: Any = True) -> np.ndarray:
+        """
+        allowed() for parallel lists of schools, dates and sports
+
+        Args:
+            home: One flag for every entry or an array of flags
+
+        Returns:
+            Boolean array, one entry per triple
+        """
+        rows = np.array([self.index.get(school, len(self.schools)) for school in schools], dtype=np.intp)
+        days = day_ordinals(dates)
+        bits = np.array([SPORT_BITS.get(sport, 0) for sport in sports], dtype=np.uint16)
+        home = np.broadcast_to(np.asarray(home, dtype=bool), bits.shape)
+
+        offsets = days - self.day0
+        inside = (offsets >= 0) & (offsets < self.days)
+        clipped = np.where(inside, offsets, 0)
+        blocked = self.weekday_blocked[rows, (days - 1) % 7]
+        blocked |= np.where(inside, self.play_blocked[rows, clipped] | np.where(home, self.host_blocked[rows, clipped], 0), 0).astype(np.uint16)
+        return (blocked & bits) == 0
+
+    def soft_flags(self, school: str, date: Any, sport: str) -> List[str]:
+        """Soft planes (SOFT_PLANES) that mark a school's date for a sport"""
+        day = (datetime.date.fromisoformat(date) if isinstance(date, str) else date).toordinal()
+        row, offset = self._lookup(school, day)
+        bit = SPORT_BITS.get(sport)
+        if bit is None or not 0 <= offset < self.days:
+            return []
+        return [plane for p, plane in enumerate(SOFT_PLANES) if self.soft[p, row, offset] & bit]
+
+    def explain(self, school: str, date: Any, sport: str, home: bool = True) -> List[Constraint]:
+        """Hard constraints that rule out a school's game on a date"""
+        date = datetime.date.fromisoformat(date) if isinstance(date, str) else date
+        return [c for c in self.constraints if c.hard and c.applies(school, date, sport, home)]
+
+    def for_school(self, school: str) -> List[Constraint]:
+        """Constraints naming a school"""
+        return [c for c in self.constraints if c.school == school]
+
+def _sources_version(files: List[str]) -> str:
+    digest = hashlib.sha256(f"compiler:{COMPILER_VERSION}".encode())
+    for path in files:
+        stat = os.stat(path)
+        digest.update(f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()[:16]
+
+def build_constraints(source_dirs: Iterable[str] = CONSTRAINT_SOURCE_PATHS, cache_dir: Optional[str] = CACHE_PATH,
+                      rebuild: bool = False) -> CompiledConstraints:
+    """
+    Compile the scheduling sheets, reusing the on-disk copy when the sheets are unchanged
+
+    Args:
+        source_dirs: Directories searched for the sheets
+        cache_dir: Directory for the compiled arrays, or None to keep them in memory
+        rebuild: Recompile even when a cached copy exists
+
+    Returns:
+        CompiledConstraints instance
+    """
+    files = source_files(source_dirs)
+    version = _sources_version(files)
+
+    arrays_file = os.path.join(cache_dir, f"constraints_{version}.npz") if cache_dir else None
+    index_file = os.path.join(cache_dir, f"constraints_{version}.json") if cache_dir else None
+    if arrays_file and not rebuild and os.path.exists(arrays_file) and os.path.exists(index_file):
+        try:
+            with open(index_file) as f:
+                constraints = [Constraint.from_dict(data) for data in json.load(f)]
+            with np.load(arrays_file, allow_pickle=False) as cached:
+                return CompiledConstraints(constraints, version, {name: cached[name] for name in cached.files})
+        except Exception as e:
+            print(f"Error reading cached constraints: {str(e)}", file=sys.stderr)
+
+    compiled = CompiledConstraints(parse_sources(files), version)
+
+    if arrays_file:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            np.savez(arrays_file, host_blocked=compiled.host_blocked, play_blocked=compiled.play_blocked,
+                     weekday_blocked=compiled.weekday_blocked, soft=compiled.soft)
+            with open(index_file, "w") as f:
+                json.dump([c.to_dict() for c in compiled.constraints], f)
+        except Exception as e:
+            print(f"Error saving constraints: {str(e)}", file=sys.stderr)
+
+    return compiled
+
+_constraints: Optional[CompiledConstraints] = None
+_constraints_lock = threading.Lock()
+
+def get_constraints() -> Optional[CompiledConstraints]:
+    """
+    Get the shared compiled constraints for this process, recompiling them if a sheet changed
+
+    Returns:
+        CompiledConstraints, or None if the sheets could not be compiled
+    """
+    global _constraints
+
+    with _constraints_lock:
+        try:
+            if _constraints is None or _constraints.version != _sources_version(source_files()):
+                _constraints = build_constraints()
+        except Exception as e:
+            print(f"Error loading scheduling constraints: {str(e)}", file=sys.stderr)
+    return _constraints
+
+def main():
+    parser = argparse.ArgumentParser(description='FlexTime Scheduling Constraints')
+    parser.add_argument('-s', '--school', type=str, help='School code')
+    parser.add_argument('-d', '--date', type=str, help='Date (YYYY-MM-DD)')
+    parser.add_argument('--sport', type=str, help='Sport code')
+    parser.add_argument('--away', action='store_true', help='Check an away game instead of a home game')
+    parser.add_argument('--rebuild', action='store_true', help='Recompile and persist the constraints')
+
+    args = parser.parse_args()
+
+    compiled = build_constraints(rebuild=args.rebuild)
+    if args.school and args.date and args.sport:
+        print(json.dumps({
+            "allowed": compiled.allowed(args.school, args.date, args.sport, home=not args.away),
+            "blocked_by": [c.to_dict() for c in compiled.explain(args.school, args.date, args.sport, not args.away)],
+            "flags": compiled.soft_flags(args.school, args.date, args.sport)
+        }, indent=2))
+    elif args.school:
+        print(json.dumps([c.to_dict() for c in compiled.for_school(args.school)], indent=2))
+    else:
+        print(json.dumps({"version": compiled.version, "constraints": len(compiled.constraints),
+                          "schools": compiled.schools}, indent=2))
+
+if __name__ == "__main__":
+    main()
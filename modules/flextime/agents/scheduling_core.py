@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Scheduling Core
+
+Shared pieces of the FlexTime conference schedule generators: game-date
+calendars built from a sport's traditional game days, date windows for
+traditional-date phrases ("Mid-October", "Thanksgiving weekend"),
+road-streak checks, work spread over a process pool, including
+randomized restarts that keep the best few schedules under a
+caller-supplied scoring function, and the upstream-findings section
+agents add when the head coach passes them earlier subtask results.
+
+Part of the XII-OS FlexTime module.
+"""
+
+import os
+import re
+import sys
+import time
+import heapq
+import pickle
+import calendar
+import datetime
+import concurrent.futures
+import concurrent.futures.process
+from typing import Dict, List, Any, Optional, Tuple, Callable, Iterable
+
+import numpy as np
+
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+MONTHS = ["january", "february", "march", "april", "may", "june", "july",
+          "august", "september", "october", "november", "december"]
+DEFAULT_MIN_DAYS_BETWEEN = 3  # days from one game date to the next
+
+# Days of the month covered by "Early", "Mid" and "Late", widened by a few days
+# either side since traditions drift with the calendar
+PERIOD_DAYS = {"early": (1, 10), "mid": (11, 20), "late": (21, 31)}
+TRADITION_SLACK_DAYS = 3
+
+Candidate = Dict[str, Any]
+
+def game_dates(start_date: str, count: int, game_days: Iterable[str],
+               min_days_between: int = DEFAULT_MIN_DAYS_BETWEEN) -> List[str]:
+    """
+    Consecutive game dates on a sport's traditional game days
+
+    Args:
+        start_date: First possible date (YYYY-MM-DD)
+        count: Number of dates
+        game_days: Weekday names games are played on (e.g. ["Wednesday", "Saturday"])
+        min_days_between: Minimum days from one date to the next
+
+    Returns:
+        ISO dates, each the first game day at least min_days_between after the previous one
+
+    Raises:
+        ValueError: If game_days names no weekday
+    """
+    allowed = {WEEKDAYS.index(day) for day in game_days if day in WEEKDAYS}
+    if not allowed:
+        raise ValueError(f"No valid game days in {list(game_days)}")
+
+    day = datetime.date.fromisoformat(start_date)
+    dates = []
+    while len(dates) < count:
+        while day.weekday() not in allowed:
+            day += datetime.timedelta(days=1)
+        dates.append(day.isoformat())
+        day += datetime.timedelta(days=min_days_between)
+    return dates
+
+def next_season_date(month_day: str, today: Optional[datetime.date] = None) -> str:
+    """The next occurrence (today or later) of a "MM-DD" date"""
+    today = today or datetime.date.today()
+    month, day = (int(part) for part in month_day.split("-"))
+    candidate = datetime.date(today.year, month, day)
+    if candidate < today:
+        candidate = datetime.date(today.year + 1, month, day)
+    return candidate.isoformat()
+
+def thanksgiving(year: int) -> datetime.date:
+    """US Thanksgiving (fourth Thursday of November)"""
+    first = datetime.date(year, 11, 1)
+    return first + datetime.timedelta(days=(3 - first.weekday()) % 7 + 21)
+
+def tradition_window(phrase: str, year: int) -> Optional[Tuple[datetime.date, datetime.date]]:
+    """
+    Date window for a traditional-date phrase
+
+    Args:
+        phrase: Text such as "Mid-October", "Late November" or "Thanksgiving weekend"
+        year: Year the window falls in
+
+    Returns:
+        (first, last) dates inclusive, or None if the phrase names no period
+    """
+    text = phrase.lower()
+    if "thanksgiving" in text or "black friday" in text:
+        day = thanksgiving(year)
+        return day, day + datetime.timedelta(days=3)
+
+    match = re.search(r"(early|mid|late)[\s-]*(" + "|".join(MONTHS) + ")", text)
+    if not match:
+        return None
+    month = MONTHS.index(match.group(2)) + 1
+    first, last = PERIOD_DAYS[match.group(1)]
+    last = min(last, calendar.monthrange(year, month)[1])
+    slack = datetime.timedelta(days=TRADITION_SLACK_DAYS)
+    return datetime.date(year, month, first) - slack, datetime.date(year, month, last) + slack
+
+def road_streak_excess(away: np.ndarray, limit: int) -> np.ndarray:
+    """
+    Games beyond a consecutive-away limit, per team
+
+    Args:
+        away: Boolean array (teams, slots), True where the team plays away
+        limit: Away games allowed in a row
+
+    Returns:
+        Array (teams,) counting every window of limit + 1 straight away games
+    """
+    if away.shape[1] <= limit:
+        return np.zeros(away.shape[0], dtype=np.int64)
+    runs = np.zeros((away.shape[0], away.shape[1] + 1), dtype=np.int64)
+    np.cumsum(away, axis=1, out=runs[:, 1:])
+    return ((runs[:, limit + 1:] - runs[:, :-(limit + 1)]) == limit + 1).sum(axis=1)
+
+def max_road_streak(away: np.ndarray) -> np.ndarray:
+    """Longest run of away games per team for a (teams, slots) boolean array"""
+    longest = np.zeros(away.shape[0], dtype=np.int64)
+    current = np.zeros(away.shape[0], dtype=np.int64)
+    for column in away.T:
+        current = np.where(column, current + 1, 0)
+        longest = np.maximum(longest, current)
+    return longest
+
+def random_graph(degree: np.ndarray, banned: np.ndarray, rng: np.random.Generator,
+                  attempts: int = 50) -> Optional[np.ndarray]:
+    """
+    Random simple graph with the given degrees (randomized Havel-Hakimi)
+
+    Args:
+        degree: Required degree of each vertex
+        banned: Boolean (n, n) matrix of pairs that must not be joined
+        rng: Random generator
+        attempts: Randomized constructions tried before giving up
+
+    Returns:
+        Symmetric boolean adjacency matrix, or None if no construction succeeded
+    """
+    n = len(degree)
+    for _ in range(attempts):
+        remaining = degree.copy()
+        graph = np.zeros((n, n), dtype=bool)
+        while remaining.max() > 0:
+            team = int(np.argmax(remaining + rng.random(n) * 0.5))
+            options = np.flatnonzero((remaining > 0) & ~banned[team] & ~graph[team])
+            options = options[options != team]
+            if len(options) < remaining[team]:
+                break
+            order = options[np.argsort(-(remaining[options] + rng.random(len(options))))]
+            chosen = order[:remaining[team]]
+            graph[team, chosen] = graph[chosen, team] = True
+            remaining[chosen] -= 1
+            remaining[team] = 0
+        else:
+            return graph
+    return None
+
+def parallel_map(function: Callable[[Any], Any], items: List[Any],
+                 workers: Optional[int] = None) -> Tuple[List[Any], int]:
+    """
+    Apply a function to every item on a process pool, in order
+
+    The function must be picklable (a module-level function or a
+    functools.partial of one). Falls back to this process when the work
+    cannot be pickled or the pool cannot start; an exception raised by the
+    function itself propagates.
+
+    Args:
+        function: Function applied to each item
+        items: Work items
+        workers: Worker processes (defaults to the CPU count, at most 4); 1 runs in this process
+
+    Returns:
+        Tuple of (results in item order, workers used)
+    """
+    workers = workers or min(os.cpu_count() or 1, 4)
+    if workers > 1 and len(items) > 1:
+        try:
+            pickle.dumps((function, items))
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            print(f"Error pickling work for worker processes, continuing in-process: {str(e)}", file=sys.stderr)
+        else:
+            try:
+                with concurrent.futures.ProcessPoolExecutor(max_workers=min(workers, len(items))) as pool:
+                    return list(pool.map(function, items)), min(workers, len(items))
+            except (OSError, concurrent.futures.process.BrokenProcessPool) as e:
+                print(f"Error running worker processes, continuing in-process: {str(e)}", file=sys.stderr)
+    return [function(item) for item in items], 1
+
+def run_restarts(search: Callable[[int], Optional[Candidate]], seeds: List[int],
+                 score: Callable[[Candidate], float], keep: int = 1,
+                 workers: Optional[int] = None) -> Tuple[List[Candidate], Dict[str, Any]]:
+    """
+    Run independent randomized searches and keep the best candidates
+
+    The search function runs in worker processes, so it must be picklable
+    (a module-level function or a functools.partial of one); the scoring
+    function runs in this process and can be any callable.
+
+    Args:
+        search: Function seed -> candidate schedule, or None when the seed found nothing feasible
+        seeds: One seed per restart
+        score: Function candidate -> score (lower is better)
+        keep: Number of best candidates to return
+        workers: Worker processes (defaults to the CPU count, at most 4); 1 runs in this process
+
+    Returns:
+        Tuple of (best candidates in score order, each with its "score", search statistics)
+    """
+    started = time.perf_counter()
+    results, workers = parallel_map(search, seeds, workers)
+
+    scored = []
+    for order, candidate in enumerate(results):
+        if candidate is not None:
+            candidate["score"] = float(score(candidate))
+            scored.append((candidate["score"], order, candidate))
+    best = [candidate for _, _, candidate in heapq.nsmallest(keep, scored)]
+
+    stats = {
+        "restarts": len(seeds),
+        "feasible": len(scored),
+        "workers": workers,
+        "elapsed_seconds": round(time.perf_counter() - started, 2)
+    }
+    return best, stats
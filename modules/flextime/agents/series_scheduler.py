@@ -0,0 +1,528 @@
+#!/usr/bin/env python3
+"""
+Series Scheduler
+
+Builds baseball and softball conference schedules of three-game weekend
+series (Fri-Sun) from the parameters in historical_patterns_agent. Each
+candidate picks every team's opponents, assigns series to weekends and sets
+venues by simulated annealing, with no team playing more than two straight
+away series and every team playing half its series at home.
+
+Early-season (February and March) home series are pushed toward warm-weather
+sites: each team's weekend risk comes from climatology (rain, lightning and
+freeze probabilities), or from latitude for schools without weather history.
+When a weekend is rained out, the series still to be played can be
+regenerated around the weekends already completed.
+
+Part of the XII-OS FlexTime module.
+"""
+
+import sys
+import json
+import argparse
+import datetime
+import functools
+from typing import Dict, List, Any, Optional, Tuple, Callable
+
+import numpy as np
+
+import climatology
+import distance_engine
+import scheduling_core
+from historical_patterns_agent import SPORT_TRADITIONAL_PARAMETERS
+
+SERIES_SPORTS = ["baseball", "softball"]
+
+# Conference members sponsoring each sport
+SPORT_TEAMS = {
+    "baseball": ["arizona", "arizona_state", "baylor", "byu", "cincinnati", "houston", "kansas",
+                 "kansas_state", "oklahoma_state", "tcu", "texas_tech", "ucf", "utah", "west_virginia"],
+    "softball": ["arizona", "arizona_state", "baylor", "byu", "houston", "iowa_state", "kansas",
+                 "oklahoma_state", "texas_tech", "ucf", "utah"]
+}
+CONFERENCE_START = "03-06"       # first Friday on or after this date opens conference play
+OPEN_WEEKENDS = 1                # conference weekends beyond the number of series
+SERIES_DAYS = 3                  # Friday through Sunday
+MAX_CONSECUTIVE_AWAY_SERIES = 2  # "No more than 2 consecutive away series"
+
+# Early-season weather
+EARLY_SEASON_MONTHS = (2, 3)
+SPRING_HAZARDS = ["rain", "lightning", "freeze"]
+WARM_LATITUDE = 30.0             # latitude proxy when a school has no weather history:
+COLD_LATITUDE = 41.0             # risk rises from 0 at WARM_LATITUDE to 1 at COLD_LATITUDE
+
+# Search settings
+DEFAULT_CANDIDATES = 4
+DEFAULT_KEEP = 1
+SEARCH_ITERATIONS = 6000
+STALL_ITERATIONS = 1500
+HARD_VIOLATION_WEIGHT = 20.0       # low enough for the search to cross infeasible states
+WEATHER_WEIGHT = 10.0            # per early-season home series, scaled by the site's risk
+CHANGE_WEIGHT = 1.0              # per series moved off its weekend when rescheduling
+RESCHEDULE_ATTEMPTS = 3          # searches per rainout, the last from the pushed-back schedule
+REPAIR_BEAM = 16                 # layouts kept per step of the chain-swap repair
+REPAIR_DEPTH = 6                 # chain swaps the repair tries before falling back to annealing
+INITIAL_TEMPERATURE = 5.0
+FINAL_TEMPERATURE = 0.05
+
+def conference_weekends(season: int, count: int, start: str = CONFERENCE_START) -> List[List[str]]:
+    """Dates (Fri, Sat, Sun) of consecutive conference weekends"""
+    friday = datetime.date.fromisoformat(f"{season}-{start}")
+    friday += datetime.timedelta(days=(4 - friday.weekday()) % 7)
+    return [[(friday + datetime.timedelta(weeks=w, days=d)).isoformat() for d in range(SERIES_DAYS)]
+            for w in range(count)]
+
+def early_season_risk(teams: List[str], weekends: List[List[str]],
+                      climate: Optional[climatology.Climatology] = None,
+                      matrix: Optional[distance_engine.DistanceMatrix] = None) -> np.ndarray:
+    """
+    Weather risk of hosting each weekend, for early-season weekends only
+
+    Args:
+        teams: Team codes
+        weekends: Dates of each weekend
+        climate: Climatology tables (defaults to the shared ones)
+        matrix: Distance matrix supplying school coordinates for the latitude proxy
+
+    Returns:
+        Array (teams, weekends) in [0, 1]; 0 for weekends outside EARLY_SEASON_MONTHS
+    """
+    early = np.array([datetime.date.fromisoformat(dates[0]).month in EARLY_SEASON_MONTHS for dates in weekends])
+    risk = np.zeros((len(teams), len(weekends)))
+    if not early.any():
+        return risk
+
+    climate = climate if climate is not None else climatology.get_climatology()
+    matrix = matrix or distance_engine.get_distance_matrix()
+    columns = [climatology.HAZARDS.index(hazard) for hazard in SPRING_HAZARDS]
+    dates = [date for dates in weekends for date in dates]
+
+    for i, team in enumerate(teams):
+        if climate is not None and team in climate:
+            probs = climate.lookup([team] * len(dates), dates)[:, columns].max(axis=1)
+            risk[i] = probs.reshape(len(weekends), SERIES_DAYS).mean(axis=1) / 100
+        elif team in matrix:
+            latitude = matrix.coordinates[matrix.index[team]][0]
+            risk[i] = np.clip((latitude - WARM_LATITUDE) / (COLD_LATITUDE - WARM_LATITUDE), 0, 1)
+    return np.where(early, risk, 0.0)
+
+def assign_weekends(teams: List[str], pairs: List[List[str]], weekends: int, risk: np.ndarray, limit: int,
+                    seed: int, iterations: int = SEARCH_ITERATIONS, hosts: Optional[List[bool]] = None,
+                    history: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                    preferred: Optional[List[int]] = None,
+                    initial: Optional[List[int]] = None) -> Optional[Tuple[List[int], List[bool]]]:
+    """
+    Assign series to weekends (and venues) by simulated annealing
+
+    Args:
+        teams: Team codes
+        pairs: [a, b] opponents of each series
+        weekends: Weekends available after any already played
+        risk: Early-season hosting risk (teams, played weekends + weekends)
+        limit: Away series allowed in a row
+        seed: Random seed
+        iterations: Annealing moves
+        hosts: Fixed venues (True where a hosts), or None to choose venues with
+            every team hosting half its series
+        history: (played, away) boolean arrays (teams, played weekends) of weekends
+            already completed, so streaks carry over
+        preferred: Weekend each series would ideally keep (when rescheduling)
+        initial: Starting weekend per series (defaults to a greedy assignment)
+
+    Returns:
+        Tuple of (weekend per series, counted from the first open weekend; True where a hosts),
+        or None if no feasible assignment was found
+    """
+    if not pairs:
+        return [], []
+    rng = np.random.default_rng(seed)
+    index = {team: i for i, team in enumerate(teams)}
+    a = np.array([index[x] for x, _ in pairs])
+    b = np.array([index[y] for _, y in pairs])
+    n = len(teams)
+    played_before, away_before = history if history is not None else (np.zeros((n, 0), bool), np.zeros((n, 0), bool))
+    offset = played_before.shape[1]
+    series_count = np.bincount(np.concatenate([a, b]), minlength=n) + played_before.sum(axis=1)
+    free_venues = hosts is None
+    preferred = np.array(preferred) if preferred is not None else None
+
+    if initial is not None:
+        week = np.array(initial, dtype=np.int64)
+    else:
+        # Greedy start: each series on the first weekend both teams are free
+        week = np.empty(len(pairs), dtype=np.int64)
+        busy = np.zeros((n, weekends), dtype=bool)
+        for s in rng.permutation(len(pairs)):
+            open_weeks = np.flatnonzero(~busy[a[s]] & ~busy[b[s]])
+            week[s] = open_weeks[0] if len(open_weeks) else rng.integers(weekends)
+            busy[a[s], week[s]] = busy[b[s], week[s]] = True
+    flip = rng.random(len(pairs)) < 0.5 if free_venues else ~np.asarray(hosts, dtype=bool)
+
+    def evaluate(week, flip):
+        host = np.where(flip, b, a)
+        guest = np.where(flip, a, b)
+        load = (np.bincount(host * weekends + week, minlength=n * weekends)
+                + np.bincount(guest * weekends + week, minlength=n * weekends)).reshape(n, weekends)
+        away = np.zeros((n, weekends), dtype=bool)
+        away[guest, week] = True
+        played = np.concatenate([played_before, load > 0], axis=1)
+        away = np.concatenate([away_before, away], axis=1)
+        order = np.argsort(~played, axis=1, kind="stable")
+        sequence = np.take_along_axis(away, order, axis=1) & (np.arange(played.shape[1]) < series_count[:, None])
+
+        team_hard = np.clip(load - 1, 0, None).sum(axis=1) + scheduling_core.road_streak_excess(sequence, limit)
+        if free_venues:
+            home = np.bincount(host, minlength=n)
+            team_hard = team_hard + np.clip(np.abs(home - series_count / 2) - 0.5, 0, None)
+        hard = team_hard.sum()
+        exposure = risk[host, offset + week]
+        if preferred is not None:
+            # Weather only weighs on series that move, so it never moves one by itself
+            moved = week != preferred
+            soft = WEATHER_WEIGHT * exposure[moved].sum() + CHANGE_WEIGHT * moved.sum()
+        else:
+            soft = WEATHER_WEIGHT * exposure.sum()
+        return hard, HARD_VIOLATION_WEIGHT * hard + soft, team_hard
+
+    def chain_swap(week, s, y):
+        # Swap the chain of series linked to s by shared teams between its weekend and y;
+        # like a whole-weekend swap it never creates a clash, but it moves few series
+        x = week[s]
+        options = np.flatnonzero((week == x) | (week == y))
+        chain = np.zeros(n, dtype=bool)
+        chain[[a[s], b[s]]] = True
+        linked = chain[a[options]] | chain[b[options]]
+        while True:
+            chain[a[options[linked]]] = chain[b[options[linked]]] = True
+            grown = chain[a[options]] | chain[b[options]]
+            if (grown == linked).all():
+                break
+            linked = grown
+        new_week = week.copy()
+        new_week[options[linked]] = np.where(week[options[linked]] == x, y, x)
+        return new_week
+
+    def repair(week, flip):
+        # Beam search over chain swaps that start from a series of a team breaking a
+        # rule or from a series moved off its weekend; from a nearly feasible start
+        # this finds the few moves a repair needs. Returns the cheapest feasible
+        # (cost, weeks) found, if any
+        hard, cost, team_hard = evaluate(week, flip)
+        beam = [(cost, week, team_hard)]
+        found = (cost, week) if hard == 0 else None
+        seen = {week.tobytes()}
+        for _ in range(REPAIR_DEPTH):
+            scored = []
+            for _, parent, team_hard in beam:
+                troubled = team_hard > 0
+                for s in np.flatnonzero(troubled[a] | troubled[b] | (parent != preferred)):
+                    for y in range(weekends):
+                        if y == parent[s]:
+                            continue
+                        child = chain_swap(parent, s, y)
+                        key = child.tobytes()
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        hard, cost, child_hard = evaluate(child, flip)
+                        scored.append((cost, child, child_hard))
+                        if hard == 0 and (found is None or cost < found[0]):
+                            found = (cost, child)
+            beam = sorted(scored, key=lambda c: c[0])[:REPAIR_BEAM]
+        return found
+
+    if preferred is not None:
+        repaired = repair(week, flip)
+        if repaired is not None:
+            return [int(w) for w in repaired[1]], [not f for f in flip]
+    hard, cost, _ = evaluate(week, flip)
+    best = (cost, hard, week, flip)
+    cooling = (FINAL_TEMPERATURE / INITIAL_TEMPERATURE) ** (1.0 / max(iterations, 1))
+    temperature = INITIAL_TEMPERATURE
+
+    improved = 0
+    for step in range(iterations):
+        if best[1] == 0 and step - improved > STALL_ITERATIONS:
+            break
+        new_week, new_flip = week, flip
+        move = rng.random() * (1.0 if free_venues else 0.7)
+        s = rng.integers(len(pairs))
+        if move < 0.25:
+            new_week = week.copy()
+            new_week[s] = rng.integers(weekends)
+        elif move < 0.45:
+            other = rng.integers(len(pairs))
+            new_week = week.copy()
+            new_week[s], new_week[other] = week[other], week[s]
+        elif move < 0.7 and preferred is not None:
+            # Often back to the weekend s was moved off
+            y = preferred[s] if preferred[s] >= 0 and rng.random() < 0.5 else rng.integers(weekends)
+            if y == week[s]:
+                continue
+            new_week = chain_swap(week, s, y)
+        elif move < 0.7:
+            # Swap two whole weekends, which never creates a clash
+            if weekends > 1:
+                x, y = rng.choice(weekends, 2, replace=False)
+                new_week = np.where(week == x, y, np.where(week == y, x, week))
+        else:
+            new_flip = flip.copy()
+            new_flip[s] = ~flip[s]
+
+        new_hard, new_cost, _ = evaluate(new_week, new_flip)
+        delta = new_cost - cost
+        if delta <= 0 or rng.random() < np.exp(-delta / temperature):
+            week, flip, hard, cost = new_week, new_flip, new_hard, new_cost
+            if (hard, cost) < (best[1], best[0]):
+                best, improved = (cost, hard, week, flip), step
+        temperature *= cooling
+
+    _, hard, week, flip = best
+    if hard > 0:
+        return None
+    return [int(w) for w in week], [not f for f in flip]
+
+def _schedule(sport: str, season: int, teams: List[str], pairs: List[List[str]], weeks: List[int],
+              hosts: List[bool], weekends: List[List[str]], risk: np.ndarray) -> Dict[str, Any]:
+    """Dated series and metrics for a weekend assignment"""
+    index = {team: i for i, team in enumerate(teams)}
+    series = []
+    for (x, y), week, x_hosts in zip(pairs, weeks, hosts):
+        home, away = (x, y) if x_hosts else (y, x)
+        series.append({"weekend": week + 1, "dates": weekends[week], "home_team": home, "away_team": away})
+    series.sort(key=lambda s: (s["weekend"], s["home_team"]))
+
+    played = np.zeros((len(teams), len(weekends)), dtype=bool)
+    road = np.zeros((len(teams), len(weekends)), dtype=bool)
+    exposure = 0.0
+    for s in series:
+        w = s["weekend"] - 1
+        played[index[s["home_team"]], w] = played[index[s["away_team"]], w] = True
+        road[index[s["away_team"]], w] = True
+        exposure += risk[index[s["home_team"]], w]
+    sequence = np.array([row[mask].tolist() + [False] * (len(row) - mask.sum()) for row, mask in zip(road, played)])
+
+    return {
+        "sport": sport,
+        "season": season,
+        "weekends": [{"weekend": w + 1, "dates": dates} for w, dates in enumerate(weekends)],
+        "series": series,
+        "metrics": {
+            "home_series": {team: sum(1 for s in series if s["home_team"] == team) for team in teams},
+            "max_consecutive_away": int(scheduling_core.max_road_streak(sequence).max()),
+            "early_season_risk": round(float(exposure), 3)
+        }
+    }
+
+def _season_inputs(sport: str, season: int, climate: Optional[climatology.Climatology]):
+    params = SPORT_TRADITIONAL_PARAMETERS[sport]["parameters"]
+    teams = SPORT_TEAMS[sport]
+    weekends = conference_weekends(season, params["conference_series"] + OPEN_WEEKENDS)
+    return teams, params["conference_series"], weekends, early_season_risk(teams, weekends, climate)
+
+def round_robin_series(teams: List[str], series_per_team: int, weekends: int,
+                       rng: np.random.Generator) -> Optional[Tuple[List[List[str]], List[int]]]:
+    """
+    Clash-free starting schedule drawn from a round robin
+
+    Rounds of a circle-method round robin (with a bye for an odd number of
+    teams) are chosen at random and placed on weekends. With an odd number of
+    teams, the teams whose bye round was left out would play one series too
+    many; the series between them is dropped.
+
+    Returns:
+        Tuple of (series pairs, weekend per series), or None when the season
+        does not fit a round-robin layout
+    """
+    order = [teams[i] for i in rng.permutation(len(teams))]
+    odd = len(order) % 2 == 1
+    if odd:
+        order.append(None)
+    n = len(order)
+    rounds = []
+    rotation = order[1:]
+    for _ in range(n - 1):
+        lineup = [order[0]] + rotation
+        rounds.append([(lineup[k], lineup[n - 1 - k]) for k in range(n // 2)])
+        rotation = rotation[-1:] + rotation[:-1]
+
+    needed = series_per_team + 1 if odd else series_per_team
+    if needed > min(len(rounds), weekends):
+        return None
+    chosen = [rounds[r] for r in rng.choice(len(rounds), needed, replace=False)]
+    series = [list(pair) for games in chosen for pair in games if None not in pair]
+    weeks = [w for w, games in zip(rng.choice(weekends, needed, replace=False), chosen)
+             for pair in games if None not in pair]
+
+    counts = {}
+    for pair in series:
+        for team in pair:
+            counts[team] = counts.get(team, 0) + 1
+    extra = {team for team, count in counts.items() if count > series_per_team}
+    if extra:
+        drop = [k for k, pair in enumerate(series) if set(pair) <= extra]
+        if len(extra) != 2 or len(drop) != 1:
+            return None
+        del series[drop[0]], weeks[drop[0]]
+    return series, weeks
+
+def build_candidate(sport: str, season: int, teams: List[str], series_per_team: int,
+                    weekends: List[List[str]], risk: np.ndarray, iterations: int, seed: int) -> Optional[Dict[str, Any]]:
+    """
+    One schedule candidate: opponents and a clash-free start from a random
+    round robin, then weekends and venues by annealing
+
+    Returns:
+        Schedule with its "seed", or None if no feasible schedule was found
+    """
+    rng = np.random.default_rng(seed)
+    start = round_robin_series(teams, series_per_team, len(weekends), rng)
+    if start is not None:
+        pairs, initial = start
+    else:
+        n = len(teams)
+        graph = scheduling_core.random_graph(np.full(n, series_per_team), np.eye(n, dtype=bool), rng)
+        if graph is None:
+            return None
+        pairs, initial = [[teams[i], teams[j]] for i, j in np.argwhere(np.triu(graph))], None
+
+    result = assign_weekends(teams, pairs, len(weekends), risk, MAX_CONSECUTIVE_AWAY_SERIES, seed, iterations,
+                             initial=initial)
+    if result is None:
+        return None
+    schedule = _schedule(sport, season, teams, pairs, result[0], result[1], weekends, risk)
+    schedule["seed"] = seed
+    return schedule
+
+def default_score(candidate: Dict[str, Any]) -> float:
+    """Early-season weather risk taken on by home series (lower is better)"""
+    return candidate["metrics"]["early_season_risk"]
+
+def generate_series_schedules(sport: str = "baseball", season: Optional[int] = None,
+                              candidates: int = DEFAULT_CANDIDATES, keep: int = DEFAULT_KEEP,
+                              workers: Optional[int] = None, seed: Optional[int] = None,
+                              score: Optional[Callable[[Dict[str, Any]], float]] = None,
+                              climate: Optional[climatology.Climatology] = None,
+                              iterations: int = SEARCH_ITERATIONS) -> Dict[str, Any]:
+    """
+    Generate baseball or softball conference series schedules
+
+    Args:
+        sport: "baseball" or "softball"
+        season: Season year (defaults to the next spring)
+        candidates: Independent candidates to build
+        keep: Number of best candidates to return
+        workers: Worker processes
+        seed: Base random seed
+        score: Function schedule -> score, lower is better (defaults to default_score)
+        climate: Climatology tables (defaults to the shared ones)
+        iterations: Annealing moves per candidate
+
+    Returns:
+        Dictionary with the best "schedules" and "search" statistics
+    """
+    if sport not in SERIES_SPORTS:
+        raise ValueError(f"Unsupported sport for the series scheduler: {sport}")
+    if season is None:
+        today = datetime.date.today()
+        season = today.year if today.month < 2 else today.year + 1
+
+    teams, series_per_team, weekends, risk = _season_inputs(sport, season, climate)
+    base_seed = seed if seed is not None else int(np.random.SeedSequence().entropy % (2 ** 31))
+    search = functools.partial(build_candidate, sport, season, teams, series_per_team, weekends, risk, iterations)
+    best, stats = scheduling_core.run_restarts(search, [base_seed + n for n in range(candidates)],
+                                               score or default_score, keep, workers)
+    return {"sport": sport, "season": season, "schedules": best, "search": stats}
+
+def reschedule_after_rainout(schedule: Dict[str, Any], weekend: int, rained_out: Optional[List[List[str]]] = None,
+                             extra_weekends: int = 1, seed: int = 0,
+                             climate: Optional[climatology.Climatology] = None,
+                             iterations: int = SEARCH_ITERATIONS) -> Optional[Dict[str, Any]]:
+    """
+    Regenerate the rest of a schedule after a weekend is rained out
+
+    Weekends before `weekend` stand as played. The rained-out series and all
+    later series keep their venues and are reassigned to the weekends after
+    it (plus `extra_weekends` added at the end), keeping the away-series limit
+    across the played weekends and moving as few series as possible.
+
+    Args:
+        schedule: Schedule from generate_series_schedules
+        weekend: Weekend number (1-based) that was rained out
+        rained_out: [home, away] series lost that weekend (defaults to all of them)
+        extra_weekends: Make-up weekends appended to the season
+        seed: Random seed
+        climate: Climatology tables (defaults to the shared ones)
+        iterations: Annealing moves
+
+    Returns:
+        Updated schedule with "rescheduled" listing the moved series, or None if
+        the remaining series cannot be fitted
+    """
+    teams = list(schedule["metrics"]["home_series"])
+    index = {team: i for i, team in enumerate(teams)}
+    lost = {tuple(pair) for pair in rained_out} if rained_out is not None else None
+
+    weekends = [w["dates"] for w in schedule["weekends"]]
+    if extra_weekends:
+        last = datetime.date.fromisoformat(weekends[-1][0])
+        weekends += conference_weekends(last.year, extra_weekends, (last + datetime.timedelta(weeks=1)).strftime("%m-%d"))
+    risk = early_season_risk(teams, weekends, climate)
+
+    played = np.zeros((len(teams), weekend), dtype=bool)
+    away = np.zeros((len(teams), weekend), dtype=bool)
+    kept, pending = [], []
+    for s in schedule["series"]:
+        w = s["weekend"] - 1
+        is_lost = w == weekend - 1 and (lost is None or (s["home_team"], s["away_team"]) in lost)
+        if w < weekend - 1 or (w == weekend - 1 and not is_lost):
+            kept.append(s)
+            played[index[s["home_team"]], w] = played[index[s["away_team"]], w] = True
+            away[index[s["away_team"]], w] = True
+        else:
+            pending.append(s)
+
+    pairs = [[s["home_team"], s["away_team"]] for s in pending]
+    preferred = [max(s["weekend"] - 1 - weekend, -1) for s in pending]
+    # Try the lost series parked on the last weekend first (fewest moves), then
+    # every remaining series pushed back a weekend, which keeps each team's
+    # order and so is feasible whenever a make-up weekend was added
+    open_weekends = len(weekends) - weekend
+    parked = [w if w >= 0 else open_weekends - 1 for w in preferred]
+    shifted = [min(s["weekend"] - weekend, open_weekends - 1) for s in pending]
+    for attempt, initial in enumerate([parked] * (RESCHEDULE_ATTEMPTS - 1) + [shifted]):
+        result = assign_weekends(teams, pairs, open_weekends, risk, MAX_CONSECUTIVE_AWAY_SERIES, seed + attempt,
+                                 iterations, hosts=[True] * len(pairs), history=(played, away),
+                                 preferred=preferred, initial=initial)
+        if result is not None:
+            break
+    else:
+        return None
+
+    weeks = [s["weekend"] - 1 for s in kept] + [weekend + w for w in result[0]]
+    updated = _schedule(schedule["sport"], schedule["season"], teams,
+                        [[s["home_team"], s["away_team"]] for s in kept] + pairs,
+                        weeks, [True] * len(weeks), weekends, risk)
+    updated["rescheduled"] = [
+        {"home_team": s["home_team"], "away_team": s["away_team"], "from_weekend": s["weekend"], "to_weekend": weekend + w + 1}
+        for s, w in zip(pending, result[0]) if s["weekend"] != weekend + w + 1
+    ]
+    return updated
+
+def main():
+    parser = argparse.ArgumentParser(description='FlexTime Series Scheduler')
+    parser.add_argument('-s', '--sport', type=str, default="baseball", choices=SERIES_SPORTS, help='Sport code')
+    parser.add_argument('--season', type=int, help='Season year')
+    parser.add_argument('-c', '--candidates', type=int, default=DEFAULT_CANDIDATES, help='Candidates to build')
+    parser.add_argument('-w', '--workers', type=int, help='Worker processes')
+    parser.add_argument('--seed', type=int, help='Random seed')
+
+    args = parser.parse_args()
+
+    result = generate_series_schedules(args.sport, args.season, args.candidates, workers=args.workers, seed=args.seed)
+    if not result["schedules"]:
+        print("No feasible schedule found; try more candidates", file=sys.stderr)
+    print(json.dumps(result, indent=2))
+
+if __name__ == "__main__":
+    main()
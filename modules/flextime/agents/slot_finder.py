@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Slot Finder
+
+Searches for the nearest feasible alternative slot for a conflicting event.
+Each venue keeps a sorted timeline of busy intervals and the free gaps between
+them, so a candidate slot is checked with a few bisections; candidates come
+from the preferred start times in the sport's manual and are ranked by
+displacement cost.
+
+Part of the XII-OS FlexTime module.
+"""
+
+import sys
+import bisect
+import datetime
+import functools
+import heapq
+import itertools
+from typing import Dict, List, Any, Optional, Tuple, Callable, Mapping
+
+from conflict_engine import (
+    MINUTES_PER_DAY, TENNIS_PAIR, VenueInterval, TransitionTable,
+    build_interval, parse_clock, format_clock
+)
+from sports import agent_registry
+
+# Displacement cost weights
+DAY_SHIFT_COST = 10.0         # per day moved
+HOUR_SHIFT_COST = 1.0         # per hour the start time moves
+PREFERENCE_COST = 2.0         # per priority step below the sport's first choice
+TIGHT_TRANSITION_COST = 5.0   # slot leaves less than transition + 1 hour buffer
+SAME_DAY_TENNIS_COST = 5.0    # men's and women's tennis on the same day
+
+DEFAULT_WINDOW_DAYS = 14
+
+@functools.lru_cache(maxsize=None)
+def manual_start_times(sport: str) -> Tuple[Mapping[str, Any], ...]:
+    """
+    Preferred start times (scheduling.preferredStartTimes) from a sport's manual
+
+    Returns:
+        The manual's start times with their priorities, or () for sports without
+        a sports agent or whose manual fails to load
+    """
+    try:
+        return tuple(agent_registry.get_agent(sport).manual['scheduling']['preferredStartTimes'])
+    except KeyError:
+        return ()
+    except Exception as e:
+        print(f"Error loading {sport} start times: {str(e)}", file=sys.stderr)
+        return ()
+
+class VenueTimeline:
+    """Sorted busy intervals and free gaps for one venue"""
+
+    def __init__(self, school: str, venue: str, transitions: TransitionTable):
+        self.school = school
+        self.venue = venue
+        self.transitions = transitions
+        # Entries are (minute, event id, insertion number, interval); the insertion
+        # number breaks ties so intervals themselves are never compared
+        self._by_start: List[Tuple[int, str, int, VenueInterval]] = []
+        self._by_end: List[Tuple[int, str, int, VenueInterval]] = []
+        self._entry: Dict[VenueInterval, int] = {}
+        self._counter = itertools.count()
+        self._day_sports: Dict[str, Dict[str, int]] = {}
+        self._sports: Dict[str, int] = {}
+        self._gap_starts: List[int] = []
+        self._gap_ends: List[int] = []
+        self._dirty = True
+
+    def add(self, interval: VenueInterval):
+        n = self._entry[interval] = next(self._counter)
+        bisect.insort(self._by_start, (interval.busy_start, interval.event_id, n, interval))
+        bisect.insort(self._by_end, (interval.busy_end, interval.event_id, n, interval))
+        day = self._day_sports.setdefault(interval.date, {})
+        day[interval.sport] = day.get(interval.sport, 0) + 1
+        self._sports[interval.sport] = self._sports.get(interval.sport, 0) + 1
+        self._dirty = True
+
+    def remove(self, interval: VenueInterval):
+        n = self._entry.pop(interval)
+        self._by_start.remove((interval.busy_start, interval.event_id, n, interval))
+        self._by_end.remove((interval.busy_end, interval.event_id, n, interval))
+        self._day_sports[interval.date][interval.sport] -= 1
+        self._sports[interval.sport] -= 1
+        self._dirty = True
+
+    def _rebuild_gaps(self):
+        """Merge busy intervals into blocks; gaps lie between consecutive blocks"""
+        gap_starts = [-float("inf")]
+        gap_ends = []
+        block_end = None
+
+        for busy_start, _, _, interval in self._by_start:
+            if block_end is None or busy_start > block_end:
+                gap_ends.append(busy_start)
+                gap_starts.append(interval.busy_end)
+                block_end = interval.busy_end
+            else:
+                block_end = max(block_end, interval.busy_end)
+                gap_starts[-1] = block_end
+
+        gap_ends.append(float("inf"))
+        self._gap_starts, self._gap_ends = gap_starts, gap_ends
+        self._dirty = False
+
+    def check(self, candidate: VenueInterval) -> Optional[Tuple[float, List[str]]]:
+        """
+        Check whether a candidate interval fits at this venue
+
+        Returns:
+            None if the slot would create a hard conflict, otherwise a
+            (soft penalty, notes) tuple
+        """
+        if self._dirty:
+            self._rebuild_gaps()
+
+        # The candidate must sit entirely inside one free gap
+        i = bisect.bisect_right(self._gap_starts, candidate.busy_start) - 1
+        if i < 0 or self._gap_ends[i] < candidate.busy_end:
+            return None
+
+        sports = [s for s, n in self._sports.items() if n > 0] + [candidate.sport]
+        horizon = self.transitions.horizon_minutes(self.school, self.venue, sports)
+        penalty = 0.0
+        notes = []
+
+        # Events ending shortly before the candidate
+        lo = bisect.bisect_left(self._by_end, (candidate.busy_start - horizon,))
+        hi = bisect.bisect_right(self._by_end, (candidate.busy_start, "\uffff"))
+        for busy_end, _, _, other in self._by_end[lo:hi]:
+            hours = (candidate.busy_start - busy_end) / 60
+            required = self.transitions.hours(self.school, self.venue, other.sport, candidate.sport)
+            if hours < required:
+                return None
+            if hours < required + 1:
+                penalty += TIGHT_TRANSITION_COST
+                notes.append(f"Tight transition after {other.sport}")
+
+        # Events starting shortly after the candidate
+        lo = bisect.bisect_left(self._by_start, (candidate.busy_end,))
+        hi = bisect.bisect_right(self._by_start, (candidate.busy_end + horizon, "\uffff"))
+        for busy_start, _, _, other in self._by_start[lo:hi]:
+            hours = (busy_start - candidate.busy_end) / 60
+            required = self.transitions.hours(self.school, self.venue, candidate.sport, other.sport)
+            if hours < required:
+                return None
+            if hours < required + 1:
+                penalty += TIGHT_TRANSITION_COST
+                notes.append(f"Tight transition before {other.sport}")
+
+        if candidate.sport in TENNIS_PAIR:
+            other_tennis = (TENNIS_PAIR - {candidate.sport}).pop()
+            if self._day_sports.get(candidate.date, {}).get(other_tennis, 0):
+                penalty += SAME_DAY_TENNIS_COST
+                notes.append("Men's and women's tennis on the same day")
+
+        return penalty, notes
+
+class SlotFinder:
+    """Nearest-feasible-slot search over a full season"""
+
+    def __init__(self, schedules: Dict[str, List[Dict[str, Any]]],
+                 venue_resolver: Callable[[str, str], str],
+                 transition_lookup: Callable[..., float],
+                 preferred_start_times: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+                 constraints: Optional[Any] = None):
+        """
+        Args:
+            schedules: Dictionary mapping sport codes to lists of scheduled events;
+                events without an "id" are given one (as in ConflictSession)
+            venue_resolver: Function (school_code, sport) -> venue name or ""
+            transition_lookup: Function (from_sport, to_sport, school_code, venue_name) -> hours
+            preferred_start_times: Optional start times by sport to use instead of the sport manuals
+            constraints: Optional compiled campus constraints (scheduling_constraints.CompiledConstraints);
+                days the host cannot host or the visitor cannot play are skipped
+        """
+        self.transitions = TransitionTable(transition_lookup)
+        self.preferred_start_times = preferred_start_times
+        self.constraints = constraints
+
+        self.events: Dict[str, Dict[str, Any]] = {}
+        self._sports: Dict[str, str] = {}
+        self._placement: Dict[str, Tuple[VenueTimeline, VenueInterval]] = {}
+        self._timelines: Dict[Tuple[str, str], VenueTimeline] = {}
+        self._team_days: Dict[Tuple[str, str], Dict[int, int]] = {}
+        venue_cache = {}
+
+        for sport, events in schedules.items():
+            for n, event in enumerate(events):
+                event = dict(event)
+                event.setdefault("id", f"{sport}-{n + 1}")
+                self.events[event["id"]] = event
+                self._sports[event["id"]] = sport
+
+                home_school = event.get("home_team")
+                if not home_school:
+                    continue
+                if (home_school, sport) not in venue_cache:
+                    venue_cache[(home_school, sport)] = venue_resolver(home_school, sport)
+                venue = venue_cache[(home_school, sport)]
+                interval = build_interval(sport, event) if venue else None
+                if interval is None:
+                    continue
+
+                timeline = self._timelines.get((home_school, venue))
+                if timeline is None:
+                    timeline = self._timelines[(home_school, venue)] = VenueTimeline(home_school, venue, self.transitions)
+                self._place(event["id"], timeline, interval)
+
+    @staticmethod
+    def _teams(sport: str, event: Dict[str, Any]) -> List[Tuple[str, str]]:
+        teams = [event.get("home_team"), event.get("away_team") or event.get("opponent")]
+        return [(team, sport) for team in teams if team]
+
+    def _place(self, event_id: str, timeline: VenueTimeline, interval: VenueInterval):
+        timeline.add(interval)
+        self._placement[event_id] = (timeline, interval)
+        day = interval.start // MINUTES_PER_DAY
+        for team in self._teams(interval.sport, self.events[event_id]):
+            days = self._team_days.setdefault(team, {})
+            days[day] = days.get(day, 0) + 1
+
+    def _unplace(self, event_id: str) -> Tuple[VenueTimeline, VenueInterval]:
+        timeline, interval = self._placement.pop(event_id)
+        timeline.remove(interval)
+        day = interval.start // MINUTES_PER_DAY
+        for team in self._teams(interval.sport, self.events[event_id]):
+            self._team_days[team][day] -= 1
+        return timeline, interval
+
+    def _teams_free(self, sport: str, event: Dict[str, Any], day: int, rest_days: int) -> bool:
+        for team in self._teams(sport, event):
+            days = self._team_days.get(team, {})
+            if any(days.get(d, 0) for d in range(day - rest_days, day + rest_days + 1)):
+                return False
+        return True
+
+    def _calendar_allows(self, sport: str, event: Dict[str, Any], day: int) -> bool:
+        if self.constraints is None:
+            return True
+        home, away = event.get("home_team"), event.get("away_team") or event.get("opponent")
+        return (self.constraints.allowed_day(home, day, sport, home=True)
+                and (not away or self.constraints.allowed_day(away, day, sport, home=False)))
+
+    def find_slots(self, event_id: str, k: int = 5, window_days: int = DEFAULT_WINDOW_DAYS,
+                   rest_days: int = 0) -> List[Dict[str, Any]]:
+        """
+        Find the k cheapest feasible alternative slots for an event
+
+        A slot is feasible if the venue is free for the event (including its setup
+        and teardown windows and the required transition buffers), neither team
+        has another game in the sport within `rest_days` of it and, with campus
+        constraints, neither school's calendar rules the day out.
+
+        Args:
+            event_id: Event to move
+            k: Number of alternatives to return
+            window_days: Search this many days either side of the current date
+            rest_days: Minimum days between a team's games (0 = no same-day games)
+
+        Returns:
+            List of slot dictionaries ordered by displacement cost
+        """
+        if event_id not in self._placement:
+            return []
+
+        sport = self._sports[event_id]
+        event = self.events[event_id]
+        timeline, current = self._unplace(event_id)
+
+        try:
+            duration = current.end - current.start
+            setup = current.start - current.busy_start
+            teardown = current.busy_end - current.end
+            current_day = current.start // MINUTES_PER_DAY
+            current_clock = current.start % MINUTES_PER_DAY
+
+            if self.preferred_start_times is not None:
+                times = self.preferred_start_times.get(sport)
+            else:
+                times = manual_start_times(sport)
+            # Without preferred times, only the current start time is tried on other days
+            times = times or [{"time": current.start_time, "priority": 1}]
+            best_priority = min(t.get("priority", 1) for t in times)
+            options = []
+
+            for offset in range(-window_days, window_days + 1):
+                day = current_day + offset
+                if not self._teams_free(sport, event, day, rest_days) or not self._calendar_allows(sport, event, day):
+                    continue
+                date = datetime.date.fromordinal(day).isoformat()
+
+                for preferred in times:
+                    clock = parse_clock(preferred["time"])
+                    if clock is None or (offset == 0 and clock == current_clock):
+                        continue
+
+                    start = day * MINUTES_PER_DAY + clock
+                    candidate = VenueInterval(sport, date, start, start + duration, setup, teardown,
+                                              preferred["time"], format_clock(start + duration), event_id,
+                                              current.description)
+                    fit = timeline.check(candidate)
+                    if fit is None:
+                        continue
+
+                    penalty, notes = fit
+                    cost = (abs(offset) * DAY_SHIFT_COST
+                            + abs(clock - current_clock) / 60 * HOUR_SHIFT_COST
+                            + (preferred.get("priority", 1) - best_priority) * PREFERENCE_COST
+                            + penalty)
+                    options.append((cost, start, {
+                        "event_id": event_id,
+                        "sport": sport,
+                        "school": timeline.school,
+                        "venue": timeline.venue,
+                        "date": date,
+                        "start_time": candidate.start_time,
+                        "end_time": candidate.end_time,
+                        "day_shift": offset,
+                        "cost": round(cost, 2),
+                        "notes": notes
+                    }))
+
+            return [slot for _, _, slot in heapq.nsmallest(k, options, key=lambda x: (x[0], x[1]))]
+        finally:
+            self._place(event_id, timeline, current)
+
+    def apply(self, event_id: str, slot: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Move an event into a slot returned by find_slots and update the indexes
+
+        Returns:
+            The updated event
+        """
+        timeline, current = self._unplace(event_id)
+        event = self.events[event_id]
+        event.update({"date": slot["date"], "start_time": slot["start_time"], "end_time": slot["end_time"]})
+        event.pop("end_date", None)
+
+        setup = current.start - current.busy_start
+        teardown = current.busy_end - current.end
+        start = datetime.date.fromisoformat(slot["date"]).toordinal() * MINUTES_PER_DAY + parse_clock(slot["start_time"])
+        moved = VenueInterval(current.sport, slot["date"], start, start + (current.end - current.start), setup, teardown,
+                              slot["start_time"], slot["end_time"], event_id, current.description)
+        self._place(event_id, timeline, moved)
+        return event
+
+    def resolve_conflicts(self, conflicts: List[Dict[str, Any]], choose_event: Callable[[Dict[str, Any]], str],
+                          k: int = 3, window_days: int = DEFAULT_WINDOW_DAYS, rest_days: int = 0) -> List[Dict[str, Any]]:
+        """
+        Resolve every hard conflict in one call
+
+        Conflicts are handled in order; the event chosen for each is moved into
+        its cheapest slot before the next conflict is searched, so later moves
+        account for earlier ones. Conflicts whose chosen event was already moved
+        are skipped.
+
+        Args:
+            conflicts: Conflicts from detect_conflicts (with event ids)
+            choose_event: Function picking which event of a conflict to move
+
+        Returns:
+            List of resolutions with the conflict, the moved event id,
+            the chosen slot (or None) and the ranked alternatives
+        """
+        resolutions = []
+        moved = set()
+
+        for conflict in conflicts:
+            if conflict["type"] != "hard_conflict":
+                continue
+            if conflict.get("event1_id") in moved or conflict.get("event2_id") in moved:
+                continue
+
+            event_id = choose_event(conflict)
+            alternatives = self.find_slots(event_id, k=k, window_days=window_days, rest_days=rest_days)
+            chosen = alternatives[0] if alternatives else None
+            if chosen:
+                self.apply(event_id, chosen)
+                moved.add(event_id)
+
+            resolutions.append({
+                "conflict": conflict,
+                "event_id": event_id,
+                "chosen": chosen,
+                "alternatives": alternatives
+            })
+
+        return resolutions
@@ -0,0 +1,179 @@
+"""
+Sport Agent Registry
+
+Maps sport codes to sports agent classes and hands out agents that share
+one frozen copy of each sport manual, so callers can ask for an agent per
+request without re-loading the manual or rebuilding its lookups.
+
+Part of the XII-OS FlexTime module.
+"""
+
+from typing import Dict, List, Any, Optional, Tuple, Type
+import os
+import sys
+import time
+import json
+import logging
+import argparse
+import importlib
+import threading
+import statistics
+
+from .base_sports_agent import BaseSportsAgent, ManualLookups, logger
+
+# Sport codes and the module and class of the agent that handles them
+AGENT_CLASSES: Dict[str, Tuple[str, str]] = {
+    'football': ('football_agent', 'FootballAgent'),
+    'basketball': ('basketball_agent', 'BasketballAgent'),
+    'mbasketball': ('basketball_agent', 'BasketballAgent'),
+    'wbasketball': ('basketball_agent', 'BasketballAgent'),
+    'volleyball': ('volleyball_agent', 'VolleyballAgent')
+}
+
+_classes: Dict[str, Type[BaseSportsAgent]] = {}
+_agents: Dict[Type[BaseSportsAgent], BaseSportsAgent] = {}
+_registry_lock = threading.Lock()
+
+def register_agent(sport: str, agent_class: Type[BaseSportsAgent]):
+    """Register (or replace) the agent class for a sport code"""
+    with _registry_lock:
+        _classes[sport] = agent_class
+        _agents.pop(agent_class, None)
+
+def unregister_agent(sport: str):
+    """Forget the agent class and shared agent for a sport code; built-in sports are imported again on next use"""
+    with _registry_lock:
+        agent_class = _classes.pop(sport, None)
+        _agents.pop(agent_class, None)
+
+def available_sports() -> List[str]:
+    """Sport codes with an agent"""
+    return sorted(set(AGENT_CLASSES) | set(_classes))
+
+def get_agent_class(sport: str) -> Type[BaseSportsAgent]:
+    """
+    Agent class for a sport code, importing its module on first use
+
+    Raises:
+        KeyError: If no agent handles the sport
+    """
+    agent_class = _classes.get(sport)
+    if agent_class is None:
+        module_name, class_name = AGENT_CLASSES[sport]
+        module = importlib.import_module(f'{__package__}.{module_name}')
+        agent_class = _classes.setdefault(sport, getattr(module, class_name))
+    return agent_class
+
+def create_agent(sport: str) -> BaseSportsAgent:
+    """New agent for a sport; its manual and lookups are shared with every other agent for that sport"""
+    return get_agent_class(sport)()
+
+def get_agent(sport: str) -> BaseSportsAgent:
+    """
+    Shared agent for a sport, created on first use
+
+    Agents hold nothing but their read-only manual, so one instance can serve all threads.
+    """
+    agent_class = get_agent_class(sport)
+    agent = _agents.get(agent_class)
+    if agent is None:
+        with _registry_lock:
+            agent = _agents.get(agent_class)
+            if agent is None:
+                agent = _agents[agent_class] = agent_class()
+    return agent
+
+def _sample_validations(agent: BaseSportsAgent) -> int:
+    """Run a representative set of validators once; returns how many ran"""
+    agent.validate_game_schedule({'start_time': '2025-09-06T19:00:00', 'duration': 200,
+                                  'last_game_end': '2025-08-30T22:30:00'})
+    crew = [{'role': role} for role, count in agent.lookups.required_officials.items() for _ in range(count)]
+    agent.validate_officials_crew({'officials': crew})
+    return 2
+
+def _import_agent(agent_class: Type[BaseSportsAgent], sport: str) -> BaseSportsAgent:
+    """
+    Agent built the way every constructor worked before the shared manuals
+
+    Imports the manual module itself and keeps the raw manual, with lookups of its own.
+    """
+    logger.info(f"Initializing {sport} agent")
+    agent = agent_class.__new__(agent_class)
+    agent.sport = sport
+    module = __import__(f'src.sports.{sport}.manual', fromlist=[f'{sport.capitalize()}Manual'])
+    agent.manual = getattr(module, f'{sport.capitalize()}Manual')
+    agent.lookups = ManualLookups(agent.manual)
+    logger.info(f"Successfully loaded manual for {sport}")
+    return agent
+
+def _mean_ms(timings: List[float]) -> float:
+    return round(statistics.mean(timings) * 1000, 4)
+
+def benchmark(sports: Optional[List[str]] = None, repeats: int = 200) -> Dict[str, Dict[str, Any]]:
+    """
+    Compare building an agent per request by importing its manual against the registry
+
+    A request is one agent construction plus the sample validations. Sports whose
+    manual fails to load are reported and left out.
+
+    Returns:
+        Dictionary keyed by sport with construction, request and validation timings
+    """
+    results = {}
+    # Agents log every construction and validation, which costs both paths the same and swamps the difference
+    previous = logging.root.manager.disable
+    logging.disable(logging.INFO)
+    try:
+        for sport in sports or ['football', 'basketball', 'volleyball']:
+            try:
+                agent = get_agent(sport)
+            except ImportError as e:
+                print(f"Error loading {sport} agent: {str(e)}", file=sys.stderr)
+                continue
+            agent_class = type(agent)
+
+            timings: Dict[str, List[float]] = {'import': [], 'registry': [], 'import_request': [], 'registry_request': []}
+            for _ in range(repeats):
+                start = time.perf_counter()
+                imported = _import_agent(agent_class, agent.sport)
+                timings['import'].append(time.perf_counter() - start)
+                _sample_validations(imported)
+                timings['import_request'].append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                created = create_agent(sport)
+                timings['registry'].append(time.perf_counter() - start)
+                _sample_validations(created)
+                timings['registry_request'].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            validations = sum(_sample_validations(agent) for _ in range(repeats))
+            elapsed = time.perf_counter() - start
+
+            results[sport] = {
+                'import_construction_ms': _mean_ms(timings['import']),
+                'registry_construction_ms': _mean_ms(timings['registry']),
+                'import_request_ms': _mean_ms(timings['import_request']),
+                'registry_request_ms': _mean_ms(timings['registry_request']),
+                'validations_per_second': round(validations / elapsed)
+            }
+    finally:
+        logging.disable(previous)
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='FlexTime Sport Agent Registry')
+    parser.add_argument('-s', '--sports', type=str, nargs='*', help='Sports to benchmark (default: one per agent)')
+    parser.add_argument('-n', '--repeats', type=int, default=200, help='Requests and validation rounds per sport')
+    parser.add_argument('-m', '--manuals', type=str,
+                        help='Directory holding src/sports/<sport>/manual.py, e.g. tests/fixtures/manuals')
+
+    args = parser.parse_args()
+
+    if args.manuals:
+        sys.path.insert(0, os.path.abspath(args.manuals))
+
+    print(json.dumps(benchmark(args.sports, args.repeats), indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,15 @@
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Mapping
 from datetime import datetime
 import sys
 import os
 from pathlib import Path
 import logging
+import threading
 from enum import Enum
+from functools import cached_property
+from types import MappingProxyType
+
+import numpy as np
 
 # Add XII-OS to Python path for imports
 xii_os_path = Path(__file__).parent.parent.parent / 'XII-OS'
@@ -14,6 +19,8 @@ sys.path.append(str(xii_os_path))
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+WEEKDAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
 class ValidationSeverity(Enum):
     """Enumeration for validation issue severity levels"""
     LOW = "low"
@@ -34,9 +41,103 @@ class ValidationIssue:
             'type': self.type,
             'severity': self.severity.value,
             'message': self.message,
-            'details': self.details
+            'details': thaw(self.details)
         }
 
+def freeze(value: Any) -> Any:
+    """Read-only copy of manual data: dicts become mapping proxies and lists tuples"""
+    if isinstance(value, MappingProxyType):
+        return value
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+def thaw(value: Any) -> Any:
+    """Plain dict and list copy of frozen manual data, e.g. for JSON output"""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+# Frozen manuals by sport, shared by every agent in the process
+_manuals: Dict[str, Mapping[str, Any]] = {}
+_manuals_lock = threading.Lock()
+
+def load_manual(sport: str) -> Mapping[str, Any]:
+    """Load a sport manual from XII-OS once per process as a read-only structure"""
+    manual = _manuals.get(sport)
+    if manual is not None:
+        return manual
+
+    with _manuals_lock:
+        if sport not in _manuals:
+            try:
+                logger.debug(f"Attempting to load manual for {sport}")
+                module = __import__(f'src.sports.{sport}.manual', fromlist=[f'{sport.capitalize()}Manual'])
+                _manuals[sport] = freeze(getattr(module, f'{sport.capitalize()}Manual'))
+                logger.debug(f"Successfully loaded manual version {_manuals[sport].get('version', 'unknown')}")
+            except ImportError as e:
+                logger.error(f"Failed to load manual for {sport}: {e}")
+                raise ImportError(f"Could not load manual for sport: {sport}. Error: {e}")
+        return _manuals[sport]
+
+def clear_manual_cache():
+    """Forget loaded manuals so the next agent re-imports them"""
+    with _manuals_lock:
+        _manuals.clear()
+        _lookups.clear()
+
+class ManualLookups:
+    """Sets and tables the validators derive from a manual, each built on first use"""
+
+    def __init__(self, manual: Mapping[str, Any]):
+        self.manual = manual
+
+    @cached_property
+    def surface_types(self) -> frozenset:
+        return frozenset(self.manual['venue']['field']['surfaceTypes'])
+
+    @cached_property
+    def required_officials(self) -> Mapping[str, int]:
+        return MappingProxyType({role: req['count'] for role, req in self.manual['officials']['required'].items()})
+
+    @cached_property
+    def schedule(self) -> Mapping[str, Any]:
+        scheduling = self.manual['scheduling']
+        preferred_times = tuple(st['time'] for st in scheduling['preferredStartTimes'])
+        traditional_days = tuple(gd['day'] for gd in scheduling['traditionalGameDays'])
+        preferred_minutes = np.array([int(t[:2]) * 60 + int(t[3:5]) for t in preferred_times], dtype=np.int32)
+        day_allowed = np.array([day in traditional_days for day in WEEKDAY_NAMES])
+        preferred_minutes.flags.writeable = False
+        day_allowed.flags.writeable = False
+        return MappingProxyType({
+            'preferred_times': preferred_times,
+            'preferred_minutes': preferred_minutes,
+            'traditional_days': traditional_days,
+            'day_allowed': day_allowed,
+            'max_duration': scheduling['gameDuration']['total'],
+            'duration_unit': scheduling['gameDuration']['unit'],
+            'min_rest': scheduling['restPeriod']['minimum'],
+            'rest_unit': scheduling['restPeriod']['unit']
+        })
+
+# Lookups by sport, for the manual they were built from; a sport's entry is replaced
+# (never added to) when an agent brings a different manual, so the cache stays one per sport
+_lookups: Dict[str, Tuple[Mapping[str, Any], ManualLookups]] = {}
+
+def manual_lookups(sport: str, manual: Mapping[str, Any]) -> ManualLookups:
+    """Shared lookups for a sport's frozen manual"""
+    entry = _lookups.get(sport)
+    if entry is None or entry[0] is not manual:
+        with _manuals_lock:
+            entry = _lookups.get(sport)
+            if entry is None or entry[0] is not manual:
+                entry = _lookups[sport] = (manual, ManualLookups(manual))
+    return entry[1]
+
 class BaseSportsAgent:
     """Base class for all sports agents that interface between XII-OS and FlexTime"""
     
@@ -44,20 +145,13 @@ class BaseSportsAgent:
         """Initialize the sports agent with logging and manual loading"""
         logger.info(f"Initializing {sport} agent")
         self.sport = sport
-        self.manual = self._load_manual()
+        self.manual = freeze(self._load_manual())
+        self.lookups = manual_lookups(sport, self.manual)
         logger.info(f"Successfully loaded manual for {sport}")
         
-    def _load_manual(self) -> Dict[str, Any]:
-        """Load the sport manual from XII-OS with error handling"""
-        try:
-            logger.debug(f"Attempting to load manual for {self.sport}")
-            module = __import__(f'src.sports.{self.sport}.manual', fromlist=[f'{self.sport.capitalize()}Manual'])
-            manual = getattr(module, f'{self.sport.capitalize()}Manual')
-            logger.debug(f"Successfully loaded manual version {manual.get('version', 'unknown')}")
-            return manual
-        except ImportError as e:
-            logger.error(f"Failed to load manual for {self.sport}: {e}")
-            raise ImportError(f"Could not load manual for sport: {self.sport}. Error: {e}")
+    def _load_manual(self) -> Mapping[str, Any]:
+        """Load the sport manual from XII-OS, shared with other agents for the same sport"""
+        return load_manual(self.sport)
 
     def validate_venue(self, venue_data: Dict[str, Any]) -> List[ValidationIssue]:
         """Validate venue against manual requirements with detailed reporting"""
@@ -98,7 +192,7 @@ class BaseSportsAgent:
     def _validate_surface_type(self, venue_data: Dict[str, Any], venue_reqs: Dict[str, Any], issues: List[ValidationIssue]):
         """Helper method for surface type validation"""
         if 'surface_type' in venue_data:
-            if venue_data['surface_type'] not in venue_reqs['field']['surfaceTypes']:
+            if venue_data['surface_type'] not in self.lookups.surface_types:
                 issues.append(ValidationIssue(
                     type='surface_type',
                     severity=ValidationSeverity.MEDIUM,
@@ -141,6 +235,7 @@ class BaseSportsAgent:
         self._validate_temperature(weather_data, weather_reqs, issues)
         self._validate_wind(weather_data, weather_reqs, issues)
         self._validate_precipitation(weather_data, weather_reqs, issues)
+        self._validate_climate(weather_data, weather_reqs, issues)
 
         logger.info(f"Completed weather validation. Found {len(issues)} issues.")
         return issues
@@ -164,20 +259,87 @@ class BaseSportsAgent:
                     }
                 ))
 
+    def _validate_wind(self, weather_data: Dict[str, Any], weather_reqs: Dict[str, Any], issues: List[ValidationIssue]):
+        """Helper method for wind validation"""
+        if 'wind_speed' in weather_data and 'wind' in weather_reqs:
+            max_speed = weather_reqs['wind']['maximumSpeed']
+            if weather_data['wind_speed'] > max_speed:
+                issues.append(ValidationIssue(
+                    type='wind',
+                    severity=ValidationSeverity.HIGH,
+                    message="Wind speed above allowed maximum",
+                    details={
+                        'actual': weather_data['wind_speed'],
+                        'maximum': max_speed,
+                        'unit': weather_reqs['wind']['unit']
+                    }
+                ))
+
+    def _validate_precipitation(self, weather_data: Dict[str, Any], weather_reqs: Dict[str, Any], issues: List[ValidationIssue]):
+        """Helper method for precipitation validation"""
+        if 'precipitation_rate' in weather_data and 'precipitation' in weather_reqs:
+            max_rate = weather_reqs['precipitation']['maximumRate']
+            if weather_data['precipitation_rate'] > max_rate:
+                issues.append(ValidationIssue(
+                    type='precipitation',
+                    severity=ValidationSeverity.HIGH,
+                    message="Precipitation rate above allowed maximum",
+                    details={
+                        'actual': weather_data['precipitation_rate'],
+                        'maximum': max_rate,
+                        'unit': weather_reqs['precipitation']['unit']
+                    }
+                ))
+
+    def _validate_climate(self, weather_data: Dict[str, Any], weather_reqs: Dict[str, Any], issues: List[ValidationIssue]):
+        """Helper method for long-range validation of a future date from climatology"""
+        if 'school' not in weather_data or 'date' not in weather_data:
+            return
+        # Flat module beside the sports package in the agents directory; imported here so
+        # loading a sports agent does not pull in pandas and the climatology tables
+        import climatology
+
+        climate = climatology.get_climatology()
+        probabilities = climate.probabilities(weather_data['school'], weather_data['date']) if climate else None
+        if probabilities is None:
+            return
+
+        # Only hazards the manual regulates count against a date
+        temperature = weather_reqs.get('temperature', {})
+        relevant = {
+            'rain': 'precipitation' in weather_reqs,
+            'lightning': 'lightningProtocol' in weather_reqs,
+            'freeze': temperature.get('minimum', float('-inf')) >= climatology.FREEZE_F,
+            'heat': temperature.get('maximum', float('inf')) <= climatology.EXTREME_HEAT_F
+        }
+        for hazard, probability in probabilities.items():
+            if relevant[hazard] and probability > climatology.CLIMATE_MEDIUM_RISK:
+                issues.append(ValidationIssue(
+                    type=f'climate_{hazard}',
+                    severity=ValidationSeverity.HIGH if probability > climatology.CLIMATE_HIGH_RISK else ValidationSeverity.MEDIUM,
+                    message=f"Historical {hazard} risk on this date",
+                    details={
+                        'probability': probability,
+                        'school': weather_data['school'],
+                        'date': weather_data['date'],
+                        'unit': 'percent of years'
+                    }
+                ))
+
     def get_scheduling_guidelines(self) -> Dict[str, Any]:
         """Get scheduling guidelines with validation"""
         logger.info("Retrieving scheduling guidelines")
-        return self.manual['scheduling']
+        return thaw(self.manual['scheduling'])
 
     def get_officials_requirements(self) -> Dict[str, Any]:
         """Get officials requirements with validation"""
         logger.info("Retrieving officials requirements")
-        return self.manual['officials']
+        return thaw(self.manual['officials'])
 
     def get_references(self) -> Dict[str, Any]:
         """Get reference documentation"""
         logger.info("Retrieving reference documentation")
-        return self.manual['references']
+        return thaw(self.manual['references'])
 
     def validate_game_schedule(self, schedule_data: Dict[str, Any]) -> List[ValidationIssue]:
         """Validate game schedule with comprehensive checks"""
@@ -193,6 +355,129 @@ class BaseSportsAgent:
         logger.info(f"Completed schedule validation. Found {len(issues)} issues.")
         return issues
 
+    def _schedule_rules(self) -> Mapping[str, Any]:
+        """Scheduling rules from the manual in the form the validators compare against"""
+        return self.lookups.schedule
+
+    def validate_season(self, games: List[Dict[str, Any]]) -> Dict[int, List[ValidationIssue]]:
+        """
+        Validate a whole season of games against the manual's scheduling rules at once.
+
+        Each game takes the same fields as validate_game_schedule plus home_team/away_team (or team).
+        Without an explicit last_game_end, rest is measured from the end of each team's previous game
+        in the list, using its duration or the manual's game length. Start times are read once and
+        every rule is checked over arrays.
+
+        Args:
+            games: Games of this agent's sport
+
+        Returns:
+            Issues keyed by the index of the game they belong to; games without issues are left out
+        """
+        logger.info(f"Starting season validation for {len(games)} games")
+        rules = self._schedule_rules()
+        count = len(games)
+        results: Dict[int, List[ValidationIssue]] = {}
+        if not count:
+            return results
+
+        starts = [datetime.fromisoformat(game['start_time']) if game.get('start_time') else None for game in games]
+        timed = np.array([start is not None for start in starts])
+        minutes = np.array([start.hour * 60 + start.minute if start else -1 for start in starts], dtype=np.int32)
+        weekday = np.array([start.weekday() if start else 0 for start in starts], dtype=np.int8)
+        # Wall-clock minutes since year 1, which is what fromisoformat differences give for same-offset times
+        start_at = np.array([start.toordinal() if start else 0 for start in starts], dtype=np.int64) * 1440 + minutes
+        has_duration = np.array(['duration' in game for game in games])
+        duration = np.array([game.get('duration', rules['max_duration']) for game in games], dtype=np.float64)
+
+        long_games = np.flatnonzero(has_duration & (duration > rules['max_duration']))
+        off_time = np.flatnonzero(timed & ~np.isin(minutes, rules['preferred_minutes']))
+        off_day = np.flatnonzero(timed & ~rules['day_allowed'][weekday])
+        rest_hours, rest_team = self._season_rest(games, starts, timed, start_at, duration)
+        short_rest = np.flatnonzero(rest_hours < rules['min_rest'])
+
+        for i in long_games.tolist():
+            results.setdefault(i, []).append(ValidationIssue(
+                type='duration',
+                severity=ValidationSeverity.MEDIUM,
+                message="Game duration exceeds allowed time",
+                details={
+                    'actual': games[i]['duration'],
+                    'maximum': rules['max_duration'],
+                    'unit': rules['duration_unit']
+                }
+            ))
+        for i in short_rest.tolist():
+            details = {
+                'actual_hours': float(rest_hours[i]),
+                'minimum_hours': rules['min_rest'],
+                'unit': rules['rest_unit']
+            }
+            if rest_team[i] is not None:
+                details['team'] = rest_team[i]
+            results.setdefault(i, []).append(ValidationIssue(
+                type='rest_period',
+                severity=ValidationSeverity.HIGH,
+                message="Insufficient rest period",
+                details=details
+            ))
+        for i in off_time.tolist():
+            results.setdefault(i, []).append(ValidationIssue(
+                type='start_time',
+                severity=ValidationSeverity.LOW,
+                message="Start time not in preferred times",
+                details={
+                    'actual': starts[i].strftime('%H:%M'),
+                    'preferred_times': rules['preferred_times']
+                }
+            ))
+        for i in off_day.tolist():
+            results.setdefault(i, []).append(ValidationIssue(
+                type='game_day',
+                severity=ValidationSeverity.LOW,
+                message="Non-traditional game day",
+                details={
+                    'actual': WEEKDAY_NAMES[starts[i].weekday()],
+                    'traditional_days': rules['traditional_days']
+                }
+            ))
+
+        logger.info(f"Completed season validation. Found issues in {len(results)} of {count} games.")
+        return {i: results[i] for i in sorted(results)}
+
+    def _season_rest(self, games: List[Dict[str, Any]], starts: List[Optional[datetime]], timed: np.ndarray,
+                     start_at: np.ndarray, duration: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Hours of rest before each game and the team with the least of it (inf where nothing precedes)"""
+        count = len(games)
+        rest = np.full(count, np.inf)
+        team_of = np.full(count, None, dtype=object)
+
+        # A game's own last_game_end wins, as in validate_game_schedule
+        for i, game in enumerate(games):
+            if 'last_game_end' in game and starts[i] is not None:
+                rest[i] = (starts[i] - datetime.fromisoformat(game['last_game_end'])).total_seconds() / 3600
+
+        # One row per (game, team); teams are kept apart per sport when games are mixed
+        rows = [(i, game.get('sport', ''), team) for i, game in enumerate(games)
+                if timed[i] and 'last_game_end' not in game
+                for team in ([game['team']] if 'team' in game else [game.get('home_team'), game.get('away_team')])
+                if team]
+        if not rows:
+            return rest, team_of
+        index = np.array([i for i, _, _ in rows])
+        teams = np.array([team for _, _, team in rows], dtype=object)
+        _, keys = np.unique([f"{sport}|{team}" for _, sport, team in rows], return_inverse=True)
+
+        # Sorted by team then start, each row that shares its predecessor's team rests since that game ended
+        order = np.lexsort((start_at[index], keys))
+        index, keys, teams = index[order], keys[order], teams[order]
+        follows = np.flatnonzero(keys[1:] == keys[:-1]) + 1
+        hours = (start_at[index[follows]] - (start_at[index[follows - 1]] + duration[index[follows - 1]])) / 60.0
+        np.minimum.at(rest, index[follows], hours)
+        tightest = hours <= rest[index[follows]]
+        team_of[index[follows][tightest]] = teams[follows][tightest]
+        return rest, team_of
+
     def _validate_game_duration(self, schedule_data: Dict[str, Any], scheduling: Dict[str, Any], issues: List[ValidationIssue]):
         """Helper method for game duration validation"""
         if 'duration' in schedule_data:
@@ -232,7 +517,7 @@ class BaseSportsAgent:
         if 'start_time' in schedule_data:
             game_time = datetime.fromisoformat(schedule_data['start_time'])
             time_str = game_time.strftime('%H:%M')
-            valid_times = [st['time'] for st in scheduling['preferredStartTimes']]
+            valid_times = self._schedule_rules()['preferred_times']
             
             if time_str not in valid_times:
                 issues.append(ValidationIssue(
@@ -249,7 +534,7 @@ class BaseSportsAgent:
         """Helper method for game day validation"""
         if 'start_time' in schedule_data:
             game_day = datetime.fromisoformat(schedule_data['start_time']).strftime('%A')
-            valid_days = [gd['day'] for gd in scheduling['traditionalGameDays']]
+            valid_days = self._schedule_rules()['traditional_days']
             
             if game_day not in valid_days:
                 issues.append(ValidationIssue(
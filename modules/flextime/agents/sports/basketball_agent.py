@@ -1,7 +1,8 @@
 from typing import Dict, List, Any
 from datetime import datetime
 import logging
-from .base_sports_agent import BaseSportsAgent, ValidationIssue, ValidationSeverity
+from collections import Counter
+from .base_sports_agent import BaseSportsAgent, ValidationIssue, ValidationSeverity, thaw
 
 logger = logging.getLogger(__name__)
 
@@ -117,9 +118,10 @@ class BasketballAgent(BaseSportsAgent):
         required_markings = self.manual['venue']['court']['requiredMarkings']
         
         if 'markings' in court_data:
+            present = set(court_data['markings'])
             missing_markings = [
-                marking for marking in required_markings 
-                if marking not in court_data['markings']
+                marking for marking in required_markings
+                if marking not in present
             ]
             
             if missing_markings:
@@ -192,9 +194,9 @@ class BasketballAgent(BaseSportsAgent):
         
         if 'officials' in crew_data:
             crew = crew_data['officials']
-            for role, requirements in required_officials.items():
-                required_count = requirements['count']
-                actual_count = sum(1 for official in crew if official['role'] == role)
+            crew_counts = Counter(official['role'] for official in crew)
+            for role, required_count in self.lookups.required_officials.items():
+                actual_count = crew_counts[role]
                 
                 if actual_count < required_count:
                     issues.append(ValidationIssue(
@@ -260,11 +262,11 @@ class BasketballAgent(BaseSportsAgent):
         logger.info("Retrieving equipment requirements")
         equipment = self.manual['venue']['equipment']
         return {
-            'required': equipment['required'],
-            'recommended': equipment['recommended']
+            'required': thaw(equipment['required']),
+            'recommended': thaw(equipment['recommended'])
         }
 
     def get_court_requirements(self) -> Dict[str, Any]:
         """Get detailed court requirements for basketball"""
         logger.info("Retrieving court requirements")
-        return self.manual['venue']['court'] 
\ No newline at end of file
+        return thaw(self.manual['venue']['court']) 
\ No newline at end of file
@@ -1,10 +1,20 @@
-from typing import Dict, List, Any
-from datetime import datetime
+from typing import Dict, List, Any, Optional
+from datetime import datetime, date
 import logging
-from .base_sports_agent import BaseSportsAgent, ValidationIssue, ValidationSeverity
+from collections import Counter
+
+import numpy as np
+
+from .base_sports_agent import BaseSportsAgent, ValidationIssue, ValidationSeverity, thaw
 
 logger = logging.getLogger(__name__)
 
+# Minimum days between a team's conference games
+MIN_CONFERENCE_SPACING_DAYS = 5
+# Maximum Thursday games per team per season
+MAX_THURSDAY_GAMES = 2
+THURSDAY = 3
+
 class FootballAgent(BaseSportsAgent):
     """Football-specific agent that implements sport-specific validations"""
 
@@ -20,9 +30,10 @@ class FootballAgent(BaseSportsAgent):
         required_markings = self.manual['venue']['field']['requiredMarkings']
         
         if 'markings' in field_data:
+            present = set(field_data['markings'])
             missing_markings = [
-                marking for marking in required_markings 
-                if marking not in field_data['markings']
+                marking for marking in required_markings
+                if marking not in present
             ]
             
             if missing_markings:
@@ -54,9 +65,10 @@ class FootballAgent(BaseSportsAgent):
         
         if 'officials' in crew_data:
             crew = crew_data['officials']
+            crew_counts = Counter(official['role'] for official in crew)
             for role in required_officials:
-                required_count = required_officials[role]['count']
-                actual_count = sum(1 for official in crew if official['role'] == role)
+                required_count = self.lookups.required_officials[role]
+                actual_count = crew_counts[role]
                 
                 if actual_count < required_count:
                     issues.append(ValidationIssue(
@@ -113,7 +125,7 @@ class FootballAgent(BaseSportsAgent):
                 existing_date = datetime.fromisoformat(existing_game['date']).date()
                 days_between = abs((game_date - existing_date).days)
                 
-                if days_between < 5:  # Minimum days between conference games
+                if days_between < MIN_CONFERENCE_SPACING_DAYS:
                     issues.append(ValidationIssue(
                         type='conference_spacing',
                         severity=ValidationSeverity.MEDIUM,
@@ -122,7 +134,7 @@ class FootballAgent(BaseSportsAgent):
                             'game_date': game_date.isoformat(),
                             'conflict_date': existing_date.isoformat(),
                             'days_between': days_between,
-                            'minimum_required': 5
+                            'minimum_required': MIN_CONFERENCE_SPACING_DAYS
                         }
                     ))
 
@@ -133,20 +145,154 @@ class FootballAgent(BaseSportsAgent):
                 if datetime.fromisoformat(game['date']).strftime('%A') == 'Thursday'
             ])
             
-            if thursday_games >= 2:  # Maximum 2 Thursday games per season
+            if thursday_games >= MAX_THURSDAY_GAMES:
                 issues.append(ValidationIssue(
                     type='thursday_games',
                     severity=ValidationSeverity.MEDIUM,
                     message="Exceeds maximum Thursday games per season",
                     details={
                         'current_count': thursday_games,
-                        'maximum_allowed': 2
+                        'maximum_allowed': MAX_THURSDAY_GAMES
                     }
                 ))
         
         logger.info(f"Conference restrictions check complete. Found {len(issues)} issues.")
         return issues
 
+    def check_season_restrictions(self, games: List[Dict[str, Any]],
+                                  finals_weeks: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, List[ValidationIssue]]:
+        """
+        Check conference restrictions for every team across a whole season in one pass.
+
+        Applies the rules of check_conference_restrictions to each team's games: no games in the
+        school's finals weeks, at least MIN_CONFERENCE_SPACING_DAYS between conference games and no
+        more than MAX_THURSDAY_GAMES on Thursdays. Each team's games are sorted once, so spacing is
+        the gap to the previous game and the Thursday limit a running count.
+
+        Args:
+            games: Games with home_team, away_team and date (or start_time); conference: False
+                   leaves a game out of the spacing check
+            finals_weeks: Finals intervals ({'start', 'end'}) by school; defaults to the exam dates
+                          compiled from the campus conflicts sheet
+
+        Returns:
+            Issues by team, with an empty list for teams without any
+        """
+        logger.info(f"Checking season restrictions for {len(games)} games")
+        if finals_weeks is None:
+            finals_weeks = self._compiled_finals_weeks()
+
+        # One row per (team, game)
+        rows = [(team, opponent, game.get('date') or game['start_time'], game.get('conference', True))
+                for game in games
+                for team, opponent in ((game['home_team'], game['away_team']), (game['away_team'], game['home_team']))]
+        results: Dict[str, List[ValidationIssue]] = {team: [] for team, _, _, _ in rows}
+        if not rows:
+            return results
+        teams, team_codes = np.unique([team for team, _, _, _ in rows], return_inverse=True)
+        days = np.array([_ordinal(day) for _, _, day, _ in rows], dtype=np.int64)
+        conference = np.array([bool(flag) for _, _, _, flag in rows])
+
+        order = np.lexsort((days, team_codes))
+        codes, days, conference = team_codes[order], days[order], conference[order]
+        first_row = np.r_[True, codes[1:] != codes[:-1]]
+
+        finals = self._finals_overlap(teams, codes, days, finals_weeks)
+
+        # Gap to the team's previous conference game
+        conf_rows = np.flatnonzero(conference)
+        follows = conf_rows[1:][codes[conf_rows[1:]] == codes[conf_rows[:-1]]]
+        previous = np.full(len(days), -1)
+        previous[conf_rows[1:]] = conf_rows[:-1]
+        close = follows[days[follows] - days[previous[follows]] < MIN_CONFERENCE_SPACING_DAYS]
+
+        # Thursday games the team already has before each game
+        thursday = (days - 1) % 7 == THURSDAY
+        prior = np.cumsum(thursday) - thursday
+        group_start = np.maximum.accumulate(np.where(first_row, np.arange(len(days)), 0))
+        before = prior - prior[group_start]
+        over = np.flatnonzero(thursday & (before >= MAX_THURSDAY_GAMES))
+
+        def add(k: int, issue: ValidationIssue):
+            results[teams[codes[k]]].append(issue)
+
+        for k, interval in finals:
+            add(k, ValidationIssue(
+                type='conference_schedule',
+                severity=ValidationSeverity.HIGH,
+                message="Game scheduled during finals week",
+                details={
+                    'game_date': date.fromordinal(int(days[k])).isoformat(),
+                    'opponent': rows[order[k]][1],
+                    'finals_week': {'start': interval[0].isoformat(), 'end': interval[1].isoformat()}
+                }
+            ))
+        for k in close.tolist():
+            add(k, ValidationIssue(
+                type='conference_spacing',
+                severity=ValidationSeverity.MEDIUM,
+                message="Insufficient spacing between conference games",
+                details={
+                    'game_date': date.fromordinal(int(days[k])).isoformat(),
+                    'conflict_date': date.fromordinal(int(days[previous[k]])).isoformat(),
+                    'days_between': int(days[k] - days[previous[k]]),
+                    'minimum_required': MIN_CONFERENCE_SPACING_DAYS
+                }
+            ))
+        for k in over.tolist():
+            add(k, ValidationIssue(
+                type='thursday_games',
+                severity=ValidationSeverity.MEDIUM,
+                message="Exceeds maximum Thursday games per season",
+                details={
+                    'game_date': date.fromordinal(int(days[k])).isoformat(),
+                    'current_count': int(before[k]),
+                    'maximum_allowed': MAX_THURSDAY_GAMES
+                }
+            ))
+
+        logger.info(f"Season restrictions check complete. Found {sum(map(len, results.values()))} issues.")
+        return results
+
+    def _finals_overlap(self, teams: np.ndarray, codes: np.ndarray, days: np.ndarray,
+                        finals_weeks: Dict[str, List[Dict[str, Any]]]) -> List[tuple]:
+        """Rows whose date falls in their team's finals weeks, with the interval each one hits"""
+        intervals = sorted((code, _ordinal(week['start']), _ordinal(week['end']))
+                           for code, team in enumerate(teams.tolist())
+                           for week in finals_weeks.get(team, []))
+        if not intervals:
+            return []
+        # All schools' intervals on one axis: a day's key is (school code, ordinal) packed into one integer
+        span = 1 << 32
+        starts = np.array([code * span + first for code, first, _ in intervals], dtype=np.int64)
+        ends = np.array([code * span + last for code, _, last in intervals], dtype=np.int64)
+        # Running maximum of the ends so overlapping intervals still cover every day between them
+        reach = np.maximum.accumulate(ends)
+        keys = codes.astype(np.int64) * span + days
+        hit = np.searchsorted(starts, keys, side='right') - 1
+        inside = np.flatnonzero((hit >= 0) & (reach[np.maximum(hit, 0)] >= keys))
+        # Report the latest-starting interval that actually contains the day
+        found = []
+        for k in inside.tolist():
+            j = int(hit[k])
+            while ends[j] < keys[k]:
+                j -= 1
+            found.append((k, (date.fromordinal(intervals[j][1]), date.fromordinal(intervals[j][2]))))
+        return found
+
+    def _compiled_finals_weeks(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Exam periods by school from the compiled campus scheduling sheets"""
+        # scheduling_constraints sits beside the sports package in the agents directory, which
+        # must be on sys.path; it is only needed when the caller does not pass finals weeks
+        import scheduling_constraints
+
+        compiled = scheduling_constraints.get_constraints()
+        weeks: Dict[str, List[Dict[str, Any]]] = {}
+        for constraint in compiled.constraints if compiled else []:
+            if getattr(constraint, 'event', None) == 'exam' and constraint.school:
+                weeks.setdefault(constraint.school, []).append({'start': constraint.first, 'end': constraint.last})
+        return weeks
+
     def validate_safety_zones(self, venue_data: Dict[str, Any]) -> List[ValidationIssue]:
         """Validate safety zones around the field"""
         logger.info("Validating safety zones")
@@ -233,11 +379,19 @@ class FootballAgent(BaseSportsAgent):
         logger.info("Retrieving facility requirements")
         facilities = self.manual['venue']['facilities']
         return {
-            'required': facilities['required'],
-            'recommended': facilities['recommended']
+            'required': thaw(facilities['required']),
+            'recommended': thaw(facilities['recommended'])
         }
 
     def get_field_requirements(self) -> Dict[str, Any]:
         """Get detailed field requirements for football"""
         logger.info("Retrieving field requirements")
-        return self.manual['venue']['field'] 
\ No newline at end of file
+        return thaw(self.manual['venue']['field']) 
+
+def _ordinal(value: Any) -> int:
+    """Day number of a date, datetime or ISO date/time string"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        value = value.date()
+    return value.toordinal()
@@ -1,7 +1,8 @@
 from typing import Dict, List, Any
 from datetime import datetime
 import logging
-from .base_sports_agent import BaseSportsAgent, ValidationIssue, ValidationSeverity
+from collections import Counter
+from .base_sports_agent import BaseSportsAgent, ValidationIssue, ValidationSeverity, thaw
 
 logger = logging.getLogger(__name__)
 
@@ -20,9 +21,10 @@ class VolleyballAgent(BaseSportsAgent):
         required_markings = self.manual['venue']['court']['requiredMarkings']
         
         if 'markings' in court_data:
+            present = set(court_data['markings'])
             missing_markings = [
-                marking for marking in required_markings 
-                if marking not in court_data['markings']
+                marking for marking in required_markings
+                if marking not in present
             ]
             
             if missing_markings:
@@ -167,9 +169,10 @@ class VolleyballAgent(BaseSportsAgent):
         
         if 'officials' in crew_data:
             crew = crew_data['officials']
+            crew_counts = Counter(official['role'] for official in crew)
             for role in required_officials:
-                required_count = required_officials[role]['count']
-                actual_count = sum(1 for official in crew if official['role'] == role)
+                required_count = self.lookups.required_officials[role]
+                actual_count = crew_counts[role]
                 
                 if actual_count < required_count:
                     issues.append(ValidationIssue(
@@ -235,11 +238,11 @@ class VolleyballAgent(BaseSportsAgent):
         logger.info("Retrieving equipment requirements")
         equipment = self.manual['venue']['equipment']
         return {
-            'required': equipment['required'],
-            'recommended': equipment['recommended']
+            'required': thaw(equipment['required']),
+            'recommended': thaw(equipment['recommended'])
         }
 
     def get_court_requirements(self) -> Dict[str, Any]:
         """Get detailed court requirements for volleyball"""
         logger.info("Retrieving court requirements")
-        return self.manual['venue']['court'] 
\ No newline at end of file
+        return thaw(self.manual['venue']['court']) 
\ No newline at end of file
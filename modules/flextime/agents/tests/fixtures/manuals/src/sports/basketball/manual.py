@@ -0,0 +1,41 @@
+"""
+Stand-in basketball manual in the shape the Python sports agents read
+
+XII-OS has no basketball manual yet. Values match the valid court in sports/tests/test_basketball_agent.py,
+which runs with tests/fixtures/manuals on PYTHONPATH; see src/sports/football/manual.py next to this one.
+"""
+
+BasketballManual = {
+    'sport': 'basketball',
+    'version': '2024.1',
+    'venue': {
+        'court': {'length': 94, 'width': 50, 'unit': 'feet',
+                  'requiredMarkings': ['center_circle', 'three_point_line', 'free_throw_line', 'key', 'baseline', 'sidelines']},
+        'backboard': {'height': 10, 'minExtension': 4, 'unit': 'feet'},
+        'shotClock': {'minimum': 2},
+        'equipment': {
+            'required': ['shot clocks', 'game clock', 'possession arrow', 'scorer table'],
+            'recommended': ['video board', 'replay monitors']
+        }
+    },
+    'weather': {
+        'temperature': {'minimum': 60, 'maximum': 80, 'unit': 'fahrenheit'}
+    },
+    'scheduling': {
+        'gameDuration': {'total': 120, 'unit': 'minutes'},
+        'restPeriod': {'minimum': 40, 'unit': 'hours'},
+        'preferredStartTimes': [
+            {'time': '18:00', 'priority': 2},
+            {'time': '19:00', 'priority': 3},
+            {'time': '20:00', 'priority': 1}
+        ],
+        'traditionalGameDays': [{'day': 'Tuesday', 'priority': 2}, {'day': 'Wednesday', 'priority': 2},
+                                {'day': 'Saturday', 'priority': 1}]
+    },
+    'officials': {
+        'required': {'referee': {'count': 1}, 'umpire': {'count': 2}}
+    },
+    'references': {
+        'rules': ['NCAA Basketball Rules 2024']
+    }
+}
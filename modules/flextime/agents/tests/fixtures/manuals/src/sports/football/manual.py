@@ -0,0 +1,62 @@
+"""
+Stand-in for src/sports/football/manual.ts in the shape the Python sports agents read
+
+Put tests/fixtures/manuals on sys.path (or pass it to `python -m sports.agent_registry --manuals`)
+so load_manual imports it as src.sports.football.manual.
+"""
+
+FootballManual = {
+    'sport': 'football',
+    'version': '2024.1',
+    'venue': {
+        'field': {
+            'length': {'minimum': 120, 'unit': 'yards'},
+            'width': {'minimum': 53.3, 'unit': 'yards'},
+            'surfaceTypes': ['natural grass', 'artificial turf - NCAA approved'],
+            'requiredMarkings': ['yard lines', 'hash marks', 'sidelines', 'end lines', 'goal lines', 'team areas']
+        },
+        'lighting': {
+            'minimumLevel': {'minimum': 100, 'unit': 'footcandles'},
+            'eveningRequired': True
+        },
+        'facilities': {
+            'required': ['locker rooms', 'medical facilities', 'officials room', 'restrooms', 'scoreboard',
+                         'play clocks', 'press box'],
+            'recommended': ['instant replay booth', 'media room', 'concessions', 'video board']
+        },
+        'safetyZones': {
+            'sideline': {'minimumDistance': 12, 'unit': 'feet'}
+        }
+    },
+    'weather': {
+        'temperature': {'minimum': 32, 'maximum': 95, 'unit': 'fahrenheit'},
+        'wind': {'maximumSpeed': 40, 'unit': 'mph'},
+        'precipitation': {'maximumRate': 0.5, 'unit': 'inches/hour'},
+        'lightningProtocol': {'delayDuration': 30, 'unit': 'minutes'}
+    },
+    'scheduling': {
+        'gameDuration': {'total': 210, 'unit': 'minutes'},
+        'restPeriod': {'minimum': 144, 'unit': 'hours'},
+        'preferredStartTimes': [
+            {'time': '13:00', 'priority': 1},
+            {'time': '15:30', 'priority': 2},
+            {'time': '19:00', 'priority': 3}
+        ],
+        'traditionalGameDays': [{'day': 'Saturday', 'priority': 1}, {'day': 'Thursday', 'priority': 2}]
+    },
+    'officials': {
+        'required': {
+            'referee': {'count': 1},
+            'umpire': {'count': 1},
+            'head_linesman': {'count': 1},
+            'line_judge': {'count': 1},
+            'back_judge': {'count': 1},
+            'field_judge': {'count': 1},
+            'side_judge': {'count': 1}
+        }
+    },
+    'references': {
+        'rules': ['NCAA Football Rules and Interpretations 2024'],
+        'scheduling': ['Big 12 Conference Scheduling Guidelines 2024']
+    }
+}
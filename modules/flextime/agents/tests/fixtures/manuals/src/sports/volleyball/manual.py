@@ -0,0 +1,36 @@
+"""
+Stand-in volleyball manual in the shape the Python sports agents read
+
+XII-OS has no volleyball manual yet; see src/sports/football/manual.py next to this one.
+"""
+
+VolleyballManual = {
+    'sport': 'volleyball',
+    'version': '2024.1',
+    'venue': {
+        'court': {'requiredMarkings': ['attack_line', 'center_line', 'service_zone']},
+        'net': {'height': {'minimum': 7.33, 'maximum': 7.36, 'unit': 'feet'}},
+        'ceiling': {'minimumHeight': 23, 'unit': 'feet'},
+        'equipment': {
+            'required': ['net system', 'referee stand', 'scoreboard'],
+            'recommended': ['video challenge system']
+        }
+    },
+    'weather': {
+        'temperature': {'minimum': 60, 'maximum': 80, 'unit': 'fahrenheit'}
+    },
+    'scheduling': {
+        'gameDuration': {'total': 150, 'unit': 'minutes'},
+        'restPeriod': {'minimum': 18, 'unit': 'hours'},
+        'preferredStartTimes': [{'time': '18:00', 'priority': 2}, {'time': '19:00', 'priority': 1}],
+        'traditionalGameDays': [{'day': 'Wednesday', 'priority': 2}, {'day': 'Friday', 'priority': 1},
+                                {'day': 'Saturday', 'priority': 1}],
+        'matchFormat': {'setsToWin': 3, 'pointsPerSet': 25}
+    },
+    'officials': {
+        'required': {'first_referee': {'count': 1}, 'second_referee': {'count': 1}, 'line_judge': {'count': 2}}
+    },
+    'references': {
+        'rules': ['NCAA Women\'s Volleyball Rules 2024']
+    }
+}
@@ -0,0 +1,97 @@
+import os
+import sys
+import json
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sports import agent_registry
+from sports import base_sports_agent
+from sports.base_sports_agent import BaseSportsAgent, freeze, clear_manual_cache
+from sports.volleyball_agent import VolleyballAgent
+
+# Stand-ins for the XII-OS manuals, importable as src.sports.<sport>.manual
+MANUALS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'manuals')
+
+MANUAL = freeze({
+    'version': '2024',
+    'venue': {'court': {'requiredMarkings': ['attack_line', 'center_line']}, 'ceiling': {'minimumHeight': 23, 'unit': 'feet'}},
+    'officials': {'required': {'referee': {'count': 1}, 'line_judge': {'count': 2}}}
+})
+
+class ManualVolleyballAgent(VolleyballAgent):
+    def _load_manual(self):
+        return MANUAL
+
+class FreshManualVolleyballAgent(VolleyballAgent):
+    def _load_manual(self):
+        return {'version': '2024', 'officials': {'required': {'referee': {'count': 1}}}}
+
+class CurlingAgent(BaseSportsAgent):
+    def __init__(self):
+        super().__init__('curling')
+
+class TestAgentRegistry(unittest.TestCase):
+    """Test cases for the sport agent registry and shared manuals"""
+
+    def setUp(self):
+        agent_registry.register_agent('test_volleyball', ManualVolleyballAgent)
+
+    def tearDown(self):
+        agent_registry.unregister_agent('test_volleyball')
+
+    def test_agents_share_manual_and_lookups(self):
+        """Agents for a sport share one read-only manual and its derived lookups"""
+        shared = agent_registry.get_agent('test_volleyball')
+        self.assertIs(agent_registry.get_agent('test_volleyball'), shared)
+        fresh = agent_registry.create_agent('test_volleyball')
+        self.assertIsNot(fresh, shared)
+        self.assertIs(fresh.manual, shared.manual)
+        self.assertIs(fresh.lookups, shared.lookups)
+        self.assertEqual(dict(shared.lookups.required_officials), {'referee': 1, 'line_judge': 2})
+        with self.assertRaises(TypeError):
+            shared.manual['venue'] = {}
+        self.assertIn('test_volleyball', agent_registry.available_sports())
+
+        # Getters hand out plain copies callers may change
+        court = shared.get_court_requirements()
+        self.assertIsInstance(court['requiredMarkings'], list)
+        court['requiredMarkings'].append('end_line')
+        self.assertEqual(shared.manual['venue']['court']['requiredMarkings'], ('attack_line', 'center_line'))
+
+    def test_fresh_manuals_do_not_grow_cache(self):
+        """An agent that builds its own manual each time replaces its sport's lookups instead of adding more"""
+        cached = len(base_sports_agent._lookups)
+        agents = [FreshManualVolleyballAgent() for _ in range(50)]
+        self.assertEqual(dict(agents[-1].lookups.required_officials), {'referee': 1})
+        self.assertLessEqual(len(base_sports_agent._lookups), cached + 1)
+
+    def test_validators_use_lookups(self):
+        """Validators give the same answers from the precompiled lookups"""
+        agent = agent_registry.get_agent('test_volleyball')
+        issues = agent.validate_officials_crew({'officials': [{'role': 'referee'}, {'role': 'line_judge'}]})
+        self.assertEqual([(i.details['role'], i.details['actual']) for i in issues], [('line_judge', 1)])
+        issues = agent.validate_court_markings({'markings': ['attack_line']})
+        self.assertEqual(issues[0].details['missing'], ['center_line'])
+        # Manual fragments in issue details come back as plain JSON-ready data
+        self.assertEqual(json.loads(json.dumps(issues[0].to_dict()))['details']['required'], ['attack_line', 'center_line'])
+
+    def test_benchmark_skips_missing_manuals(self):
+        """The benchmark runs on the stand-in manuals and leaves out sports whose manual is missing"""
+        sys.path.insert(0, MANUALS)
+        agent_registry.register_agent('test_curling', CurlingAgent)
+        try:
+            results = agent_registry.benchmark(['football', 'test_curling'], repeats=2)
+        finally:
+            sys.path.remove(MANUALS)
+            for sport in ('football', 'test_curling'):
+                agent_registry.unregister_agent(sport)
+            clear_manual_cache()
+            for name in [name for name in sys.modules if name == 'src' or name.startswith('src.')]:
+                del sys.modules[name]
+
+        self.assertEqual(list(results), ['football'])
+        self.assertGreater(results['football']['validations_per_second'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
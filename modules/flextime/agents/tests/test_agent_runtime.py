@@ -0,0 +1,75 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent_runtime import AgentRuntime, AgentTimeoutError
+
+AGENT_SOURCE = '''
+import time
+
+CALLS = []
+
+def process_user_query(query: str) -> str:
+    CALLS.append(query)
+    if query == "slow":
+        time.sleep(0.5)
+    elif query == "sleepy":
+        time.sleep(0.3)
+    return f"echo: {query}"
+'''
+
+class TestAgentRuntime(unittest.TestCase):
+    """Test cases for the persistent agent runtime"""
+
+    def setUp(self):
+        """Set up a throwaway agent module"""
+        self.agent_dir = tempfile.mkdtemp()
+        self.agent_path = os.path.join(self.agent_dir, "echo_test_agent.py")
+        with open(self.agent_path, 'w') as f:
+            f.write(AGENT_SOURCE)
+        sys.path.insert(0, self.agent_dir)
+        sys.modules.pop("echo_test_agent", None)
+
+        self.runtime = AgentRuntime({"echo": self.agent_path}, default_timeout=5.0)
+
+    def tearDown(self):
+        self.runtime.shutdown(wait=True)
+        sys.path.remove(self.agent_dir)
+
+    def test_module_loaded_once(self):
+        """Test repeated calls reuse the imported module"""
+        self.assertEqual(self.runtime.run("echo", "one"), "echo: one")
+        self.assertEqual(self.runtime.run("echo", "two"), "echo: two")
+        self.assertEqual(self.runtime.load("echo").CALLS, ["one", "two"])
+
+        report = self.runtime.latency_report()["echo"]
+        self.assertEqual(report["warm_calls"], 1)
+        self.assertIsNotNone(report["first_call_ms"])
+
+    def test_timeout(self):
+        """Test a slow agent is reported as timed out"""
+        with self.assertRaises(AgentTimeoutError):
+            self.runtime.run("echo", "slow", timeout=0.05)
+
+    def test_process_timeout_spares_other_calls(self):
+        """Test a timed-out call in process mode stops only its own worker"""
+        runtime = AgentRuntime({"echo": self.agent_path}, isolation="process", default_timeout=5.0)
+        try:
+            slow = runtime.submit("echo", "slow")
+            sibling = runtime.submit("echo", "sleepy")
+            with self.assertRaises(AgentTimeoutError):
+                runtime.result("echo", slow, timeout=0.05)
+            self.assertEqual(runtime.result("echo", sibling), "echo: sleepy")
+            self.assertEqual(runtime.run("echo", "again"), "echo: again")
+        finally:
+            runtime.shutdown(wait=True)
+
+    def test_unknown_agent(self):
+        """Test availability check for unregistered agents"""
+        self.assertFalse(self.runtime.has_agent("missing"))
+
+if __name__ == '__main__':
+    unittest.main()
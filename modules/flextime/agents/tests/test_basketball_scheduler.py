@@ -0,0 +1,58 @@
+import os
+import sys
+import unittest
+from collections import Counter, defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+import scheduling_core
+from basketball_scheduler import generate_conference_schedules
+from historical_patterns_agent import SPORT_TRADITIONAL_PARAMETERS
+
+class TestSchedulingCore(unittest.TestCase):
+    """Test cases for the shared scheduling helpers"""
+
+    def test_game_dates_follow_game_days(self):
+        """Dates fall on the allowed weekdays and keep the minimum spacing"""
+        dates = scheduling_core.game_dates("2027-01-01", 4, ["Wednesday", "Saturday"])
+        self.assertEqual(dates, ["2027-01-02", "2027-01-06", "2027-01-09", "2027-01-13"])
+        with self.assertRaises(ValueError):
+            scheduling_core.game_dates("2027-01-01", 4, ["Funday"])
+
+    def test_road_streaks(self):
+        """Every window beyond the limit counts once"""
+        away = np.array([[1, 1, 1, 1, 0, 1], [0, 1, 1, 0, 1, 1]], dtype=bool)
+        self.assertEqual(scheduling_core.road_streak_excess(away, 2).tolist(), [2, 0])
+        self.assertEqual(scheduling_core.max_road_streak(away).tolist(), [4, 2])
+
+class TestBasketballScheduler(unittest.TestCase):
+    """Test cases for the basketball conference schedule generator"""
+
+    def test_feasible_schedule(self):
+        """A 16-team schedule is balanced, within the away limit and pairs every meeting correctly"""
+        result = generate_conference_schedules("mbasketball", "2027-01-01", restarts=2, keep=1,
+                                               iterations=6000, workers=1, seed=4)
+        self.assertEqual(len(result["schedules"]), 1)
+        schedule = result["schedules"][0]
+        params = SPORT_TRADITIONAL_PARAMETERS["mbasketball"]["parameters"]
+
+        games = Counter()
+        meetings = defaultdict(list)
+        for game in schedule["games"]:
+            games[game["home_team"]] += 1
+            games[game["away_team"]] += 1
+            meetings[frozenset((game["home_team"], game["away_team"]))].append(game["home_team"])
+            self.assertIn(game["day"], params["typical_game_days"])
+
+        self.assertEqual(set(games.values()), {params["conference_games"]})
+        self.assertEqual(set(schedule["metrics"]["home_games"].values()), {params["conference_games"] // 2})
+        self.assertLessEqual(schedule["metrics"]["max_consecutive_away"], params["back_to_back_away_limit"])
+        for hosts in meetings.values():
+            self.assertEqual(len(set(hosts)), len(hosts))
+        for pair in params["travel_partners"]:
+            self.assertEqual(len(meetings[frozenset(pair)]), 2)
+
+if __name__ == "__main__":
+    unittest.main()
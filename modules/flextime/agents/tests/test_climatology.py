@@ -0,0 +1,70 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from climatology import build_climatology, day_of_year_index, HAZARDS
+from game_manager_agent import assess_season_climate_risk
+
+class TestClimatology(unittest.TestCase):
+    """Test cases for the climatology probability tables"""
+
+    def setUp(self):
+        """Write four years of history: freezing every January, hot every July, rain every third day"""
+        self.directory = tempfile.mkdtemp()
+        dates = pd.date_range("2016-01-01", "2019-12-31")
+        tmax = np.where(dates.month == 7, 100.0, 60.0)
+        tmin = np.where(dates.month == 1, 20.0, 45.0)
+        precip = np.where(np.arange(len(dates)) % 3 == 0, 0.5, 0.0)
+        pd.DataFrame({"date": dates.strftime("%Y-%m-%d"), "precipitation": precip,
+                      "tmax": tmax, "tmin": tmin}).to_csv(os.path.join(self.directory, "kansas.csv"), index=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_leap_and_common_years_share_calendar_days(self):
+        """March 1 maps to the same row in leap and common years"""
+        rows = day_of_year_index(["2024-03-01", "2025-03-01", "2024-02-29", "2025-12-31"])
+        self.assertEqual(rows.tolist(), [60, 60, 59, 365])
+
+    def test_probabilities_and_memory_mapped_reload(self):
+        """Tables reflect the history and reload memory-mapped from the cache"""
+        climate = build_climatology(self.directory, cache_dir=self.directory)
+        january = climate.probabilities("kansas", "2027-01-15")
+        july = climate.probabilities("kansas", "2027-07-15")
+
+        self.assertEqual(january["freeze"], 100)
+        self.assertEqual(july["heat"], 100)
+        self.assertEqual(july["freeze"], 0)
+        self.assertEqual(january["lightning"], 0)
+        self.assertIn(january["rain"], range(30, 37))
+        self.assertIsNone(climate.probabilities("utah", "2027-01-15"))
+
+        reloaded = build_climatology(self.directory, cache_dir=self.directory)
+        self.assertIsInstance(reloaded.table, np.memmap)
+        self.assertEqual(reloaded.version, climate.version)
+        self.assertEqual(reloaded.table.shape, (1, 366, len(HAZARDS)))
+
+    def test_season_climate_risk(self):
+        """Freezes only count for freeze-sensitive sports; unknown schools are flagged"""
+        climate = build_climatology(self.directory, cache_dir=None)
+        schedule = {
+            "football": [{"home_team": "kansas", "date": "2027-01-10"}],
+            "baseball": [{"home_team": "kansas", "date": "2027-01-10"},
+                         {"home_team": "utah", "date": "2027-01-10"}],
+            "basketball": [{"home_team": "kansas", "date": "2027-07-10"}]
+        }
+        games = assess_season_climate_risk(schedule, climate=climate)["games"]
+
+        self.assertEqual([g["risk_level"] for g in games], ["High", "Medium", "Unknown", "Low"])
+        self.assertIn("Freezing temperatures", games[0]["notes"])
+        self.assertNotIn("Freezing temperatures", games[1]["notes"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import conflict_engine
+
+def arena_resolver(school_code: str, sport: str) -> str:
+    return "Arena" if sport != "football" else "Stadium"
+
+def transition_lookup(from_sport: str, to_sport: str, school_code: str = None, venue_name: str = None) -> int:
+    return 2
+
+def detect(schedules):
+    return conflict_engine.detect_conflicts(schedules, arena_resolver, transition_lookup)
+
+def event(event_id, date, start, end="", **extra):
+    data = {"id": event_id, "home_team": "kansas", "date": date, "start_time": start, "end_time": end}
+    data.update(extra)
+    return data
+
+class TestConflictEngine(unittest.TestCase):
+    """Test cases for the interval conflict engine"""
+
+    def test_overlap(self):
+        """Test overlapping events are hard conflicts"""
+        conflicts = detect({
+            "volleyball": [event("v1", "2025-01-10", "18:00", "20:00")],
+            "wrestling": [event("w1", "2025-01-10", "19:00", "21:00")]
+        })
+        self.assertEqual(len(conflicts), 1)
+        self.assertEqual(conflicts[0]["type"], "hard_conflict")
+        self.assertEqual((conflicts[0]["event1_id"], conflicts[0]["event2_id"]), ("v1", "w1"))
+
+    def test_transition_shortfall_and_tight(self):
+        """Test transition time below and just above the requirement"""
+        conflicts = detect({
+            "volleyball": [event("v1", "2025-01-10", "10:00", "12:00"), event("v2", "2025-01-11", "10:00", "12:00")],
+            "wrestling": [event("w1", "2025-01-10", "13:00", "15:00"), event("w2", "2025-01-11", "14:30", "16:00")]
+        })
+        reasons = sorted(c["reason"] for c in conflicts)
+        self.assertEqual(reasons, [
+            "Insufficient transition time (1.0 hours, need 2 hours)",
+            "Tight transition time (2.5 hours)"
+        ])
+
+    def test_midnight_crossing(self):
+        """Test an event running past midnight conflicts with an early event the next day"""
+        conflicts = detect({
+            "volleyball": [event("v1", "2025-01-10", "22:00", "01:00")],
+            "wrestling": [event("w1", "2025-01-11", "00:30", "02:00")]
+        })
+        self.assertEqual([c["type"] for c in conflicts], ["hard_conflict"])
+        self.assertEqual(conflicts[0]["date"], "2025-01-10")
+
+    def test_setup_and_teardown_windows(self):
+        """Test setup/teardown minutes extend an event's venue occupancy"""
+        conflicts = detect({
+            "volleyball": [event("v1", "2025-01-10", "10:00", "12:00", teardown_minutes=60)],
+            "wrestling": [event("w1", "2025-01-10", "15:00", "17:00", setup_minutes=90)]
+        })
+        self.assertEqual(conflicts[0]["reason"], "Insufficient transition time (0.5 hours, need 2 hours)")
+
+    def test_same_day_rules(self):
+        """Test tennis and basketball pairings apply across the whole day"""
+        conflicts = detect({
+            "mtennis": [event("mt", "2025-03-01", "09:00")],
+            "wtennis": [event("wt", "2025-03-01", "18:00")],
+            "mbasketball": [event("mb", "2025-03-02", "11:00")],
+            "wbasketball": [event("wb", "2025-03-02", "19:00")]
+        })
+        self.assertEqual(sorted(c["type"] for c in conflicts), ["doubleheader_opportunity", "soft_conflict"])
+
+class TestConflictSession(unittest.TestCase):
+    """Test cases for incremental conflict re-evaluation"""
+
+    def setUp(self):
+        """Set up a small season with one overlap"""
+        self.session = conflict_engine.ConflictSession({
+            "volleyball": [event("v1", "2025-01-10", "18:00", "20:00")],
+            "wrestling": [event("w1", "2025-01-10", "19:00", "21:00"), event("w2", "2025-01-12", "19:00", "21:00")]
+        }, arena_resolver, transition_lookup)
+
+    def test_move_resolves_conflict(self):
+        """Test moving an event away reports the removed conflict only"""
+        self.assertEqual(len(self.session.conflicts()), 1)
+
+        diff = self.session.move_event("w1", date="2025-01-15")
+        self.assertEqual(len(diff["removed"]), 1)
+        self.assertEqual(diff["added"], [])
+        self.assertEqual(self.session.conflicts(), [])
+
+    def test_move_into_conflict(self):
+        """Test moving an event onto a busy day reports the new conflict"""
+        diff = self.session.move_event("w2", date="2025-01-10", start_time="22:30", end_time="23:30")
+        self.assertEqual(sorted(c["reason"] for c in diff["added"]), [
+            "Insufficient transition time (1.5 hours, need 2 hours)",
+            "Tight transition time (2.5 hours)"
+        ])
+        self.assertEqual(diff["removed"], [])
+
+    def test_add_and_remove(self):
+        """Test add_event and remove_event diffs"""
+        diff = self.session.add_event("gymnastics", event("g1", "2025-01-12", "20:00", "22:00"))
+        self.assertEqual([c["type"] for c in diff["added"]], ["hard_conflict"])
+
+        diff = self.session.remove_event("w2")
+        self.assertEqual(len(diff["removed"]), 1)
+        self.assertEqual(len(self.session.conflicts()), 1)
+
+    def test_generated_ids_after_remove(self):
+        """Test events added without an id never reuse an id in use or one freed by remove_event"""
+        session = conflict_engine.ConflictSession({
+            "volleyball": [{"home_team": "kansas", "date": "2025-01-10", "start_time": "18:00", "end_time": "20:00"},
+                           {"home_team": "kansas", "date": "2025-01-11", "start_time": "18:00", "end_time": "20:00"}]
+        }, arena_resolver, transition_lookup)
+        session.remove_event("volleyball-1")
+
+        session.add_event("volleyball", {"home_team": "kansas", "date": "2025-01-13", "start_time": "18:00"})
+        session.add_event("volleyball", {"home_team": "kansas", "date": "2025-01-14", "start_time": "18:00"})
+        self.assertEqual(sorted(session.events), ["volleyball-2", "volleyball-3", "volleyball-4"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from distance_engine import DistanceMatrix, build_distance_matrix, SCHOOL_COORDINATES
+
+class TestDistanceEngine(unittest.TestCase):
+    """Test cases for the distance engine"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.cache_dir = tempfile.mkdtemp()
+        self.matrix = build_distance_matrix(cache_dir=self.cache_dir)
+
+    def test_matrix_shape(self):
+        """Test that every school is present with a symmetric, zero-diagonal matrix"""
+        for school in SCHOOL_COORDINATES:
+            self.assertIn(school, self.matrix)
+            self.assertEqual(self.matrix.distance(school, school), 0.0)
+
+        self.assertEqual(
+            self.matrix.distance("kansas", "west_virginia"),
+            self.matrix.distance("west_virginia", "kansas")
+        )
+
+    def test_known_distance(self):
+        """Test a short in-state trip is in a realistic range"""
+        miles = self.matrix.distance("kansas", "kansas_state")
+        self.assertTrue(70 < miles < 110)
+
+    def test_batch_matches_single_lookups(self):
+        """Test the batch API returns the same values as single lookups"""
+        pairs = [("arizona", "ucf"), ("tcu", "baylor"), ("utah", "byu")]
+        batch = self.matrix.distances(pairs)
+        self.assertEqual(list(batch), [self.matrix.distance(o, d) for o, d in pairs])
+
+    def test_persisted_matrix_reused(self):
+        """Test a second build loads the persisted matrix"""
+        files = os.listdir(self.cache_dir)
+        self.assertEqual(len(files), 1)
+
+        reloaded = build_distance_matrix(cache_dir=self.cache_dir)
+        self.assertEqual(reloaded.version, self.matrix.version)
+        self.assertEqual(reloaded.keys, self.matrix.keys)
+
+    def test_from_coordinates(self):
+        """Test building a matrix for an arbitrary set of locations"""
+        matrix = DistanceMatrix.from_coordinates({"a": (40.0, -100.0), "b": (41.0, -100.0)})
+        self.assertAlmostEqual(matrix.distance("a", "b"), 69.1 * 1.2, delta=1.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from football_rotation import generate_rotation, protected_games
+from historical_patterns_agent import validate_schedule_against_traditions
+
+class TestFootballRotation(unittest.TestCase):
+    """Test cases for the multi-season football rotation"""
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_rotation_is_fair_and_reuses_earlier_seasons(self):
+        """Every pair meets home and away; changing one season re-solves only it and later seasons"""
+        result = generate_rotation(2027, seed=0, workers=1, cache_dir=self.cache_dir)
+        self.assertEqual(result["unsolved"], [])
+        rotation = result["rotation"]
+        self.assertEqual(rotation["pairs_home_and_away"], rotation["pairs"])
+        self.assertTrue(all(17 <= home <= 19 for home in rotation["home_games"].values()))
+
+        for season in result["seasons"]:
+            windows = {frozenset(game["teams"]): game["weeks"] for game in protected_games(season["season"])}
+            busy = Counter()
+            for game in season["games"]:
+                busy.update([(game["home_team"], game["week"]), (game["away_team"], game["week"])])
+                pair = frozenset((game["home_team"], game["away_team"]))
+                if pair in windows:
+                    self.assertIn(game["week"] - 1, windows[pair])
+            self.assertEqual(max(busy.values()), 1)
+            self.assertLessEqual(season["metrics"]["max_consecutive_away"], 2)
+
+            # Kansas State cannot play both Kansas on Thanksgiving weekend and Iowa State on Black Friday
+            validation = validate_schedule_against_traditions("football", {"games": season["games"]})
+            self.assertTrue(validation["is_valid"])
+            self.assertEqual([w["type"] for w in validation["warnings"]], ["Black Friday Game"])
+
+        changed = generate_rotation(2027, seed=0, workers=1, cache_dir=self.cache_dir,
+                                    overrides={2029: {"excluded": [["houston", "ucf"]]}})
+        self.assertEqual(changed["search"]["opponents"]["cached"], [2027, 2028])
+        self.assertEqual(changed["search"]["opponents"]["solved"], [2029, 2030])
+        self.assertEqual(changed["seasons"][:2], result["seasons"][:2])
+
+    def test_short_rotation_is_rejected(self):
+        """Three seasons of nine games cannot bring all fifteen opponents to two meetings"""
+        with self.assertRaises(ValueError):
+            generate_rotation(2027, seasons=3, workers=1, cache_dir=self.cache_dir)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import sys
+import datetime
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from weather_provider import synthesize_forecast
+from game_manager_agent import assess_season_weather_risk, assess_weather_risk, plan_school_operations
+
+class TestSeasonWeatherRisk(unittest.TestCase):
+    """Test cases for the batch season weather-risk assessment"""
+
+    def setUp(self):
+        """Build a small season with pre-fetched forecasts"""
+        start = datetime.date(2026, 3, 1)
+        self.schedule = {"baseball": [], "softball": [], "basketball": []}
+        self.forecasts = {}
+        for school in ["arizona", "kansas", "utah"]:
+            for i in range(20):
+                day = start + datetime.timedelta(days=i)
+                for sport in self.schedule:
+                    self.schedule[sport].append({"home_team": school, "date": day.isoformat()})
+                self.forecasts[(school, day.isoformat())] = synthesize_forecast(school, day)
+
+    def test_matches_single_game_assessment(self):
+        """Every game gets the same level and notes as assess_weather_risk"""
+        result = assess_season_weather_risk(self.schedule, forecasts=self.forecasts)
+        self.assertEqual(len(result["games"]), 180)
+
+        for game in result["games"]:
+            expected = assess_weather_risk(game["school"], game["sport"], game["date"],
+                                           forecast=self.forecasts[(game["school"], game["date"])])
+            self.assertEqual(game["risk_level"], expected["risk_level"])
+            self.assertEqual(game["notes"], expected["notes"])
+            if game["sport"] == "basketball":
+                self.assertEqual(game["risk_level"], "Low")
+
+        self.assertEqual(sum(result["summary"].values()), 180)
+
+    def test_riskiest_dates_ordered_by_score(self):
+        """Riskiest dates per venue are limited to top_n and sorted by score"""
+        result = assess_season_weather_risk(self.schedule, top_n=3, forecasts=self.forecasts)
+
+        for dates in result["riskiest_dates"].values():
+            self.assertLessEqual(len(dates), 3)
+            scores = [entry["risk_score"] for entry in dates]
+            self.assertEqual(scores, sorted(scores, reverse=True))
+
+class TestOperationsPlanning(unittest.TestCase):
+    """Test cases for the batch operations planner"""
+
+    def setUp(self):
+        """A busy weekend: soccer, football and volleyball on Saturday, volleyball on Sunday"""
+        self.events = [
+            {"id": "soccer", "sport": "soccer", "date": "2025-09-13", "start_time": "11:00"},
+            {"id": "football", "sport": "football", "date": "2025-09-13", "start_time": "14:00"},
+            {"id": "volleyball", "sport": "volleyball", "date": "2025-09-13", "start_time": "19:00"},
+            {"id": "volleyball2", "sport": "volleyball", "date": "2025-09-14", "start_time": "13:00"}
+        ]
+
+    def test_demand_curve_and_peak(self):
+        """Security demand steps as shifts overlap and peaks when volleyball setup meets football teardown"""
+        plan = plan_school_operations("kansas", self.events)
+        security = plan["roles"]["security"]
+
+        self.assertEqual([(d["start"][-5:], d["end"][-5:], d["staff"]) for d in security["demand"][:4]],
+                         [("08:00", "15:00", 132), ("15:00", "17:00", 120),
+                          ("17:00", "20:30", 135), ("20:30", "22:00", 15)])
+        self.assertEqual(security["peak"], {"staff": 135, "start": "2025-09-13 17:00", "end": "2025-09-13 20:30"})
+        self.assertEqual(security["over_capacity"], [])
+        self.assertEqual(plan["peak_concurrent_events"], 2)
+
+    def test_over_capacity_windows(self):
+        """Windows above capacity list the events driving the demand"""
+        plan = plan_school_operations("kansas", self.events, staff_capacity={"security": 130})
+        windows = plan["roles"]["security"]["over_capacity"]
+
+        self.assertEqual([(w["start"][-5:], w["end"][-5:], w["staff"]) for w in windows],
+                         [("08:00", "15:00", 132), ("17:00", "20:30", 135)])
+        self.assertEqual(windows[0]["events"], ["soccer", "football"])
+        self.assertEqual(windows[1]["events"], ["football", "volleyball"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import sys
+import time
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import head_coach_agent
+from agent_runtime import AgentRuntime
+
+AGENT_SOURCE = '''
+import time
+
+def process_user_query(query: str, context=None) -> str:
+    time.sleep(0.3)
+    return f"{query}|{sorted(context) if context else []}"
+'''
+
+class TestSubtaskGraph(unittest.TestCase):
+    """Test cases for dependency-graph execution of subtasks"""
+
+    def setUp(self):
+        """Point the head coach at a throwaway agent"""
+        self.agent_dir = tempfile.mkdtemp()
+        agent_path = os.path.join(self.agent_dir, "sleepy_test_agent.py")
+        with open(agent_path, 'w') as f:
+            f.write(AGENT_SOURCE)
+        sys.path.insert(0, self.agent_dir)
+
+        self.previous_runtime = head_coach_agent._runtime
+        head_coach_agent._runtime = AgentRuntime({"sleepy": agent_path}, max_workers=4, default_timeout=5.0)
+
+    def tearDown(self):
+        head_coach_agent._runtime.shutdown()
+        head_coach_agent._runtime = self.previous_runtime
+        sys.path.remove(self.agent_dir)
+
+    def test_independent_subtasks_run_concurrently(self):
+        """Test latency follows the critical path and context reaches dependents only"""
+        subtasks = [
+            {"id": "a", "agent": "sleepy", "description": "a", "priority": 1, "depends_on": []},
+            {"id": "b", "agent": "sleepy", "description": "b", "priority": 1, "depends_on": []},
+            {"id": "c", "agent": "sleepy", "description": "c", "priority": 2, "depends_on": ["a"]}
+        ]
+
+        start = time.perf_counter()
+        results = head_coach_agent.execute_subtasks(subtasks)
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 0.85)
+        self.assertEqual(results["a"]["response"], "a|[]")
+        self.assertEqual(results["b"]["response"], "b|[]")
+        self.assertEqual(results["c"]["response"], "c|['a']")
+
+    def test_unknown_agent_does_not_block(self):
+        """Test a missing agent is reported without stalling its dependents"""
+        subtasks = [
+            {"id": "x", "agent": "missing", "description": "x", "priority": 1, "depends_on": []},
+            {"id": "y", "agent": "sleepy", "description": "y", "priority": 2, "depends_on": ["x"]}
+        ]
+
+        results = head_coach_agent.execute_subtasks(subtasks)
+        self.assertEqual(results["x"]["error"], "unavailable")
+        self.assertEqual(results["y"]["response"], "y|['x']")
+
+    def test_decompose_declares_dependencies(self):
+        """Test decomposed subtasks only depend on subtasks that exist"""
+        subtasks = head_coach_agent.decompose_task("venue conflict and weather operations for football")
+        ids = {subtask["id"] for subtask in subtasks}
+        for subtask in subtasks:
+            self.assertTrue(set(subtask["depends_on"]) <= ids)
+
+class TestRoutedAgents(unittest.TestCase):
+    """Test cases for context and system prompts reaching the real routed agents"""
+
+    def setUp(self):
+        self.previous_runtime = head_coach_agent._runtime
+        paths = {name: head_coach_agent.AGENT_PATHS[name] for name in ("venue_data", "campus_conflicts")}
+        head_coach_agent._runtime = AgentRuntime(paths, max_workers=2, default_timeout=30.0)
+
+    def tearDown(self):
+        head_coach_agent._runtime.shutdown()
+        head_coach_agent._runtime = self.previous_runtime
+
+    def test_upstream_results_reach_dependent_agent(self):
+        """Test a routed agent's answer carries the findings of the subtasks it depends on"""
+        subtasks = head_coach_agent.decompose_task("venue conflict analysis for a shared facility")
+        results = head_coach_agent.execute_subtasks(subtasks)
+
+        venue_lines = results["venue_data"]["response"].splitlines()
+        conflicts = results["campus_conflicts"]["response"]
+        self.assertIsNone(results["campus_conflicts"]["error"])
+        self.assertIn("[Upstream Findings]", conflicts)
+        self.assertIn("(venue_data):", conflicts)
+        # Upstream responses are quoted whole
+        for line in filter(None, venue_lines):
+            self.assertIn(f"    {line}", conflicts)
+        self.assertNotIn("[Upstream Findings]", results["venue_data"]["response"])
+
+    def test_execute_agent_forwards_system_prompt(self):
+        """Test the system prompt reaches the agent without changing which analysis it gives"""
+        plain = head_coach_agent.execute_agent("venue_data", "what venues are there")
+        prompted = head_coach_agent.execute_agent("venue_data", "what venues are there", "Focus on baylor")
+        self.assertTrue(plain.startswith("[Venue Data Agent]"))
+        self.assertEqual(prompted, plain + "\n\n[Caller Instructions]\nFocus on baylor")
+
+if __name__ == '__main__':
+    unittest.main()
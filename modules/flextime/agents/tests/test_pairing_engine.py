@@ -0,0 +1,67 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from distance_engine import DistanceMatrix, SCHOOL_COORDINATES
+from pairing_engine import min_weight_perfect_matching, greedy_pairing, pairing_total, optimal_pairings
+
+def brute_force(weights, remaining):
+    if not remaining:
+        return 0.0
+    first, rest = remaining[0], remaining[1:]
+    return min(weights[first, other] + brute_force(weights, rest[:k] + rest[k + 1:]) for k, other in enumerate(rest))
+
+class TestPairingEngine(unittest.TestCase):
+    """Test cases for travel-partner pairing"""
+
+    def setUp(self):
+        """Set up a random symmetric weight matrix"""
+        rng = np.random.default_rng(7)
+        raw = rng.random((10, 10)) * 1000
+        self.weights = (raw + raw.T) / 2
+
+    def test_matches_brute_force(self):
+        """Test the matching is a perfect matching with the minimum total"""
+        pairs, total = min_weight_perfect_matching(self.weights)
+        self.assertEqual(sorted(i for pair in pairs for i in pair), list(range(10)))
+        self.assertAlmostEqual(total, brute_force(self.weights, list(range(10))))
+        self.assertAlmostEqual(total, pairing_total(self.weights, pairs))
+        self.assertLessEqual(total, pairing_total(self.weights, greedy_pairing(self.weights)) + 1e-9)
+
+    def test_fixed_pairs(self):
+        """Test fixed pairs are kept and the rest is optimized"""
+        pairs, total = min_weight_perfect_matching(self.weights, [(3, 0)])
+        self.assertIn((0, 3), pairs)
+        self.assertAlmostEqual(total, self.weights[0, 3] + brute_force(self.weights, [1, 2, 4, 5, 6, 7, 8, 9]))
+
+    def test_odd_league_rejected(self):
+        """Test an odd number of schools raises ValueError"""
+        with self.assertRaises(ValueError):
+            min_weight_perfect_matching(self.weights[:9, :9])
+
+    def test_hypothetical_league(self):
+        """Test an 18-team league and the savings report"""
+        coordinates = dict(SCHOOL_COORDINATES, memphis=(35.1187, -89.9378), smu=(32.8412, -96.7845))
+        matrix = DistanceMatrix.from_coordinates(coordinates)
+        result = optimal_pairings(matrix, list(coordinates))
+        self.assertEqual(len(result["pairings"]), 9)
+        self.assertGreaterEqual(result["savings_miles"], 0)
+        self.assertIs(optimal_pairings(matrix, list(coordinates)), result)
+
+    def test_repeated_fixed_pairs(self):
+        """Test a fixed pair given twice is merged and a school fixed to two partners is rejected"""
+        matrix = DistanceMatrix.from_coordinates(SCHOOL_COORDINATES)
+        schools = list(SCHOOL_COORDINATES)
+        once = optimal_pairings(matrix, schools, [["kansas", "kansas_state"]])
+        twice = optimal_pairings(matrix, schools, [["kansas", "kansas_state"], ["kansas_state", "kansas"]])
+        self.assertEqual(twice["pairings"], once["pairings"])
+        self.assertEqual(twice["fixed_pairs"], [["kansas", "kansas_state"]])
+        with self.assertRaises(ValueError):
+            optimal_pairings(matrix, schools, [["kansas", "kansas_state"], ["kansas", "baylor"]])
+
+if __name__ == '__main__':
+    unittest.main()
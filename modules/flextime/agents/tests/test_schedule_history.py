@@ -0,0 +1,69 @@
+import os
+import sys
+import shutil
+import datetime
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import schedule_history
+
+GRID = [
+    "2024-25 Big 12 Men's Basketball,,,,",
+    ",,KU,KSU,BU,TCU",
+    "Sat,4-Jan,KSU,at KU,TCU,at BU",
+    "Mon,6-Jan,at BU,,KU,",
+    "Sat,11-Jan,,TCU,,at KSU",
+    "Sat,1-Mar,at KSU,KU,,",
+]
+
+class TestScheduleHistory(unittest.TestCase):
+    """Test cases for the historical schedule store"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.source = os.path.join(self.root, "scheduling")
+        self.store = os.path.join(self.root, "store")
+        os.makedirs(os.path.join(self.source, "basketball"))
+        self.grid = os.path.join(self.source, "basketball", "2024-25 Big 12 MBB Conference Schedule.csv")
+        with open(self.grid, "w") as f:
+            f.write("\n".join(GRID) + "\n")
+        with open(os.path.join(self.source, "basketball", "2024-25 Summary.pdf"), "wb") as f:
+            f.write(b"%PDF-1.4")
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_grid_games_are_stored_once(self):
+        """Each game is listed under both teams in the grid and stored once, host first"""
+        summary = schedule_history.ingest(self.source, self.store)
+        self.assertEqual(len(summary["parsed"]), 1)
+        self.assertEqual(summary["skipped"], ["basketball/2024-25 Summary.pdf"])
+        self.assertEqual(summary["games"], 5)
+
+        games = schedule_history.load_games("mbasketball", ["2024-25"], store_dir=self.store)
+        self.assertEqual(list(zip(games["date"].dt.date, games["home_team"], games["away_team"])), [
+            (datetime.date(2025, 1, 4), "baylor", "tcu"),
+            (datetime.date(2025, 1, 4), "kansas", "kansas_state"),
+            (datetime.date(2025, 1, 6), "baylor", "kansas"),
+            (datetime.date(2025, 1, 11), "kansas_state", "tcu"),
+            (datetime.date(2025, 3, 1), "kansas_state", "kansas"),
+        ])
+        self.assertTrue(schedule_history.load_games("mbasketball", ["2023-24"], store_dir=self.store).empty)
+
+    def test_unchanged_files_are_not_reparsed(self):
+        """Files are re-parsed only when their content changes"""
+        schedule_history.ingest(self.source, self.store)
+        summary = schedule_history.ingest(self.source, self.store)
+        self.assertEqual(summary["parsed"], [])
+        self.assertEqual(summary["games"], 5)
+
+        with open(self.grid, "a") as f:
+            f.write("Sat,8-Mar,,,at TCU,BU\n")
+        summary = schedule_history.ingest(self.source, self.store)
+        self.assertEqual(len(summary["parsed"]), 1)
+        self.assertEqual(len(schedule_history.load_games("mbasketball", store_dir=self.store)), 6)
+
+if __name__ == "__main__":
+    unittest.main()
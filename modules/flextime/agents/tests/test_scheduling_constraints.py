@@ -0,0 +1,112 @@
+import os
+import sys
+import csv
+import time
+import shutil
+import datetime
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+import scheduling_constraints
+from scheduling_constraints import BlackoutDates, UnavailableVenue, PreferredDays, SeasonWindow
+
+CAMPUS_ROWS = [
+    ["Please provide information below for the Big 12 to be aware of when scheduling the following sports:\n"
+     "• SOCCER\n• TENNIS\n• SOFTBALL\n• BASEBALL\n\nAlthough some of this information may pertain to other sports"],
+    ["", "2025-26 Campus Conflicts (Cannot host event on these dates)", "2025 WINTER EXAM DATES", "2026 SPRING BREAK",
+     "2026 SPRING EXAM DATES", "SPRING GRADUATION DATE", "Preferred 2026 SOFTBALL HOME DATES",
+     "Preferred 2026 BASEBALL HOME DATES", "Other Notes"],
+    ["ARIZONA STATE", "April 1-5 Hosting NCAA WBB Final Four; Unable to compete during finals.",
+     "Dec 8-13", "March 8-15", "May 4-9", "May 11", "N/A", "N/A", ""],
+    ["BYU", "NO SUNDAYS plus BYU is asked to avoid home contests on Oct 4-5, 2025", "Dec. 12-17, 2025", "March 20",
+     "April 17-22", "April 23-24", "Prefer to have home games Apr. 17-18, 2026", "Home during exams", ""],
+    ["K-STATE", "", "", "", "", "", "", "", ""],
+]
+
+CONSIDERATION_ROWS = [
+    ["SOCCER SCHEDULING (16 Teams)", "", ""],
+    ["FORMAT OVERVIEW", "OPTION C (Hybrid)", ""],
+    ["", "• 2025 Start Date: Thursday, September 11", ""],
+    ["", "• 2025 End Date: Sunday, November 2", ""],
+]
+
+def write_csv(path, rows):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", newline="") as f:
+        csv.writer(f).writerows(rows)
+
+class TestSchedulingConstraints(unittest.TestCase):
+    """Test cases for the scheduling sheet compiler"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.source = os.path.join(self.root, "scheduling")
+        self.cache = os.path.join(self.root, "cache")
+        self.campus = os.path.join(self.source, "core", "2025-26 Big 12 Campus Scheduling Conflicts.csv")
+        write_csv(self.campus, CAMPUS_ROWS)
+        write_csv(os.path.join(self.source, "soccer", "2025-26 Big 12 Soccer Scheduling Considerations.csv"),
+                  CONSIDERATION_ROWS)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_sheets_compile_to_typed_constraints(self):
+        """Each kind of sheet entry becomes the matching constraint type"""
+        compiled = scheduling_constraints.build_constraints([self.source], cache_dir=None)
+        kinds = {(type(c).__name__, c.school) for c in compiled.constraints}
+        self.assertIn(("UnavailableVenue", "arizona_state"), kinds)
+        self.assertIn(("PreferredDays", "byu"), kinds)
+        self.assertIn(("SeasonWindow", None), kinds)
+
+        finals = [c for c in compiled.for_school("arizona_state") if isinstance(c, BlackoutDates)]
+        self.assertEqual([(c.first, c.last, c.home_only) for c in finals],
+                         [(datetime.date(2025, 12, 8), datetime.date(2025, 12, 13), False),
+                          (datetime.date(2026, 5, 4), datetime.date(2026, 5, 9), False)])
+        venue = next(c for c in compiled.constraints if isinstance(c, UnavailableVenue))
+        self.assertEqual(venue.sports, ["wbasketball"])
+        baseball = next(c for c in compiled.for_school("byu") if isinstance(c, PreferredDays) and c.sports == ["baseball"])
+        self.assertEqual((baseball.first, baseball.last), (datetime.date(2026, 4, 17), datetime.date(2026, 4, 22)))
+        window = next(c for c in compiled.constraints if isinstance(c, SeasonWindow))
+        self.assertEqual((window.sports, window.first, window.last),
+                         (["soccer"], datetime.date(2025, 9, 11), datetime.date(2025, 11, 2)))
+
+    def test_lookups_match_constraints(self):
+        """Bitset lookups agree with checking every constraint directly"""
+        compiled = scheduling_constraints.build_constraints([self.source], cache_dir=None)
+        self.assertFalse(compiled.allowed("byu", "2025-10-05", "soccer", home=False))
+        self.assertTrue(compiled.allowed("byu", "2025-10-04", "soccer"))
+        self.assertEqual(compiled.soft_flags("byu", "2025-10-04", "soccer"), ["avoid_home"])
+        self.assertFalse(compiled.allowed("kansas_state", "2025-08-30", "soccer"))
+        self.assertTrue(compiled.allowed("kansas_state", "2025-09-13", "soccer"))
+        self.assertTrue(compiled.allowed("kansas_state", "2025-08-30", "volleyball"))
+
+        rng = np.random.default_rng(0)
+        schools = rng.choice(["arizona_state", "byu", "kansas_state", "utah"], 2000).tolist()
+        dates = [datetime.date(2025, 7, 1) + datetime.timedelta(days=int(d)) for d in rng.integers(-30, 400, 2000)]
+        sports = rng.choice(scheduling_constraints.SPORTS, 2000).tolist()
+        home = rng.random(2000) < 0.5
+        expected = [not compiled.explain(s, d, sp, bool(h)) for s, d, sp, h in zip(schools, dates, sports, home)]
+        self.assertEqual(compiled.allowed_many(schools, dates, sports, home).tolist(), expected)
+
+    def test_cache_follows_sheet_changes(self):
+        """The compiled form is reused until a sheet changes"""
+        first = scheduling_constraints.build_constraints([self.source], cache_dir=self.cache)
+        again = scheduling_constraints.build_constraints([self.source], cache_dir=self.cache)
+        self.assertEqual(again.version, first.version)
+        self.assertEqual(len(os.listdir(self.cache)), 2)
+        self.assertTrue(np.array_equal(again.host_blocked, first.host_blocked))
+        self.assertEqual([c.to_dict() for c in again.constraints], [c.to_dict() for c in first.constraints])
+
+        rows = CAMPUS_ROWS + [["UTAH", "December 13", "", "", "", "", "", "", ""]]
+        write_csv(self.campus, rows)
+        os.utime(self.campus, ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+        changed = scheduling_constraints.build_constraints([self.source], cache_dir=self.cache)
+        self.assertNotEqual(changed.version, first.version)
+        self.assertFalse(changed.allowed("utah", "2025-12-13", "baseball"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scheduling_core
+
+PARENT_PID = os.getpid()
+
+def fails_in_worker(item):
+    if os.getpid() != PARENT_PID:
+        raise ValueError(f"bad item {item}")
+    return item
+
+class TestParallelMap(unittest.TestCase):
+    """Test cases for scheduling_core.parallel_map"""
+
+    def test_worker_errors_propagate(self):
+        """An exception raised by the function in a worker is not retried in this process"""
+        with self.assertRaises(ValueError):
+            scheduling_core.parallel_map(fails_in_worker, [1, 2], workers=2)
+
+    def test_unpicklable_function_runs_in_process(self):
+        """Work that cannot be sent to worker processes runs here instead"""
+        offset = 10
+        results, workers = scheduling_core.parallel_map(lambda item: item + offset, [1, 2, 3], workers=2)
+        self.assertEqual((results, workers), ([11, 12, 13], 1))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import sys
+import random
+import datetime
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sports.football_agent import FootballAgent, MIN_CONFERENCE_SPACING_DAYS, MAX_THURSDAY_GAMES
+
+class ManualFootballAgent(FootballAgent):
+    def _load_manual(self):
+        return {}
+
+def game(home, away, day):
+    return {'home_team': home, 'away_team': away, 'date': day}
+
+class TestSeasonRestrictions(unittest.TestCase):
+    """Test cases for FootballAgent.check_season_restrictions"""
+
+    def setUp(self):
+        self.agent = ManualFootballAgent()
+
+    def test_restrictions_by_team(self):
+        """Finals, spacing and Thursday issues land on the teams they affect"""
+        games = [
+            game('kansas', 'baylor', '2025-09-04'),
+            game('tcu', 'kansas', '2025-09-11'),
+            game('kansas', 'utah', '2025-09-13'),
+            game('baylor', 'kansas', '2025-09-18'),
+            game('utah', 'tcu', '2025-12-06'),
+        ]
+        finals = {'utah': [{'start': datetime.date(2025, 12, 1), 'end': datetime.date(2025, 12, 6)}]}
+        results = self.agent.check_season_restrictions(games, finals)
+        self.assertEqual(sorted(results), ['baylor', 'kansas', 'tcu', 'utah'])
+        self.assertEqual(results['baylor'], [])
+        self.assertEqual(results['tcu'], [])
+        self.assertEqual([(i.type, i.details['game_date']) for i in results['kansas']],
+                         [('conference_spacing', '2025-09-13'), ('thursday_games', '2025-09-18')])
+        self.assertEqual([(i.type, i.details['game_date']) for i in results['utah']],
+                         [('conference_schedule', '2025-12-06')])
+
+    def test_matches_pairwise_check(self):
+        """The sorted-window checks agree with comparing every pair of games"""
+        rng = random.Random(3)
+        teams = [f'team_{i}' for i in range(16)]
+        start = datetime.date(2025, 8, 28)
+        games = [game(*rng.sample(teams, 2), (start + datetime.timedelta(days=rng.randrange(110))).isoformat())
+                 for _ in range(200)]
+        finals = {team: [{'start': start + datetime.timedelta(days=d), 'end': start + datetime.timedelta(days=d + 6)}
+                         for d in rng.sample(range(100), 2)] for team in teams[:10]}
+        results = self.agent.check_season_restrictions(games, finals)
+
+        for team in teams:
+            days = sorted(datetime.date.fromisoformat(g['date']) for g in games if team in (g['home_team'], g['away_team']))
+            expected = {'conference_schedule': set(), 'conference_spacing': set(), 'thursday_games': set()}
+            for i, day in enumerate(days):
+                if any(w['start'] <= day <= w['end'] for w in finals.get(team, [])):
+                    expected['conference_schedule'].add(day.isoformat())
+                if i and (day - days[i - 1]).days < MIN_CONFERENCE_SPACING_DAYS:
+                    expected['conference_spacing'].add(day.isoformat())
+                if day.weekday() == 3 and sum(d.weekday() == 3 for d in days[:i]) >= MAX_THURSDAY_GAMES:
+                    expected['thursday_games'].add(day.isoformat())
+            found = {kind: set() for kind in expected}
+            for issue in results.get(team, []):
+                found[issue.type].add(issue.details['game_date'])
+            self.assertEqual(found, expected, team)
+
+if __name__ == '__main__':
+    unittest.main()
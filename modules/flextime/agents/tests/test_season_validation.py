@@ -0,0 +1,69 @@
+import os
+import sys
+import time
+import unittest
+import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sports.base_sports_agent import BaseSportsAgent
+
+# Scheduling section of src/sports/football/manual.ts
+SCHEDULING = {
+    'gameDuration': {'total': 210, 'unit': 'minutes'},
+    'restPeriod': {'minimum': 144, 'unit': 'hours'},
+    'preferredStartTimes': [{'time': '13:00'}, {'time': '15:30'}, {'time': '19:00'}],
+    'traditionalGameDays': [{'day': 'Saturday'}, {'day': 'Thursday'}],
+}
+
+class ManualAgent(BaseSportsAgent):
+    def _load_manual(self):
+        return {'scheduling': SCHEDULING}
+
+def game(home, away, start, **fields):
+    return dict(home_team=home, away_team=away, start_time=start, **fields)
+
+class TestSeasonValidation(unittest.TestCase):
+    """Test cases for BaseSportsAgent.validate_season"""
+
+    def setUp(self):
+        self.agent = ManualAgent('football')
+
+    def test_issues_are_grouped_by_game(self):
+        """Each game gets the rules it breaks, with rest measured from the team's previous game"""
+        games = [
+            game('kansas', 'baylor', '2025-09-06T19:00:00'),
+            game('tcu', 'kansas', '2025-09-11T19:00:00'),
+            game('baylor', 'utah', '2025-09-14T12:00:00', duration=240),
+            game('utah', 'tcu', '2025-09-20T19:00:00'),
+        ]
+        issues = self.agent.validate_season(games)
+        self.assertEqual(sorted(issues), [1, 2])
+        rest = issues[1][0]
+        self.assertEqual((rest.type, rest.details['team'], rest.details['actual_hours']), ('rest_period', 'kansas', 116.5))
+        self.assertEqual([issue.type for issue in issues[2]], ['duration', 'start_time', 'game_day'])
+
+    def test_matches_single_game_validation(self):
+        """Games carrying last_game_end get the same issues as validating them one at a time"""
+        games = [game('kansas', 'baylor', f'2025-{9 + d // 28:02d}-{1 + d % 28:02d}T{h:02d}:{m:02d}:00',
+                      duration=180 + d, last_game_end=f'2025-08-{1 + d % 28:02d}T20:00:00')
+                 for d in range(60) for h, m in ((13, 0), (18, 30))]
+        season = self.agent.validate_season(games)
+        for i, g in enumerate(games):
+            single = [issue.to_dict() for issue in self.agent.validate_game_schedule(g)]
+            self.assertEqual(sorted(single, key=str), sorted((issue.to_dict() for issue in season.get(i, [])), key=str))
+
+    def test_full_season_is_fast(self):
+        """Several thousand games validate in well under a second"""
+        schools = [f'school_{i}' for i in range(16)]
+        start = datetime.datetime(2025, 8, 30, 13)
+        games = [game(schools[(w + k) % 16], schools[(w + 2 * k + 1) % 16],
+                      (start + datetime.timedelta(days=w * 3, hours=k % 3)).isoformat(), sport=f'sport_{s}')
+                 for s in range(12) for w in range(40) for k in range(8)]
+        began = time.perf_counter()
+        issues = self.agent.validate_season(games)
+        self.assertLess(time.perf_counter() - began, 1.0)
+        self.assertTrue(issues)
+
+if __name__ == '__main__':
+    unittest.main()
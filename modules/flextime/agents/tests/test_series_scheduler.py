@@ -0,0 +1,68 @@
+import os
+import sys
+import unittest
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from series_scheduler import generate_series_schedules, reschedule_after_rainout, SPORT_TEAMS
+from historical_patterns_agent import SPORT_TRADITIONAL_PARAMETERS
+
+class TestSeriesScheduler(unittest.TestCase):
+    """Test cases for the baseball and softball series scheduler"""
+
+    def assertValidSchedule(self, schedule, series_per_team):
+        busy = Counter()
+        for series in schedule["series"]:
+            busy.update([(series["home_team"], series["weekend"]), (series["away_team"], series["weekend"])])
+        self.assertEqual(max(busy.values()), 1)
+        games = Counter(team for team, _ in busy.elements())
+        self.assertEqual(set(games.values()), {series_per_team})
+        self.assertLessEqual(schedule["metrics"]["max_consecutive_away"], 2)
+
+    def test_feasible_schedule(self):
+        """Every team plays each opponent at most once, hosts half its series and keeps the away limit"""
+        result = generate_series_schedules("softball", 2027, candidates=2, workers=1, seed=0)
+        self.assertEqual(len(result["schedules"]), 1)
+        schedule = result["schedules"][0]
+        series_per_team = SPORT_TRADITIONAL_PARAMETERS["softball"]["parameters"]["conference_series"]
+
+        self.assertValidSchedule(schedule, series_per_team)
+        pairs = Counter(frozenset((s["home_team"], s["away_team"])) for s in schedule["series"])
+        self.assertEqual(max(pairs.values()), 1)
+        self.assertEqual(set(schedule["metrics"]["home_series"]), set(SPORT_TEAMS["softball"]))
+        self.assertEqual(set(schedule["metrics"]["home_series"].values()), {series_per_team // 2})
+        for series in schedule["series"]:
+            self.assertEqual(len(series["dates"]), 3)
+
+    def test_rainout_keeps_played_weekends(self):
+        """A rained-out weekend moves its series later without touching weekends already played"""
+        schedule = generate_series_schedules("softball", 2027, candidates=2, workers=1, seed=0)["schedules"][0]
+        updated = reschedule_after_rainout(schedule, 3, seed=0)
+        self.assertIsNotNone(updated)
+        series_per_team = SPORT_TRADITIONAL_PARAMETERS["softball"]["parameters"]["conference_series"]
+
+        self.assertValidSchedule(updated, series_per_team)
+        self.assertEqual(len(updated["weekends"]), len(schedule["weekends"]) + 1)
+        played = [s for s in schedule["series"] if s["weekend"] < 3]
+        self.assertEqual([s for s in updated["series"] if s["weekend"] < 3], played)
+        self.assertFalse(any(s["weekend"] == 3 for s in updated["series"]))
+        venues = lambda schedule: Counter((s["home_team"], s["away_team"]) for s in schedule["series"])
+        self.assertEqual(venues(updated), venues(schedule))
+        lost = {(s["home_team"], s["away_team"]) for s in schedule["series"] if s["weekend"] == 3}
+        self.assertTrue(lost <= {(s["home_team"], s["away_team"]) for s in updated["rescheduled"]})
+        remaining = [s for s in schedule["series"] if s["weekend"] >= 3]
+        self.assertLessEqual(len(updated["rescheduled"]), len(remaining) // 2)
+
+    def test_rainout_moves_few_series(self):
+        """Losing a whole early weekend moves the lost series and a few others, not the rest of the season"""
+        schedule = generate_series_schedules("baseball", 2027, candidates=2, workers=1, seed=0)["schedules"][0]
+        updated = reschedule_after_rainout(schedule, 2, seed=0)
+        self.assertIsNotNone(updated)
+
+        self.assertValidSchedule(updated, SPORT_TRADITIONAL_PARAMETERS["baseball"]["parameters"]["conference_series"])
+        lost = [s for s in schedule["series"] if s["weekend"] == 2]
+        self.assertLessEqual(len(updated["rescheduled"]), 2 * len(lost))
+
+if __name__ == "__main__":
+    unittest.main()
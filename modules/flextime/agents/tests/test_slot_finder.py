@@ -0,0 +1,103 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import conflict_engine
+import slot_finder
+from slot_finder import SlotFinder, VenueTimeline
+from sports import agent_registry
+from sports.base_sports_agent import BaseSportsAgent
+
+def arena_resolver(school_code: str, sport: str) -> str:
+    return "Arena"
+
+def transition_lookup(from_sport: str, to_sport: str, school_code: str = None, venue_name: str = None) -> int:
+    return 2
+
+def event(event_id, date, start, end, away="tcu"):
+    return {"id": event_id, "home_team": "kansas", "away_team": away, "date": date, "start_time": start, "end_time": end}
+
+PREFERRED = {"wrestling": [{"time": "19:00", "priority": 1}, {"time": "14:00", "priority": 2}]}
+
+class ManualWrestlingAgent(BaseSportsAgent):
+    def __init__(self):
+        super().__init__('wrestling')
+
+    def _load_manual(self):
+        return {'scheduling': {'preferredStartTimes': [{'time': '13:00', 'priority': 1}]}}
+
+class TestSlotFinder(unittest.TestCase):
+    """Test cases for the nearest-feasible-slot search"""
+
+    def setUp(self):
+        """Set up a venue with a volleyball/wrestling overlap"""
+        self.schedules = {
+            "volleyball": [event("v1", "2025-01-10", "18:00", "20:00")],
+            "wrestling": [event("w1", "2025-01-10", "19:00", "21:00", away="baylor"),
+                          event("w2", "2025-01-11", "19:00", "21:00")]
+        }
+        self.finder = SlotFinder(self.schedules, arena_resolver, transition_lookup, PREFERRED)
+
+    def test_cheapest_slot_first(self):
+        """Test slots are ranked by displacement cost"""
+        slots = self.finder.find_slots("w1", k=3, window_days=2)
+        self.assertEqual((slots[0]["date"], slots[0]["start_time"], slots[0]["end_time"]), ("2025-01-09", "19:00", "21:00"))
+        self.assertEqual([s["cost"] for s in slots], sorted(s["cost"] for s in slots))
+
+        # Same-day afternoon fits, but pays for the time shift and the tight turnaround
+        same_day = [s for s in slots if s["date"] == "2025-01-10"]
+        self.assertEqual(same_day[0]["start_time"], "14:00")
+        self.assertEqual(same_day[0]["notes"], ["Tight transition before volleyball"])
+
+    def test_slots_are_conflict_free(self):
+        """Test returned slots avoid the venue's busy intervals and transition buffers"""
+        for slot in self.finder.find_slots("w1", k=10, window_days=3):
+            moved = dict(self.schedules, wrestling=[
+                dict(self.schedules["wrestling"][0], date=slot["date"], start_time=slot["start_time"], end_time=slot["end_time"]),
+                self.schedules["wrestling"][1]
+            ])
+            conflicts = conflict_engine.detect_conflicts(moved, arena_resolver, transition_lookup)
+            self.assertNotIn("hard_conflict", [c["type"] for c in conflicts])
+
+    def test_opponent_availability(self):
+        """Test days on which either team already plays are skipped"""
+        self.schedules["wrestling"].append(dict(event("w3", "2025-01-09", "19:00", "21:00"), home_team="baylor"))
+        finder = SlotFinder(self.schedules, arena_resolver, transition_lookup, PREFERRED)
+        dates = {s["date"] for s in finder.find_slots("w1", k=20, window_days=2)}
+        self.assertEqual(dates, {"2025-01-08", "2025-01-10", "2025-01-12"})
+
+    def test_batch_resolution(self):
+        """Test every hard conflict gets a chosen slot"""
+        conflicts = conflict_engine.detect_conflicts(self.schedules, arena_resolver, transition_lookup)
+        resolutions = self.finder.resolve_conflicts(conflicts, lambda c: c["event2_id"])
+        self.assertEqual(len(resolutions), 1)
+        self.assertEqual(resolutions[0]["event_id"], "w1")
+        self.assertIsNotNone(resolutions[0]["chosen"])
+
+    def test_start_times_from_manual(self):
+        """Test the sport manual's preferred start times are used when none are given"""
+        agent_registry.register_agent("wrestling", ManualWrestlingAgent)
+        slot_finder.manual_start_times.cache_clear()
+        try:
+            finder = SlotFinder(self.schedules, arena_resolver, transition_lookup)
+            slots = finder.find_slots("w1", k=10, window_days=2)
+        finally:
+            agent_registry.unregister_agent("wrestling")
+            slot_finder.manual_start_times.cache_clear()
+        self.assertTrue(slots)
+        self.assertEqual({s["start_time"] for s in slots}, {"13:00"})
+
+    def test_same_event_twice(self):
+        """Test intervals tied on start and event id can be added and removed"""
+        timeline = VenueTimeline("kansas", "Arena", conflict_engine.TransitionTable(transition_lookup))
+        first = conflict_engine.build_interval("wrestling", event("w1", "2025-01-10", "19:00", "21:00"))
+        second = conflict_engine.build_interval("wrestling", event("w1", "2025-01-10", "19:00", "21:00"))
+        timeline.add(first)
+        timeline.add(second)
+        timeline.remove(first)
+        self.assertEqual([entry[-1] for entry in timeline._by_start], [second])
+
+if __name__ == '__main__':
+    unittest.main()
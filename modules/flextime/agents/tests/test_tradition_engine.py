@@ -0,0 +1,77 @@
+import os
+import sys
+import datetime
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+import tradition_engine
+from historical_patterns_agent import validate_schedule_against_traditions, get_tradition_rules, tradition_rule_specs
+
+def game(home, away, date):
+    return {"home_team": home, "away_team": away, "date": date}
+
+class TestTraditionEngine(unittest.TestCase):
+    """Test cases for the compiled tradition rules"""
+
+    def test_phrase_windows(self):
+        """"and" needs every part, "/" allows any alternative and weekdays narrow a part"""
+        parts = tradition_engine.phrase_windows("Mid-January and early February", [2027])
+        self.assertEqual([part for part, _, _ in parts], ["Mid-January", "early February"])
+        _, windows, _ = tradition_engine.phrase_windows("January/February", [2027])[0]
+        self.assertEqual(windows, [(datetime.date(2027, 1, 1), datetime.date(2027, 1, 31)),
+                                   (datetime.date(2027, 2, 1), datetime.date(2027, 2, 28))])
+        _, _, weekdays = tradition_engine.phrase_windows("Monday night in January", [2027])[0]
+        self.assertEqual(weekdays, {0})
+        _, windows, _ = tradition_engine.phrase_windows("Black Friday", [2027])[0]
+        self.assertEqual(windows, [(datetime.date(2027, 11, 26), datetime.date(2027, 11, 26))])
+
+    def test_validation_reports_schedule_violations(self):
+        """Only traditions the proposed games actually break are reported"""
+        games = [
+            game("kansas", "kansas_state", "2027-11-27"),
+            game("oklahoma_state", "texas_tech", "2027-11-25"),
+            game("kansas", "iowa_state", "2027-10-23"),
+            game("iowa_state", "kansas_state", "2027-11-26"),
+            game("texas_tech", "kansas", "2027-10-02"),
+            game("oklahoma_state", "kansas", "2027-10-09"),
+        ]
+        validation = validate_schedule_against_traditions("football", {"games": games})
+        self.assertTrue(validation["is_valid"])
+        self.assertEqual(validation["warnings"], [])
+        self.assertEqual(validation["adherence_score"], 100)
+
+        games[0] = game("kansas", "kansas_state", "2027-11-06")
+        games.append(game("tcu", "kansas", "2027-10-16"))
+        validation = validate_schedule_against_traditions("football", {"games": games})
+        self.assertFalse(validation["is_valid"])
+        self.assertEqual([v["type"] for v in validation["violations"]], ["Rivalry Weekend"])
+        self.assertEqual(validation["violations"][0]["description"],
+                         "Kansas vs Kansas State (Sunflower Showdown) played 2027-11-06, not Thanksgiving Weekend")
+        self.assertEqual([w["description"] for w in validation["warnings"]], ["Kansas has 3 consecutive away games"])
+        self.assertEqual(validation["adherence_score"], 100 - 15 - 5)
+
+    def test_one_date_rule_per_pair(self):
+        """A rivalry weekend replaces the rivalry's own traditional date instead of adding a second rule"""
+        for sport in ("football", "mbasketball", "wbasketball"):
+            specs = [spec for spec in tradition_rule_specs(sport) if spec["severity"] == "High"]
+            pairs = [frozenset(spec["teams"]) for spec in specs]
+            self.assertEqual(len(pairs), len(set(pairs)))
+
+        west_virginia = next(spec for spec in tradition_rule_specs("football")
+                             if set(spec["teams"]) == {"west_virginia", "cincinnati"})
+        self.assertEqual((west_virginia["name"], west_virginia["phrase"]), ("Eastern Division Rivalry", "Thanksgiving Weekend"))
+
+    def test_batch_score_matches_single(self):
+        """Scoring a batch gives each schedule the same score as scoring it alone"""
+        rules = get_tradition_rules("football", (2027,))
+        good = rules.encode([game("kansas", "kansas_state", "2027-11-27"), game("baylor", "tcu", "2027-10-30")])
+        bad = rules.encode([game("kansas", "kansas_state", "2027-09-04"), game("baylor", "tcu", "2027-09-11")])
+        batch = [np.stack([g, b]) for g, b in zip(good, bad)]
+        self.assertEqual(rules.score(*batch).tolist(), [rules.score(*good)[0], rules.score(*bad)[0]])
+        self.assertLess(rules.score(*bad)[0], rules.score(*good)[0])
+
+if __name__ == "__main__":
+    unittest.main()
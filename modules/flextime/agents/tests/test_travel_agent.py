@@ -0,0 +1,44 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import travel_agent
+
+TRIPS = [
+    {"origin": "kansas", "destination": "ucf", "sport": "football", "event_date": "2025-10-04"},
+    {"origin": "kansas", "destination": "kansas_state", "sport": "mbasketball", "event_date": "2025-01-10"},
+    {"origin": "utah", "destination": "west_virginia", "sport": "volleyball", "event_date": "2025-10-01"},
+    {"origin": "baylor", "destination": "tcu", "sport": "baseball", "event_date": "2025-04-11"},
+    {"origin": "byu", "destination": "cincinnati", "sport": "wtennis", "event_date": "2025-03-20", "return_date": "2025-03-23"}
+]
+
+class TestSeasonTravelBudget(unittest.TestCase):
+    """Test cases for batch season budgeting"""
+
+    def setUp(self):
+        """Budget the trip table once"""
+        self.season = travel_agent.calculate_season_travel_budget(TRIPS)
+
+    def test_matches_single_trip_budget(self):
+        """Test each trip matches the single-trip plan and budget"""
+        for i, trip in enumerate(TRIPS):
+            plan = travel_agent.create_travel_plan(trip["origin"], trip["destination"], trip["sport"],
+                                                   trip["event_date"], trip.get("return_date"), include_weather=False)
+            budget = travel_agent.calculate_travel_budget(plan)
+            row = self.season["trips"].iloc[i]
+
+            self.assertEqual(row["mode"], plan["transportation"]["recommended_mode"])
+            self.assertAlmostEqual(row["total"], budget["total"], places=6)
+            self.assertAlmostEqual(row["lodging"], budget["lodging"], places=6)
+
+    def test_rollups(self):
+        """Test per-school and per-sport rollups add up to the total"""
+        total = self.season["total"]["total"]
+        self.assertAlmostEqual(self.season["by_school"]["total"].sum(), total, places=6)
+        self.assertAlmostEqual(self.season["by_sport"]["total"].sum(), total, places=6)
+        self.assertEqual(self.season["by_school"].loc["kansas", "trips"], 2)
+
+if __name__ == '__main__':
+    unittest.main()
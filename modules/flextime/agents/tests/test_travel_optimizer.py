@@ -0,0 +1,81 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from distance_engine import DistanceMatrix
+import travel_optimizer
+import compass_integration_agent
+
+# Three schools on a line: a -- 100 -- b -- 100 -- c (before the road factor)
+MATRIX = DistanceMatrix.from_coordinates({"a": (40.0, -100.0), "b": (40.0, -98.69), "c": (40.0, -97.38)})
+MATRIX_12 = DistanceMatrix.from_coordinates({f"s{i}": (35.0 + i % 4, -100.0 + i) for i in range(12)})
+
+class TestTravelOptimizer(unittest.TestCase):
+    """Test cases for the travel optimizer"""
+
+    def test_cost_components(self):
+        """Test miles, longest trip and road streaks for a known schedule"""
+        games = [
+            {"round": 1, "home_team": "b", "away_team": "a"},
+            {"round": 2, "home_team": "c", "away_team": "a"},
+            {"round": 3, "home_team": "a", "away_team": "b"}
+        ]
+        problem = travel_optimizer.TravelProblem(games, MATRIX, max_consecutive_away=1)
+        slots, flips = problem.identity()
+        result = problem.evaluate(slots[None], flips[None])
+
+        ab, bc, ac = MATRIX.distance("a", "b"), MATRIX.distance("b", "c"), MATRIX.distance("a", "c")
+        # a: a -> b -> c -> a; b: home, home (bye), a, home; c: home (bye) throughout
+        self.assertAlmostEqual(float(result["total_miles"][0]), ab + bc + ac + 2 * ab, places=2)
+        self.assertAlmostEqual(float(result["longest_trip"][0]), ab + bc + ac, places=2)
+        self.assertEqual(int(result["max_streak"][0]), 2)
+        self.assertEqual(int(result["streak_violations"][0]), 1)
+
+    def test_optimize_keeps_games_and_balance(self):
+        """Test optimizing keeps every matchup, home counts and locked games"""
+        schedule = travel_optimizer.round_robin_schedule(["a", "b", "c", "d"])
+        schedule["games"][0]["locked"] = True
+        matrix = DistanceMatrix.from_coordinates({"a": (40.0, -100.0), "b": (41.0, -90.0), "c": (35.0, -95.0), "d": (30.0, -85.0)})
+
+        result = travel_optimizer.optimize_schedule(schedule, time_budget=0.2, workers=1, seed=1, matrix=matrix)
+        pairs = lambda games: sorted(tuple(sorted((g["home_team"], g["away_team"]))) for g in games)
+        self.assertEqual(pairs(result["games"]), pairs(schedule["games"]))
+        self.assertEqual(result["optimizationMetrics"]["homeGamesChanged"], 0)
+        self.assertIn(schedule["games"][0], result["games"])
+
+        cost = result["optimizationMetrics"]["cost"]
+        self.assertLessEqual(cost["optimized"], cost["original"])
+        self.assertGreater(result["search"]["candidates_evaluated"], 0)
+
+    def test_games_come_out_in_round_order(self):
+        """Test integer rounds past 9 are ordered numerically"""
+        schedule = travel_optimizer.round_robin_schedule([f"s{i}" for i in range(12)])
+        result = travel_optimizer.optimize_schedule(schedule, time_budget=0.1, workers=1, seed=0, matrix=MATRIX_12)
+        rounds = [game["round"] for game in result["games"]]
+        self.assertGreater(max(rounds), 10)
+        self.assertEqual(rounds, sorted(rounds))
+
+class TestSampleOptimization(unittest.TestCase):
+    """Test cases for the optimization answered to chat queries"""
+
+    def setUp(self):
+        self.budget = compass_integration_agent.SAMPLE_TIME_BUDGET
+        compass_integration_agent.SAMPLE_TIME_BUDGET = 0.2
+        compass_integration_agent._sample_optimization = None
+
+    def tearDown(self):
+        compass_integration_agent.SAMPLE_TIME_BUDGET = self.budget
+        compass_integration_agent._sample_optimization = None
+
+    def test_queries_share_one_search(self):
+        """Test repeated optimization queries reuse the result for the same distance matrix"""
+        first = compass_integration_agent.get_sample_optimization()
+        response = compass_integration_agent.process_user_query("optimize the basketball schedule for travel")
+
+        self.assertIs(compass_integration_agent.get_sample_optimization(), first)
+        self.assertIn(f"{first['search']['candidates_evaluated']:,}", response)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from venue_calendar import VenueCalendar
+
+def arena(school, sport):
+    return "Arena"
+
+class TestVenueCalendar(unittest.TestCase):
+    """Test cases for the SQLite venue calendar"""
+
+    def setUp(self):
+        """Book one evening game with a 3 hour setup and 1 hour teardown"""
+        self.calendar = VenueCalendar(None)
+        self.calendar.add_booking("kansas", "Arena", "mbasketball", {
+            "date": "2025-02-15", "start_time": "18:00", "end_time": "21:00",
+            "setup_minutes": 180, "teardown_minutes": 60, "description": "Men's Basketball vs. Baylor"
+        })
+
+    def test_conflicts_include_setup_and_teardown(self):
+        """The busy window runs from setup start to teardown end"""
+        self.assertEqual(len(self.calendar.conflicts("kansas", "Arena", "2025-02-15", "14:00", "15:30")), 1)
+        self.assertEqual(len(self.calendar.conflicts("kansas", "Arena", "2025-02-15", "21:30", "01:00")), 1)
+        self.assertEqual(self.calendar.conflicts("kansas", "Arena", "2025-02-15", "12:00", "15:00"), [])
+        self.assertEqual(self.calendar.conflicts("kansas", "Other Arena", "2025-02-15", "18:00", "21:00"), [])
+
+    def test_free_windows(self):
+        """Free windows surround the busy window; the next free window skips it"""
+        self.assertEqual(self.calendar.free_windows("kansas", "Arena", "2025-02-15", "2025-02-15"), [
+            {"start": "2025-02-15 00:00", "end": "2025-02-15 15:00"},
+            {"start": "2025-02-15 22:00", "end": "2025-02-16 00:00"}
+        ])
+        self.assertEqual(self.calendar.next_free_window("kansas", "Arena", "2025-02-15", "13:00", 180),
+                         {"start": "2025-02-15 22:00", "end": "2025-02-16 01:00"})
+        self.assertEqual(self.calendar.next_free_window("kansas", "Arena", "2025-02-15", "10:00", 120),
+                         {"start": "2025-02-15 10:00", "end": "2025-02-15 12:00"})
+
+    def test_bulk_load_and_sweep(self):
+        """Reloading a source replaces it; the sweep reports candidate events on booked windows"""
+        season = {"wbasketball": [
+            {"id": "w1", "home_team": "kansas", "date": "2025-02-16", "start_time": "14:00"},
+            {"id": "w2", "home_team": "kansas", "date": "2025-02-18", "start_time": "19:00"}
+        ]}
+        self.assertEqual(self.calendar.load_schedules(season, arena, source="season"), 2)
+        self.assertEqual(self.calendar.load_schedules(season, arena, source="season"), 2)
+        self.assertEqual(len(self.calendar.free_windows("kansas", "Arena", "2025-02-16", "2025-02-18")), 3)
+
+        candidate = {"volleyball": [
+            {"id": "v1", "home_team": "kansas", "date": "2025-02-15", "start_time": "14:00"},
+            {"id": "v2", "home_team": "kansas", "date": "2025-02-16", "start_time": "10:00"},
+            {"id": "v3", "home_team": "kansas", "date": "2025-02-18", "start_time": "20:00"}
+        ]}
+        conflicts = self.calendar.sweep(candidate, arena, setup_minutes={"volleyball": 60})
+        self.assertEqual([(c["event_id"], c["conflicts_with"]["date"]) for c in conflicts],
+                         [("v1", "2025-02-15"), ("v3", "2025-02-18")])
+        self.assertEqual(self.calendar.sweep(season, arena, exclude_source="season"), [])
+
+if __name__ == '__main__':
+    unittest.main()
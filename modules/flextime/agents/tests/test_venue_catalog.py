@@ -0,0 +1,71 @@
+import os
+import sys
+import json
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import venue_catalog
+from venue_catalog import VenueCatalog
+
+VENUES = {
+    "schools": {
+        "kansas": {
+            "name": "University of Kansas",
+            "venues": [
+                {
+                    "name": "Allen Fieldhouse",
+                    "sports": ["mbasketball", "wbasketball", "volleyball"],
+                    "transition_times": {"basketball_to_volleyball": 2, "volleyball_to_basketball": 3}
+                },
+                {"name": "Horejsi Center", "sports": ["volleyball"]}
+            ]
+        }
+    }
+}
+
+class TestVenueCatalog(unittest.TestCase):
+    """Test cases for the shared venue catalog"""
+
+    def setUp(self):
+        """Write a small venue file"""
+        handle, self.path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(handle, 'w') as f:
+            json.dump(VENUES, f)
+        self.catalog = VenueCatalog(self.path)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_indexes(self):
+        """Test lookups by school/sport, school/name and sport"""
+        self.assertEqual(self.catalog.venue_for("kansas", "volleyball")["name"], "Allen Fieldhouse")
+        self.assertEqual(self.catalog.venue("kansas", "Horejsi Center")["sports"], ["volleyball"])
+        self.assertEqual(len(self.catalog.venues_for_sport("volleyball")), 2)
+        self.assertIsNone(self.catalog.venue_for("kansas", "football"))
+
+    def test_transition_hours(self):
+        """Test basketball sports share the venue's basketball transition times"""
+        self.assertEqual(self.catalog.transition_hours("kansas", "Allen Fieldhouse", "wbasketball", "volleyball"), 2)
+        self.assertEqual(self.catalog.transition_hours("kansas", "Allen Fieldhouse", "volleyball", "mbasketball"), 3)
+        self.assertIsNone(self.catalog.transition_hours("kansas", "Horejsi Center", "volleyball", "volleyball"))
+
+    def test_reload_on_change(self):
+        """Test the catalog re-reads the file when its modification time changes"""
+        data = json.loads(json.dumps(VENUES))
+        data["schools"]["kansas"]["venues"][1]["sports"].append("wrestling")
+        with open(self.path, 'w') as f:
+            json.dump(data, f)
+        stat = os.stat(self.path)
+        os.utime(self.path, (stat.st_atime, stat.st_mtime + 5))
+
+        interval = venue_catalog.RELOAD_CHECK_INTERVAL
+        venue_catalog.RELOAD_CHECK_INTERVAL = 0
+        try:
+            self.assertEqual(self.catalog.venue_for("kansas", "wrestling")["name"], "Horejsi Center")
+        finally:
+            venue_catalog.RELOAD_CHECK_INTERVAL = interval
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import venue_compliance
+from venue_catalog import VenueCatalog
+from sports.basketball_agent import BasketballAgent
+from sports.volleyball_agent import VolleyballAgent
+
+class ManualBasketballAgent(BasketballAgent):
+    def _load_manual(self):
+        return {'version': '2024', 'venue': {'court': {'length': 94, 'width': 50, 'unit': 'feet',
+                                                       'requiredMarkings': ['key']}}}
+
+class ManualVolleyballAgent(VolleyballAgent):
+    def _load_manual(self):
+        return {'version': '2024', 'venue': {'ceiling': {'minimumHeight': 23, 'unit': 'feet'},
+                                             'court': {'requiredMarkings': ['attack_line']}}}
+
+ARENA = {'name': 'Arena', 'sports': ['mbasketball', 'volleyball'], 'ceiling_height': 30,
+         'markings': ['attack_line', 'key'], 'dimensions': {'length': 94, 'width': 50}}
+GYM = {'name': 'Gym', 'sports': ['volleyball'], 'ceiling_height': 25}
+
+class TestVenueCompliance(unittest.TestCase):
+    """Test cases for the venue x sport compliance matrix"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.path = os.path.join(self.root, 'venues.json')
+        self.cache = os.path.join(self.root, 'cache')
+        self.write({'kansas': [ARENA], 'utah': [GYM]})
+        basketball = ManualBasketballAgent()
+        self.agents = {'mbasketball': basketball, 'volleyball': ManualVolleyballAgent()}
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def write(self, venues):
+        with open(self.path, 'w') as f:
+            json.dump({'schools': {school: {'name': school, 'venues': v} for school, v in venues.items()}}, f)
+
+    def build(self, catalog, **kwargs):
+        return venue_compliance.build_compliance_matrix(catalog, agents=self.agents, cache_dir=self.cache,
+                                                        sports=['football', 'mbasketball', 'volleyball'], **kwargs)
+
+    def test_cells_follow_manual_checks(self):
+        """Each cell reflects the checks the venue has data for"""
+        matrix = self.build(VenueCatalog(self.path))
+        self.assertEqual(matrix.cell('kansas', 'Arena', 'volleyball'), 'compliant')
+        self.assertEqual(matrix.cell('kansas', 'Arena', 'mbasketball'), 'incomplete')
+        self.assertEqual(matrix.cell('kansas', 'Arena', 'football'), 'unavailable')
+        self.assertEqual(matrix.cell('utah', 'Gym', 'volleyball'), 'incomplete')
+        self.assertEqual(matrix.venues_with('volleyball'), [('kansas', 'Arena')])
+
+    def test_only_changed_rows_are_recomputed(self):
+        """A rebuild re-evaluates just the venue records that changed"""
+        catalog = VenueCatalog(self.path)
+        first = self.build(catalog)
+        self.assertEqual(len(first.recomputed), 2)
+        self.assertEqual(self.build(VenueCatalog(self.path)).recomputed, [])
+
+        self.write({'kansas': [dict(ARENA, dimensions={'length': 90, 'width': 50})], 'utah': [GYM]})
+        catalog.refresh(force=True)
+        changed = self.build(catalog, previous=first)
+        self.assertEqual(changed.recomputed, [('kansas', 'Arena')])
+        self.assertEqual(changed.cell('kansas', 'Arena', 'mbasketball'), 'non_compliant')
+        self.assertEqual([issue['type'] for issue in changed.issues('kansas', 'Arena', 'mbasketball')], ['court_length'])
+
+if __name__ == '__main__':
+    unittest.main()
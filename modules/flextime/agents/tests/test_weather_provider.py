@@ -0,0 +1,67 @@
+import os
+import sys
+import shutil
+import datetime
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from weather_provider import WeatherProvider, synthesize_forecasts, forecast_ttl
+
+NOW = datetime.datetime(2025, 9, 1, 12, 0).timestamp()
+
+class TestWeatherProvider(unittest.TestCase):
+    """Test cases for the cached weather provider"""
+
+    def setUp(self):
+        """Set up a provider on a temporary store with a counting fetcher"""
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "weather.sqlite")
+        self.calls = []
+        self.now = NOW
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def provider(self):
+        def fetcher(schools, start_date, end_date):
+            self.calls.append((tuple(schools), start_date, end_date))
+            return synthesize_forecasts(schools, start_date, end_date)
+        return WeatherProvider(self.path, fetcher, clock=lambda: self.now)
+
+    def test_bulk_fetch_once(self):
+        """Test a season of lookups is one fetch, then served from cache"""
+        provider = self.provider()
+        pairs = [("baylor", "2025-09-06"), ("kansas", "2025-10-18"), ("utah", "2025-11-29")]
+        forecasts = provider.lookup(pairs)
+        self.assertEqual(set(forecasts), set(pairs))
+        self.assertEqual(self.calls, [(("baylor", "kansas", "utah"), "2025-09-06", "2025-11-29")])
+
+        provider.lookup(pairs)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_store_survives_restart(self):
+        """Test a new provider on the same store does not refetch"""
+        self.provider().get_forecast("tcu", "2025-09-01", "2025-09-07")
+        provider = self.provider()
+        forecasts = provider.get_forecast("tcu", "2025-09-02", "2025-09-03")
+        self.assertEqual([f["date"] for f in forecasts], ["2025-09-02", "2025-09-03"])
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(provider.stats["store_hits"], 2)
+
+    def test_ttl_by_lead_time(self):
+        """Test near-term forecasts expire sooner than long-range ones"""
+        provider = self.provider()
+        provider.lookup([("byu", "2025-09-02"), ("byu", "2025-12-01")])
+
+        self.now += 2 * 60 * 60
+        provider.lookup([("byu", "2025-09-02"), ("byu", "2025-12-01")])
+        self.assertEqual(self.calls[-1], (("byu",), "2025-09-02", "2025-09-02"))
+
+        today = datetime.date(2025, 9, 1)
+        self.assertIsNone(forecast_ttl(datetime.date(2025, 8, 1), today))
+        self.assertLess(forecast_ttl(today, today), forecast_ttl(datetime.date(2025, 12, 1), today))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Tradition Engine
+
+Compiled tradition rules for the historical patterns agent. Traditional-date
+phrases ("Late November", "Thanksgiving weekend", "Mid-January and early
+February", "Season Finale") are turned once per sport and season range into
+day-ordinal lookup tables, and every rule, plus the consecutive-away limit,
+is then checked against a whole batch of candidate schedules in one numpy
+pass, fast enough to serve as a generator's objective.
+
+Part of the XII-OS FlexTime module.
+"""
+
+import re
+import datetime
+import calendar
+from typing import Dict, List, Any, Optional, Tuple, Iterable
+
+import numpy as np
+
+import scheduling_core
+
+FINALE_PHRASES = ("season finale", "final weekend")
+VIOLATION_SEVERITY = "High"       # rules at this severity are violations, the rest warnings
+VIOLATION_PENALTY = 15            # adherence points lost per violation
+WARNING_PENALTY = 5               # adherence points lost per warning
+
+Window = Tuple[datetime.date, datetime.date]
+
+def display_name(team: str) -> str:
+    """Readable school name for a team code ("kansas_state" -> "Kansas State", "tcu" -> "TCU")"""
+    return team.upper() if len(team) <= 3 else team.replace("_", " ").title()
+
+def _alternative_window(text: str, year: int) -> Optional[Window]:
+    lowered = text.lower()
+    day = scheduling_core.thanksgiving(year)
+    if "black friday" in lowered:
+        return day + datetime.timedelta(days=1), day + datetime.timedelta(days=1)
+    if "thanksgiving day" in lowered:
+        return day, day
+    window = scheduling_core.tradition_window(text, year)
+    if window is not None:
+        return window
+    match = re.search("(" + "|".join(scheduling_core.MONTHS) + ")", lowered)
+    if not match:
+        return None
+    month = scheduling_core.MONTHS.index(match.group(1)) + 1
+    return datetime.date(year, month, 1), datetime.date(year, month, calendar.monthrange(year, month)[1])
+
+def phrase_windows(phrase: str, years: Iterable[int]) -> List[Tuple[str, List[Window], Optional[set]]]:
+    """
+    Date windows required by a traditional-date phrase
+
+    "and" separates windows that each need a game ("Mid-January and early
+    February"); "/" separates alternatives ("January/February"). A weekday
+    in a part restricts it to that day ("Monday night in January").
+
+    Args:
+        phrase: Traditional-date phrase
+        years: Years the windows may fall in
+
+    Returns:
+        List of (part text, alternative (first, last) windows, allowed weekdays or None);
+        parts naming no period are left out
+    """
+    parts = []
+    for part in re.split(r"\band\b", phrase, flags=re.IGNORECASE):
+        part = part.strip()
+        windows = [window for alternative in part.split("/") for year in years
+                   for window in [_alternative_window(alternative, year)] if window is not None]
+        if not windows:
+            continue
+        weekdays = {i for i, day in enumerate(scheduling_core.WEEKDAYS) if day.lower() in part.lower()}
+        parts.append((part, windows, weekdays or None))
+    return parts
+
+class TraditionRules:
+    """
+    Tradition rules for one sport compiled over a range of seasons
+
+    Each rule asks for a meeting of two teams inside a date window (or as
+    both teams' last game of the season). A rule only applies when both of
+    its teams appear in the schedule.
+    """
+
+    def __init__(self, teams: List[str], specs: List[Dict[str, Any]], years: Iterable[int],
+                 away_limit: Optional[int] = None):
+        """
+        Args:
+            teams: Team codes that may appear in schedules
+            specs: Rules as {"teams": [a, b], "name", "phrase", "type", "severity"}
+            years: Years the schedules fall in
+            away_limit: Away games allowed in a row, or None for no limit
+        """
+        self.teams = list(teams)
+        self.team_index = {team: i for i, team in enumerate(self.teams)}
+        self.away_limit = away_limit
+        years = sorted(set(years))
+        self.day0 = datetime.date(years[0], 1, 1).toordinal()
+        span = datetime.date(years[-1], 12, 31).toordinal() - self.day0 + 1
+        weekday = (np.arange(span) + self.day0 - 1) % 7  # date.weekday() of each day in the span
+
+        self.rules = []
+        rows = []
+        for spec in specs:
+            a, b = spec["teams"]
+            if a not in self.team_index or b not in self.team_index:
+                continue
+            if spec["phrase"].lower() in FINALE_PHRASES:
+                self.rules.append(dict(spec, window=spec["phrase"], finale=True))
+                rows.append(np.zeros(span + 1, dtype=bool))
+                continue
+            for part, windows, weekdays in phrase_windows(spec["phrase"], years):
+                allowed = np.zeros(span + 1, dtype=bool)  # the extra last day stands for "outside the span"
+                for first, last in windows:
+                    allowed[max(first.toordinal() - self.day0, 0):max(last.toordinal() - self.day0 + 1, 0)] = True
+                if weekdays:
+                    allowed[:span] &= np.isin(weekday, list(weekdays))
+                self.rules.append(dict(spec, window=part, finale=False))
+                rows.append(allowed)
+
+        n = len(self.teams) + 1
+        pairs = np.array([[self.team_index[t] for t in rule["teams"]] for rule in self.rules], dtype=np.int64).reshape(-1, 2)
+        self.pairs = pairs
+        self.codes = pairs.min(axis=1) * n + pairs.max(axis=1)
+        self.finale = np.array([rule["finale"] for rule in self.rules], dtype=bool)
+        self.allowed = np.array(rows, dtype=bool).reshape(len(self.rules), span + 1)
+        self.penalty = np.array([VIOLATION_PENALTY if rule["severity"] == VIOLATION_SEVERITY else WARNING_PENALTY
+                                 for rule in self.rules], dtype=np.float64)
+
+    def encode(self, games: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Arrays for a schedule's games ({"home_team", "away_team", "date"})
+
+        Returns:
+            Tuple of (home index, away index, day ordinal) arrays; unknown teams are -1
+            and games without a valid date are left out
+        """
+        home, away, day = [], [], []
+        for game in games:
+            try:
+                ordinal = datetime.date.fromisoformat(game["date"]).toordinal()
+            except (KeyError, TypeError, ValueError):
+                continue
+            home.append(self.team_index.get(game.get("home_team"), -1))
+            away.append(self.team_index.get(game.get("away_team"), -1))
+            day.append(ordinal)
+        return (np.array(home, dtype=np.int64), np.array(away, dtype=np.int64), np.array(day, dtype=np.int64))
+
+    def evaluate(self, home: np.ndarray, away: np.ndarray, day: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Check every rule for a batch of schedules
+
+        Args:
+            home, away: Team indices (candidates, games); -1 marks padding or unknown teams
+            day: Day ordinals (candidates, games)
+
+        Returns:
+            Tuple of (missed rules (candidates, rules), longest away run (candidates, teams))
+        """
+        home, away, day = np.atleast_2d(home), np.atleast_2d(away), np.atleast_2d(day)
+        count = home.shape[0]
+        n = len(self.teams)
+        home = np.where(home < 0, n, home)
+        away = np.where(away < 0, n, away)
+
+        team = np.arange(n)[None, :, None]
+        is_home = home[:, None, :] == team
+        is_away = away[:, None, :] == team
+        involved = is_home | is_away
+        present = involved.any(axis=2)
+
+        # Date windows and season finales
+        offset = day - self.day0
+        span = self.allowed.shape[1] - 1
+        in_window = self.allowed[:, np.where((offset >= 0) & (offset < span), offset, span)]
+        last = np.concatenate([np.where(involved, day[:, None, :], -1).max(axis=2, initial=-1),
+                               np.full((count, 1), -2)], axis=1)
+        is_final = (day == np.take_along_axis(last, home, axis=1)) & (day == np.take_along_axis(last, away, axis=1))
+        meets = (np.minimum(home, away) * (n + 1) + np.maximum(home, away))[None] == self.codes[:, None, None]
+        hit = (meets & np.where(self.finale[:, None, None], is_final[None], in_window)).any(axis=2).T
+        applicable = present[:, self.pairs[:, 0]] & present[:, self.pairs[:, 1]]
+        missed = applicable & ~hit
+
+        # Longest run of away games since the last home game
+        order = np.argsort(day, axis=1, kind="stable")[:, None, :]
+        is_home = np.take_along_axis(is_home, order, axis=2)
+        away_count = np.cumsum(np.take_along_axis(is_away, order, axis=2), axis=2)
+        since_home = away_count - np.maximum.accumulate(np.where(is_home, away_count, 0), axis=2)
+        streak = since_home.max(axis=2, initial=0)
+        return missed, streak
+
+    def score(self, home: np.ndarray, away: np.ndarray, day: np.ndarray) -> np.ndarray:
+        """Adherence score (0-100, higher is better) for a batch of schedules"""
+        return self._adherence(*self.evaluate(home, away, day))
+
+    def _adherence(self, missed: np.ndarray, streak: np.ndarray) -> np.ndarray:
+        penalty = missed @ self.penalty
+        if self.away_limit is not None:
+            penalty += WARNING_PENALTY * (streak > self.away_limit).sum(axis=1)
+        return np.clip(100.0 - penalty, 0.0, 100.0)
+
+    def check(self, games: List[Dict[str, Any]], unit: str = "games") -> Dict[str, Any]:
+        """
+        Findings for one schedule
+
+        Args:
+            games: Games with "home_team", "away_team" and "date"
+            unit: What a game is called in messages ("games", "series")
+
+        Returns:
+            Dictionary with "adherence_score" and "findings", each finding carrying
+            "type", "description", "severity", "recommendation", "parameter",
+            "tradition" and "proposed_change"
+        """
+        home, away, day = self.encode(games)
+        missed, streak = self.evaluate(home, away, day)
+        findings = []
+
+        n = len(self.teams) + 1
+        home_code, away_code = np.where(home < 0, n - 1, home), np.where(away < 0, n - 1, away)
+        codes = np.minimum(home_code, away_code) * n + np.maximum(home_code, away_code)
+        for r in np.flatnonzero(missed[0]):
+            rule = self.rules[r]
+            a, b = rule["teams"]
+            matchup = f"{display_name(a)} vs {display_name(b)}"
+            dates = [datetime.date.fromordinal(int(d)).isoformat() for d in np.sort(day[codes == self.codes[r]])]
+            played = f"played {', '.join(dates)}" if dates else "not scheduled"
+            if rule["finale"]:
+                tradition = "Final regular-season game for both teams"
+                recommendation = "Make the game the last of the season for both teams"
+            else:
+                tradition = f"Traditionally played {rule['window']}"
+                recommendation = f"Move the game to its traditional {rule['window']} slot"
+            findings.append({
+                "type": rule["type"],
+                "description": f"{matchup} ({rule['name']}) {played}, not {rule['window']}",
+                "severity": rule["severity"],
+                "recommendation": recommendation,
+                "parameter": f"{matchup} game date",
+                "tradition": tradition,
+                "proposed_change": f"Scheduled for {', '.join(dates)}" if dates else "Not scheduled"
+            })
+
+        if self.away_limit is not None:
+            for t in np.flatnonzero(streak[0] > self.away_limit):
+                name = display_name(self.teams[t])
+                run = f"{streak[0, t]} consecutive away {unit}"
+                findings.append({
+                    "type": "Consecutive Away Games",
+                    "description": f"{name} has {run}",
+                    "severity": "Medium",
+                    "recommendation": f"Restructure to limit to {self.away_limit} consecutive away {unit}",
+                    "parameter": f"Consecutive away {unit} for {name}",
+                    "tradition": f"Maximum {self.away_limit} consecutive away {unit}",
+                    "proposed_change": run
+                })
+
+        return {"adherence_score": float(self._adherence(missed, streak)[0]), "findings": findings}
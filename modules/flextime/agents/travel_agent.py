@@ -14,11 +14,17 @@ import sys
 import json
 import argparse
 import datetime
-import subprocess
 import requests
 import re
 from typing import Dict, List, Any, Optional, Union
 
+import numpy as np
+import pandas as pd
+
+import distance_engine
+import weather_provider
+import agent_runtime
+
 # FlexTime configuration
 FLEXTIME_VERSION = "1.0.0"
 FLEXTIME_MODULE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -145,6 +151,23 @@ TRANSPORTATION_THRESHOLDS = {
     }
 }
 
+# Budget rates used by calculate_travel_budget and calculate_season_travel_budget
+PER_DIEM_RATES = {
+    "Premium": 75,
+    "High": 65,
+    "Medium-High": 60,
+    "Medium": 55,
+    "Low": 45
+}
+DEFAULT_BUDGET_TIER = "Medium"
+DEFAULT_TEAM_SIZE = 30
+AVERAGE_ROOM_RATE = 150          # dollars per room per night
+TEAM_MEAL_RATE = 25              # dollars per person per day, meals not covered by per diem
+INCIDENTALS_RATE = 10            # dollars per person per day
+GROUND_TRANSPORT_SHORT_TRIP = 1000   # bus rental at destination, trips of up to 2 days
+GROUND_TRANSPORT_LONG_TRIP = 1500    # bus rental at destination, longer trips
+FALLBACK_DISTANCE_MILES = 800.0  # used when a school is missing from the distance matrix
+
 # Utility functions
 def get_school_context() -> str:
     """
@@ -168,84 +191,27 @@ def get_school_context() -> str:
 
 def get_travel_distance(origin_school: str, destination_school: str) -> float:
     """
-    Get travel distance between two schools using COMPASS data
+    Get travel distance between two schools from the shared distance matrix
     
     Args:
-        origin_school: Origin school code
-        destination_school: Destination school code
+        origin_school: Origin school code (or "school:venue" key)
+        destination_school: Destination school code (or "school:venue" key)
         
     Returns:
         Distance in miles
     """
     try:
-        # Call the COMPASS integration agent to get distances
-        result = subprocess.run([
-            sys.executable,
-            os.path.join(AGENTS_PATH, "compass_integration_agent.py"),
-            "-p", f"Get travel distance from {origin_school} to {destination_school}"
-        ], capture_output=True, text=True)
-        
-        # Parse the output to extract distance
-        # In a real implementation, we'd parse structured data
-        # For now, return a reasonable mock distance
-        
-        # Mock distances based on regions
-        west_schools = ["arizona", "arizona_state", "colorado", "utah", "byu"]
-        central_schools = ["texas_tech", "tcu", "baylor", "oklahoma_state", "kansas", "kansas_state", "iowa_state"]
-        east_schools = ["west_virginia", "cincinnati"]
-        south_schools = ["houston", "ucf"]
-        
-        if origin_school == destination_school:
-            return 0.0
-        
-        # Cross-region distances
-        if (origin_school in west_schools and destination_school in east_schools) or \
-           (origin_school in east_schools and destination_school in west_schools):
-            return 1800.0 + (hash(origin_school + destination_school) % 400)
-            
-        if (origin_school in west_schools and destination_school in south_schools) or \
-           (origin_school in south_schools and destination_school in west_schools):
-            return 1500.0 + (hash(origin_school + destination_school) % 300)
-            
-        if (origin_school in central_schools and destination_school in east_schools) or \
-           (origin_school in east_schools and destination_school in central_schools):
-            return 900.0 + (hash(origin_school + destination_school) % 200)
-            
-        if (origin_school in central_schools and destination_school in south_schools) or \
-           (origin_school in south_schools and destination_school in central_schools):
-            return 800.0 + (hash(origin_school + destination_school) % 150)
-            
-        if (origin_school in west_schools and destination_school in central_schools) or \
-           (origin_school in central_schools and destination_school in west_schools):
-            return 1000.0 + (hash(origin_school + destination_school) % 200)
-            
-        if (origin_school in south_schools and destination_school in east_schools) or \
-           (origin_school in east_schools and destination_school in south_schools):
-            return 1100.0 + (hash(origin_school + destination_school) % 200)
-        
-        # Within-region distances
-        if origin_school in west_schools and destination_school in west_schools:
-            return 400.0 + (hash(origin_school + destination_school) % 400)
-            
-        if origin_school in central_schools and destination_school in central_schools:
-            return 300.0 + (hash(origin_school + destination_school) % 300)
-            
-        if origin_school in east_schools and destination_school in east_schools:
-            return 300.0 + (hash(origin_school + destination_school) % 100)
-            
-        if origin_school in south_schools and destination_school in south_schools:
-            return 1000.0  # Houston to Orlando
-        
-        # Default case
-        return 800.0 + (hash(origin_school + destination_school) % 700)
-        
+        return distance_engine.get_travel_distance(origin_school, destination_school)
     except Exception as e:
         print(f"Error getting travel distance: {str(e)}", file=sys.stderr)
-        return 800.0  # Default reasonable distance
+        return FALLBACK_DISTANCE_MILES
 
 def get_weather_forecast(school_code: str, start_date: str, end_date: str) -> List[Dict[str, Any]]:
     """
-    Get weather forecast for a school location using the COMPASS agent
+    Get weather forecast for a school location within a date range
+    
+    Forecasts come from the shared weather provider, which caches them per
+    (school, date) in memory and on disk.
     
     Args:
         school_code: School identifier
@@ -256,41 +222,7 @@ def get_weather_forecast(school_code: str, start_date: str, end_date: str) -> Li
         List of weather forecasts for each day
     """
     try:
-        # Call the COMPASS integration agent
-        result = subprocess.run([
-            sys.executable,
-            os.path.join(AGENTS_PATH, "compass_integration_agent.py"),
-            "-p", f"Get weather forecast for {school_code} from {start_date} to {end_date}"
-        ], capture_output=True, text=True)
-        
-        # Parse the output
-        # In a real implementation, we would parse structured data
-        # For now, we'll return a mock forecast
-        
-        # Mock forecast data
-        forecasts = []
-        start = datetime.datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.datetime.strptime(end_date, "%Y-%m-%d")
-        days = (end - start).days + 1
-        
-        for i in range(days):
-            day = start + datetime.timedelta(days=i)
-            day_str = day.strftime("%Y-%m-%d")
-            
-            # Create a mock forecast
-            forecast = {
-                "date": day_str,
-                "school": school_code,
-                "conditions": "Sunny",
-                "temperature": {"high": 75, "low": 60, "unit": "F"},
-                "precipitation": {"chance": 10, "type": "none"},
-                "wind": {"speed": 5, "direction": "NW"},
-                "advisories": []
-            }
-            
-            forecasts.append(forecast)
-        
-        return forecasts
+        return weather_provider.get_provider().get_forecast(school_code, start_date, end_date)
     except Exception as e:
         print(f"Error getting weather forecast: {str(e)}", file=sys.stderr)
         return []
@@ -312,7 +244,7 @@ def recommend_transportation_mode(origin_school: str, destination_school: str, s
     
     # Get sport requirements
     sport_reqs = SPORT_TRAVEL_REQUIREMENTS.get(sport, {})
-    default_team_size = sport_reqs.get("team_size", {}).get("total", 30) if sport_reqs else 30
+    default_team_size = sport_reqs.get("team_size", {}).get("total", DEFAULT_TEAM_SIZE) if sport_reqs else DEFAULT_TEAM_SIZE
     actual_team_size = team_size if team_size is not None else default_team_size
     
     # Get preferred transportation from sport requirements
@@ -385,7 +317,7 @@ def recommend_transportation_mode(origin_school: str, destination_school: str, s
     return recommendation
 
 def create_travel_plan(origin_school: str, destination_school: str, sport: str, 
-                      event_date: str, return_date: str = None) -> Dict[str, Any]:
+                      event_date: str, return_date: str = None, include_weather: bool = True) -> Dict[str, Any]:
     """
     Create a comprehensive travel plan for a team trip
     
@@ -395,6 +327,7 @@ def create_travel_plan(origin_school: str, destination_school: str, sport: str,
         sport: Sport code
         event_date: Date of event (YYYY-MM-DD)
         return_date: Return date (YYYY-MM-DD), if None will calculate based on sport
+        include_weather: Fetch the destination forecast (skip when only budgeting)
         
     Returns:
         Dictionary with complete travel plan
@@ -430,7 +363,7 @@ def create_travel_plan(origin_school: str, destination_school: str, sport: str,
     lodging_needs = sport_reqs.get("typical_lodging_needs", "15-20 hotel rooms")
     
     # Get weather forecast for the destination
-    weather = get_weather_forecast(destination_school, departure_date, return_date)
+    weather = get_weather_forecast(destination_school, departure_date, return_date) if include_weather else []
     
     # Create the travel plan
     plan = {
@@ -446,7 +379,7 @@ def create_travel_plan(origin_school: str, destination_school: str, sport: str,
             "airport_name": SCHOOL_AIRPORTS.get(destination_school, {}).get("name", "")
         },
         "sport": sport,
-        "team_size": sport_reqs.get("team_size", {}).get("total", 30) if sport_reqs else 30,
+        "team_size": sport_reqs.get("team_size", {}).get("total", DEFAULT_TEAM_SIZE) if sport_reqs else DEFAULT_TEAM_SIZE,
         "dates": {
             "departure": departure_date,
             "event": event_date,
@@ -483,7 +416,7 @@ def calculate_travel_budget(travel_plan: Dict[str, Any]) -> Dict[str, float]:
         Dictionary with budget details
     """
     # Extract relevant values
-    team_size = travel_plan.get("team_size", 30)
+    team_size = travel_plan.get("team_size", DEFAULT_TEAM_SIZE)
     sport = travel_plan.get("sport", "")
     transport_cost = travel_plan.get("transportation", {}).get("estimated_cost", 0)
     
@@ -494,31 +427,22 @@ def calculate_travel_budget(travel_plan: Dict[str, Any]) -> Dict[str, float]:
     
     # Per diem rates based on sport tier
     sport_reqs = SPORT_TRAVEL_REQUIREMENTS.get(sport, {})
-    budget_tier = sport_reqs.get("budget_tier", "Medium")
-    
-    per_diem_rates = {
-        "Premium": 75,
-        "High": 65,
-        "Medium-High": 60,
-        "Medium": 55,
-        "Low": 45
-    }
+    budget_tier = sport_reqs.get("budget_tier", DEFAULT_BUDGET_TIER)
     
-    per_diem = per_diem_rates.get(budget_tier, 55)
+    per_diem = PER_DIEM_RATES.get(budget_tier, PER_DIEM_RATES[DEFAULT_BUDGET_TIER])
     
     # Lodging costs
-    avg_room_rate = 150  # Average room rate per night
     rooms_needed = int(team_size / 2) + 5  # Double occupancy plus staff rooms
-    lodging_cost = rooms_needed * avg_room_rate * (days - 1)  # -1 because return day typically doesn't need lodging
+    lodging_cost = rooms_needed * AVERAGE_ROOM_RATE * (days - 1)  # -1 because return day typically doesn't need lodging
     
     # Meals not covered by per diem (e.g., team meals)
-    team_meals_cost = team_size * 25 * days  # $25 per person per day for team meals
+    team_meals_cost = team_size * TEAM_MEAL_RATE * days
     
     # Ground transportation at destination
-    ground_transport_cost = 1000 if days <= 2 else 1500  # Estimated bus rental at destination
+    ground_transport_cost = GROUND_TRANSPORT_SHORT_TRIP if days <= 2 else GROUND_TRANSPORT_LONG_TRIP
     
     # Incidentals
-    incidentals = team_size * 10 * days  # $10 per person per day
+    incidentals = team_size * INCIDENTALS_RATE * days
     
     # Per diem
     per_diem_cost = team_size * per_diem * days
@@ -544,6 +468,164 @@ def calculate_travel_budget(travel_plan: Dict[str, Any]) -> Dict[str, float]:
     
     return budget
 
+def build_season_trips(schedules: Dict[str, List[Dict[str, Any]]]) -> pd.DataFrame:
+    """
+    Build the season trip table from schedules
+    
+    Every event with a home team and an away team ("away_team" or "opponent")
+    becomes one trip for the away team.
+    
+    Args:
+        schedules: Dictionary of schedules by sport
+        
+    Returns:
+        DataFrame with origin, destination, sport and event_date columns
+        (plus return_date and team_size where events provide them)
+    """
+    rows = []
+    for sport, events in schedules.items():
+        for event in events:
+            away = event.get("away_team") or event.get("opponent")
+            if not away or not event.get("home_team") or not event.get("date"):
+                continue
+            row = {"origin": away, "destination": event["home_team"], "sport": sport, "event_date": event["date"]}
+            if event.get("return_date"):
+                row["return_date"] = event["return_date"]
+            if event.get("team_size"):
+                row["team_size"] = event["team_size"]
+            rows.append(row)
+    
+    return pd.DataFrame(rows, columns=None if rows else ["origin", "destination", "sport", "event_date"])
+
+def calculate_season_travel_budget(trips: Union[pd.DataFrame, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Budget a whole season of trips at once
+    
+    Applies the same transportation, date and cost rules as
+    recommend_transportation_mode, create_travel_plan and calculate_travel_budget,
+    as column operations over the whole trip table.
+    
+    Args:
+        trips: Trip table (DataFrame or list of dicts) with origin, destination,
+            sport and event_date columns, and optional return_date and team_size
+        
+    Returns:
+        Dictionary with:
+            "trips": per-trip DataFrame (mode, distance, dates and cost breakdown)
+            "by_school": costs summed per travelling school
+            "by_sport": costs summed per sport
+            "total": conference-wide totals
+    """
+    trips = pd.DataFrame(trips).reset_index(drop=True)
+    cost_columns = ["transportation", "lodging", "per_diem", "team_meals", "ground_transportation", "incidentals", "total"]
+    
+    if trips.empty:
+        empty = pd.DataFrame(columns=["trips", "distance"] + cost_columns)
+        return {"trips": trips, "by_school": empty, "by_sport": empty,
+                "total": {column: 0.0 for column in ["trips", "distance"] + cost_columns}}
+    
+    # Distances from the shared matrix, with the single-trip fallback for unknown schools
+    matrix = distance_engine.get_distance_matrix()
+    origin_idx = trips["origin"].map(matrix.index)
+    destination_idx = trips["destination"].map(matrix.index)
+    known = (origin_idx.notna() & destination_idx.notna()).to_numpy()
+    distance = np.full(len(trips), FALLBACK_DISTANCE_MILES)
+    distance[known] = matrix.miles[origin_idx[known].astype(int), destination_idx[known].astype(int)]
+    
+    # Sport attributes
+    sport = trips["sport"]
+    default_size = sport.map({s: r.get("team_size", {}).get("total", DEFAULT_TEAM_SIZE) for s, r in SPORT_TRAVEL_REQUIREMENTS.items()})
+    team_size = default_size.fillna(DEFAULT_TEAM_SIZE)
+    if "team_size" in trips:
+        team_size = trips["team_size"].fillna(team_size)
+    team_size = team_size.to_numpy(dtype=float)
+    heavy = sport.map({s: r.get("equipment_needs", "").startswith("Heavy") for s, r in SPORT_TRAVEL_REQUIREMENTS.items()}).fillna(False).to_numpy(dtype=bool)
+    tier = sport.map({s: r.get("budget_tier", DEFAULT_BUDGET_TIER) for s, r in SPORT_TRAVEL_REQUIREMENTS.items()}).fillna(DEFAULT_BUDGET_TIER)
+    per_diem_rate = tier.map(PER_DIEM_RATES).fillna(PER_DIEM_RATES[DEFAULT_BUDGET_TIER]).to_numpy(dtype=float)
+    
+    # Transportation mode (same precedence as recommend_transportation_mode)
+    is_football = (sport == "football").to_numpy()
+    mode = np.select(
+        [
+            is_football & (distance > 200),
+            distance <= TRANSPORTATION_THRESHOLDS["bus"]["max_distance"],
+            (distance >= TRANSPORTATION_THRESHOLDS["commercial_air"]["min_distance"]) & (team_size <= 40),
+            (distance >= TRANSPORTATION_THRESHOLDS["charter_air"]["min_distance"]) & ((team_size > 40) | heavy),
+            distance >= TRANSPORTATION_THRESHOLDS["charter_air"]["min_distance"]
+        ],
+        ["charter_air", "bus", "commercial_air", "charter_air", "commercial_air"],
+        default=""
+    )
+    
+    flight_time = distance / 500 + 0.5
+    transportation = np.select(
+        [mode == "bus", mode == "commercial_air", mode == "charter_air"],
+        [distance * TRANSPORTATION_THRESHOLDS["bus"]["cost_per_mile"] * 2,
+         team_size * TRANSPORTATION_THRESHOLDS["commercial_air"]["cost_per_person"] * 2,
+         flight_time * TRANSPORTATION_THRESHOLDS["charter_air"]["cost_per_hour"] * 2],
+        default=0.0
+    )
+    travel_time = np.select(
+        [mode == "bus", mode == "commercial_air", mode == "charter_air"],
+        [distance / 60.0 + 0.5, 2 + distance / 500, flight_time + 1],
+        default=0.0
+    )
+    
+    # Dates (same defaults as create_travel_plan)
+    event = pd.to_datetime(trips["event_date"], format="%Y-%m-%d")
+    departure = event - pd.Timedelta(days=1)
+    series_days = np.where(sport.isin(["baseball", "softball"]), 2, 1)
+    return_date = event + pd.to_timedelta(series_days, unit="D")
+    if "return_date" in trips:
+        given = pd.to_datetime(trips["return_date"], format="%Y-%m-%d")
+        return_date = given.fillna(return_date)
+    days = ((return_date - departure).dt.days + 1).to_numpy()
+    
+    # Costs (same rates as calculate_travel_budget)
+    rooms = np.floor(team_size / 2) + 5
+    lodging = rooms * AVERAGE_ROOM_RATE * (days - 1)
+    team_meals = team_size * TEAM_MEAL_RATE * days
+    ground = np.where(days <= 2, GROUND_TRANSPORT_SHORT_TRIP, GROUND_TRANSPORT_LONG_TRIP)
+    incidentals = team_size * INCIDENTALS_RATE * days
+    per_diem = team_size * per_diem_rate * days
+    
+    result = pd.DataFrame({
+        "origin": trips["origin"],
+        "destination": trips["destination"],
+        "sport": sport,
+        "event_date": trips["event_date"],
+        "departure": departure.dt.strftime("%Y-%m-%d"),
+        "return": return_date.dt.strftime("%Y-%m-%d"),
+        "days": days,
+        "distance": distance,
+        "team_size": team_size,
+        "mode": mode,
+        "travel_time": travel_time,
+        "transportation": transportation,
+        "lodging": lodging,
+        "per_diem": per_diem,
+        "team_meals": team_meals,
+        "ground_transportation": ground,
+        "incidentals": incidentals
+    })
+    result["total"] = result[cost_columns[:-1]].sum(axis=1)
+    
+    def rollup(key: str) -> pd.DataFrame:
+        grouped = result.groupby(key)
+        summary = grouped[["distance"] + cost_columns].sum()
+        summary.insert(0, "trips", grouped.size())
+        return summary
+    
+    totals = {"trips": len(result), "distance": float(result["distance"].sum())}
+    totals.update({column: float(result[column].sum()) for column in cost_columns})
+    
+    return {
+        "trips": result,
+        "by_school": rollup("origin"),
+        "by_sport": rollup("sport"),
+        "total": totals
+    }
+
 def optimize_travel_schedule(schedules: Dict[str, List[Dict[str, Any]]], school: str) -> Dict[str, Any]:
     """
     Optimize travel schedule to minimize costs and travel time
@@ -611,11 +693,11 @@ def optimize_travel_schedule(schedules: Dict[str, List[Dict[str, Any]]], school:
                         "notes": "Consider combined travel arrangements for these events at the same destination"
                     })
     
-    # Find opportunities for charter sharing
-    potential_charters = []
-    for event in all_events:
-        if event.get("opponent", "") and get_travel_distance(school, event.get("opponent", "")) > 800:
-            potential_charters.append(event)
+    # Find opportunities for charter sharing - look up all trip distances in one batch
+    matrix = distance_engine.get_distance_matrix()
+    trips = [e for e in all_events if e.get("opponent", "") in matrix and school in matrix]
+    trip_distances = matrix.distances((school, e["opponent"]) for e in trips)
+    potential_charters = [e for e, d in zip(trips, trip_distances) if d > 800]
     
     # Sort potential charters by date
     potential_charters.sort(key=lambda x: x.get("date", ""))
@@ -646,7 +728,7 @@ def optimize_travel_schedule(schedules: Dict[str, List[Dict[str, Any]]], school:
         "potential_savings": sum(opt.get("estimated_savings", 0) for opt in optimizations)
     }
 
-def process_user_query(query: str) -> str:
+def _answer_query(query: str) -> str:
     """
     Process user queries to the Travel Agent
     
@@ -737,7 +819,7 @@ def process_user_query(query: str) -> str:
         return "Travel Agent capabilities:\n" + \
                "1. Recommend transportation modes based on distance, sport, and team size\n" + \
                "2. Create comprehensive travel plans for team trips\n" + \
-               "3. Calculate detailed travel budgets\n" + \
+               "3. Calculate detailed travel budgets for single trips or a whole season\n" + \
                "4. Provide information about airports and transportation hubs\n" + \
                "5. Optimize travel schedules to minimize costs and travel time\n" + \
                "6. Answer queries about sport-specific travel requirements\n" + \
@@ -748,6 +830,10 @@ def process_user_query(query: str) -> str:
     return "I understand you're asking about travel planning, but I need more specific information. " + \
            "You can ask about transportation modes, travel requirements, airports, budgets, distances, or request help for more information."
 
+def process_user_query(query: str, context: Optional[Dict[str, Any]] = None, system_prompt: str = "") -> str:
+    """Process a user query; see agent_runtime.answer_query for context and system_prompt"""
+    return agent_runtime.answer_query(_answer_query, query, context, system_prompt)
+
 def main():
     """
     Main function to handle command-line operation
@@ -762,6 +848,7 @@ def main():
     parser.add_argument("-t", "--transport", help="Calculate transportation recommendation", action="store_true")
     parser.add_argument("-f", "--full-plan", help="Generate full travel plan", action="store_true")
     parser.add_argument("-b", "--budget", help="Calculate travel budget", action="store_true")
+    parser.add_argument("--season-budget", help="Budget a season trip table (CSV or JSON file)")
     
     args = parser.parse_args()
     
@@ -784,10 +871,25 @@ def main():
         print(json.dumps(plan, indent=2))
         return
     
+    # Handle season budget calculation
+    if args.season_budget:
+        if args.season_budget.endswith(".csv"):
+            trips = pd.read_csv(args.season_budget)
+        else:
+            with open(args.season_budget, 'r') as f:
+                trips = json.load(f)
+        season = calculate_season_travel_budget(trips)
+        print(json.dumps({
+            "total": season["total"],
+            "by_school": season["by_school"].round(2).to_dict(orient="index"),
+            "by_sport": season["by_sport"].round(2).to_dict(orient="index")
+        }, indent=2, default=float))
+        return
+    
     # Handle budget calculation
     if args.budget and args.origin and args.destination and args.sport and args.event_date:
         plan = create_travel_plan(args.origin, args.destination, args.sport, 
-                                 args.event_date, args.return_date)
+                                 args.event_date, args.return_date, include_weather=False)
         budget = calculate_travel_budget(plan)
         print(json.dumps(budget, indent=2))
         return
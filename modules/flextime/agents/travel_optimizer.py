@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Travel Optimizer
+
+Reorders the rounds of a conference schedule and flips home/away assignments
+to reduce travel, using simulated annealing. Every candidate is scored by a
+vectorized cost function over the distance matrix (total miles, longest road
+trip, road streaks beyond the limit, home/away balance), a whole batch of
+candidate moves at a time. Independent annealing runs share the time budget
+across worker processes and the best result wins.
+
+Part of the XII-OS FlexTime module.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import concurrent.futures
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+import distance_engine
+
+# Cost weights (miles-equivalent)
+LONGEST_TRIP_WEIGHT = 10.0      # per mile of the season's longest road trip
+ROAD_STREAK_WEIGHT = 2000.0     # per road game beyond the consecutive-away limit
+HOME_BALANCE_WEIGHT = 5000.0    # per home game gained or lost by a team
+DEFAULT_MAX_CONSECUTIVE_AWAY = 2
+
+# Search settings
+DEFAULT_TIME_BUDGET = 5.0       # seconds
+MOVE_BATCH_SIZE = 64            # candidate moves scored per annealing step
+FLIP_MOVE_SHARE = 0.3           # share of candidate moves that flip home/away
+FINAL_TEMPERATURE_RATIO = 1e-3  # final temperature relative to the initial one
+
+# Travel time model for reporting (matches the bus range in travel_agent)
+BUS_MAX_MILES = 500
+BUS_MPH = 55.0
+AIR_MPH = 450.0
+AIR_OVERHEAD_HOURS = 2.5
+
+def round_key_field(games: List[Dict[str, Any]]) -> str:
+    """Field that orders a schedule's games into rounds: round, week or date"""
+    for field in ("round", "week", "date"):
+        if games and all(field in game for game in games):
+            return field
+    raise ValueError("Every game needs a 'round', 'week' or 'date' field")
+
+class TravelProblem:
+    """Array form of a schedule: who plays whom, at whose venue, in which round"""
+
+    def __init__(self, games: List[Dict[str, Any]], matrix: distance_engine.DistanceMatrix,
+                 max_consecutive_away: int = DEFAULT_MAX_CONSECUTIVE_AWAY):
+        """
+        Args:
+            games: Games with "home_team", "away_team" and a round field
+            matrix: Distance matrix containing every team
+            max_consecutive_away: Road games in a row before the streak penalty applies
+
+        Raises:
+            ValueError: If a team plays twice in one round
+            KeyError: If a team is not in the distance matrix
+        """
+        self.round_field = round_key_field(games)
+        self.round_keys = sorted({game[self.round_field] for game in games})
+        self.teams = sorted({game["home_team"] for game in games} | {game["away_team"] for game in games})
+        team_index = {team: i for i, team in enumerate(self.teams)}
+        round_index = {key: r for r, key in enumerate(self.round_keys)}
+
+        self.home = np.array([team_index[g["home_team"]] for g in games], dtype=np.intp)
+        self.away = np.array([team_index[g["away_team"]] for g in games], dtype=np.intp)
+        self.round = np.array([round_index[g[self.round_field]] for g in games], dtype=np.intp)
+        self.locked = np.array([bool(g.get("locked")) for g in games])
+        self.T, self.R, self.G = len(self.teams), len(self.round_keys), len(games)
+        self.max_consecutive_away = max_consecutive_away
+        self.miles = matrix.submatrix(self.teams)
+        self.flat_miles = self.miles.astype(np.float32).ravel()
+
+        for r in range(self.R):
+            playing = np.concatenate([self.home[self.round == r], self.away[self.round == r]])
+            if len(playing) != len(set(playing.tolist())):
+                raise ValueError(f"A team plays more than once in round {self.round_keys[r]}")
+
+        # Return fixture of each game (same pair, venues reversed), or -1
+        fixtures = {(h, a): g for g, (h, a) in enumerate(zip(self.home.tolist(), self.away.tolist()))}
+        self.partner = np.array([fixtures.get((a, h), -1) for h, a in zip(self.home.tolist(), self.away.tolist())], dtype=np.intp)
+
+        # Game each team plays in each round (G = no game)
+        self.game_at = np.full((self.R, self.T), self.G, dtype=np.intp)
+        self.game_at[self.round, self.home] = np.arange(self.G)
+        self.game_at[self.round, self.away] = np.arange(self.G)
+
+        self.locked_rounds = np.zeros(self.R, dtype=bool)
+        self.locked_rounds[self.round[self.locked]] = True
+        self.home_counts = np.bincount(self.home, minlength=self.T)
+
+    def identity(self) -> Tuple[np.ndarray, np.ndarray]:
+        """The original schedule: round r in slot r, no flips"""
+        return np.arange(self.R, dtype=np.intp), np.zeros(self.G, dtype=bool)
+
+    def locations(self, slots: np.ndarray, flips: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Where each team is in each slot, for a batch of candidate schedules
+
+        Args:
+            slots: (B, R) slot assigned to each original round
+            flips: (B, G) whether each game's home/away is reversed
+
+        Returns:
+            Tuple of (B, R, T) location indices and (B, R, T) road-game flags
+        """
+        batch = len(slots)
+        host = np.where(flips, self.away, self.home)
+        host = np.concatenate([host, np.full((batch, 1), -1, dtype=host.dtype)], axis=1)
+
+        # Round played in each slot, then the game each team plays in it
+        round_at_slot = np.empty_like(slots)
+        np.put_along_axis(round_at_slot, slots, np.arange(self.R)[None, :], axis=1)
+        games = self.game_at[round_at_slot].reshape(batch, -1)
+        hosts = np.take_along_axis(host, games, axis=1).reshape(batch, self.R, self.T)
+
+        teams = np.arange(self.T)
+        on_road = (hosts >= 0) & (hosts != teams)
+        return np.where(hosts >= 0, hosts, teams), on_road
+
+    def evaluate(self, slots: np.ndarray, flips: np.ndarray, detail: bool = False) -> Dict[str, np.ndarray]:
+        """
+        Score a batch of candidate schedules
+
+        Args:
+            slots: (B, R) slot assigned to each original round
+            flips: (B, G) whether each game's home/away is reversed
+            detail: Also compute reporting-only metrics (travel_hours, trips)
+
+        Returns:
+            Dictionary of (B,) arrays: cost, total_miles, longest_trip, streak_violations,
+            max_streak, imbalance (plus travel_hours and trips with detail)
+        """
+        loc, on_road = self.locations(slots, flips)
+        batch = len(slots)
+        team = np.broadcast_to(np.arange(self.T)[None, None, :], (batch, 1, self.T))
+        path = np.concatenate([team, loc, team], axis=1)
+        legs = self.flat_miles[path[:, :-1] * self.T + path[:, 1:]]
+
+        # Road trips run from leaving home to the next arrival home
+        cumulative = np.cumsum(legs, axis=1)
+        at_home = path[:, 1:] == team
+        trip_base = np.maximum.accumulate(np.where(at_home, cumulative, 0), axis=1)
+        trip_length = cumulative[:, 1:] - trip_base[:, :-1]
+        longest_trip = np.where(at_home[:, 1:], trip_length, 0).max(axis=(1, 2))
+
+        # Consecutive road games
+        road_count = np.cumsum(on_road, axis=1, dtype=np.int16)
+        streak = road_count - np.maximum.accumulate(np.where(on_road, 0, road_count), axis=1)
+
+        host = np.where(flips, self.away, self.home)
+        offsets = (np.arange(batch) * self.T)[:, None]
+        home_counts = np.bincount((host + offsets).ravel(), minlength=batch * self.T).reshape(batch, self.T)
+
+        total_miles = legs.sum(axis=(1, 2))
+        streak_violations = (streak > self.max_consecutive_away).sum(axis=(1, 2))
+        imbalance = np.abs(home_counts - self.home_counts).sum(axis=1)
+
+        result = {
+            "cost": (total_miles + LONGEST_TRIP_WEIGHT * longest_trip
+                     + ROAD_STREAK_WEIGHT * streak_violations + HOME_BALANCE_WEIGHT * imbalance),
+            "total_miles": total_miles,
+            "longest_trip": longest_trip,
+            "streak_violations": streak_violations,
+            "max_streak": streak.max(axis=(1, 2)),
+            "imbalance": imbalance
+        }
+
+        if detail:
+            hours = np.where(legs <= BUS_MAX_MILES, legs / BUS_MPH, AIR_OVERHEAD_HOURS + legs / AIR_MPH)
+            result["travel_hours"] = np.where(legs > 0, hours, 0.0).sum(axis=(1, 2))
+            result["trips"] = (at_home & (legs > 0)).sum(axis=(1, 2))
+        return result
+
+    def propose(self, slots: np.ndarray, flips: np.ndarray, count: int, rng: np.random.Generator,
+                allow_flips: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Generate a batch of neighbors of one schedule: swap the slots of two
+        unlocked rounds, or flip an unlocked game (and its return fixture)
+        """
+        cand_slots = np.repeat(slots[None, :], count, axis=0)
+        cand_flips = np.repeat(flips[None, :], count, axis=0)
+        rows = np.arange(count)
+
+        free_rounds = np.flatnonzero(~self.locked_rounds)
+        free_games = np.flatnonzero(~self.locked)
+        flip_rows = (rng.random(count) < FLIP_MOVE_SHARE) if allow_flips and free_games.size else np.zeros(count, dtype=bool)
+
+        swap_rows = rows[~flip_rows]
+        if swap_rows.size and free_rounds.size >= 2:
+            i = rng.choice(free_rounds, swap_rows.size)
+            j = rng.choice(free_rounds, swap_rows.size)
+            cand_slots[swap_rows, i], cand_slots[swap_rows, j] = cand_slots[swap_rows, j], cand_slots[swap_rows, i]
+
+        flip_rows = rows[flip_rows]
+        if flip_rows.size:
+            g = rng.choice(free_games, flip_rows.size)
+            cand_flips[flip_rows, g] ^= True
+            partner = self.partner[g]
+            paired = (partner >= 0) & ~self.locked[np.maximum(partner, 0)]
+            cand_flips[flip_rows[paired], partner[paired]] ^= True
+
+        return cand_slots, cand_flips
+
+def anneal(problem: TravelProblem, time_budget: float, seed: int,
+           allow_flips: bool = True) -> Dict[str, Any]:
+    """
+    Simulated annealing from the original schedule
+
+    Each step scores MOVE_BATCH_SIZE neighbors and considers the best of them
+    for acceptance; the temperature falls geometrically over the time budget.
+
+    Returns:
+        Dictionary with the best slots, flips, cost and the number of candidates evaluated
+    """
+    rng = np.random.default_rng(seed)
+    slots, flips = problem.identity()
+    cost = float(problem.evaluate(slots[None], flips[None])["cost"][0])
+    best = (slots, flips, cost)
+
+    # Initial temperature from the spread of first-step deltas
+    cand_slots, cand_flips = problem.propose(slots, flips, MOVE_BATCH_SIZE, rng, allow_flips)
+    deltas = problem.evaluate(cand_slots, cand_flips)["cost"] - cost
+    initial_temp = max(float(np.abs(deltas).mean()), 1.0)
+    evaluated = MOVE_BATCH_SIZE
+
+    start = time.perf_counter()
+    while True:
+        progress = (time.perf_counter() - start) / time_budget if time_budget > 0 else 1.0
+        if progress >= 1.0:
+            break
+        temperature = initial_temp * FINAL_TEMPERATURE_RATIO ** progress
+
+        cand_slots, cand_flips = problem.propose(slots, flips, MOVE_BATCH_SIZE, rng, allow_flips)
+        costs = problem.evaluate(cand_slots, cand_flips)["cost"]
+        evaluated += MOVE_BATCH_SIZE
+        k = int(costs.argmin())
+        delta = float(costs[k]) - cost
+
+        if delta <= 0 or rng.random() < np.exp(-delta / temperature):
+            slots, flips, cost = cand_slots[k], cand_flips[k], float(costs[k])
+            if cost < best[2]:
+                best = (slots.copy(), flips.copy(), cost)
+
+    return {"slots": best[0], "flips": best[1], "cost": best[2], "evaluated": evaluated, "seed": seed}
+
+def _percent_change(original: float, optimized: float) -> str:
+    if not original:
+        return "0%"
+    return f"{round(100 * (original - optimized) / original)}%"
+
+def _metric(original: float, optimized: float, digits: int = 1) -> Dict[str, Any]:
+    return {
+        "original": round(float(original), digits),
+        "optimized": round(float(optimized), digits),
+        "improvement": _percent_change(original, optimized)
+    }
+
+def optimize_schedule(schedule: Dict[str, Any], time_budget: float = DEFAULT_TIME_BUDGET,
+                      workers: Optional[int] = None, seed: Optional[int] = None,
+                      max_consecutive_away: int = DEFAULT_MAX_CONSECUTIVE_AWAY,
+                      allow_flips: bool = True,
+                      matrix: Optional[distance_engine.DistanceMatrix] = None) -> Dict[str, Any]:
+    """
+    Reorder rounds and home/away assignments of a schedule to reduce travel
+
+    Args:
+        schedule: Dictionary with a "games" list; each game has "home_team",
+            "away_team" and a "round", "week" or "date" field, and may be
+            marked "locked" to keep its round and venue
+        time_budget: Seconds of annealing per worker
+        workers: Worker processes (defaults to the CPU count, at most 4);
+            1 runs in this process
+        seed: Base random seed
+        max_consecutive_away: Road games in a row before the streak penalty applies
+        allow_flips: Allow home/away flips as well as round reordering
+        matrix: Distance matrix (defaults to the shared one)
+
+    Returns:
+        Copy of the schedule with optimized "games", "optimizationMetrics"
+        (original/optimized/improvement) and "search" statistics
+    """
+    optimized = dict(schedule)
+    games = schedule.get("games", [])
+    if not games:
+        optimized["optimizationMetrics"] = {}
+        optimized["search"] = {"candidates_evaluated": 0, "workers": 0, "elapsed_seconds": 0.0}
+        return optimized
+
+    problem = TravelProblem(games, matrix or distance_engine.get_distance_matrix(), max_consecutive_away)
+    workers = workers or min(os.cpu_count() or 1, 4)
+    base_seed = seed if seed is not None else int(time.time())
+    seeds = [base_seed + n for n in range(workers)]
+
+    started = time.perf_counter()
+    results = []
+    if workers > 1:
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(anneal, problem, time_budget, s, allow_flips) for s in seeds]
+                results = [future.result() for future in futures]
+        except Exception as e:
+            print(f"Error running optimizer workers, continuing in-process: {str(e)}", file=sys.stderr)
+            results = []
+    if not results:
+        workers = 1
+        results = [anneal(problem, time_budget, seeds[0], allow_flips)]
+    elapsed = time.perf_counter() - started
+
+    best = min(results, key=lambda r: r["cost"])
+    slots, flips = problem.identity()
+    before = {k: v[0] for k, v in problem.evaluate(slots[None], flips[None], detail=True).items()}
+    after = {k: v[0] for k, v in problem.evaluate(best["slots"][None], best["flips"][None], detail=True).items()}
+
+    # Order games by their new round (round_keys is sorted), keeping the input order within a round
+    order = sorted(range(len(games)), key=lambda g: (int(best["slots"][problem.round[g]]), g))
+    new_games = []
+    for g in order:
+        game = dict(games[g])
+        game[problem.round_field] = problem.round_keys[int(best["slots"][problem.round[g]])]
+        if best["flips"][g]:
+            game["home_team"], game["away_team"] = game["away_team"], game["home_team"]
+        new_games.append(game)
+
+    evaluated = sum(r["evaluated"] for r in results)
+    optimized["games"] = new_games
+    optimized["optimizationMetrics"] = {
+        "totalTravelDistance": _metric(before["total_miles"], after["total_miles"]),
+        "averageTravelTime": _metric(before["travel_hours"] / problem.T, after["travel_hours"] / problem.T),
+        "longestTrip": _metric(before["longest_trip"], after["longest_trip"]),
+        "consecutiveRoadGames": {
+            "original": int(before["max_streak"]),
+            "optimized": int(after["max_streak"]),
+            "gamesOverLimit": {"original": int(before["streak_violations"]), "optimized": int(after["streak_violations"])}
+        },
+        "homeGamesChanged": int(after["imbalance"]),
+        "cost": _metric(before["cost"], after["cost"])
+    }
+    optimized["search"] = {
+        "candidates_evaluated": evaluated,
+        "workers": workers,
+        "elapsed_seconds": round(elapsed, 2),
+        "candidates_per_minute": int(evaluated / elapsed * 60) if elapsed else 0
+    }
+    return optimized
+
+def round_robin_schedule(teams: List[str], double: bool = True) -> Dict[str, Any]:
+    """
+    Build a round-robin schedule with the circle method
+
+    Args:
+        teams: Team codes (a bye is added for an odd count)
+        double: Add a second half with venues reversed
+
+    Returns:
+        Schedule dictionary with a "games" list keyed by "round"
+    """
+    teams = list(teams) + ([None] if len(teams) % 2 else [])
+    n = len(teams)
+    rotation = teams[1:]
+    games = []
+
+    for r in range(n - 1):
+        lineup = [teams[0]] + rotation
+        for k in range(n // 2):
+            a, b = lineup[k], lineup[n - 1 - k]
+            if a is None or b is None:
+                continue
+            # The fixed team alternates by round; rotating slots alternate by position
+            flip = r % 2 if k == 0 else k % 2 == 0
+            home, away = (b, a) if flip else (a, b)
+            games.append({"round": r + 1, "home_team": home, "away_team": away})
+        rotation = rotation[-1:] + rotation[:-1]
+
+    if double:
+        games += [{"round": g["round"] + n - 1, "home_team": g["away_team"], "away_team": g["home_team"]} for g in games]
+
+    return {"games": games}
+
+def main():
+    parser = argparse.ArgumentParser(description='FlexTime Travel Optimizer')
+    parser.add_argument('-s', '--schedule', type=str, help='JSON schedule file with a "games" list')
+    parser.add_argument('-t', '--time-budget', type=float, default=DEFAULT_TIME_BUDGET, help='Seconds per worker')
+    parser.add_argument('-w', '--workers', type=int, help='Worker processes')
+    parser.add_argument('--seed', type=int, help='Random seed')
+    parser.add_argument('--no-flips', action='store_true', help='Keep home/away assignments')
+
+    args = parser.parse_args()
+
+    if args.schedule:
+        with open(args.schedule, 'r') as f:
+            schedule = json.load(f)
+    else:
+        schedule = round_robin_schedule(sorted(distance_engine.SCHOOL_COORDINATES))
+
+    result = optimize_schedule(schedule, args.time_budget, args.workers, args.seed, allow_flips=not args.no_flips)
+    print(json.dumps({"optimizationMetrics": result["optimizationMetrics"], "search": result["search"]}, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Venue Calendar
+
+Persistent calendar of venue bookings for the game manager agent. Every
+booking is stored in SQLite with its busy window (setup through teardown) on
+the conflict engine's minute timeline, in a table indexed by (school, venue,
+busy start). Each venue also records its longest busy window, which bounds
+every overlap query to an index range scan, so availability, next-free-window
+and free-window queries cost O(log n + k).
+
+Part of the XII-OS FlexTime module.
+"""
+
+import os
+import sys
+import json
+import heapq
+import sqlite3
+import argparse
+import datetime
+import threading
+from typing import Dict, List, Any, Optional, Tuple, Callable
+
+from conflict_engine import MINUTES_PER_DAY, build_interval, parse_clock, parse_day, format_clock
+
+# FlexTime configuration
+FLEXTIME_VERSION = "1.0.0"
+FLEXTIME_MODULE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STORAGE_PATH = os.path.join(FLEXTIME_MODULE_PATH, "data", "storage")
+VENUE_CALENDAR_PATH = os.path.join(STORAGE_PATH, "venue_calendar.sqlite")
+
+BOOKING_COLUMNS = ("id", "sport", "event_id", "description", "source", "date", "start_time", "end_time",
+                   "busy_start", "busy_end")
+
+def format_minute(minute: int) -> str:
+    """Convert a minute on the timeline to "YYYY-MM-DD HH:MM" """
+    day = datetime.date.fromordinal(minute // MINUTES_PER_DAY)
+    return f"{day.isoformat()} {format_clock(minute)}"
+
+def to_minute(date: str, time: str = "00:00") -> int:
+    """
+    Convert a date and "HH:MM" time to a minute on the timeline
+
+    Raises:
+        ValueError: If the date or time cannot be parsed
+    """
+    day = parse_day(date)
+    clock = parse_clock(time)
+    if day is None or clock is None:
+        raise ValueError(f"Invalid date or time: {date} {time}")
+    return day * MINUTES_PER_DAY + clock
+
+class VenueCalendar:
+    """SQLite-backed venue bookings with setup and teardown windows"""
+
+    def __init__(self, path: Optional[str] = VENUE_CALENDAR_PATH):
+        """
+        Args:
+            path: SQLite file for the calendar (None keeps it in memory)
+        """
+        if path:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path or ":memory:", check_same_thread=False)
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS bookings ("
+            "id INTEGER PRIMARY KEY, school TEXT NOT NULL, venue TEXT NOT NULL, sport TEXT NOT NULL, "
+            "event_id TEXT, description TEXT, source TEXT NOT NULL, date TEXT NOT NULL, "
+            "start_time TEXT NOT NULL, end_time TEXT NOT NULL, busy_start INTEGER NOT NULL, busy_end INTEGER NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS bookings_by_start ON bookings (school, venue, busy_start);"
+            "CREATE INDEX IF NOT EXISTS bookings_by_source ON bookings (source);"
+            "CREATE TABLE IF NOT EXISTS venue_spans ("
+            "school TEXT NOT NULL, venue TEXT NOT NULL, max_span INTEGER NOT NULL, PRIMARY KEY (school, venue));"
+        )
+        self._db.commit()
+
+    def _span(self, school: str, venue: str) -> Optional[int]:
+        row = self._db.execute("SELECT max_span FROM venue_spans WHERE school = ? AND venue = ?",
+                               (school, venue)).fetchone()
+        return row[0] if row else None
+
+    def _rows_from(self, school: str, venue: str, lo: int, hi: Optional[int] = None,
+                   exclude_source: Optional[str] = None) -> List[Tuple]:
+        """Bookings at a venue whose busy window ends after lo and starts before hi, by busy start"""
+        span = self._span(school, venue)
+        if span is None:
+            return []
+        query = (f"SELECT {', '.join(BOOKING_COLUMNS)} FROM bookings "
+                 "WHERE school = ? AND venue = ? AND busy_start >= ? AND busy_end > ?")
+        params = [school, venue, lo - span, lo]
+        if hi is not None:
+            query += " AND busy_start < ?"
+            params.append(hi)
+        if exclude_source is not None:
+            query += " AND source != ?"
+            params.append(exclude_source)
+        return self._db.execute(query + " ORDER BY busy_start", params).fetchall()
+
+    @staticmethod
+    def _booking(row: Tuple) -> Dict[str, Any]:
+        booking = dict(zip(BOOKING_COLUMNS, row))
+        booking["event"] = booking["description"]
+        booking["busy_start"] = format_minute(booking["busy_start"])
+        booking["busy_end"] = format_minute(booking["busy_end"])
+        return booking
+
+    def _insert(self, rows: List[Tuple]):
+        """Insert (school, venue, sport, event_id, description, source, date, start, end, busy_start, busy_end) rows"""
+        spans = {}
+        for row in rows:
+            key = (row[0], row[1])
+            spans[key] = max(spans.get(key, 0), row[10] - row[9])
+
+        self._db.executemany(
+            "INSERT INTO bookings (school, venue, sport, event_id, description, source, date, start_time, end_time, "
+            "busy_start, busy_end) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+        )
+        self._db.executemany(
+            "INSERT INTO venue_spans VALUES (?, ?, ?) "
+            "ON CONFLICT (school, venue) DO UPDATE SET max_span = MAX(max_span, excluded.max_span)",
+            [(school, venue, span) for (school, venue), span in spans.items()]
+        )
+
+    def add_booking(self, school: str, venue: str, sport: str, event: Dict[str, Any], source: str = "manual") -> bool:
+        """
+        Book a single event
+
+        Args:
+            school: Host school code
+            venue: Venue name
+            sport: Sport code
+            event: Event with "date", "start_time" and optional "end_time", "end_date",
+                "setup_minutes", "teardown_minutes", "id" and "description"
+            source: Label grouping bookings that are loaded or removed together
+
+        Returns:
+            True if the event was booked, False if its date or time is invalid
+        """
+        interval = build_interval(sport, event)
+        if interval is None:
+            return False
+
+        with self._lock:
+            self._insert([(school, venue, sport, interval.event_id, interval.description, source, interval.date,
+                           interval.start_time, interval.end_time, interval.busy_start, interval.busy_end)])
+            self._db.commit()
+        return True
+
+    def load_schedules(self, schedules: Dict[str, List[Dict[str, Any]]], venue_resolver: Callable[[str, str], str],
+                       source: str = "season", setup_minutes: Optional[Dict[str, int]] = None,
+                       teardown_minutes: Optional[Dict[str, int]] = None) -> int:
+        """
+        Bulk-load a season's home events, replacing earlier bookings from the same source
+
+        Args:
+            schedules: Dictionary mapping sport codes to lists of scheduled events
+            venue_resolver: Function (school_code, sport) -> venue name or ""
+            source: Label for this load; reloading a source replaces its bookings
+            setup_minutes: Default setup window per sport for events without "setup_minutes"
+            teardown_minutes: Default teardown window per sport for events without "teardown_minutes"
+
+        Returns:
+            Number of bookings loaded
+        """
+        setup_minutes = setup_minutes or {}
+        teardown_minutes = teardown_minutes or {}
+        venue_cache = {}
+        rows = []
+
+        for sport, events in schedules.items():
+            defaults = {"setup_minutes": setup_minutes.get(sport, 0), "teardown_minutes": teardown_minutes.get(sport, 0)}
+            for event in events:
+                school = event.get("home_team")
+                if not school:
+                    continue
+                if (school, sport) not in venue_cache:
+                    venue_cache[(school, sport)] = venue_resolver(school, sport)
+                venue = event.get("venue") or venue_cache[(school, sport)]
+                interval = build_interval(sport, {**defaults, **event})
+                if not venue or interval is None:
+                    continue
+                rows.append((school, venue, sport, interval.event_id, interval.description, source, interval.date,
+                             interval.start_time, interval.end_time, interval.busy_start, interval.busy_end))
+
+        with self._lock:
+            self._db.execute("DELETE FROM bookings WHERE source = ?", (source,))
+            self._insert(rows)
+            self._db.commit()
+        return len(rows)
+
+    def remove_source(self, source: str) -> int:
+        """Remove every booking loaded under a source label"""
+        with self._lock:
+            removed = self._db.execute("DELETE FROM bookings WHERE source = ?", (source,)).rowcount
+            self._db.commit()
+        return removed
+
+    def conflicts(self, school: str, venue: str, date: str, start_time: str, end_time: str) -> List[Dict[str, Any]]:
+        """
+        Bookings whose busy window overlaps a time range (an end time earlier
+        than the start time finishes after midnight)
+
+        Returns:
+            List of conflicting bookings in start order; empty when the venue is free
+        """
+        start = to_minute(date, start_time)
+        end = to_minute(date, end_time)
+        if end <= start:
+            end += MINUTES_PER_DAY
+        with self._lock:
+            return [self._booking(row) for row in self._rows_from(school, venue, start, end)]
+
+    def free_windows(self, school: str, venue: str, start_date: str, end_date: str,
+                     min_minutes: int = 0) -> List[Dict[str, str]]:
+        """
+        Free windows at a venue between the start of start_date and the end of end_date
+
+        Args:
+            min_minutes: Shortest window to report
+
+        Returns:
+            List of {"start", "end"} windows ("YYYY-MM-DD HH:MM")
+        """
+        lo = to_minute(start_date)
+        hi = to_minute(end_date) + MINUTES_PER_DAY
+        with self._lock:
+            rows = self._rows_from(school, venue, lo, hi)
+
+        windows = []
+        cursor = lo
+        for row in rows:
+            busy_start, busy_end = row[-2], row[-1]
+            if busy_start - cursor >= max(min_minutes, 1):
+                windows.append((cursor, busy_start))
+            cursor = max(cursor, busy_end)
+        if hi - cursor >= max(min_minutes, 1):
+            windows.append((cursor, hi))
+
+        return [{"start": format_minute(a), "end": format_minute(b)} for a, b in windows]
+
+    def next_free_window(self, school: str, venue: str, date: str, start_time: str,
+                         duration_minutes: int) -> Dict[str, str]:
+        """
+        Earliest window of at least duration_minutes starting at or after a date and time
+
+        Returns:
+            {"start", "end"} window ("YYYY-MM-DD HH:MM") of exactly duration_minutes
+        """
+        cursor = to_minute(date, start_time)
+        with self._lock:
+            span = self._span(school, venue)
+            rows = [] if span is None else self._db.execute(
+                "SELECT busy_start, busy_end FROM bookings WHERE school = ? AND venue = ? AND busy_start >= ? "
+                "ORDER BY busy_start", (school, venue, cursor - span)
+            )
+            for busy_start, busy_end in rows:
+                if busy_end <= cursor:
+                    continue
+                if busy_start - cursor >= duration_minutes:
+                    break
+                cursor = max(cursor, busy_end)
+
+        return {"start": format_minute(cursor), "end": format_minute(cursor + duration_minutes)}
+
+    def sweep(self, schedules: Dict[str, List[Dict[str, Any]]], venue_resolver: Callable[[str, str], str],
+              setup_minutes: Optional[Dict[str, int]] = None, teardown_minutes: Optional[Dict[str, int]] = None,
+              exclude_source: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Check every home event of a candidate schedule against the calendar in one pass
+
+        Candidate events are grouped by venue and sorted; each venue's bookings
+        over the candidate's date range are read with one ordered query and
+        merged against them with an active set, so the sweep is
+        O((n + m) log (n + m)) overall. Conflicts between candidate events
+        themselves are the conflict engine's job and are not reported here.
+
+        Args:
+            schedules: Candidate schedule, dictionary mapping sport codes to events
+            venue_resolver: Function (school_code, sport) -> venue name or ""
+            setup_minutes: Default setup window per sport for events without "setup_minutes"
+            teardown_minutes: Default teardown window per sport for events without "teardown_minutes"
+            exclude_source: Ignore bookings under this source (e.g. the candidate's own earlier load)
+
+        Returns:
+            List of {"school", "venue", "sport", "event_id", "date", "start_time", "end_time", "conflicts_with"}
+        """
+        setup_minutes = setup_minutes or {}
+        teardown_minutes = teardown_minutes or {}
+        by_venue = {}
+        for sport, events in schedules.items():
+            defaults = {"setup_minutes": setup_minutes.get(sport, 0), "teardown_minutes": teardown_minutes.get(sport, 0)}
+            for event in events:
+                school = event.get("home_team")
+                venue = event.get("venue") or (venue_resolver(school, sport) if school else "")
+                interval = build_interval(sport, {**defaults, **event}) if venue else None
+                if interval is not None:
+                    by_venue.setdefault((school, venue), []).append(interval)
+
+        results = []
+        for (school, venue), intervals in by_venue.items():
+            intervals.sort(key=lambda i: i.busy_start)
+            with self._lock:
+                rows = self._rows_from(school, venue, intervals[0].busy_start,
+                                       max(i.busy_end for i in intervals), exclude_source)
+
+            # Bookings enter the active heap as candidates pass their start, leave once they end
+            active = []
+            r = 0
+            for interval in intervals:
+                while r < len(rows) and rows[r][-2] < interval.busy_end:
+                    heapq.heappush(active, (rows[r][-1], r))
+                    r += 1
+                while active and active[0][0] <= interval.busy_start:
+                    heapq.heappop(active)
+                for _, index in sorted(active, key=lambda a: a[1]):
+                    if rows[index][-2] < interval.busy_end:
+                        results.append({
+                            "school": school,
+                            "venue": venue,
+                            "sport": interval.sport,
+                            "event_id": interval.event_id,
+                            "date": interval.date,
+                            "start_time": interval.start_time,
+                            "end_time": interval.end_time,
+                            "conflicts_with": self._booking(rows[index])
+                        })
+        return results
+
+    def clear(self):
+        """Remove every booking"""
+        with self._lock:
+            self._db.execute("DELETE FROM bookings")
+            self._db.execute("DELETE FROM venue_spans")
+            self._db.commit()
+
+_calendar: Optional[VenueCalendar] = None
+_calendar_lock = threading.Lock()
+
+def get_calendar() -> VenueCalendar:
+    """Get the shared venue calendar for this process"""
+    global _calendar
+
+    if _calendar is None:
+        with _calendar_lock:
+            if _calendar is None:
+                try:
+                    _calendar = VenueCalendar()
+                except Exception as e:
+                    print(f"Error opening venue calendar, using memory only: {str(e)}", file=sys.stderr)
+                    _calendar = VenueCalendar(None)
+    return _calendar
+
+def main():
+    parser = argparse.ArgumentParser(description='FlexTime Venue Calendar')
+    parser.add_argument('-s', '--school', type=str, help='School code')
+    parser.add_argument('-v', '--venue', type=str, help='Venue name')
+    parser.add_argument('--start', type=str, help='Start date (YYYY-MM-DD)')
+    parser.add_argument('--end', type=str, help='End date (YYYY-MM-DD)')
+    parser.add_argument('--min-minutes', type=int, default=0, help='Shortest free window to list')
+
+    args = parser.parse_args()
+
+    if args.school and args.venue and args.start:
+        windows = get_calendar().free_windows(args.school, args.venue, args.start, args.end or args.start,
+                                              args.min_minutes)
+        print(json.dumps(windows, indent=2))
+        return
+
+    parser.print_help()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Venue Catalog
+
+Loads big12_venues.json once per process and serves indexed venue lookups
+(by school and sport, school and venue name, and sport) plus per-venue
+transition-time tables to all FlexTime agents. The file is re-read only
+when its modification time changes.
+
+Part of the XII-OS FlexTime module.
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import threading
+from typing import Dict, List, Any, Optional, Tuple
+
+# FlexTime configuration
+FLEXTIME_VERSION = "1.0.0"
+FLEXTIME_MODULE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+XII_OS_PATH = os.path.dirname(os.path.dirname(FLEXTIME_MODULE_PATH))
+VENUE_DATA_PATH = os.path.join(XII_OS_PATH, "data", "venue_data", "big12_venues.json")
+VENUE_SCHEMA_PATH = os.path.join(XII_OS_PATH, "data", "venue_data", "venue_schema.json")
+
+RELOAD_CHECK_INTERVAL = 1.0  # seconds between modification-time checks
+
+# Sports that share a transition profile (e.g. men's and women's basketball)
+TRANSITION_SPORT_GROUPS = {
+    "mbasketball": "basketball",
+    "wbasketball": "basketball"
+}
+
+def transition_group(sport: str) -> str:
+    """Sport name as used in venue transition_times keys"""
+    return TRANSITION_SPORT_GROUPS.get(sport, sport)
+
+class VenueCatalog:
+    """Indexed, auto-reloading view of the venue data file"""
+
+    def __init__(self, path: str = VENUE_DATA_PATH):
+        self.path = path
+        self.data: Dict[str, Any] = {"schools": {}}
+        self.version = ""
+
+        self._lock = threading.Lock()
+        self._mtime: Optional[float] = None
+        self._last_check = 0.0
+
+        self._by_school_sport: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._by_school_name: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._by_sport: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+        self._transitions: Dict[Tuple[str, str], Dict[Tuple[str, str], float]] = {}
+
+        self.refresh(force=True)
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Reload the file if its modification time changed
+
+        Args:
+            force: Skip the check interval and re-stat the file now
+
+        Returns:
+            True if the catalog was (re)loaded
+        """
+        now = time.monotonic()
+        if not force and now - self._last_check < RELOAD_CHECK_INTERVAL:
+            return False
+
+        with self._lock:
+            self._last_check = now
+            try:
+                mtime = os.stat(self.path).st_mtime
+            except OSError:
+                mtime = None
+
+            if mtime == self._mtime and not force:
+                return False
+
+            self._load(mtime)
+            return True
+
+    def _load(self, mtime: Optional[float]):
+        data = {"schools": {}}
+        raw = b""
+
+        try:
+            if mtime is not None:
+                with open(self.path, 'rb') as f:
+                    raw = f.read()
+                data = json.loads(raw)
+            else:
+                print(f"Warning: Venue data file not found at {self.path}", file=sys.stderr)
+        except Exception as e:
+            print(f"Error loading venue data: {str(e)}", file=sys.stderr)
+            data = {"schools": {}}
+
+        by_school_sport = {}
+        by_school_name = {}
+        by_sport = {}
+        transitions = {}
+
+        for school_code, school in data.get("schools", {}).items():
+            for venue in school.get("venues", []):
+                by_school_name[(school_code, venue["name"])] = venue
+                for sport in venue.get("sports", []):
+                    # First listed venue wins, matching the order agents used to scan in
+                    by_school_sport.setdefault((school_code, sport), venue)
+                    by_sport.setdefault(sport, []).append((school_code, venue))
+
+                table = {}
+                for key, hours in venue.get("transition_times", {}).items():
+                    if "_to_" in key:
+                        from_group, to_group = key.split("_to_", 1)
+                        table[(from_group, to_group)] = hours
+                transitions[(school_code, venue["name"])] = table
+
+        self.data = data
+        self.version = hashlib.sha256(raw).hexdigest()[:16]
+        self._by_school_sport = by_school_sport
+        self._by_school_name = by_school_name
+        self._by_sport = by_sport
+        self._transitions = transitions
+        self._mtime = mtime
+
+    def venue_for(self, school_code: str, sport: str) -> Optional[Dict[str, Any]]:
+        """Venue a school uses for a sport, or None"""
+        self.refresh()
+        return self._by_school_sport.get((school_code, sport))
+
+    def venue(self, school_code: str, venue_name: str) -> Optional[Dict[str, Any]]:
+        """Venue record by school and venue name, or None"""
+        self.refresh()
+        return self._by_school_name.get((school_code, venue_name))
+
+    def venues_for_sport(self, sport: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """All (school_code, venue) pairs hosting a sport"""
+        self.refresh()
+        return list(self._by_sport.get(sport, []))
+
+    def school_venues(self, school_code: str) -> List[Dict[str, Any]]:
+        """All venues listed for a school"""
+        self.refresh()
+        return self.data.get("schools", {}).get(school_code, {}).get("venues", [])
+
+    def transition_hours(self, school_code: str, venue_name: str, from_sport: str, to_sport: str) -> Optional[float]:
+        """
+        Venue-specific transition time between two sports
+
+        Returns:
+            Hours, or None if the venue does not define this transition
+        """
+        self.refresh()
+        table = self._transitions.get((school_code, venue_name))
+        if not table:
+            return None
+        return table.get((transition_group(from_sport), transition_group(to_sport)))
+
+    def transition_table(self, school_code: str, venue_name: str) -> Dict[Tuple[str, str], float]:
+        """Precomputed transition table for a venue, keyed by (from_group, to_group)"""
+        self.refresh()
+        return dict(self._transitions.get((school_code, venue_name), {}))
+
+_catalog: Optional[VenueCatalog] = None
+_catalog_lock = threading.Lock()
+
+def get_catalog() -> VenueCatalog:
+    """Get the shared venue catalog for this process"""
+    global _catalog
+
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = VenueCatalog()
+    return _catalog
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Venue Compliance
+
+Evaluates every venue in big12_venues.json against the venue requirements of
+every sport manual (field and court dimensions, surfaces, lighting, markings,
+shot clocks, ceiling height, safety zones) and keeps the result as a
+venue x sport matrix. Agents come from the sport agent registry, so each
+manual is loaded once per process; rows are evaluated on a worker pool,
+and the matrix is persisted with a hash per venue row so that updating one
+venue record re-evaluates only that row.
+
+Part of the XII-OS FlexTime module.
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+import threading
+import concurrent.futures
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+from venue_catalog import VenueCatalog, get_catalog
+from sports import agent_registry
+from sports.base_sports_agent import thaw
+
+# FlexTime configuration
+FLEXTIME_VERSION = "1.0.0"
+FLEXTIME_MODULE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_PATH = os.path.join(FLEXTIME_MODULE_PATH, "data", "storage", "cache")
+COMPLIANCE_CACHE_FILE = "venue_compliance.json"
+
+# Bump when the checks below change so cached rows are re-evaluated
+COMPLIANCE_VERSION = 1
+DEFAULT_WORKERS = 4
+
+# Sport columns of the matrix
+COMPLIANCE_SPORTS = ["football", "mbasketball", "wbasketball", "volleyball"]
+
+# Venue validators of each agent and the venue fields they read. A check only runs when the
+# venue record has at least one of its fields; otherwise the cell is incomplete, not failed.
+VENUE_CHECKS = {
+    "FootballAgent": [
+        ("validate_venue", ("length", "width", "surface_type", "has_lights", "lighting_level")),
+        ("validate_field_markings", ("markings",)),
+        ("validate_safety_zones", ("safety_zones",))
+    ],
+    "BasketballAgent": [
+        ("validate_court_dimensions", ("dimensions",)),
+        ("validate_backboard_setup", ("backboards",)),
+        ("validate_court_markings", ("markings",)),
+        ("validate_shot_clocks", ("shotClocks",))
+    ],
+    "VolleyballAgent": [
+        ("validate_ceiling_height", ("ceiling_height",)),
+        ("validate_court_markings", ("markings",))
+    ]
+}
+
+# Matrix cell codes
+UNAVAILABLE = 0    # the sport's manual could not be loaded
+INCOMPLETE = 1     # no failed check, but the venue lacks data for some checks
+COMPLIANT = 2
+NON_COMPLIANT = 3
+STATUS_NAMES = ["unavailable", "incomplete", "compliant", "non_compliant"]
+
+def load_agents(sports: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Shared agents for the given sports from the agent registry
+
+    Args:
+        sports: Sport codes (defaults to COMPLIANCE_SPORTS)
+
+    Returns:
+        Mapping of sport code to agent; sports whose manual fails to load are left out
+    """
+    agents: Dict[str, Any] = {}
+    for sport in sports or COMPLIANCE_SPORTS:
+        try:
+            agents[sport] = agent_registry.get_agent(sport)
+        except Exception as e:
+            print(f"Error loading {sport} agent: {str(e)}", file=sys.stderr)
+    return agents
+
+def manual_version(agent: Any) -> str:
+    """Version of the manual an agent validates against: its declared version and a hash of its content"""
+    content = json.dumps(thaw(agent.manual), sort_keys=True, default=str)
+    return f"{agent.manual.get('version', 'unknown')}:{hashlib.sha256(content.encode()).hexdigest()[:12]}"
+
+def evaluate_cell(agent: Optional[Any], venue: Dict[str, Any]) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Run an agent's venue validators on one venue record
+
+    Returns:
+        Tuple of (status code, issue dicts)
+    """
+    if agent is None:
+        return UNAVAILABLE, []
+
+    issues: List[Dict[str, Any]] = []
+    skipped = False
+    checks = next(VENUE_CHECKS[cls.__name__] for cls in type(agent).__mro__ if cls.__name__ in VENUE_CHECKS)
+    for method, fields in checks:
+        if not any(field in venue for field in fields):
+            skipped = True
+            continue
+        try:
+            issues.extend(issue.to_dict() for issue in getattr(agent, method)(venue))
+        except Exception as e:
+            # A manual without the section a check reads cannot decide the cell either way
+            print(f"Error running {method} for {venue.get('name')}: {str(e)}", file=sys.stderr)
+            skipped = True
+
+    if issues:
+        return NON_COMPLIANT, issues
+    return (INCOMPLETE if skipped else COMPLIANT), []
+
+def evaluate_row(agents: Dict[str, Any], venue: Dict[str, Any], sports: List[str]) -> Dict[str, Any]:
+    """Evaluate one venue against every sport column"""
+    cells = [evaluate_cell(agents.get(sport), venue) for sport in sports]
+    return {
+        "status": [status for status, _ in cells],
+        "issues": {sport: issues for sport, (_, issues) in zip(sports, cells) if issues}
+    }
+
+def row_hash(venue: Dict[str, Any], sports: List[str], versions: Dict[str, str]) -> str:
+    """Key of a venue row: its record, the sport columns and the manual versions they were checked against"""
+    digest = hashlib.sha256(f"compliance:{COMPLIANCE_VERSION}".encode())
+    digest.update(json.dumps(venue, sort_keys=True, default=str).encode())
+    digest.update(json.dumps([[sport, versions.get(sport)] for sport in sports]).encode())
+    return digest.hexdigest()[:16]
+
+class ComplianceMatrix:
+    """Venue x sport compliance statuses with the issues behind every failed cell"""
+
+    def __init__(self, venues: List[Tuple[str, str]], sports: List[str], rows: List[Dict[str, Any]],
+                 hashes: List[str], recomputed: Optional[List[Tuple[str, str]]] = None):
+        self.venues = list(venues)
+        self.sports = list(sports)
+        self.rows = rows
+        self.hashes = hashes
+        self.recomputed = recomputed or []
+        self.status = np.array([row["status"] for row in rows], dtype=np.int8).reshape(len(venues), len(sports))
+        self._venue_index = {venue: i for i, venue in enumerate(self.venues)}
+        self._sport_index = {sport: j for j, sport in enumerate(self.sports)}
+
+    def cell(self, school: str, venue_name: str, sport: str) -> str:
+        """Status name of one venue for one sport"""
+        return STATUS_NAMES[self.status[self._venue_index[(school, venue_name)], self._sport_index[sport]]]
+
+    def issues(self, school: str, venue_name: str, sport: str) -> List[Dict[str, Any]]:
+        """Issues that make a venue non-compliant for a sport"""
+        return self.rows[self._venue_index[(school, venue_name)]]["issues"].get(sport, [])
+
+    def venues_with(self, sport: str, status: int = COMPLIANT) -> List[Tuple[str, str]]:
+        """(school, venue name) pairs with the given status for a sport"""
+        column = self.status[:, self._sport_index[sport]]
+        return [self.venues[i] for i in np.flatnonzero(column == status)]
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """Count of venues in each status per sport"""
+        return {sport: {name: int(np.count_nonzero(self.status[:, j] == code))
+                        for code, name in enumerate(STATUS_NAMES)}
+                for j, sport in enumerate(self.sports)}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sports": self.sports,
+            "venues": [
+                {"school": school, "venue": name, "hash": self.hashes[i],
+                 "status": dict(zip(self.sports, (STATUS_NAMES[code] for code in self.rows[i]["status"]))),
+                 "issues": self.rows[i]["issues"]}
+                for i, (school, name) in enumerate(self.venues)
+            ]
+        }
+
+def _read_cache(cache_file: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    if not cache_file or not os.path.exists(cache_file):
+        return {}
+    try:
+        with open(cache_file) as f:
+            return {row.pop("hash"): row for row in json.load(f).get("rows", [])}
+    except Exception as e:
+        print(f"Error reading cached venue compliance: {str(e)}", file=sys.stderr)
+        return {}
+
+def build_compliance_matrix(catalog: Optional[VenueCatalog] = None, agents: Optional[Dict[str, Any]] = None,
+                            sports: Optional[List[str]] = None, cache_dir: Optional[str] = CACHE_PATH,
+                            previous: Optional[ComplianceMatrix] = None,
+                            max_workers: int = DEFAULT_WORKERS) -> ComplianceMatrix:
+    """
+    Build the venue x sport compliance matrix, re-evaluating only rows whose inputs changed
+
+    Args:
+        catalog: Venue catalog (defaults to the shared one)
+        agents: Agents by sport code (defaults to load_agents(sports))
+        sports: Sport columns (defaults to COMPLIANCE_SPORTS)
+        cache_dir: Directory for the persisted matrix, or None to skip persistence
+        previous: An earlier matrix whose rows can be reused in place of the on-disk copy
+        max_workers: Size of the worker pool for rows that need evaluating
+
+    Returns:
+        ComplianceMatrix instance
+    """
+    catalog = catalog or get_catalog()
+    sports = list(sports or COMPLIANCE_SPORTS)
+    agents = agents if agents is not None else load_agents(sports)
+    versions = {sport: manual_version(agent) for sport, agent in agents.items()}
+
+    records = [((school, venue["name"]), venue)
+               for school, data in sorted(catalog.data.get("schools", {}).items())
+               for venue in data.get("venues", [])]
+    hashes = [row_hash(venue, sports, versions) for _, venue in records]
+
+    cache_file = os.path.join(cache_dir, COMPLIANCE_CACHE_FILE) if cache_dir else None
+    known = _read_cache(cache_file)
+    if previous is not None:
+        known.update(zip(previous.hashes, previous.rows))
+
+    stale = [i for i, key in enumerate(hashes) if key not in known]
+    rows: List[Optional[Dict[str, Any]]] = [known.get(key) for key in hashes]
+    if len(stale) > 1 and max_workers > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="flextime-compliance") as pool:
+            for i, row in zip(stale, pool.map(lambda i: evaluate_row(agents, records[i][1], sports), stale)):
+                rows[i] = row
+    else:
+        for i in stale:
+            rows[i] = evaluate_row(agents, records[i][1], sports)
+
+    matrix = ComplianceMatrix([key for key, _ in records], sports, rows, hashes,
+                              recomputed=[records[i][0] for i in stale])
+
+    # Rewrite when rows changed, which also drops rows of venues that are gone
+    if cache_file and (stale or set(known) != set(hashes)):
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(cache_file, "w") as f:
+                json.dump({"rows": [dict(row, hash=key) for key, row in zip(hashes, rows)]}, f)
+        except Exception as e:
+            print(f"Error saving venue compliance: {str(e)}", file=sys.stderr)
+
+    return matrix
+
+_matrix: Optional[ComplianceMatrix] = None
+_matrix_source: Optional[str] = None
+_agents: Optional[Dict[str, Any]] = None
+_matrix_lock = threading.Lock()
+
+def get_compliance_matrix() -> ComplianceMatrix:
+    """
+    Get the shared compliance matrix for this process, updating the rows of changed venues
+    """
+    global _matrix, _matrix_source, _agents
+
+    catalog = get_catalog()
+    catalog.refresh()
+    with _matrix_lock:
+        if _matrix is None or catalog.version != _matrix_source:
+            if _agents is None:
+                _agents = load_agents()
+            _matrix = build_compliance_matrix(catalog, agents=_agents, previous=_matrix)
+            _matrix_source = catalog.version
+        return _matrix
+
+def main():
+    parser = argparse.ArgumentParser(description='FlexTime Venue Compliance')
+    parser.add_argument('-s', '--sport', type=str, help='List venues and their status for one sport')
+    parser.add_argument('--rebuild', action='store_true', help='Rebuild and persist the matrix')
+    parser.add_argument('-w', '--workers', type=int, default=DEFAULT_WORKERS, help='Worker pool size for --rebuild')
+
+    args = parser.parse_args()
+
+    matrix = build_compliance_matrix(max_workers=args.workers) if args.rebuild else get_compliance_matrix()
+
+    if args.sport:
+        print(json.dumps({f"{school}:{name}": matrix.cell(school, name, args.sport)
+                          for school, name in matrix.venues}, indent=2))
+    else:
+        print(json.dumps({"venues": len(matrix.venues), "recomputed": len(matrix.recomputed),
+                          "summary": matrix.summary()}, indent=2))
+
+if __name__ == "__main__":
+    main()
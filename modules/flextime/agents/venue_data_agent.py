@@ -10,6 +10,7 @@ Part of the XII-OS FlexTime module.
 
 import os
 import sys
+import copy
 import json
 import re
 import argparse
@@ -19,13 +20,16 @@ from bs4 import BeautifulSoup
 import subprocess
 from typing import Dict, List, Any, Optional, Union
 
+import venue_catalog
+import agent_runtime
+
 # FlexTime configuration
 FLEXTIME_VERSION = "1.0.0"
 FLEXTIME_MODULE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 AGENTS_PATH = os.path.dirname(os.path.abspath(__file__))
 SCHEDULING_DATA_PATH = "/Users/nickthequick/XII-OS/data/scheduling_data"
-VENUE_DATA_PATH = "/Users/nickthequick/XII-OS/data/venue_data/big12_venues.json"
-VENUE_SCHEMA_PATH = "/Users/nickthequick/XII-OS/data/venue_data/venue_schema.json"
+VENUE_DATA_PATH = venue_catalog.VENUE_DATA_PATH
+VENUE_SCHEMA_PATH = venue_catalog.VENUE_SCHEMA_PATH
 
 # Big 12 Conference constants
 BIG12_SCHOOLS = [
@@ -62,22 +66,12 @@ SCHOOL_WEBSITES = {
 
 def load_venue_data() -> Dict[str, Any]:
     """
-    Load current venue data from the centralized JSON file
+    Load current venue data from the shared venue catalog
     
     Returns:
-        Dictionary containing venue data for all schools
+        Editable copy of the venue data for all schools
     """
-    try:
-        if os.path.exists(VENUE_DATA_PATH):
-            with open(VENUE_DATA_PATH, 'r') as f:
-                venue_data = json.load(f)
-            return venue_data
-        else:
-            print(f"Warning: Venue data file not found at {VENUE_DATA_PATH}", file=sys.stderr)
-            return {"schools": {}}
-    except Exception as e:
-        print(f"Error loading venue data: {str(e)}", file=sys.stderr)
-        return {"schools": {}}
+    return copy.deepcopy(venue_catalog.get_catalog().data)
 
 def load_venue_schema() -> Dict[str, Any]:
     """
@@ -116,6 +110,7 @@ def save_venue_data(data: Dict[str, Any]) -> bool:
         with open(VENUE_DATA_PATH, 'w') as f:
             json.dump(data, f, indent=2)
         
+        venue_catalog.get_catalog().refresh(force=True)
         return True
     except Exception as e:
         print(f"Error saving venue data: {str(e)}", file=sys.stderr)
@@ -305,7 +300,7 @@ def get_venue_status() -> Dict[str, Any]:
     }
     
     # Load current data
-    venue_data = load_venue_data()
+    venue_data = venue_catalog.get_catalog().data
     
     for school_code in BIG12_SCHOOLS:
         if school_code in venue_data.get("schools", {}):
@@ -389,7 +384,7 @@ def parse_venue_info_from_text(text: str, school_code: str) -> List[Dict[str, An
     
     return unique_venues
 
-def process_user_query(query: str) -> str:
+def _answer_query(query: str) -> str:
     """
     Process a user query related to venue data
     
@@ -445,7 +440,7 @@ def process_user_query(query: str) -> str:
             break
     
     if school_mentioned:
-        venue_data = load_venue_data()
+        venue_data = venue_catalog.get_catalog().data
         
         if "schools" in venue_data and school_mentioned in venue_data["schools"]:
             school_data = venue_data["schools"][school_mentioned]
@@ -530,7 +525,7 @@ def process_user_query(query: str) -> str:
     
     # Check for validation request
     if any(term in query_lower for term in ["validate", "check", "verify"]):
-        venue_data = load_venue_data()
+        venue_data = venue_catalog.get_catalog().data
         venue_schema = load_venue_schema()
         
         validation_errors = validate_venue_data(venue_data, venue_schema)
@@ -578,6 +573,10 @@ def process_user_query(query: str) -> str:
     
     return response
 
+def process_user_query(query: str, context: Optional[Dict[str, Any]] = None, system_prompt: str = "") -> str:
+    """Process a user query; see agent_runtime.answer_query for context and system_prompt"""
+    return agent_runtime.answer_query(_answer_query, query, context, system_prompt)
+
 def main():
     parser = argparse.ArgumentParser(description='FlexTime Venue Data Agent')
     parser.add_argument('-p', '--prompt', type=str, required=True, help='User prompt/query')
@@ -586,7 +585,7 @@ def main():
     args = parser.parse_args()
     
     # Process the query
-    response = process_user_query(args.prompt)
+    response = process_user_query(args.prompt, system_prompt=args.system_prompt)
     
     # Print the response
     print(response)
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Weather Provider
+
+Single source of weather forecasts for the FlexTime agents. Forecasts are
+cached per (school, date) in memory and in an on-disk SQLite store, with a
+time-to-live that depends on how far out the date is, so repeated CLI runs
+reuse earlier results. Cache misses are filled with one bulk fetch covering
+every school and date involved.
+
+Part of the XII-OS FlexTime module.
+"""
+
+import os
+import sys
+import json
+import time
+import zlib
+import sqlite3
+import argparse
+import datetime
+import threading
+from typing import Dict, List, Any, Optional, Tuple, Iterable, Callable
+
+# FlexTime configuration
+FLEXTIME_VERSION = "1.0.0"
+FLEXTIME_MODULE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_PATH = os.path.join(FLEXTIME_MODULE_PATH, "data", "storage", "cache")
+FORECAST_STORE_PATH = os.path.join(CACHE_PATH, "weather_forecasts.sqlite")
+
+# Forecast lifetime by lead time: (max days ahead, seconds). Past dates never expire.
+FORECAST_TTL_SECONDS = [
+    (2, 60 * 60),            # next two days: hourly
+    (7, 6 * 60 * 60),        # this week: every 6 hours
+    (16, 24 * 60 * 60),      # extended forecast range: daily
+]
+LONG_RANGE_TTL_SECONDS = 7 * 24 * 60 * 60  # beyond the forecast range: weekly
+
+HIGH_ALTITUDE_SCHOOLS = ["colorado", "byu", "utah", "texas_tech"]
+SOUTHERN_SCHOOLS = ["arizona", "arizona_state", "houston", "ucf"]
+
+Forecast = Dict[str, Any]
+Fetcher = Callable[[List[str], str, str], List[Forecast]]
+
+def forecast_ttl(date: datetime.date, today: datetime.date) -> Optional[float]:
+    """
+    Seconds a forecast for `date` stays fresh when fetched on `today`
+
+    Returns:
+        TTL in seconds, or None for dates already past (never refetched)
+    """
+    lead = (date - today).days
+    if lead < 0:
+        return None
+    for max_lead, ttl in FORECAST_TTL_SECONDS:
+        if lead <= max_lead:
+            return ttl
+    return LONG_RANGE_TTL_SECONDS
+
+def synthesize_forecast(school_code: str, day: datetime.date) -> Forecast:
+    """
+    Deterministic synthetic forecast for one school and day
+
+    Stands in for the COMPASS weather API; the same (school, date) always
+    produces the same forecast.
+    """
+    day_str = day.strftime("%Y-%m-%d")
+    seed = zlib.crc32(f"{school_code}_{day_str}".encode())
+
+    temp_high = 40 + (seed % 60)  # Temperature between 40-100°F
+    temp_low = temp_high - 15 - (seed % 10)  # 15-25 degrees lower than high
+    precip_chance = seed % 101  # 0-100%
+
+    if school_code in HIGH_ALTITUDE_SCHOOLS:
+        temp_high -= 5
+        temp_low -= 7
+    if school_code in SOUTHERN_SCHOOLS:
+        temp_high += 8
+        temp_low += 6
+
+    conditions = "Sunny"
+    if precip_chance > 80:
+        conditions = "Heavy Rain"
+    elif precip_chance > 60:
+        conditions = "Rain"
+    elif precip_chance > 40:
+        conditions = "Partly Cloudy"
+    elif precip_chance > 20:
+        conditions = "Mostly Sunny"
+
+    if school_code in ["colorado", "utah", "byu"] and day.month in [11, 12, 1, 2, 3] and precip_chance > 50:
+        conditions = "Snow"
+    if school_code in ["houston", "ucf"] and day.month in [6, 7, 8, 9] and precip_chance > 70:
+        conditions = "Thunderstorms"
+
+    forecast = {
+        "date": day_str,
+        "school": school_code,
+        "conditions": conditions,
+        "temperature": {"high": temp_high, "low": temp_low, "unit": "F"},
+        "precipitation": {
+            "chance": precip_chance,
+            "type": "rain" if "Rain" in conditions else "snow" if conditions == "Snow" else "none"
+        },
+        "advisories": []
+    }
+
+    if conditions == "Heavy Rain" and precip_chance > 90:
+        forecast["advisories"].append("Flood Watch")
+    if conditions == "Snow" and precip_chance > 85:
+        forecast["advisories"].append("Winter Storm Warning")
+    if temp_high > 95 and precip_chance < 20:
+        forecast["advisories"].append("Heat Advisory")
+
+    return forecast
+
+def synthesize_forecasts(schools: List[str], start_date: str, end_date: str) -> List[Forecast]:
+    """Bulk fetcher: synthetic forecasts for every school and every day in a range"""
+    start = datetime.date.fromisoformat(start_date)
+    days = (datetime.date.fromisoformat(end_date) - start).days + 1
+    return [synthesize_forecast(school, start + datetime.timedelta(days=i)) for school in schools for i in range(days)]
+
+class WeatherProvider:
+    """Per-(school, date) forecast cache backed by SQLite, filled by bulk fetches"""
+
+    def __init__(self, store_path: Optional[str] = FORECAST_STORE_PATH, fetcher: Fetcher = synthesize_forecasts,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            store_path: SQLite file for the persistent store (None keeps forecasts in memory only)
+            fetcher: Function (schools, start_date, end_date) -> forecasts for every school and day
+            clock: Time source in epoch seconds (for tests)
+        """
+        self.store_path = store_path
+        self.fetcher = fetcher
+        self.clock = clock
+        self.stats = {"memory_hits": 0, "store_hits": 0, "fetched": 0, "fetch_calls": 0}
+
+        self._memory: Dict[Tuple[str, str], Tuple[float, Forecast]] = {}
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+        if store_path:
+            try:
+                os.makedirs(os.path.dirname(store_path), exist_ok=True)
+                self._db = sqlite3.connect(store_path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS forecasts ("
+                    "school TEXT NOT NULL, date TEXT NOT NULL, fetched_at REAL NOT NULL, payload TEXT NOT NULL, "
+                    "PRIMARY KEY (school, date))"
+                )
+                self._db.commit()
+            except Exception as e:
+                print(f"Error opening weather store, using memory only: {str(e)}", file=sys.stderr)
+                self._db = None
+
+    def _fresh(self, date: str, fetched_at: float, now: float, today: datetime.date) -> bool:
+        ttl = forecast_ttl(datetime.date.fromisoformat(date), today)
+        return ttl is None or now - fetched_at < ttl
+
+    def lookup(self, pairs: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], Forecast]:
+        """
+        Forecasts for a set of (school, date) pairs
+
+        Fresh entries come from memory, then from the SQLite store in a single
+        query; whatever is still missing is fetched with one bulk call spanning
+        the missing schools and dates, and written back to both caches.
+
+        Args:
+            pairs: (school_code, "YYYY-MM-DD") pairs
+
+        Returns:
+            Dictionary keyed by (school_code, date)
+        """
+        wanted = set(pairs)
+        if not wanted:
+            return {}
+
+        now = self.clock()
+        today = datetime.date.fromtimestamp(now)
+        result = {}
+
+        with self._lock:
+            for key in wanted:
+                cached = self._memory.get(key)
+                if cached and self._fresh(key[1], cached[0], now, today):
+                    result[key] = cached[1]
+            self.stats["memory_hits"] += len(result)
+
+            missing = wanted - result.keys()
+            if missing and self._db is not None:
+                found = self._load(missing, now, today)
+                self.stats["store_hits"] += len(found)
+                result.update(found)
+                missing -= found.keys()
+
+            if missing:
+                result.update(self._fetch(missing, now))
+
+        return result
+
+    def _load(self, keys: set, now: float, today: datetime.date) -> Dict[Tuple[str, str], Forecast]:
+        schools = sorted({school for school, _ in keys})
+        dates = [date for _, date in keys]
+        found = {}
+
+        try:
+            rows = self._db.execute(
+                f"SELECT school, date, fetched_at, payload FROM forecasts "
+                f"WHERE school IN ({','.join('?' * len(schools))}) AND date BETWEEN ? AND ?",
+                schools + [min(dates), max(dates)]
+            ).fetchall()
+        except Exception as e:
+            print(f"Error reading weather store: {str(e)}", file=sys.stderr)
+            return found
+
+        for school, date, fetched_at, payload in rows:
+            key = (school, date)
+            if not self._fresh(date, fetched_at, now, today):
+                continue
+            forecast = json.loads(payload)
+            self._memory[key] = (fetched_at, forecast)
+            if key in keys:
+                found[key] = forecast
+        return found
+
+    def _fetch(self, keys: set, now: float) -> Dict[Tuple[str, str], Forecast]:
+        schools = sorted({school for school, _ in keys})
+        dates = [date for _, date in keys]
+
+        try:
+            forecasts = self.fetcher(schools, min(dates), max(dates))
+        except Exception as e:
+            print(f"Error fetching weather forecasts: {str(e)}", file=sys.stderr)
+            return {}
+
+        self.stats["fetch_calls"] += 1
+        self.stats["fetched"] += len(forecasts)
+        rows = []
+        found = {}
+        for forecast in forecasts:
+            key = (forecast["school"], forecast["date"])
+            self._memory[key] = (now, forecast)
+            rows.append((key[0], key[1], now, json.dumps(forecast)))
+            if key in keys:
+                found[key] = forecast
+
+        if self._db is not None and rows:
+            try:
+                self._db.executemany("INSERT OR REPLACE INTO forecasts VALUES (?, ?, ?, ?)", rows)
+                self._db.commit()
+            except Exception as e:
+                print(f"Error writing weather store: {str(e)}", file=sys.stderr)
+        return found
+
+    def get_forecasts(self, schools: List[str], start_date: str, end_date: str) -> Dict[Tuple[str, str], Forecast]:
+        """Forecasts for every school and every day in a date range"""
+        start = datetime.date.fromisoformat(start_date)
+        days = (datetime.date.fromisoformat(end_date) - start).days + 1
+        dates = [(start + datetime.timedelta(days=i)).isoformat() for i in range(days)]
+        return self.lookup((school, date) for school in schools for date in dates)
+
+    def get_forecast(self, school_code: str, start_date: str, end_date: str) -> List[Forecast]:
+        """Forecasts for one school over a date range, in date order"""
+        forecasts = self.get_forecasts([school_code], start_date, end_date)
+        return [forecasts[key] for key in sorted(forecasts)]
+
+    def clear(self):
+        """Drop all cached forecasts, in memory and on disk"""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM forecasts")
+                self._db.commit()
+
+_provider: Optional[WeatherProvider] = None
+_provider_lock = threading.Lock()
+
+def get_provider() -> WeatherProvider:
+    """Get the shared weather provider for this process"""
+    global _provider
+
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                _provider = WeatherProvider()
+    return _provider
+
+def main():
+    parser = argparse.ArgumentParser(description='FlexTime Weather Provider')
+    parser.add_argument('-s', '--school', type=str, action='append', help='School code (repeatable)')
+    parser.add_argument('--start', type=str, help='Start date (YYYY-MM-DD)')
+    parser.add_argument('--end', type=str, help='End date (YYYY-MM-DD)')
+    parser.add_argument('--clear', action='store_true', help='Clear the forecast cache')
+
+    args = parser.parse_args()
+    provider = get_provider()
+
+    if args.clear:
+        provider.clear()
+        print("Weather forecast cache cleared")
+        return
+
+    if args.school and args.start:
+        forecasts = provider.get_forecasts(args.school, args.start, args.end or args.start)
+        print(json.dumps([forecasts[key] for key in sorted(forecasts)], indent=2))
+        print(json.dumps(provider.stats), file=sys.stderr)
+        return
+
+    parser.print_help()
+
+if __name__ == "__main__":
+    main()